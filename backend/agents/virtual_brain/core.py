@@ -168,7 +168,7 @@ class VirtualBrain:
                 f"Virtual Brain initialized successfully",
                 brain_id=self.id,
                 learner_id=self.learner_id,
-                profile=self.profile.dict()
+                profile=self.profile.model_dump()
             )
             
             return True
@@ -520,7 +520,7 @@ Feedback:"""
         self.cognitive_state.activities_completed += 1
         
         # Return state summary
-        return self.cognitive_state.dict()
+        return self.cognitive_state.model_dump()
     
     def _determine_recommended_action(self) -> str:
         """
@@ -678,7 +678,7 @@ Feedback:"""
             "learner_response": response,
             "ai_response": ai_response[:200],  # Truncate for storage
             "feedback": feedback,
-            "state": self.cognitive_state.dict(),
+            "state": self.cognitive_state.model_dump(),
             "performance": self.performance_metrics.copy(),
         }
         
@@ -705,7 +705,7 @@ Feedback:"""
         try:
             state_data = {
                 "brain_id": self.id,
-                "cognitive_state": self.cognitive_state.dict(),
+                "cognitive_state": self.cognitive_state.model_dump(),
                 "performance_metrics": self.performance_metrics,
                 "session": {
                     "id": self.current_session["id"],
@@ -754,10 +754,10 @@ Feedback:"""
             "duration_minutes": session_duration,
             "interactions_count": len(self.current_session["interactions"]),
             "adaptations_made": len(self.current_session["adaptations_made"]),
-            "final_state": self.cognitive_state.dict(),
+            "final_state": self.cognitive_state.model_dump(),
             "final_performance": self.performance_metrics.copy(),
             "recommendations": await self._generate_recommendations(
-                self.cognitive_state.dict(),
+                self.cognitive_state.model_dump(),
                 self.performance_metrics
             ),
         }
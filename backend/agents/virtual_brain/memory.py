@@ -41,7 +41,7 @@ class MemoryManager:
             
             # Initialize working memory with profile
             self.working_memory = {
-                "learner_profile": profile.dict(),
+                "learner_profile": profile.model_dump(),
                 "current_topic": None,
                 "current_skill": None,
                 "recent_mistakes": [],
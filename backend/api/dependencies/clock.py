@@ -0,0 +1,19 @@
+"""
+Request Clock Dependencies
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+from api.schemas.common import pin_now
+
+
+async def pin_request_clock() -> None:
+    """
+    Read the system clock once per request.
+
+    Computed response fields (e.g. `AssignmentResponse.days_until_due`)
+    call `request_now()`, so a list of N rows shares one timestamp instead
+    of calling `datetime.now()` per field per row. Declared async so the
+    context variable is set in the request's own task.
+    """
+    pin_now()
@@ -0,0 +1,168 @@
+"""
+API Response Helpers
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+from typing import Any, Iterable, Iterator
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from core.logging import setup_logging
+
+logger = setup_logging(__name__)
+
+# Optional dependency - internal callers fall back to JSON if not installed
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+    logger.warning("msgpack not installed - MessagePack responses disabled")
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a pydantic model with pydantic-core's native JSON serializer.
+
+    Returning a Response directly skips FastAPI's jsonable_encoder walk;
+    keep `response_model=` on the route so the OpenAPI schema is unchanged.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def spliced_model_response(model: BaseModel, fragments: dict[str, bytes], status_code: int = 200) -> Response:
+    """
+    `model_response` with some fields written from pre-serialized JSON.
+
+    For static sections (reference tables and the like) dumped once at
+    import time: the named fields are left out of the dump and their cached
+    bytes are spliced into the object instead of being walked per request.
+    """
+    body = model.__pydantic_serializer__.to_json(model, exclude=set(fragments))
+    tail = b",".join(b'"' + name.encode() + b'":' + fragment for name, fragment in fragments.items())
+    # `body` is `{}` when every field is spliced; `tail` is empty when nothing is
+    separator = b"," if len(body) > 2 and tail else b""
+    return Response(
+        content=body[:-1] + separator + tail + b"}",
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def list_response(adapter: TypeAdapter, items: list, **dump_options: Any) -> Response:
+    """
+    Serialize a list of models with a prebuilt `TypeAdapter(list[Model])`.
+
+    The whole array is written in one pydantic-core pass; `dump_options`
+    (e.g. `exclude={"__all__": {...}}`) go to `dump_json`. Keep
+    `response_model=` on the route for the OpenAPI schema.
+    """
+    return Response(content=adapter.dump_json(items, **dump_options), media_type="application/json")
+
+
+def rows_response(adapter: TypeAdapter, rows: Iterable[Any]) -> Response:
+    """`list_response` for ORM rows, validated from their attributes first"""
+    return list_response(adapter, adapter.validate_python(rows, from_attributes=True))
+
+
+def wants_msgpack(request: Request) -> bool:
+    """
+    True when the caller (an internal service) asked for MessagePack and it is available.
+
+    Routes that branch on this must mark both answers with `Vary: Accept`:
+    `msgpack_response` does so itself, wrap the JSON fallback in `vary_on_accept`.
+    """
+    return HAS_MSGPACK and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def vary_on_accept(response: Response) -> Response:
+    """Mark a content-negotiated response so caches key it on the Accept header"""
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+def msgpack_response(value: Any, status_code: int = 200, **dump_options: Any) -> Response:
+    """
+    Serialize a model, or a list of models, as MessagePack.
+
+    Only for service-to-service calls that send `Accept: application/msgpack`
+    (see `wants_msgpack`); browsers and the OpenAPI docs keep JSON.
+    """
+    return vary_on_accept(Response(
+        content=msgpack.packb(to_jsonable_python(value, **dump_options), use_bin_type=True),
+        status_code=status_code,
+        media_type=MSGPACK_MEDIA_TYPE,
+    ))
+
+
+def _field_json(model: type[BaseModel], name: str, value: Any) -> bytes:
+    """
+    `"key":value` for one field, written by `model`'s own serializer.
+
+    Going through the model keeps its config, field serializers and
+    exclusions, so the output matches `model_response` for that field.
+    """
+    if name not in model.model_fields:
+        raise KeyError(name)
+    instance = model.model_construct(_fields_set={name}, **{name: value})
+    return model.__pydantic_serializer__.to_json(instance, include={name}, by_alias=False)[1:-1]
+
+
+def _json_object_chunks(model: type[BaseModel], sections: Iterable[tuple[str, Any]]) -> Iterator[bytes]:
+    """Emit `{"field":value,...}` one serialized field per chunk"""
+    separator = b"{"
+    for name, value in sections:
+        member = _field_json(model, name, value)
+        if member:  # empty for fields the model excludes from its dumps
+            yield separator + member
+            separator = b","
+    yield b"}" if separator == b"," else b"{}"
+
+
+def fields_response(model: type[BaseModel], sections: Iterable[tuple[str, Any]], status_code: int = 200) -> Response:
+    """
+    Write a `model`-shaped JSON object from already-validated field values.
+
+    Each field is dumped on its own through the model's serializer, so
+    large list fields go to pydantic-core in one call without validating
+    the parent model. Keep `response_model=model` on the route for the
+    OpenAPI schema.
+    """
+    return Response(
+        content=b"".join(_json_object_chunks(model, sections)),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def streamed_model_response(
+    model: type[BaseModel],
+    sections: Iterable[tuple[str, Any]],
+    status_code: int = 200,
+) -> StreamingResponse:
+    """
+    Stream a `model`-shaped JSON object one field at a time.
+
+    `sections` holds `(field_name, value)` pairs and is read in full before
+    the response starts: once the 200 is sent, a failure can only truncate
+    the body, so fetching and building happen here, in the handler, where
+    errors still become error responses. Only serialization is deferred, so
+    the payload is never held as one joined blob. Values are serialized but
+    not validated; keep `response_model=model` on the route for the OpenAPI
+    schema.
+    """
+    return StreamingResponse(
+        _json_object_chunks(model, list(sections)),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -6,8 +6,11 @@ Date: 2025-01-13
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from typing import List, Optional
+from sqlalchemy import select, func, and_, case
+from pydantic import TypeAdapter
+import numpy as np
+from enum import Enum
+from typing import List, Optional, Type
 from datetime import datetime, timedelta
 
 from db.database import get_db
@@ -46,16 +49,27 @@ from api.schemas.aac import (
     AACRecommendation,
     AACAnalyticsRequest,
     AACAnalyticsResponse,
+    AACDailyTrends,
+    AACTopSymbols,
+    AACProgressOverTime,
+    SymbolCategoryCounts,
+    CommunicativeFunctionCounts,
     # Enums
     AACSymbolCategory,
+    AACCommunicativeFunction,
     AACMasteryLevel,
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.dependencies.body import json_body, json_body_openapi
+from api.responses import model_response
 from core.logging import setup_logging
 
 router = APIRouter()
 logger = setup_logging(__name__)
 
+# Prebuilt validator for bulk payloads (hundreds of symbols per request)
+BULK_SYMBOL_ADAPTER = TypeAdapter(AACBulkSymbolAdd)
+
 
 # ===== AAC System Endpoints =====
 
@@ -486,12 +500,16 @@ async def add_symbol_to_board(
     return _map_board_symbol_to_response(board_symbol)
 
 
-@router.post("/boards/{board_id}/symbols/bulk", response_model=List[AACBoardSymbolResponse])
+@router.post(
+    "/boards/{board_id}/symbols/bulk",
+    response_model=List[AACBoardSymbolResponse],
+    openapi_extra=json_body_openapi(BULK_SYMBOL_ADAPTER),
+)
 async def bulk_add_symbols_to_board(
     board_id: str,
-    data: AACBulkSymbolAdd,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    data: AACBulkSymbolAdd = Depends(json_body(BULK_SYMBOL_ADAPTER)),
 ):
     """Add multiple symbols to a board at once"""
     result = await db.execute(
@@ -832,10 +850,11 @@ async def get_dashboard_stats(
         .group_by(AACUsageLog.communicative_function)
     )
     function_rows = function_result.all()
-    function_breakdown = {
-        row.communicative_function: row.count
-        for row in function_rows
-    }
+    function_breakdown = dict.fromkeys(CommunicativeFunctionCounts.__annotations__, 0)
+    for row in function_rows:
+        function = _enum_value(AACCommunicativeFunction, row.communicative_function)
+        if function is not None:
+            function_breakdown[function] = row.count
     
     # Recent activity (last 20)
     recent_result = await db.execute(
@@ -846,7 +865,7 @@ async def get_dashboard_stats(
     )
     recent_logs = recent_result.scalars().all()
     
-    return AACDashboardStats(
+    return model_response(AACDashboardStats(
         totalSymbolsAvailable=total_symbols,
         symbolsUsedToday=symbols_today,
         symbolsUsedThisWeek=symbols_week,
@@ -856,7 +875,7 @@ async def get_dashboard_stats(
         mostUsedSymbols=most_used_symbols,
         communicativeFunctionBreakdown=function_breakdown,
         recentActivity=[_map_usage_log_to_response(log) for log in recent_logs]
-    )
+    ))
 
 
 @router.get("/recommendations/{learner_id}", response_model=List[AACRecommendation])
@@ -994,7 +1013,11 @@ async def get_analytics(
         .where(base_conditions)
         .group_by(AACSymbol.category)
     )
-    category_usage = {row.category: row.count for row in category_result.all()}
+    category_usage = dict.fromkeys(SymbolCategoryCounts.__annotations__, 0)
+    for row in category_result.all():
+        category = _enum_value(AACSymbolCategory, row.category)
+        if category is not None:
+            category_usage[category] = row.count
     
     # Communicative function usage
     function_result = await db.execute(
@@ -1005,7 +1028,11 @@ async def get_analytics(
         .where(base_conditions)
         .group_by(AACUsageLog.communicative_function)
     )
-    function_usage = {row.communicative_function: row.count for row in function_result.all()}
+    function_usage = dict.fromkeys(CommunicativeFunctionCounts.__annotations__, 0)
+    for row in function_result.all():
+        function = _enum_value(AACCommunicativeFunction, row.communicative_function)
+        if function is not None:
+            function_usage[function] = row.count
     
     # Top symbols
     top_result = await db.execute(
@@ -1020,10 +1047,46 @@ async def get_analytics(
         .order_by(func.count(AACUsageLog.id).desc())
         .limit(20)
     )
-    top_symbols = [
-        {"symbolId": row.symbol_id, "label": row.label, "count": row.count}
-        for row in top_result.all()
-    ]
+    top_rows = top_result.all()
+    top_symbols = AACTopSymbols.model_construct(
+        symbolIds=[row.symbol_id for row in top_rows],
+        labels=[row.label for row in top_rows],
+        counts=[row.count for row in top_rows],
+    )
+    
+    # Trends per period bucket, aggregated in SQL and kept columnar
+    bucket = func.date_trunc(request.groupBy, AACUsageLog.timestamp).label('bucket')
+    trend_result = await db.execute(
+        select(
+            bucket,
+            func.count(AACUsageLog.id).label('count'),
+            func.count(func.distinct(AACUsageLog.symbol_id)).label('unique_symbols'),
+            func.sum(case((AACUsageLog.was_successful == True, 1), else_=0)).label('successes'),
+            func.sum(case((AACUsageLog.was_prompted == True, 1), else_=0)).label('prompted'),
+        )
+        .where(base_conditions)
+        .group_by(bucket)
+        .order_by(bucket)
+    )
+    trend_rows = trend_result.all()
+    
+    if trend_rows:
+        buckets, counts, uniques, successes, prompted = zip(*trend_rows)
+        dates = [b.date() for b in buckets]
+        counts_arr = np.asarray(counts, dtype=np.float64)
+        daily_trends = AACDailyTrends.model_construct(
+            dates=dates,
+            utteranceCount=list(counts),
+            uniqueSymbols=list(uniques),
+        )
+        progress_over_time = AACProgressOverTime.model_construct(
+            dates=dates,
+            successRate=np.round(np.asarray(successes) / counts_arr, 4).tolist(),
+            promptedRate=np.round(np.asarray(prompted) / counts_arr, 4).tolist(),
+        )
+    else:
+        daily_trends = AACDailyTrends()
+        progress_over_time = AACProgressOverTime()
     
     return AACAnalyticsResponse(
         learnerId=request.learnerId,
@@ -1033,9 +1096,9 @@ async def get_analytics(
         averageUtteranceLength=1.0,  # Would need utterance grouping logic
         symbolUsageByCategory=category_usage,
         communicativeFunctionUsage=function_usage,
-        dailyTrends=[],  # Would need date grouping logic
+        dailyTrends=daily_trends,
         topSymbols=top_symbols,
-        progressOverTime=[]  # Would need time series logic
+        progressOverTime=progress_over_time,
     )
 
 
@@ -1187,6 +1250,15 @@ async def generate_progress_report(
 
 # ===== Helper Functions =====
 
+def _enum_value(enum_type: Type[Enum], value) -> Optional[str]:
+    """Stored value normalised through `enum_type`, or None (logged) when it is not a member"""
+    try:
+        return enum_type(value).value
+    except ValueError:
+        logger.warning(f"Skipping {enum_type.__name__} count for unknown value {value!r}")
+        return None
+
+
 def _camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case"""
     import re
@@ -1194,7 +1266,7 @@ def _camel_to_snake(name: str) -> str:
 
 
 def _map_system_to_response(system) -> AACSystemResponse:
-    return AACSystemResponse(
+    return AACSystemResponse.model_construct(
         id=system.id,
         learnerId=system.learner_id,
         systemType=system.system_type,
@@ -1217,7 +1289,7 @@ def _map_system_to_response(system) -> AACSystemResponse:
 
 
 def _map_symbol_to_response(symbol) -> AACSymbolResponse:
-    return AACSymbolResponse(
+    return AACSymbolResponse.model_construct(
         id=symbol.id,
         label=symbol.label,
         category=symbol.category,
@@ -1236,7 +1308,7 @@ def _map_symbol_to_response(symbol) -> AACSymbolResponse:
 
 
 def _map_board_symbol_to_response(board_symbol) -> AACBoardSymbolResponse:
-    return AACBoardSymbolResponse(
+    return AACBoardSymbolResponse.model_construct(
         id=board_symbol.id,
         boardId=board_symbol.board_id,
         symbolId=board_symbol.symbol_id,
@@ -1257,7 +1329,7 @@ async def _map_board_to_response(board, db: AsyncSession) -> AACBoardResponse:
     )
     board_symbols = result.scalars().all()
     
-    return AACBoardResponse(
+    return AACBoardResponse.model_construct(
         id=board.id,
         learnerId=board.learner_id,
         name=board.name,
@@ -1274,7 +1346,7 @@ async def _map_board_to_response(board, db: AsyncSession) -> AACBoardResponse:
 
 
 def _map_usage_log_to_response(log) -> AACUsageLogResponse:
-    return AACUsageLogResponse(
+    return AACUsageLogResponse.model_construct(
         id=log.id,
         learnerId=log.learner_id,
         symbolId=log.symbol_id,
@@ -1299,7 +1371,7 @@ async def _map_goal_to_response(goal, db: AsyncSession) -> AACVocabularyGoalResp
     )
     symbol = result.scalar_one_or_none()
     
-    return AACVocabularyGoalResponse(
+    return AACVocabularyGoalResponse.model_construct(
         id=goal.id,
         learnerId=goal.learner_id,
         symbolId=goal.symbol_id,
@@ -1320,7 +1392,7 @@ async def _map_goal_to_response(goal, db: AsyncSession) -> AACVocabularyGoalResp
 
 
 def _map_report_to_response(report) -> AACProgressReportResponse:
-    return AACProgressReportResponse(
+    return AACProgressReportResponse.model_construct(
         id=report.id,
         learnerId=report.learner_id,
         reportType=report.report_type,
@@ -5,10 +5,11 @@ Endpoints for organizational tools, project breakdown,
 daily planning, and EF skill assessment.
 """
 
-from datetime import datetime, date, timedelta
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from datetime import datetime, date, timedelta, timezone
+from typing import Dict, List, Optional
+import numpy as np
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from pydantic import BaseModel, TypeAdapter
 
 from api.schemas.adhd import (
     # EF Profile
@@ -54,11 +55,16 @@ from api.schemas.adhd import (
     ReminderCreate,
     ReminderResponse,
     AcknowledgeReminderRequest,
+    AcknowledgeReminderBatchItem,
+    ACKNOWLEDGE_REMINDERS_ADAPTER,
     # Interventions
     EFInterventionCreate,
+    AI_SUGGESTIONS_ADAPTER,
     EFInterventionUpdate,
     EFInterventionResponse,
     RateInterventionRequest,
+    RateInterventionBatchItem,
+    RATE_INTERVENTIONS_ADAPTER,
     EffectivenessRating,
     AIStrategiesRequest,
     AIStrategiesResponse,
@@ -66,6 +72,7 @@ from api.schemas.adhd import (
     # Self-Monitoring
     SelfMonitoringLogCreate,
     SelfMonitoringLogResponse,
+    CheckTypeStats,
     SelfMonitoringSummary,
     # Parent Dashboard
     ParentDashboardResponse,
@@ -74,7 +81,22 @@ from api.schemas.adhd import (
     UrgencyCalculationResponse,
 )
 
-router = APIRouter(prefix="/api/adhd", tags=["ADHD/Executive Function Support"])
+from api.dependencies.body import json_body, json_body_openapi
+from api.dependencies.clock import pin_request_clock
+from api.responses import model_response, streamed_model_response
+from api.schemas.common import request_now
+from services.cache.tiles import cached_tile, tile_key
+
+router = APIRouter(
+    prefix="/api/adhd",
+    tags=["ADHD/Executive Function Support"],
+    dependencies=[Depends(pin_request_clock)],
+)
+
+# Prebuilt validators for request bodies parsed straight from JSON bytes
+DAILY_PLAN_REQUEST_ADAPTER = TypeAdapter(AIDailyPlanRequest)
+SELF_MONITORING_LOG_ADAPTER = TypeAdapter(SelfMonitoringLogCreate)
+URGENCY_REQUEST_ADAPTER = TypeAdapter(UrgencyCalculationRequest)
 
 
 # ==========================================
@@ -174,7 +196,6 @@ async def delete_ef_profile(learner_id: str):
 async def create_assignment(assignment: AssignmentCreate):
     """Create a new assignment with auto-calculated urgency."""
     urgency = calculate_urgency(assignment.due_date, assignment.estimated_minutes)
-    days_until = (assignment.due_date - datetime.now()).days
     
     return AssignmentResponse(
         id="asgn_" + datetime.now().strftime("%Y%m%d%H%M%S"),
@@ -200,15 +221,13 @@ async def create_assignment(assignment: AssignmentCreate):
         learner_notes=None,
         reminders_sent=[],
         is_recurring=assignment.is_recurring,
-        recurrence_pattern=assignment.recurrence_pattern.dict() if assignment.recurrence_pattern else None,
+        recurrence_pattern=assignment.recurrence_pattern,
         points_possible=assignment.points_possible,
         points_earned=None,
         grade=None,
         feedback=None,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-        days_until_due=days_until,
-        is_overdue=days_until < 0,
         has_breakdown=False,
     )
 
@@ -229,13 +248,13 @@ async def get_learner_assignments(
     limit: int = Query(default=50, le=100),
 ):
     """Get all assignments for a learner with filtering."""
-    return AssignmentListResponse(
+    return model_response(AssignmentListResponse(
         assignments=[],
         total=0,
         by_urgency={level.value: 0 for level in UrgencyLevel},
         by_status={status.value: 0 for status in AssignmentStatus},
         overdue_count=0,
-    )
+    ))
 
 
 @router.get("/learners/{learner_id}/assignments/upcoming", response_model=AssignmentListResponse)
@@ -244,13 +263,13 @@ async def get_upcoming_assignments(
     days_ahead: int = Query(default=7, le=30),
 ):
     """Get upcoming assignments sorted by urgency."""
-    return AssignmentListResponse(
+    return model_response(AssignmentListResponse(
         assignments=[],
         total=0,
         by_urgency={level.value: 0 for level in UrgencyLevel},
         by_status={status.value: 0 for status in AssignmentStatus},
         overdue_count=0,
-    )
+    ))
 
 
 @router.put("/assignments/{assignment_id}", response_model=AssignmentResponse)
@@ -460,8 +479,14 @@ async def complete_time_block(learner_id: str, plan_date: date, block_id: str):
     }
 
 
-@router.post("/ai/daily-plan", response_model=AIDailyPlanResponse)
-async def generate_ai_daily_plan(request: AIDailyPlanRequest):
+@router.post(
+    "/ai/daily-plan",
+    response_model=AIDailyPlanResponse,
+    openapi_extra=json_body_openapi(DAILY_PLAN_REQUEST_ADAPTER),
+)
+async def generate_ai_daily_plan(
+    request: AIDailyPlanRequest = Depends(json_body(DAILY_PLAN_REQUEST_ADAPTER)),
+):
     """Generate an AI-powered daily plan."""
     from services.adhd_ai import adhd_ai_service
     
@@ -856,13 +881,32 @@ async def create_reminder(reminder: ReminderCreate):
     )
 
 
+@router.post(
+    "/reminders/acknowledge",
+    openapi_extra=json_body_openapi(ACKNOWLEDGE_REMINDERS_ADAPTER),
+)
+async def acknowledge_reminders(
+    acks: List[AcknowledgeReminderBatchItem] = Depends(json_body(ACKNOWLEDGE_REMINDERS_ADAPTER)),
+):
+    """Acknowledge many reminders in one request (offline sync)."""
+    now = request_now(timezone.utc)
+    return [
+        {
+            "reminder_id": ack.reminder_id,
+            "was_acknowledged": True,
+            "acknowledged_at": ack.acknowledged_at or now,
+        }
+        for ack in acks
+    ]
+
+
 @router.post("/reminders/{reminder_id}/acknowledge")
 async def acknowledge_reminder(reminder_id: str, ack: AcknowledgeReminderRequest):
     """Acknowledge a reminder."""
     return {
         "reminder_id": reminder_id,
         "was_acknowledged": True,
-        "acknowledged_at": ack.acknowledged_at,
+        "acknowledged_at": ack.acknowledged_at or request_now(timezone.utc),
     }
 
 
@@ -893,7 +937,6 @@ async def create_intervention(intervention: EFInterventionCreate):
         is_active=True,
         implemented_by=intervention.implemented_by,
         effectiveness_ratings=None,
-        average_effectiveness=None,
         total_ratings=0,
         target_behavior=intervention.target_behavior,
         success_criteria=intervention.success_criteria,
@@ -930,6 +973,30 @@ async def update_intervention(intervention_id: str, update: EFInterventionUpdate
     raise HTTPException(status_code=404, detail="Intervention not found")
 
 
+@router.post(
+    "/interventions/rate",
+    openapi_extra=json_body_openapi(RATE_INTERVENTIONS_ADAPTER),
+)
+async def rate_interventions(
+    ratings: List[RateInterventionBatchItem] = Depends(json_body(RATE_INTERVENTIONS_ADAPTER)),
+):
+    """Rate many interventions in one request (offline sync)."""
+    now = request_now(timezone.utc)
+    return [
+        {
+            "intervention_id": rating.intervention_id,
+            "rating": EffectivenessRating(
+                date=now,
+                rating=rating.rating,
+                notes=rating.notes,
+                rated_by=rating.rated_by,
+            ),
+            "new_average": rating.rating,  # In production, calculate from all ratings
+        }
+        for rating in ratings
+    ]
+
+
 @router.post("/interventions/{intervention_id}/rate")
 async def rate_intervention(intervention_id: str, rating: RateInterventionRequest):
     """Rate an intervention's effectiveness."""
@@ -971,8 +1038,8 @@ async def get_ai_strategies(request: AIStrategiesRequest):
         context=request.context,
     )
     
-    # Convert AI suggestions to intervention objects
-    suggestions = []
+    # Convert AI suggestions to intervention objects, validated as one batch
+    raw_suggestions = []
     for strategy in ai_result.get("strategies", []):
         domain_str = strategy.get("domain", "organization").upper()
         try:
@@ -980,17 +1047,18 @@ async def get_ai_strategies(request: AIStrategiesRequest):
         except KeyError:
             domain = EFDomain.ORGANIZATION
         
-        suggestions.append(EFInterventionCreate(
-            learner_id=request.learner_id,
-            domain=domain,
-            strategy_name=strategy.get("title", "Strategy"),
-            description=strategy.get("description", ""),
-            how_to_implement=strategy.get("description", ""),
-            materials=strategy.get("tools_needed", []),
-            frequency="as needed",
-            implemented_by="SELF",
-            evidence_basis=strategy.get("why_it_helps"),
-        ))
+        raw_suggestions.append({
+            "learner_id": request.learner_id,
+            "domain": domain,
+            "strategy_name": strategy.get("title", "Strategy"),
+            "description": strategy.get("description", ""),
+            "how_to_implement": strategy.get("description", ""),
+            "materials": strategy.get("tools_needed", []),
+            "frequency": "as needed",
+            "implemented_by": "SELF",
+            "evidence_basis": strategy.get("why_it_helps"),
+        })
+    suggestions = AI_SUGGESTIONS_ADAPTER.validate_python(raw_suggestions)
     
     # Fall back to default suggestions if AI failed
     if not suggestions:
@@ -1020,7 +1088,7 @@ async def get_ai_strategies(request: AIStrategiesRequest):
     return AIStrategiesResponse(
         suggestions=suggestions,
         explanation=ai_result.get("explanation", "Based on the EF profile, here are recommended strategies."),
-        priority_order=[s.domain.value for s in suggestions[:3]],
+        priority_order=[s.domain for s in suggestions[:3]],
         encouragement=ai_result.get("encouragement", "Small steps lead to big changes!"),
     )
 
@@ -1029,8 +1097,14 @@ async def get_ai_strategies(request: AIStrategiesRequest):
 # SELF-MONITORING ENDPOINTS
 # ==========================================
 
-@router.post("/self-monitoring", response_model=SelfMonitoringLogResponse)
-async def log_self_monitoring(log: SelfMonitoringLogCreate):
+@router.post(
+    "/self-monitoring",
+    response_model=SelfMonitoringLogResponse,
+    openapi_extra=json_body_openapi(SELF_MONITORING_LOG_ADAPTER),
+)
+async def log_self_monitoring(
+    log: SelfMonitoringLogCreate = Depends(json_body(SELF_MONITORING_LOG_ADAPTER)),
+):
     """Log a self-monitoring check."""
     return SelfMonitoringLogResponse(
         id="monitor_" + datetime.now().strftime("%Y%m%d%H%M%S"),
@@ -1076,15 +1150,59 @@ async def get_self_monitoring_summary(
     end_date: date,
 ):
     """Get summary of self-monitoring data."""
+    async def build() -> SelfMonitoringSummary:
+        logs: List[SelfMonitoringLogResponse] = []  # In production, fetch from database
+        return _summarize_self_monitoring(learner_id, start_date, end_date, logs)
+    
+    key = tile_key("self-monitoring", learner_id, start_date, end_date)
+    return Response(content=await cached_tile(key, build), media_type="application/json")
+
+
+def _on_task_by(keys: np.ndarray, on_task: np.ndarray) -> Dict[str, CheckTypeStats]:
+    """Group on-task flags by key with one unique/bincount pass."""
+    labels, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse)
+    hits = np.bincount(inverse, weights=on_task)
+    percentages = np.round(hits / totals * 100, 1)
+    return {
+        label: CheckTypeStats(total=total, on_task_count=hit, percentage=pct)
+        for label, total, hit, pct in zip(
+            labels.tolist(), totals.tolist(), hits.astype(np.int64).tolist(), percentages.tolist()
+        )
+    }
+
+
+def _summarize_self_monitoring(
+    learner_id: str,
+    start_date: date,
+    end_date: date,
+    logs: List[SelfMonitoringLogResponse],
+) -> SelfMonitoringSummary:
+    """Aggregate self-monitoring logs column-wise into a summary."""
+    total = len(logs)
+    by_check_type: Dict[str, CheckTypeStats] = {}
+    by_time_of_day: Dict[str, CheckTypeStats] = {}
+    on_task_percentage = 0.0
+    
+    if total:
+        on_task = np.fromiter((log.was_on_task is True for log in logs), dtype=np.bool_, count=total)
+        check_types = np.array([log.check_type for log in logs])
+        hours = np.fromiter((log.time.hour for log in logs), dtype=np.int8, count=total)
+        periods = np.array(["morning", "afternoon", "evening"])[np.digitize(hours, (12, 17))]
+        
+        on_task_percentage = round(float(on_task.mean()) * 100, 1)
+        by_check_type = _on_task_by(check_types, on_task)
+        by_time_of_day = _on_task_by(periods, on_task)
+    
     return SelfMonitoringSummary(
         learner_id=learner_id,
         date_range_start=start_date,
         date_range_end=end_date,
-        total_checks=0,
-        on_task_percentage=0,
-        by_check_type={},
+        total_checks=total,
+        on_task_percentage=on_task_percentage,
+        by_check_type=by_check_type,
         by_subject=None,
-        by_time_of_day={},
+        by_time_of_day={period: stats.model_dump() for period, stats in by_time_of_day.items()},
         trends=[],
         recommendations=[],
     )
@@ -1097,27 +1215,36 @@ async def get_self_monitoring_summary(
 @router.get("/learners/{learner_id}/parent-dashboard", response_model=ParentDashboardResponse)
 async def get_parent_dashboard(learner_id: str):
     """Get parent dashboard view for a learner."""
-    return ParentDashboardResponse(
-        learner_id=learner_id,
-        learner_name="",  # In production, fetch from database
-        upcoming_assignments=[],
-        overdue_assignments=[],
-        recently_completed=[],
-        todays_plan=None,
-        weekly_completion_rate=0,
-        ef_profile_summary=None,
-        active_interventions=[],
-        alerts=[],
-        recent_self_monitoring=None,
-    )
+    # Every section is fetched before streaming starts. In production, fetch from database
+    sections = [
+        ("learner_id", learner_id),
+        ("learner_name", ""),
+        ("upcoming_assignments", []),
+        ("overdue_assignments", []),
+        ("recently_completed", []),
+        ("todays_plan", None),
+        ("weekly_completion_rate", 0.0),
+        ("ef_profile_summary", None),
+        ("active_interventions", []),
+        ("alerts", []),
+        ("recent_self_monitoring", None),
+    ]
+    
+    return streamed_model_response(ParentDashboardResponse, sections)
 
 
 # ==========================================
 # URGENCY CALCULATION ENDPOINT
 # ==========================================
 
-@router.post("/calculate-urgency", response_model=UrgencyCalculationResponse)
-async def calculate_assignment_urgency(request: UrgencyCalculationRequest):
+@router.post(
+    "/calculate-urgency",
+    response_model=UrgencyCalculationResponse,
+    openapi_extra=json_body_openapi(URGENCY_REQUEST_ADAPTER),
+)
+async def calculate_assignment_urgency(
+    request: UrgencyCalculationRequest = Depends(json_body(URGENCY_REQUEST_ADAPTER)),
+):
     """Calculate urgency levels for multiple assignments."""
     # In production, fetch assignments and calculate
     return UrgencyCalculationResponse(
@@ -4,8 +4,9 @@ Author: artpromedia
 Date: 2025-11-23
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import TypeAdapter
 from typing import Dict, Any
 
 from db.database import get_db
@@ -13,25 +14,35 @@ from db.models.user import User
 from api.schemas.agent import (
     AgentInteraction,
     AgentResponse,
+    AGENT_RESPONSE_ADAPTER,
     AgentState,
     AdaptationRequest,
     AdaptationResponse,
     SessionSummary
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.dependencies.body import json_body, json_body_openapi
 from agents.agent_manager import agent_manager
 from core.logging import setup_logging
 
 router = APIRouter()
 logger = setup_logging(__name__)
 
+# Prebuilt validators for request bodies parsed straight from JSON bytes
+INTERACTION_ADAPTER = TypeAdapter(AgentInteraction)
+ADAPTATION_REQUEST_ADAPTER = TypeAdapter(AdaptationRequest)
 
-@router.post("/interact", response_model=AgentResponse)
+
+@router.post(
+    "/interact",
+    response_model=AgentResponse,
+    openapi_extra=json_body_openapi(INTERACTION_ADAPTER),
+)
 async def interact_with_virtual_brain(
-    interaction: AgentInteraction,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    interaction: AgentInteraction = Depends(json_body(INTERACTION_ADAPTER)),
 ):
     """
     Process an interaction with the learner's Virtual Brain
@@ -66,7 +77,10 @@ async def interact_with_virtual_brain(
             result
         )
         
-        return AgentResponse(**result)
+        return Response(
+            content=AGENT_RESPONSE_ADAPTER.dump_json(AGENT_RESPONSE_ADAPTER.validate_python(result)),
+            media_type="application/json",
+        )
         
     except Exception as e:
         logger.error(f"Error in Virtual Brain interaction: {str(e)}")
@@ -104,7 +118,7 @@ async def get_virtual_brain_state(
         return AgentState(
             brain_id=virtual_brain.id,
             learner_id=learner_id,
-            cognitive_state=virtual_brain.cognitive_state.dict(),
+            cognitive_state=virtual_brain.cognitive_state.model_dump(),
             performance_metrics=virtual_brain.performance_metrics,
             current_session=virtual_brain.current_session,
             initialized=virtual_brain.initialized
@@ -118,11 +132,15 @@ async def get_virtual_brain_state(
         )
 
 
-@router.post("/adapt-content", response_model=AdaptationResponse)
+@router.post(
+    "/adapt-content",
+    response_model=AdaptationResponse,
+    openapi_extra=json_body_openapi(ADAPTATION_REQUEST_ADAPTER),
+)
 async def adapt_content_for_learner(
-    request: AdaptationRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    request: AdaptationRequest = Depends(json_body(ADAPTATION_REQUEST_ADAPTER)),
 ):
     """
     Adapt content specifically for a learner using their Virtual Brain
@@ -228,7 +246,7 @@ async def get_learning_recommendations(
         # Generate recommendations based on current state
         from datetime import datetime
         recommendations = await virtual_brain._generate_recommendations(
-            virtual_brain.cognitive_state.dict(),
+            virtual_brain.cognitive_state.model_dump(),
             virtual_brain.performance_metrics
         )
         
@@ -5,10 +5,12 @@ Endpoints for visual supports, social stories, behavior tracking,
 communication profiles, and transition support.
 """
 
+from collections import Counter
 from datetime import datetime, date, timedelta
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from operator import attrgetter
+from typing import Any, Callable, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from pydantic import BaseModel, TypeAdapter
 
 from api.schemas.autism import (
     # Profile
@@ -30,6 +32,8 @@ from api.schemas.autism import (
     VisualScheduleUpdate,
     VisualScheduleResponse,
     MarkScheduleItemComplete,
+    SCHEDULE_ITEMS_ADAPTER,
+    ScheduleType,
     # Social Story
     SocialStoryCreate,
     SocialStoryUpdate,
@@ -58,6 +62,7 @@ from api.schemas.autism import (
     TokenBoardResponse,
     AwardTokenRequest,
     ResetTokenBoardRequest,
+    TokenHistoryEntry,
     # Transition
     TransitionSupportCreate,
     TransitionSupportUpdate,
@@ -70,9 +75,25 @@ from api.schemas.autism import (
     SocialInteractionLevel,
     ChangeFlexibility,
 )
+from api.dependencies.body import json_body, json_body_openapi
+from api.responses import list_response, model_response, msgpack_response, vary_on_accept, wants_msgpack
 
 router = APIRouter(prefix="/api/autism", tags=["Autism Support System"])
 
+# Prebuilt validators for large request bodies parsed straight from JSON bytes
+SOCIAL_STORY_ADAPTER = TypeAdapter(SocialStoryCreate)
+BEHAVIOR_INCIDENT_ADAPTER = TypeAdapter(BehaviorIncidentCreate)
+BEHAVIOR_PATTERN_ADAPTER = TypeAdapter(BehaviorPatternCreate)
+TRANSITION_SUPPORT_ADAPTER = TypeAdapter(TransitionSupportCreate)
+
+# Prebuilt serializers for list endpoints
+VISUAL_SUPPORTS_ADAPTER = TypeAdapter(list[VisualSupportResponse])
+VISUAL_SCHEDULES_ADAPTER = TypeAdapter(list[VisualScheduleResponse])
+SOCIAL_STORIES_ADAPTER = TypeAdapter(list[SocialStoryResponse])
+BEHAVIOR_PATTERNS_ADAPTER = TypeAdapter(list[BehaviorPatternResponse])
+TOKEN_BOARDS_ADAPTER = TypeAdapter(list[TokenBoardResponse])
+TRANSITION_SUPPORTS_ADAPTER = TypeAdapter(list[TransitionSupportResponse])
+
 
 # ==========================================
 # AUTISM PROFILE ENDPOINTS
@@ -81,7 +102,7 @@ router = APIRouter(prefix="/api/autism", tags=["Autism Support System"])
 @router.post("/profile", response_model=AutismProfileResponse)
 async def create_autism_profile(profile: AutismProfileCreate):
     """Create an autism profile for a learner."""
-    return AutismProfileResponse(
+    return model_response(AutismProfileResponse(
         id="autism_" + profile.learner_id,
         learner_id=profile.learner_id,
         diagnosis_date=profile.diagnosis_date,
@@ -108,7 +129,7 @@ async def create_autism_profile(profile: AutismProfileCreate):
         routine_preferences=profile.routine_preferences,
         sensory_profile_id=profile.sensory_profile_id,
         primary_sensory_needs=profile.primary_sensory_needs,
-        special_interests=[i.dict() for i in profile.special_interests] if profile.special_interests else None,
+        special_interests=[i.model_dump() for i in profile.special_interests] if profile.special_interests else None,
         common_triggers=profile.common_triggers,
         calming_strategies=profile.calming_strategies,
         reinforcers=profile.reinforcers,
@@ -121,7 +142,7 @@ async def create_autism_profile(profile: AutismProfileCreate):
         therapist_notes=profile.therapist_notes,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/profile/{learner_id}", response_model=AutismProfileResponse)
@@ -150,7 +171,7 @@ async def delete_autism_profile(learner_id: str):
 @router.post("/communication-profile", response_model=CommunicationProfileResponse)
 async def create_communication_profile(profile: CommunicationProfileCreate):
     """Create a detailed communication profile."""
-    return CommunicationProfileResponse(
+    return model_response(CommunicationProfileResponse(
         id="comm_" + profile.autism_profile_id,
         autism_profile_id=profile.autism_profile_id,
         primary_expressive_mode=profile.primary_expressive_mode,
@@ -186,7 +207,7 @@ async def create_communication_profile(profile: CommunicationProfileCreate):
         ineffective_approaches=profile.ineffective_approaches,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/communication-profile/{autism_profile_id}", response_model=CommunicationProfileResponse)
@@ -208,7 +229,7 @@ async def update_communication_profile(profile_id: str, updates: CommunicationPr
 @router.post("/visual-supports", response_model=VisualSupportResponse)
 async def create_visual_support(support: VisualSupportCreate):
     """Create a visual support."""
-    return VisualSupportResponse(
+    return model_response(VisualSupportResponse(
         id="vs_" + support.autism_profile_id + "_" + str(datetime.now().timestamp()),
         autism_profile_id=support.autism_profile_id,
         created_by_id=None,
@@ -233,7 +254,7 @@ async def create_visual_support(support: VisualSupportCreate):
         is_template=support.is_template,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/visual-supports/{autism_profile_id}", response_model=List[VisualSupportResponse])
@@ -243,7 +264,8 @@ async def get_visual_supports(
     is_active: bool = True,
 ):
     """Get all visual supports for a learner."""
-    return []
+    rows = []  # In production, fetch from database
+    return list_response(VISUAL_SUPPORTS_ADAPTER, [VisualSupportResponse.from_row(row) for row in rows])
 
 
 @router.get("/visual-support/{support_id}", response_model=VisualSupportResponse)
@@ -282,20 +304,20 @@ async def record_visual_support_usage(support_id: str, usage: RecordVisualSuppor
 @router.post("/schedules", response_model=VisualScheduleResponse)
 async def create_visual_schedule(schedule: VisualScheduleCreate):
     """Create a visual schedule."""
-    return VisualScheduleResponse(
+    return model_response(VisualScheduleResponse(
         id="sched_" + schedule.autism_profile_id + "_" + str(datetime.now().timestamp()),
         autism_profile_id=schedule.autism_profile_id,
         created_by_id=None,
         name=schedule.name,
         description=schedule.description,
         schedule_type=schedule.schedule_type,
-        items=[item.dict() for item in schedule.items],
+        items=SCHEDULE_ITEMS_ADAPTER.dump_python(schedule.items),
         display_format=schedule.display_format,
         show_times=schedule.show_times,
         show_checkboxes=schedule.show_checkboxes,
         image_size=schedule.image_size,
         color_coding=schedule.color_coding,
-        applicable_days=schedule.applicable_days,
+        applicable_days_mask=schedule.applicable_days_mask,
         start_time=schedule.start_time,
         end_time=schedule.end_time,
         is_active=schedule.is_active,
@@ -305,17 +327,18 @@ async def create_visual_schedule(schedule: VisualScheduleCreate):
         completion_rate=None,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/schedules/{autism_profile_id}", response_model=List[VisualScheduleResponse])
 async def get_visual_schedules(
     autism_profile_id: str,
-    schedule_type: Optional[str] = None,
+    schedule_type: Optional[ScheduleType] = None,
     is_active: bool = True,
 ):
     """Get all visual schedules for a learner."""
-    return []
+    rows = []  # In production, fetch from database
+    return list_response(VISUAL_SCHEDULES_ADAPTER, [VisualScheduleResponse.from_row(row) for row in rows])
 
 
 @router.get("/schedule/{schedule_id}", response_model=VisualScheduleResponse)
@@ -392,12 +415,18 @@ def validate_social_story_ratio(sentences: List[SocialStorySentence]) -> dict:
     return {**counts, "ratio_valid": ratio_valid}
 
 
-@router.post("/social-stories", response_model=SocialStoryResponse)
-async def create_social_story(story: SocialStoryCreate):
+@router.post(
+    "/social-stories",
+    response_model=SocialStoryResponse,
+    openapi_extra=json_body_openapi(SOCIAL_STORY_ADAPTER),
+)
+async def create_social_story(
+    story: SocialStoryCreate = Depends(json_body(SOCIAL_STORY_ADAPTER)),
+):
     """Create a social story."""
     ratio_info = validate_social_story_ratio(story.sentences)
     
-    return SocialStoryResponse(
+    return model_response(SocialStoryResponse(
         id="story_" + story.autism_profile_id + "_" + str(datetime.now().timestamp()),
         autism_profile_id=story.autism_profile_id,
         created_by_id=None,
@@ -405,7 +434,7 @@ async def create_social_story(story: SocialStoryCreate):
         topic=story.topic,
         target_situation=story.target_situation,
         target_behavior=story.target_behavior,
-        sentences=[s.dict() for s in story.sentences],
+        sentences=story.sentences,
         descriptive_count=ratio_info["descriptive"],
         perspective_count=ratio_info["perspective"],
         directive_count=ratio_info["directive"],
@@ -417,7 +446,7 @@ async def create_social_story(story: SocialStoryCreate):
         show_images=story.show_images,
         read_aloud=story.read_aloud,
         page_per_sentence=story.page_per_sentence,
-        comprehension_questions=[q.dict() for q in story.comprehension_questions] if story.comprehension_questions else None,
+        comprehension_questions=story.comprehension_questions or None,
         is_active=story.is_active,
         times_read=0,
         last_read_at=None,
@@ -430,17 +459,21 @@ async def create_social_story(story: SocialStoryCreate):
         is_template=story.is_template,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
-@router.get("/social-stories/{autism_profile_id}", response_model=List[SocialStoryResponse])
+@router.get(
+    "/social-stories/{autism_profile_id}",
+    response_model=List[SocialStoryResponse],
+)
 async def get_social_stories(
     autism_profile_id: str,
     topic: Optional[str] = None,
     is_active: bool = True,
 ):
-    """Get all social stories for a learner."""
-    return []
+    """Get all social stories for a learner (comprehension questions are on the detail route)."""
+    rows = []  # In production, fetch from database
+    return list_response(SOCIAL_STORIES_ADAPTER, [SocialStoryResponse.from_row(row) for row in rows], exclude={"__all__": {"comprehension_questions"}})
 
 
 @router.get("/social-story/{story_id}", response_model=SocialStoryResponse)
@@ -492,23 +525,43 @@ async def generate_social_story(request: AIGenerateSocialStoryRequest):
         ),
     ]
     
-    return AIGenerateSocialStoryResponse(
+    return model_response(AIGenerateSocialStoryResponse(
         title=f"Story About {request.topic}",
         sentences=sample_sentences,
         comprehension_questions=comprehension,
         ratio_valid=True,
         generation_notes="Generated with 4 descriptive/perspective sentences per 1 directive (4:1 ratio).",
-    )
+    ))
 
 
 # ==========================================
 # BEHAVIOR INCIDENT ENDPOINTS
 # ==========================================
 
-@router.post("/behavior-incidents", response_model=BehaviorIncidentResponse)
-async def create_behavior_incident(incident: BehaviorIncidentCreate):
+def _tally(rows: List[Any], key: Callable[[Any], Any]) -> Counter:
+    """Count incident rows by one column in a single pass."""
+    return Counter(map(key, rows))
+
+
+def _top_values(rows: List[Any], key: Callable[[Any], Any], label: str, limit: int = 10) -> List[dict]:
+    """Most frequent values of a column as `{label, count, percentage}` entries."""
+    scale = 100 / len(rows) if rows else 0.0
+    return [
+        {label: value, "count": count, "percentage": round(count * scale, 1)}
+        for value, count in _tally(rows, key).most_common(limit)
+    ]
+
+
+@router.post(
+    "/behavior-incidents",
+    response_model=BehaviorIncidentResponse,
+    openapi_extra=json_body_openapi(BEHAVIOR_INCIDENT_ADAPTER),
+)
+async def create_behavior_incident(
+    incident: BehaviorIncidentCreate = Depends(json_body(BEHAVIOR_INCIDENT_ADAPTER)),
+):
     """Record a behavior incident (ABC data)."""
-    return BehaviorIncidentResponse(
+    return model_response(BehaviorIncidentResponse(
         id="incident_" + str(datetime.now().timestamp()),
         autism_profile_id=incident.autism_profile_id,
         recorded_by_id=None,
@@ -537,11 +590,12 @@ async def create_behavior_incident(incident: BehaviorIncidentCreate):
         pattern_id=None,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/behavior-incidents/{autism_profile_id}", response_model=BehaviorIncidentListResponse)
 async def get_behavior_incidents(
+    request: Request,
     autism_profile_id: str,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
@@ -549,12 +603,16 @@ async def get_behavior_incidents(
     intensity: Optional[BehaviorIntensity] = None,
 ):
     """Get behavior incidents for a learner."""
-    return BehaviorIncidentListResponse(
-        incidents=[],
-        total=0,
-        function_breakdown={},
-        intensity_breakdown={},
+    rows = []  # In production, fetch from database
+    result = BehaviorIncidentListResponse(
+        incidents=[BehaviorIncidentResponse.from_row(row) for row in rows],
+        total=len(rows),
+        function_breakdown=_tally(rows, attrgetter("hypothesized_function")),
+        intensity_breakdown=_tally(rows, attrgetter("intensity")),
     )
+    if wants_msgpack(request):
+        return msgpack_response(result)
+    return vary_on_accept(model_response(result))
 
 
 @router.get("/behavior-incident/{incident_id}", response_model=BehaviorIncidentResponse)
@@ -579,10 +637,16 @@ async def delete_behavior_incident(incident_id: str):
 # BEHAVIOR PATTERN ENDPOINTS
 # ==========================================
 
-@router.post("/behavior-patterns", response_model=BehaviorPatternResponse)
-async def create_behavior_pattern(pattern: BehaviorPatternCreate):
+@router.post(
+    "/behavior-patterns",
+    response_model=BehaviorPatternResponse,
+    openapi_extra=json_body_openapi(BEHAVIOR_PATTERN_ADAPTER),
+)
+async def create_behavior_pattern(
+    pattern: BehaviorPatternCreate = Depends(json_body(BEHAVIOR_PATTERN_ADAPTER)),
+):
     """Create a behavior pattern from analyzed incidents."""
-    return BehaviorPatternResponse(
+    return model_response(BehaviorPatternResponse(
         id="pattern_" + str(datetime.now().timestamp()),
         autism_profile_id=pattern.autism_profile_id,
         pattern_name=pattern.pattern_name,
@@ -612,7 +676,7 @@ async def create_behavior_pattern(pattern: BehaviorPatternCreate):
         intervention_start_date=pattern.intervention_start_date,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.get("/behavior-patterns/{autism_profile_id}", response_model=List[BehaviorPatternResponse])
@@ -622,7 +686,8 @@ async def get_behavior_patterns(
     is_active: bool = True,
 ):
     """Get behavior patterns for a learner."""
-    return []
+    rows = []  # In production, fetch from database
+    return list_response(BEHAVIOR_PATTERNS_ADAPTER, [BehaviorPatternResponse.from_row(row) for row in rows])
 
 
 @router.get("/behavior-pattern/{pattern_id}", response_model=BehaviorPatternResponse)
@@ -640,28 +705,24 @@ async def update_behavior_pattern(pattern_id: str, updates: BehaviorPatternUpdat
 @router.post("/behavior-patterns/analyze", response_model=BehaviorFunctionAnalysisResponse)
 async def analyze_behavior_function(request: BehaviorFunctionAnalysisRequest):
     """Analyze behavior incidents to identify function."""
-    # In production, analyze actual incidents
-    return BehaviorFunctionAnalysisResponse(
-        total_incidents=0,
-        function_breakdown={
-            "ATTENTION": 0,
-            "ESCAPE": 0,
-            "TANGIBLE": 0,
-            "SENSORY": 0,
-            "UNKNOWN": 0,
-        },
-        most_likely_function=BehaviorFunction.UNKNOWN,
-        confidence=0.0,
-        common_antecedents=[],
-        common_settings=[],
-        common_times=[],
+    rows = []  # In production, load the incidents in request.incident_ids
+    functions = _tally(rows, attrgetter("hypothesized_function"))
+    most_likely, top_count = functions.most_common(1)[0] if rows else (BehaviorFunction.UNKNOWN, 0)
+    return model_response(BehaviorFunctionAnalysisResponse(
+        total_incidents=len(rows),
+        function_breakdown=dict.fromkeys(BehaviorFunction, 0) | functions,
+        most_likely_function=most_likely,
+        confidence=round(top_count / len(rows), 2) if rows else 0.0,
+        common_antecedents=_top_values(rows, attrgetter("antecedent"), "antecedent"),
+        common_settings=_top_values(rows, attrgetter("location"), "setting"),
+        common_times=_top_values(rows, lambda row: row.incident_time.hour, "hour"),
         recommendations=[
             "Collect more ABC data to identify patterns",
             "Consider environmental modifications",
             "Develop replacement behaviors",
         ],
         suggested_pattern=None,
-    )
+    ))
 
 
 # ==========================================
@@ -671,7 +732,7 @@ async def analyze_behavior_function(request: BehaviorFunctionAnalysisRequest):
 @router.post("/token-boards", response_model=TokenBoardResponse)
 async def create_token_board(board: TokenBoardCreate):
     """Create a token board."""
-    return TokenBoardResponse(
+    return model_response(TokenBoardResponse(
         id="token_" + board.autism_profile_id + "_" + str(datetime.now().timestamp()),
         autism_profile_id=board.autism_profile_id,
         name=board.name,
@@ -696,13 +757,17 @@ async def create_token_board(board: TokenBoardCreate):
         is_active=True,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
-@router.get("/token-boards/{autism_profile_id}", response_model=List[TokenBoardResponse])
+@router.get(
+    "/token-boards/{autism_profile_id}",
+    response_model=List[TokenBoardResponse],
+)
 async def get_token_boards(autism_profile_id: str, is_active: bool = True):
-    """Get all token boards for a learner."""
-    return []
+    """Get all token boards for a learner (token history is on the detail route)."""
+    rows = []  # In production, fetch from database
+    return list_response(TOKEN_BOARDS_ADAPTER, [TokenBoardResponse.from_row(row) for row in rows], exclude={"__all__": {"token_history"}})
 
 
 @router.get("/token-board/{board_id}", response_model=TokenBoardResponse)
@@ -727,7 +792,7 @@ async def delete_token_board(board_id: str):
 async def award_token(board_id: str, award: AwardTokenRequest):
     """Award tokens on a token board."""
     # In production, update database and check if reward earned
-    return TokenBoardResponse(
+    return model_response(TokenBoardResponse(
         id=board_id,
         autism_profile_id="placeholder",
         name="Sample Board",
@@ -745,19 +810,19 @@ async def award_token(board_id: str, award: AwardTokenRequest):
         token_value=1,
         reset_frequency="session",
         last_reset_at=None,
-        token_history=[{
-            "earned_at": datetime.now().isoformat(),
-            "criterion": award.criterion,
-            "awarded_by": award.awarded_by,
-            "notes": award.notes,
-        }],
+        token_history=[TokenHistoryEntry(
+            earned_at=datetime.now(),
+            criterion=award.criterion,
+            awarded_by=award.awarded_by,
+            notes=award.notes,
+        )],
         times_completed=0,
         total_tokens_earned=award.token_count,
         average_to_completion=None,
         is_active=True,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
 @router.post("/token-board/{board_id}/reset")
@@ -774,10 +839,16 @@ async def reset_token_board(board_id: str, reset: ResetTokenBoardRequest):
 # TRANSITION SUPPORT ENDPOINTS
 # ==========================================
 
-@router.post("/transitions", response_model=TransitionSupportResponse)
-async def create_transition_support(transition: TransitionSupportCreate):
+@router.post(
+    "/transitions",
+    response_model=TransitionSupportResponse,
+    openapi_extra=json_body_openapi(TRANSITION_SUPPORT_ADAPTER),
+)
+async def create_transition_support(
+    transition: TransitionSupportCreate = Depends(json_body(TRANSITION_SUPPORT_ADAPTER)),
+):
     """Create a transition support."""
-    return TransitionSupportResponse(
+    return model_response(TransitionSupportResponse(
         id="trans_" + transition.autism_profile_id + "_" + str(datetime.now().timestamp()),
         autism_profile_id=transition.autism_profile_id,
         name=transition.name,
@@ -794,7 +865,7 @@ async def create_transition_support(transition: TransitionSupportCreate):
         uses_countdown=transition.uses_countdown,
         linked_visual_support_id=transition.linked_visual_support_id,
         linked_social_story_id=transition.linked_social_story_id,
-        transition_steps=[s.dict() for s in transition.transition_steps] if transition.transition_steps else None,
+        transition_steps=transition.transition_steps or None,
         sensory_supports_before=transition.sensory_supports_before,
         sensory_supports_after=transition.sensory_supports_after,
         uses_reinforcement=transition.uses_reinforcement,
@@ -806,17 +877,21 @@ async def create_transition_support(transition: TransitionSupportCreate):
         is_active=True,
         created_at=datetime.now(),
         updated_at=datetime.now(),
-    )
+    ))
 
 
-@router.get("/transitions/{autism_profile_id}", response_model=List[TransitionSupportResponse])
+@router.get(
+    "/transitions/{autism_profile_id}",
+    response_model=List[TransitionSupportResponse],
+)
 async def get_transition_supports(
     autism_profile_id: str,
     difficulty: Optional[TransitionDifficulty] = None,
     is_active: bool = True,
 ):
-    """Get all transition supports for a learner."""
-    return []
+    """Get all transition supports for a learner (steps are on the detail route)."""
+    rows = []  # In production, fetch from database
+    return list_response(TRANSITION_SUPPORTS_ADAPTER, [TransitionSupportResponse.from_row(row) for row in rows], exclude={"__all__": {"transition_steps"}})
 
 
 @router.get("/transition/{transition_id}", response_model=TransitionSupportResponse)
@@ -4,8 +4,11 @@ Structured literacy instruction based on Orton-Gillingham principles
 """
 
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from prisma import Prisma
 
 from ..schemas.dyslexia import (
@@ -16,7 +19,7 @@ from ..schemas.dyslexia import (
     # Phonics
     PhonicsSkillCreate, PhonicsSkillUpdate, PhonicsSkillResponse,
     # Decoding
-    DecodingSessionCreate, DecodingSessionResponse,
+    DecodingSessionCreate, DecodingSessionResponse, WordAttempt,
     # Sight Words
     SightWordProgressCreate, SightWordProgressUpdate, SightWordProgressResponse,
     # Fluency
@@ -37,12 +40,46 @@ from ..schemas.dyslexia import (
     PhonicsCategory, SensoryModality, DyslexiaLessonType,
     PhonicsMasteryLevel, PhonologicalSkillType, ComprehensionSkillType,
     # OG Sequence
-    OG_SCOPE_AND_SEQUENCE
+    OG_SCOPE_AND_SEQUENCE,
+    OG_SCOPE_AND_SEQUENCE_JSON,
 )
+from ..dependencies.body import json_body, json_body_openapi
+from ..responses import msgpack_response, rows_response, spliced_model_response, vary_on_accept, wants_msgpack
 
 router = APIRouter(prefix="/dyslexia", tags=["Dyslexia Intervention"])
 prisma = Prisma()
 
+# Decoding sessions carry long word-attempt lists; validate them from the raw bytes
+DECODING_SESSION_ADAPTER = TypeAdapter(DecodingSessionCreate)
+WORD_ATTEMPTS_ADAPTER = TypeAdapter(List[WordAttempt])
+
+# Prebuilt list adapters: rows are validated and serialized in one pass each
+PHONOLOGICAL_SKILLS_ADAPTER = TypeAdapter(List[PhonologicalSkillResponse])
+PHONICS_SKILLS_ADAPTER = TypeAdapter(List[PhonicsSkillResponse])
+DECODING_SESSIONS_ADAPTER = TypeAdapter(List[DecodingSessionResponse])
+FLUENCY_ASSESSMENTS_ADAPTER = TypeAdapter(List[FluencyAssessmentResponse])
+COMPREHENSION_SKILLS_ADAPTER = TypeAdapter(List[ComprehensionSkillResponse])
+SPELLING_PATTERNS_ADAPTER = TypeAdapter(List[SpellingPatternResponse])
+DYSLEXIA_LESSONS_ADAPTER = TypeAdapter(List[DyslexiaLessonResponse])
+MULTISENSORY_ACTIVITIES_ADAPTER = TypeAdapter(List[MultisensoryActivityResponse])
+PARENT_DYSLEXIA_SUPPORTS_ADAPTER = TypeAdapter(List[ParentDyslexiaSupportResponse])
+
+# Phonics category stored for each Orton-Gillingham level
+OG_LEVEL_CATEGORIES = {
+    1: PhonicsCategory.SINGLE_CONSONANTS.value,
+    2: PhonicsCategory.CONSONANT_DIGRAPHS.value,
+    3: PhonicsCategory.CONSONANT_BLENDS.value,
+    4: PhonicsCategory.LONG_VOWELS_CVCe.value,
+    5: PhonicsCategory.VOWEL_TEAMS.value,
+    6: PhonicsCategory.DIPHTHONGS.value,
+    7: PhonicsCategory.R_CONTROLLED_VOWELS.value,
+    8: PhonicsCategory.COMPLEX_CONSONANTS.value,
+    9: PhonicsCategory.ADVANCED_VOWELS.value,
+    10: PhonicsCategory.MULTISYLLABIC.value,
+    11: PhonicsCategory.MULTISYLLABIC.value,
+    12: PhonicsCategory.MORPHOLOGY.value,
+}
+
 
 # ==========================================
 # DYSLEXIA PROFILE ENDPOINTS
@@ -185,7 +222,7 @@ async def get_phonological_skills(learner_id: str):
         where={"learnerId": learner_id},
         order_by={"skillType": "asc"}
     )
-    return skills
+    return rows_response(PHONOLOGICAL_SKILLS_ADAPTER, skills)
 
 
 @router.patch("/phonological-skills/{skill_id}", response_model=PhonologicalSkillResponse)
@@ -290,7 +327,7 @@ async def get_phonics_skills(
         where=where_clause,
         order_by=[{"level": "asc"}, {"pattern": "asc"}]
     )
-    return skills
+    return rows_response(PHONICS_SKILLS_ADAPTER, skills)
 
 
 @router.patch("/phonics-skills/{skill_id}", response_model=PhonicsSkillResponse)
@@ -331,22 +368,6 @@ async def initialize_og_sequence(learner_id: str, up_to_level: int = 12):
         if og_level.level > up_to_level:
             break
             
-        # Determine category based on level
-        category_map = {
-            1: PhonicsCategory.SINGLE_CONSONANTS,
-            2: PhonicsCategory.CONSONANT_DIGRAPHS,
-            3: PhonicsCategory.CONSONANT_BLENDS,
-            4: PhonicsCategory.LONG_VOWELS_CVCe,
-            5: PhonicsCategory.VOWEL_TEAMS,
-            6: PhonicsCategory.DIPHTHONGS,
-            7: PhonicsCategory.R_CONTROLLED_VOWELS,
-            8: PhonicsCategory.COMPLEX_CONSONANTS,
-            9: PhonicsCategory.ADVANCED_VOWELS,
-            10: PhonicsCategory.MULTISYLLABIC,
-            11: PhonicsCategory.MULTISYLLABIC,
-            12: PhonicsCategory.MORPHOLOGY,
-        }
-        
         for i, pattern in enumerate(og_level.patterns):
             skill = await prisma.phonicsskill.upsert(
                 where={
@@ -357,7 +378,7 @@ async def initialize_og_sequence(learner_id: str, up_to_level: int = 12):
                 },
                 create={
                     "learnerId": learner_id,
-                    "category": category_map[og_level.level].value,
+                    "category": OG_LEVEL_CATEGORIES[og_level.level],
                     "level": og_level.level,
                     "pattern": pattern,
                     "patternName": f"{og_level.name} - {pattern}",
@@ -375,8 +396,14 @@ async def initialize_og_sequence(learner_id: str, up_to_level: int = 12):
 # DECODING SESSION ENDPOINTS
 # ==========================================
 
-@router.post("/decoding-sessions", response_model=DecodingSessionResponse)
-async def create_decoding_session(data: DecodingSessionCreate):
+@router.post(
+    "/decoding-sessions",
+    response_model=DecodingSessionResponse,
+    openapi_extra=json_body_openapi(DECODING_SESSION_ADAPTER),
+)
+async def create_decoding_session(
+    data: DecodingSessionCreate = Depends(json_body(DECODING_SESSION_ADAPTER)),
+):
     """Log a decoding practice session"""
     session = await prisma.decodingsession.create(
         data={
@@ -384,7 +411,7 @@ async def create_decoding_session(data: DecodingSessionCreate):
             "sessionDate": data.session_date or datetime.now(),
             "durationMinutes": data.duration_minutes,
             "wordListType": data.word_list_type,
-            "wordsAttempted": [w.model_dump() for w in data.words_attempted],
+            "wordsAttempted": WORD_ATTEMPTS_ADAPTER.dump_python(data.words_attempted),
             "totalWords": data.total_words,
             "correctWords": data.correct_words,
             "accuracy": data.accuracy,
@@ -401,6 +428,7 @@ async def create_decoding_session(data: DecodingSessionCreate):
 
 @router.get("/decoding-sessions/{learner_id}", response_model=List[DecodingSessionResponse])
 async def get_decoding_sessions(
+    request: Request,
     learner_id: str,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0)
@@ -412,7 +440,9 @@ async def get_decoding_sessions(
         take=limit,
         skip=offset
     )
-    return sessions
+    if wants_msgpack(request):
+        return msgpack_response(DECODING_SESSIONS_ADAPTER.validate_python(sessions, from_attributes=True))
+    return vary_on_accept(rows_response(DECODING_SESSIONS_ADAPTER, sessions))
 
 
 @router.get("/decoding-sessions/{learner_id}/analytics")
@@ -442,7 +472,9 @@ async def get_decoding_analytics(learner_id: str, days: int = 30):
             for error_type, count in session.errorTypes.items():
                 error_totals[error_type] = error_totals.get(error_type, 0) + count
     
-    return {
+    # Returned directly so orjson writes the session datetimes itself,
+    # without a jsonable_encoder pass
+    return ORJSONResponse({
         "period_days": days,
         "total_sessions": len(sessions),
         "total_words_practiced": total_words,
@@ -450,10 +482,10 @@ async def get_decoding_analytics(learner_id: str, days: int = 30):
         "average_accuracy": round(avg_accuracy * 100, 1),
         "error_breakdown": error_totals,
         "accuracy_trend": [
-            {"date": s.sessionDate.isoformat(), "accuracy": s.accuracy}
+            {"date": s.sessionDate, "accuracy": s.accuracy}
             for s in sessions
         ]
-    }
+    })
 
 
 # ==========================================
@@ -571,7 +603,7 @@ async def get_fluency_assessments(
         order_by={"assessmentDate": "desc"},
         take=limit
     )
-    return assessments
+    return rows_response(FLUENCY_ASSESSMENTS_ADAPTER, assessments)
 
 
 @router.get("/fluency-assessments/{learner_id}/trends")
@@ -586,17 +618,17 @@ async def get_fluency_trends(learner_id: str):
         return {"message": "No assessments found", "data": None}
     
     wcpm_trend = [
-        {"date": a.assessmentDate.isoformat(), "wcpm": a.wordsCorrectPerMinute}
+        {"date": a.assessmentDate, "wcpm": a.wordsCorrectPerMinute}
         for a in assessments
     ]
     
     accuracy_trend = [
-        {"date": a.assessmentDate.isoformat(), "accuracy": a.accuracy}
+        {"date": a.assessmentDate, "accuracy": a.accuracy}
         for a in assessments
     ]
     
     prosody_trend = [
-        {"date": a.assessmentDate.isoformat(), "prosody": a.prosodyTotal}
+        {"date": a.assessmentDate, "prosody": a.prosodyTotal}
         for a in assessments if a.prosodyTotal
     ]
     
@@ -610,7 +642,7 @@ async def get_fluency_trends(learner_id: str):
         wcpm_growth = 0
         wcpm_growth_percent = 0
     
-    return {
+    return ORJSONResponse({
         "total_assessments": len(assessments),
         "latest_wcpm": assessments[-1].wordsCorrectPerMinute if assessments else None,
         "wcpm_growth": round(wcpm_growth, 1),
@@ -618,7 +650,7 @@ async def get_fluency_trends(learner_id: str):
         "wcpm_trend": wcpm_trend,
         "accuracy_trend": accuracy_trend,
         "prosody_trend": prosody_trend
-    }
+    })
 
 
 # ==========================================
@@ -661,7 +693,7 @@ async def get_comprehension_skills(learner_id: str):
         where={"learnerId": learner_id},
         order_by={"skillType": "asc"}
     )
-    return skills
+    return rows_response(COMPREHENSION_SKILLS_ADAPTER, skills)
 
 
 @router.patch("/comprehension-skills/{skill_id}", response_model=ComprehensionSkillResponse)
@@ -763,7 +795,7 @@ async def get_spelling_patterns(
         where=where_clause,
         order_by={"pattern": "asc"}
     )
-    return patterns
+    return rows_response(SPELLING_PATTERNS_ADAPTER, patterns)
 
 
 @router.patch("/spelling-patterns/{pattern_id}", response_model=SpellingPatternResponse)
@@ -844,7 +876,7 @@ async def get_dyslexia_lessons(
         take=limit,
         skip=offset
     )
-    return lessons
+    return rows_response(DYSLEXIA_LESSONS_ADAPTER, lessons)
 
 
 @router.get("/lessons/{learner_id}/recent-focus")
@@ -937,7 +969,7 @@ async def get_multisensory_activities(
         order_by={"usageCount": "desc"},
         take=limit
     )
-    return activities
+    return rows_response(MULTISENSORY_ACTIVITIES_ADAPTER, activities)
 
 
 @router.get("/activities/{activity_id}", response_model=MultisensoryActivityResponse)
@@ -1064,7 +1096,7 @@ async def get_parent_support_logs(
         take=limit,
         skip=offset
     )
-    return logs
+    return rows_response(PARENT_DYSLEXIA_SUPPORTS_ADAPTER, logs)
 
 
 @router.get("/parent-support/{learner_id}/summary")
@@ -1107,6 +1139,20 @@ async def get_parent_support_summary(learner_id: str, days: int = 30):
 # DASHBOARD & ANALYTICS ENDPOINTS
 # ==========================================
 
+# Mastery levels counted as mastered on the dashboard
+MASTERED_LEVELS = frozenset({"MASTERED", "AUTOMATICITY"})
+
+
+def _mastered_count(skills: list) -> int:
+    """Number of skill rows at a mastered level"""
+    return sum(skill.masteryLevel in MASTERED_LEVELS for skill in skills)
+
+
+def _mean(rows: list, field: str) -> float:
+    """Average of one numeric column over the rows, 0 when there are none"""
+    return sum(map(attrgetter(field), rows)) / len(rows) if rows else 0
+
+
 @router.get("/dashboard/{learner_id}", response_model=DyslexiaDashboardData)
 async def get_dyslexia_dashboard(learner_id: str):
     """Get comprehensive dashboard data for a learner"""
@@ -1169,15 +1215,15 @@ async def get_dyslexia_dashboard(learner_id: str):
     )
     
     # Build summary
-    phonological_mastered = len([s for s in phonological_skills if s.masteryLevel in ["MASTERED", "AUTOMATICITY"]])
-    phonics_mastered = len([s for s in phonics_skills if s.masteryLevel in ["MASTERED", "AUTOMATICITY"]])
-    comprehension_mastered = len([s for s in comprehension_skills if s.masteryLevel in ["MASTERED", "AUTOMATICITY"]])
+    phonological_mastered = _mastered_count(phonological_skills)
+    phonics_mastered = _mastered_count(phonics_skills)
+    comprehension_mastered = _mastered_count(comprehension_skills)
     
     # Calculate averages
-    phonological_avg = sum(s.accuracyPercent for s in phonological_skills) / len(phonological_skills) if phonological_skills else 0
-    phonics_reading_avg = sum(s.readingAccuracy for s in phonics_skills) / len(phonics_skills) if phonics_skills else 0
-    phonics_spelling_avg = sum(s.spellingAccuracy for s in phonics_skills) / len(phonics_skills) if phonics_skills else 0
-    comprehension_avg = sum(s.accuracyPercent for s in comprehension_skills) / len(comprehension_skills) if comprehension_skills else 0
+    phonological_avg = _mean(phonological_skills, "accuracyPercent")
+    phonics_reading_avg = _mean(phonics_skills, "readingAccuracy")
+    phonics_spelling_avg = _mean(phonics_skills, "spellingAccuracy")
+    comprehension_avg = _mean(comprehension_skills, "accuracyPercent")
     
     # Fluency trend
     fluency_trend = None
@@ -1193,7 +1239,7 @@ async def get_dyslexia_dashboard(learner_id: str):
     
     # Lessons this week
     week_ago = datetime.now() - timedelta(days=7)
-    lessons_this_week = len([l for l in recent_lessons if l.lessonDate >= week_ago])
+    lessons_this_week = sum(l.lessonDate >= week_ago for l in recent_lessons)
     
     summary = DyslexiaProgressSummary(
         learner_id=learner_id,
@@ -1220,18 +1266,20 @@ async def get_dyslexia_dashboard(learner_id: str):
         last_session_date=recent_lessons[0].lessonDate if recent_lessons else None
     )
     
-    return DyslexiaDashboardData(
-        summary=summary,
-        recent_lessons=recent_lessons,
-        recent_decoding_sessions=recent_decoding,
-        recent_fluency_assessments=fluency_assessments,
-        phonics_progression=phonics_skills,
-        recommended_activities=recommended_activities,
-        og_scope_sequence=OG_SCOPE_AND_SEQUENCE
+    return spliced_model_response(
+        DyslexiaDashboardData(
+            summary=summary,
+            recent_lessons=recent_lessons,
+            recent_decoding_sessions=recent_decoding,
+            recent_fluency_assessments=fluency_assessments,
+            phonics_progression=phonics_skills,
+            recommended_activities=recommended_activities,
+        ),
+        {"og_scope_sequence": OG_SCOPE_AND_SEQUENCE_JSON},
     )
 
 
 @router.get("/og-scope-sequence")
 async def get_og_scope_sequence():
     """Get the complete Orton-Gillingham scope and sequence"""
-    return OG_SCOPE_AND_SEQUENCE
+    return Response(content=OG_SCOPE_AND_SEQUENCE_JSON, media_type="application/json")
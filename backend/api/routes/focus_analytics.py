@@ -6,7 +6,7 @@ Only receives aggregated metrics - no raw interaction data.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -61,8 +61,8 @@ class FocusMetricsSubmission(BaseModel):
     # Timestamp
     submitted_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "learner_id": "learner-123",
                 "session_id": "session-456",
@@ -76,6 +76,7 @@ class FocusMetricsSubmission(BaseModel):
                 "active_minutes": 38
             }
         }
+    )
 
 
 class FocusBreakCompleted(BaseModel):
@@ -95,8 +96,8 @@ class FocusBreakCompleted(BaseModel):
     # Timestamp
     completed_at: datetime = Field(default_factory=datetime.utcnow)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "learner_id": "learner-123",
                 "game_type": "memory",
@@ -107,6 +108,7 @@ class FocusBreakCompleted(BaseModel):
                 "session_id": "session-456"
             }
         }
+    )
 
 
 class FocusInsight(BaseModel):
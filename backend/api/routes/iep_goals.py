@@ -6,7 +6,7 @@ Supports role-based access for teachers, parents, and therapists.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -166,8 +166,8 @@ class IEPGoalResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "goal-123",
                 "learner_id": "learner-456",
@@ -185,6 +185,7 @@ class IEPGoalResponse(BaseModel):
                 "review_date": "2025-12-01T00:00:00Z"
             }
         }
+    )
 
 
 class IEPGoalsListResponse(BaseModel):
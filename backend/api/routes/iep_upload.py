@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, BackgroundTasks, Query
 from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 import logging
 import asyncio
 
@@ -34,6 +35,7 @@ from ..schemas.iep_upload import (
     ApprovalRequest,
     ApprovalResponse,
 )
+from ..responses import fields_response, list_response, model_response, rows_response
 
 # Import services
 from services.storage.s3_client import storage_client
@@ -47,6 +49,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/iep", tags=["IEP Upload & Extraction"])
 
+# Prebuilt list serializers for the document, extraction and template lists
+IEP_DOCUMENT_SUMMARIES_ADAPTER = TypeAdapter(List[IEPDocumentSummary])
+EXTRACTED_GOALS_ADAPTER = TypeAdapter(List[ExtractedGoalResponse])
+EXTRACTED_SERVICES_ADAPTER = TypeAdapter(List[ExtractedServiceResponse])
+EXTRACTED_ACCOMMODATIONS_ADAPTER = TypeAdapter(List[ExtractedAccommodationResponse])
+EXTRACTED_PRESENT_LEVELS_ADAPTER = TypeAdapter(List[ExtractedPresentLevelResponse])
+GOAL_TEMPLATES_ADAPTER = TypeAdapter(List[GoalTemplateResponse])
+
 
 async def get_repository():
     """Dependency to get IEP repository with session."""
@@ -222,31 +232,15 @@ async def list_learner_documents(
     Optionally filter by status.
     """
     status_str = status.value if status else None
-    documents = await repo.get_documents_by_learner(
+    rows = await repo.get_document_summaries_by_learner(
         learner_id, status=status_str, limit=limit, offset=offset
     )
     
-    result = []
-    for doc in documents:
-        # Get extraction counts
-        goals = await repo.get_extracted_goals(doc["id"])
-        services = await repo.get_extracted_services(doc["id"])
-        accommodations = await repo.get_extracted_accommodations(doc["id"])
-        present_levels = await repo.get_extracted_present_levels(doc["id"])
-        
-        result.append(IEPDocumentSummary(
-            id=doc["id"],
-            file_name=doc["fileName"],
-            status=IEPDocumentStatus(doc["status"]),
-            uploaded_at=doc["uploadedAt"],
-            ocr_confidence=doc.get("ocrConfidence"),
-            goal_count=len(goals),
-            service_count=len(services),
-            accommodation_count=len(accommodations),
-            present_level_count=len(present_levels),
-        ))
+    # Rows come straight from the database, so the summaries are built
+    # without re-validating them
+    result = [IEPDocumentSummary.model_construct(**row) for row in rows]
     
-    return result
+    return list_response(IEP_DOCUMENT_SUMMARIES_ADAPTER, result)
 
 
 @router.get("/documents/{doc_id}/status", response_model=ProcessingStatus)
@@ -296,7 +290,7 @@ async def get_document_status(
         current_step = "Failed"
         progress = 0
     
-    return ProcessingStatus(
+    return model_response(ProcessingStatus(
         document_id=doc_id,
         status=IEPDocumentStatus(status),
         virus_scan_status=VirusScanStatus(virus_status),
@@ -306,7 +300,7 @@ async def get_document_status(
         steps_remaining=steps_remaining,
         estimated_time_remaining=max(0, (100 - progress) // 2),  # Rough estimate
         error_message=doc.get("processingError"),
-    )
+    ))
 
 
 @router.get("/documents/{doc_id}/extracted", response_model=FullExtractionResponse)
@@ -327,12 +321,38 @@ async def get_extracted_data(
     accommodations = await repo.get_extracted_accommodations(doc_id)
     present_levels = await repo.get_extracted_present_levels(doc_id)
     
-    return FullExtractionResponse(
-        document_id=doc_id,
-        goals=[ExtractedGoalResponse(**g) for g in goals],
-        services=[ExtractedServiceResponse(**s) for s in services],
-        accommodations=[ExtractedAccommodationResponse(**a) for a in accommodations],
-        present_levels=[ExtractedPresentLevelResponse(**p) for p in present_levels],
+    return fields_response(FullExtractionResponse, [
+        ("document", IEPDocumentResponse.model_validate(doc)),
+        ("goals", EXTRACTED_GOALS_ADAPTER.validate_python(goals)),
+        ("services", EXTRACTED_SERVICES_ADAPTER.validate_python(services)),
+        ("accommodations", EXTRACTED_ACCOMMODATIONS_ADAPTER.validate_python(accommodations)),
+        ("present_levels", EXTRACTED_PRESENT_LEVELS_ADAPTER.validate_python(present_levels)),
+        ("extraction_summary", _summarize_extraction(goals, services, accommodations, present_levels).model_dump()),
+    ])
+
+
+def _summarize_extraction(
+    goals: List[dict],
+    services: List[dict],
+    accommodations: List[dict],
+    present_levels: List[dict],
+) -> ExtractionSummary:
+    """Counts and confidence statistics over a document's extracted items"""
+    all_items = goals + services + accommodations + present_levels
+    confidences = [item.get("confidence", 0) for item in all_items]
+    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+    low_confidence_count = sum(1 for c in confidences if c < 80)
+    verified_count = sum(1 for item in all_items if item.get("isVerified", False))
+    
+    return ExtractionSummary(
+        total_goals=len(goals),
+        total_services=len(services),
+        total_accommodations=len(accommodations),
+        total_present_levels=len(present_levels),
+        average_confidence=avg_confidence,
+        low_confidence_items=low_confidence_count,
+        verified_items=verified_count,
+        pending_review=len(all_items) - verified_count
     )
 
 
@@ -353,22 +373,7 @@ async def get_extraction_summary(
     accommodations = await repo.get_extracted_accommodations(doc_id)
     present_levels = await repo.get_extracted_present_levels(doc_id)
     
-    all_items = goals + services + accommodations + present_levels
-    confidences = [item.get("confidence", 0) for item in all_items]
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-    low_confidence_count = sum(1 for c in confidences if c < 80)
-    verified_count = sum(1 for item in all_items if item.get("isVerified", False))
-    
-    return ExtractionSummary(
-        total_goals=len(goals),
-        total_services=len(services),
-        total_accommodations=len(accommodations),
-        total_present_levels=len(present_levels),
-        average_confidence=avg_confidence,
-        low_confidence_items=low_confidence_count,
-        verified_items=verified_count,
-        pending_review=len(all_items) - verified_count
-    )
+    return _summarize_extraction(goals, services, accommodations, present_levels)
 
 
 # ==========================================
@@ -386,7 +391,7 @@ async def list_extracted_goals(
     List all extracted goals from a document.
     """
     goals = await repo.get_extracted_goals(doc_id, verified_only, min_confidence)
-    return [ExtractedGoalResponse(**g) for g in goals]
+    return rows_response(EXTRACTED_GOALS_ADAPTER, goals)
 
 
 @router.get("/documents/{doc_id}/goals/{goal_id}", response_model=ExtractedGoalResponse)
@@ -799,7 +804,7 @@ async def list_goal_templates(
     # Apply filters
     filtered = sample_templates
     if domain:
-        filtered = [t for t in filtered if t.domain.value == domain]
+        filtered = [t for t in filtered if t.domain == domain]
     if category:
         filtered = [t for t in filtered if t.category.lower() == category.lower()]
     if grade_level:
@@ -808,7 +813,7 @@ async def list_goal_templates(
         search_lower = search.lower()
         filtered = [t for t in filtered if search_lower in t.template_text.lower() or any(search_lower in tag for tag in t.tags)]
     
-    return filtered[offset:offset + limit]
+    return list_response(GOAL_TEMPLATES_ADAPTER, filtered[offset:offset + limit])
 
 
 @router.get("/templates/{template_id}", response_model=GoalTemplateResponse)
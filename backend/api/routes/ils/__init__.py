@@ -5,14 +5,17 @@ Author: artpromedia
 Date: 2025-11-29
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from api.dependencies.clock import pin_request_clock
 from .skills import router as skills_router
 from .progress import router as progress_router
 from .cbi import router as cbi_router
 from .goals import router as goals_router
 from .reports import router as reports_router
 
-router = APIRouter()
+# Date defaults and fallbacks read the clock once per request
+router = APIRouter(dependencies=[Depends(pin_request_clock)])
 
 # Include all sub-routers
 router.include_router(skills_router, prefix="/skills", tags=["ILS Skills"])
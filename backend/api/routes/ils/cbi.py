@@ -20,6 +20,7 @@ from api.schemas.ils import (
     CBIActivityCreate, CBIActivityUpdate, CBIActivityResponse,
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.responses import model_response
 from core.logging import setup_logging
 
 router = APIRouter()
@@ -77,12 +78,12 @@ async def get_learner_cbi_sessions(
                                if s.status == CBIStatus.COMPLETED 
                                and s.scheduled_date >= month_ago)
     
-    return CBIListResponse(
+    return model_response(CBIListResponse(
         sessions=sessions,
         total=len(sessions),
         upcoming=upcoming,
         completed_this_month=completed_this_month
-    )
+    ))
 
 
 @router.get("/{cbi_id}", response_model=CommunityBasedInstructionResponse)
@@ -20,6 +20,8 @@ from api.schemas.ils import (
     ProgressNote,
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.schemas.common import request_now
+from api.responses import model_response
 from core.logging import setup_logging
 
 router = APIRouter()
@@ -56,21 +58,23 @@ async def get_learner_goals(
     result = await db.execute(query)
     goals = result.scalars().all()
     
-    # Calculate stats
-    active = sum(1 for g in goals if g.status == ILSGoalStatus.ACTIVE)
-    achieved = sum(1 for g in goals if g.status == ILSGoalStatus.ACHIEVED)
-    
-    by_domain = {}
-    for g in goals:
-        by_domain[g.domain] = by_domain.get(g.domain, 0) + 1
-    
-    return ILSGoalListResponse(
+    # Stats are counted per domain in SQL over the same filters
+    stats = (await db.execute(
+        select(
+            ILSGoal.domain,
+            func.count(ILSGoal.id),
+            func.count(ILSGoal.id).filter(ILSGoal.status == ILSGoalStatus.ACTIVE),
+            func.count(ILSGoal.id).filter(ILSGoal.status == ILSGoalStatus.ACHIEVED),
+        ).where(query.whereclause).group_by(ILSGoal.domain)
+    )).all()
+    
+    return model_response(ILSGoalListResponse(
         goals=goals,
         total=len(goals),
-        active=active,
-        achieved=achieved,
-        by_domain=by_domain
-    )
+        active=sum(row[2] for row in stats),
+        achieved=sum(row[3] for row in stats),
+        by_domain={row[0]: row[1] for row in stats}
+    ))
 
 
 @router.get("/{goal_id}", response_model=ILSGoalResponse)
@@ -112,7 +116,7 @@ async def create_goal(
         domain=data.domain,
         goal_statement=data.goal_statement,
         rationale=data.rationale,
-        start_date=data.start_date or datetime.now(),
+        start_date=data.start_date or request_now(),
         target_date=data.target_date,
         baseline_description=data.baseline_description,
         baseline_date=data.baseline_date,
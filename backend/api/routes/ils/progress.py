@@ -7,8 +7,9 @@ Date: 2025-11-29
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_, desc
+from sqlalchemy import select, insert, func, and_, or_, desc
 from typing import List, Optional
+from pydantic import TypeAdapter
 from datetime import datetime, timedelta
 
 from db.database import get_db
@@ -18,16 +19,30 @@ from api.schemas.ils import (
     LearnerSkillProgressCreate, LearnerSkillProgressUpdate, LearnerSkillProgressResponse,
     LearnerSkillProgressListResponse,
     SkillDataPointCreate, SkillDataPointResponse, SkillDataPointListResponse,
+    StepDataEntry, EnvironmentalFactors,
     GeneralizationRecordCreate, GeneralizationRecordUpdate, GeneralizationRecordResponse,
     GeneralizationMatrixResponse,
     BulkSkillAssignRequest, BulkDataPointCreate,
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.dependencies.body import json_body, json_body_openapi
+from api.schemas.common import request_now
+from api.responses import model_response, rows_response
 from core.logging import setup_logging
 
 router = APIRouter()
 logger = setup_logging(__name__)
 
+SKILL_PROGRESS_ADAPTER = TypeAdapter(List[LearnerSkillProgressResponse])
+SKILL_DATA_POINTS_ADAPTER = TypeAdapter(List[SkillDataPointResponse])
+
+# Dump the nested data-point value objects into their JSON columns
+STEP_DATA_ADAPTER = TypeAdapter(List[StepDataEntry])
+ENVIRONMENTAL_FACTORS_ADAPTER = TypeAdapter(EnvironmentalFactors)
+
+# Bulk session bodies are parsed and validated from the raw bytes in one call
+BULK_DATA_POINTS_ADAPTER = TypeAdapter(BulkDataPointCreate)
+
 
 # ==========================================
 # LEARNER SKILL PROGRESS ENDPOINTS
@@ -61,22 +76,28 @@ async def get_learner_progress(
     result = await db.execute(query)
     progress_list = result.scalars().all()
     
-    # Calculate aggregations
+    # Count per (domain, mastery level) in SQL instead of loading every
+    # row's skill, then fold the few groups into the two breakdowns
+    counts = await db.execute(
+        select(FunctionalSkill.domain, LearnerSkillProgress.mastery_level, func.count(LearnerSkillProgress.id))
+        .select_from(LearnerSkillProgress)
+        .outerjoin(FunctionalSkill)
+        .where(query.whereclause)
+        .group_by(FunctionalSkill.domain, LearnerSkillProgress.mastery_level)
+    )
     by_domain = {}
     by_mastery = {}
-    for p in progress_list:
-        # Count by domain
-        skill_domain = p.skill.domain if p.skill else "UNKNOWN"
-        by_domain[skill_domain] = by_domain.get(skill_domain, 0) + 1
-        # Count by mastery level
-        by_mastery[p.mastery_level] = by_mastery.get(p.mastery_level, 0) + 1
-    
-    return LearnerSkillProgressListResponse(
+    for skill_domain, level, count in counts:
+        skill_domain = skill_domain or "UNKNOWN"
+        by_domain[skill_domain] = by_domain.get(skill_domain, 0) + count
+        by_mastery[level] = by_mastery.get(level, 0) + count
+    
+    return model_response(LearnerSkillProgressListResponse(
         progress=progress_list,
         total=len(progress_list),
         by_domain=by_domain,
         by_mastery_level=by_mastery
-    )
+    ))
 
 
 @router.get("/learner/{learner_id}/skill/{skill_id}", response_model=LearnerSkillProgressResponse)
@@ -163,32 +184,32 @@ async def bulk_assign_skills(
     if not await verify_learner_access(current_user, learner_id, db):
         raise HTTPException(status_code=403, detail="Access denied")
     
-    created = []
-    for skill_id in data.skill_ids:
-        # Skip if already assigned
-        existing = await db.execute(
-            select(LearnerSkillProgress).where(
-                LearnerSkillProgress.learner_id == learner_id,
-                LearnerSkillProgress.skill_id == skill_id
-            )
-        )
-        if existing.scalar_one_or_none():
-            continue
-        
-        db_progress = LearnerSkillProgress(
-            learner_id=learner_id,
-            skill_id=skill_id,
-            target_mastery_date=data.target_mastery_date,
+    # One lookup for the skills already assigned, one multi-row INSERT for
+    # the rest; RETURNING hands back the rows with their server defaults
+    existing = await db.execute(
+        select(LearnerSkillProgress.skill_id).where(
+            LearnerSkillProgress.learner_id == learner_id,
+            LearnerSkillProgress.skill_id.in_(data.skill_ids)
         )
-        db.add(db_progress)
-        created.append(db_progress)
+    )
+    assigned = set(existing.scalars())
+    new_skill_ids = [
+        skill_id for skill_id in dict.fromkeys(data.skill_ids) if skill_id not in assigned
+    ]
     
-    await db.commit()
-    for p in created:
-        await db.refresh(p)
+    created = []
+    if new_skill_ids:
+        created = (await db.scalars(
+            insert(LearnerSkillProgress).returning(LearnerSkillProgress),
+            [
+                {"learner_id": learner_id, "skill_id": skill_id, "target_mastery_date": data.target_mastery_date}
+                for skill_id in new_skill_ids
+            ],
+        )).all()
+        await db.commit()
     
     logger.info(f"Bulk assigned {len(created)} skills to learner {learner_id}")
-    return created
+    return rows_response(SKILL_PROGRESS_ADAPTER, created)
 
 
 @router.patch("/learner/{learner_id}/skill/{skill_id}", response_model=LearnerSkillProgressResponse)
@@ -298,14 +319,14 @@ async def get_learner_data_points(
     sessions_this_week = sum(1 for dp in data_points if dp.session_date >= week_ago)
     sessions_this_month = sum(1 for dp in data_points if dp.session_date >= month_ago)
     
-    return SkillDataPointListResponse(
+    return model_response(SkillDataPointListResponse(
         data_points=data_points,
         total=total,
         average_accuracy=avg_accuracy,
         average_independence=avg_independence,
         sessions_this_week=sessions_this_week,
         sessions_this_month=sessions_this_month
-    )
+    ))
 
 
 @router.post("/learner/{learner_id}/data-point", response_model=SkillDataPointResponse, status_code=status.HTTP_201_CREATED)
@@ -337,14 +358,14 @@ async def record_data_point(
     db_data_point = SkillDataPoint(
         skill_id=data.skill_id,
         learner_id=learner_id,
-        session_date=data.session_date or datetime.now(),
+        session_date=data.session_date or request_now(),
         setting=data.setting,
         duration=data.duration,
         instructor=data.instructor,
         collection_method=data.collection_method,
         steps_attempted=data.steps_attempted,
         steps_completed=data.steps_completed,
-        step_by_step_data=[s.model_dump() for s in data.step_by_step_data] if data.step_by_step_data else None,
+        step_by_step_data=STEP_DATA_ADAPTER.dump_python(data.step_by_step_data) if data.step_by_step_data else None,
         frequency=data.frequency,
         duration_seconds=data.duration_seconds,
         latency_seconds=data.latency_seconds,
@@ -355,7 +376,7 @@ async def record_data_point(
         behavior_notes=data.behavior_notes,
         antecedents=data.antecedents,
         consequences=data.consequences,
-        environmental_factors=data.environmental_factors.model_dump() if data.environmental_factors else None,
+        environmental_factors=ENVIRONMENTAL_FACTORS_ADAPTER.dump_python(data.environmental_factors) if data.environmental_factors else None,
     )
     
     db.add(db_data_point)
@@ -399,40 +420,46 @@ async def record_data_point(
     return db_data_point
 
 
-@router.post("/learner/{learner_id}/bulk-data-points", response_model=List[SkillDataPointResponse])
+@router.post(
+    "/learner/{learner_id}/bulk-data-points",
+    response_model=List[SkillDataPointResponse],
+    openapi_extra=json_body_openapi(BULK_DATA_POINTS_ADAPTER),
+)
 async def record_bulk_data_points(
     learner_id: str,
-    data: BulkDataPointCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    data: BulkDataPointCreate = Depends(json_body(BULK_DATA_POINTS_ADAPTER)),
 ):
     """Record data points for multiple skills in one session"""
     if not await verify_learner_access(current_user, learner_id, db):
         raise HTTPException(status_code=403, detail="Access denied")
     
+    # Multi-row INSERT ... RETURNING instead of an INSERT and a refresh per row
     created = []
-    for dp_data in data.data_points:
-        db_data_point = SkillDataPoint(
-            skill_id=dp_data.skill_id,
-            learner_id=learner_id,
-            session_date=data.session_date,
-            setting=data.setting,
-            instructor=data.instructor,
-            collection_method=dp_data.collection_method,
-            steps_attempted=dp_data.steps_attempted,
-            steps_completed=dp_data.steps_completed,
-            accuracy_percent=dp_data.accuracy_percent,
-            independence_percent=dp_data.independence_percent,
-        )
-        db.add(db_data_point)
-        created.append(db_data_point)
-    
-    await db.commit()
-    for dp in created:
-        await db.refresh(dp)
+    if data.data_points:
+        created = (await db.scalars(
+            insert(SkillDataPoint).returning(SkillDataPoint),
+            [
+                {
+                    "skill_id": dp_data.skill_id,
+                    "learner_id": learner_id,
+                    "session_date": data.session_date,
+                    "setting": data.setting,
+                    "instructor": data.instructor,
+                    "collection_method": dp_data.collection_method,
+                    "steps_attempted": dp_data.steps_attempted,
+                    "steps_completed": dp_data.steps_completed,
+                    "accuracy_percent": dp_data.accuracy_percent,
+                    "independence_percent": dp_data.independence_percent,
+                }
+                for dp_data in data.data_points
+            ],
+        )).all()
+        await db.commit()
     
     logger.info(f"Recorded {len(created)} data points for learner {learner_id}")
-    return created
+    return rows_response(SKILL_DATA_POINTS_ADAPTER, created)
 
 
 # ==========================================
@@ -467,15 +494,19 @@ async def get_generalization_matrix(
     )
     records = result.scalars().all()
     
-    # Build matrix
-    settings_dict = {r.setting: r for r in records}
+    # Build matrix: at most one record per setting, so a single pass
+    # keys the records and counts both flags
+    settings_dict = {}
+    mastered_count = introduced_count = 0
+    for r in records:
+        settings_dict[r.setting] = GeneralizationRecordResponse.from_row(r)
+        mastered_count += bool(r.is_mastered)
+        introduced_count += bool(r.is_introduced)
     total_target_settings = len(skill.target_settings)
-    mastered_count = sum(1 for r in records if r.is_mastered)
-    introduced_count = sum(1 for r in records if r.is_introduced)
     
     generalization_percent = (mastered_count / total_target_settings * 100) if total_target_settings > 0 else 0
     
-    return GeneralizationMatrixResponse(
+    return model_response(GeneralizationMatrixResponse(
         skill_id=skill_id,
         skill_name=skill.name,
         settings=settings_dict,
@@ -483,7 +514,7 @@ async def get_generalization_matrix(
         mastered_settings=mastered_count,
         introduced_settings=introduced_count,
         generalization_percent=generalization_percent
-    )
+    ))
 
 
 @router.post("/learner/{learner_id}/generalization", response_model=GeneralizationRecordResponse, status_code=status.HTTP_201_CREATED)
@@ -19,11 +19,22 @@ from api.schemas.ils import (
     ILSProgressReportRequest, ILSProgressReportResponse, SkillProgressSummary,
 )
 from api.dependencies.auth import get_current_user, verify_learner_access
+from api.responses import model_response
 from core.logging import setup_logging
 
 router = APIRouter()
 logger = setup_logging(__name__)
 
+# Readable domain names for the dashboard
+DOMAIN_NAMES = {
+    IndependentLivingDomain.MONEY_MANAGEMENT: "Money Management",
+    IndependentLivingDomain.COOKING_NUTRITION: "Cooking & Nutrition",
+    IndependentLivingDomain.TRANSPORTATION: "Transportation",
+    IndependentLivingDomain.HOUSING_HOME_CARE: "Housing & Home Care",
+    IndependentLivingDomain.HEALTH_SAFETY: "Health & Safety",
+    IndependentLivingDomain.COMMUNITY_RESOURCES: "Community Resources",
+}
+
 
 # ==========================================
 # DASHBOARD ENDPOINTS
@@ -105,19 +116,9 @@ async def get_ils_dashboard(
         )
         recent_dp = dp_result.scalar() or 0
         
-        # Get readable domain name
-        domain_names = {
-            IndependentLivingDomain.MONEY_MANAGEMENT: "Money Management",
-            IndependentLivingDomain.COOKING_NUTRITION: "Cooking & Nutrition",
-            IndependentLivingDomain.TRANSPORTATION: "Transportation",
-            IndependentLivingDomain.HOUSING_HOME_CARE: "Housing & Home Care",
-            IndependentLivingDomain.HEALTH_SAFETY: "Health & Safety",
-            IndependentLivingDomain.COMMUNITY_RESOURCES: "Community Resources",
-        }
-        
         domain_summaries.append(DomainSummary(
             domain=domain,
-            domain_name=domain_names.get(domain, domain.value),
+            domain_name=DOMAIN_NAMES.get(domain, domain.value),
             total_skills=domain_total,
             skills_introduced=domain_introduced,
             skills_mastered=domain_mastered,
@@ -172,16 +173,14 @@ async def get_ils_dashboard(
     
     # Priority skills (lowest mastery, critical safety first)
     priority_result = await db.execute(
-        select(LearnerSkillProgress)
+        select(LearnerSkillProgress.skill_id)
         .where(LearnerSkillProgress.learner_id == learner_id)
         .where(LearnerSkillProgress.is_active == True)
         .where(LearnerSkillProgress.mastery_level != SkillMasteryLevel.MASTERED)
-        .options(joinedload(LearnerSkillProgress.skill))
         .order_by(LearnerSkillProgress.percent_mastered)
         .limit(5)
     )
-    priority_progress = priority_result.scalars().all()
-    priority_skills = [p.skill_id for p in priority_progress]
+    priority_skills = list(priority_result.scalars())
     
     # Upcoming CBIs
     upcoming_cbi_result = await db.execute(
@@ -194,7 +193,7 @@ async def get_ils_dashboard(
     )
     upcoming_cbis = upcoming_cbi_result.scalars().all()
     
-    return ILSDashboardResponse(
+    return model_response(ILSDashboardResponse(
         learner_id=learner_id,
         learner_name=learner_name,
         total_skills_tracked=total_skills,
@@ -209,7 +208,7 @@ async def get_ils_dashboard(
         goals_achieved_this_year=goals_achieved,
         priority_skills=priority_skills,
         upcoming_cbis=upcoming_cbis
-    )
+    ))
 
 
 # ==========================================
@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, File, Uplo
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from typing import List, Optional
+from pydantic import TypeAdapter
 from datetime import datetime
 import aiofiles
 import uuid
@@ -19,14 +20,20 @@ from db.models.user import User
 from api.schemas.ils import (
     IndependentLivingDomain,
     FunctionalSkillCreate, FunctionalSkillUpdate, FunctionalSkillResponse,
-    FunctionalSkillListResponse,
+    FunctionalSkillListResponse, VisualSupport,
 )
 from api.dependencies.auth import get_current_user
+from api.responses import model_response, rows_response
 from core.logging import setup_logging
 
 router = APIRouter()
 logger = setup_logging(__name__)
 
+FUNCTIONAL_SKILLS_ADAPTER = TypeAdapter(List[FunctionalSkillResponse])
+
+# Dump the visual-support value objects into their JSON column
+VISUAL_SUPPORTS_ADAPTER = TypeAdapter(List[VisualSupport])
+
 
 # ==========================================
 # FUNCTIONAL SKILLS ENDPOINTS
@@ -95,13 +102,13 @@ async def list_functional_skills(
     result = await db.execute(query)
     skills = result.scalars().all()
     
-    return FunctionalSkillListResponse(
+    return model_response(FunctionalSkillListResponse(
         skills=skills,
         total=total,
         page=page,
         page_size=page_size,
         total_pages=(total + page_size - 1) // page_size
-    )
+    ))
 
 
 @router.get("/by-domain/{domain}", response_model=List[FunctionalSkillResponse])
@@ -117,7 +124,7 @@ async def get_skills_by_domain(
         .where(FunctionalSkill.is_active == True)
         .order_by(FunctionalSkill.name)
     )
-    return result.scalars().all()
+    return rows_response(FUNCTIONAL_SKILLS_ADAPTER, result.scalars().all())
 
 
 @router.get("/{skill_id}", response_model=FunctionalSkillResponse)
@@ -162,7 +169,7 @@ async def create_functional_skill(
         name=skill.name,
         description=skill.description,
         task_steps=skill.task_steps,
-        total_steps=skill.total_steps,
+        total_steps=len(skill.task_steps),
         prerequisite_skill_ids=skill.prerequisite_skill_ids,
         scaffolding_notes=skill.scaffolding_notes,
         min_age=skill.min_age,
@@ -170,7 +177,7 @@ async def create_functional_skill(
         min_grade_level=skill.min_grade_level,
         max_grade_level=skill.max_grade_level,
         materials_needed=skill.materials_needed,
-        visual_supports=skill.visual_supports,
+        visual_supports=VISUAL_SUPPORTS_ADAPTER.dump_python(skill.visual_supports),
         video_modeling_urls=skill.video_modeling_urls,
         social_story_url=skill.social_story_url,
         target_settings=skill.target_settings,
@@ -207,6 +214,8 @@ async def update_functional_skill(
         raise HTTPException(status_code=404, detail="Skill not found")
     
     update_data = skill.model_dump(exclude_unset=True)
+    if update_data.get("task_steps"):
+        update_data["total_steps"] = len(update_data["task_steps"])
     for field, value in update_data.items():
         setattr(db_skill, field, value)
     
@@ -261,7 +270,7 @@ async def get_skill_prerequisites(
             FunctionalSkill.id.in_(skill.prerequisite_skill_ids)
         )
     )
-    return prereq_result.scalars().all()
+    return rows_response(FUNCTIONAL_SKILLS_ADAPTER, prereq_result.scalars().all())
 
 
 @router.post("/{skill_id}/video")
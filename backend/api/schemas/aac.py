@@ -4,10 +4,13 @@ Author: artpromedia
 Date: 2025-01-13
 """
 
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from pydantic import BaseModel, Field, SkipValidation
+from typing import Any, Literal
+from datetime import date, datetime
 from enum import Enum
+from typing_extensions import TypedDict
+
+from api.schemas.common import ORMBase, make_partial
 
 
 # ===== Enums =====
@@ -76,39 +79,26 @@ class AACSymbolBase(BaseModel):
     symbolSet: str = "PCS"
     isCore: bool = False
     displayOrder: int = 0
-    backgroundColor: Optional[str] = None
-    textColor: Optional[str] = None
-    borderColor: Optional[str] = None
-    audioUrl: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    backgroundColor: str | None = None
+    textColor: str | None = None
+    borderColor: str | None = None
+    audioUrl: str | None = None
+    metadata: dict[str, Any] | None = None
 
 
 class AACSymbolCreate(AACSymbolBase):
     pass
 
 
-class AACSymbolUpdate(BaseModel):
-    label: Optional[str] = None
-    category: Optional[AACSymbolCategory] = None
-    imageUrl: Optional[str] = None
-    symbolSet: Optional[str] = None
-    isCore: Optional[bool] = None
-    displayOrder: Optional[int] = None
-    backgroundColor: Optional[str] = None
-    textColor: Optional[str] = None
-    borderColor: Optional[str] = None
-    audioUrl: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+AACSymbolUpdate = make_partial(AACSymbolBase)
 
 
-class AACSymbolResponse(AACSymbolBase):
+class AACSymbolResponse(AACSymbolBase, ORMBase):
     id: str
+    metadata: SkipValidation[dict[str, Any]] | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== Board Symbol (Junction) Schemas =====
 
@@ -116,8 +106,8 @@ class AACBoardSymbolBase(BaseModel):
     symbolId: str
     row: int
     column: int
-    customLabel: Optional[str] = None
-    customImageUrl: Optional[str] = None
+    customLabel: str | None = None
+    customImageUrl: str | None = None
     isHidden: bool = False
 
 
@@ -125,21 +115,13 @@ class AACBoardSymbolCreate(AACBoardSymbolBase):
     pass
 
 
-class AACBoardSymbolUpdate(BaseModel):
-    row: Optional[int] = None
-    column: Optional[int] = None
-    customLabel: Optional[str] = None
-    customImageUrl: Optional[str] = None
-    isHidden: Optional[bool] = None
+AACBoardSymbolUpdate = make_partial(AACBoardSymbolBase, "symbolId")
 
 
-class AACBoardSymbolResponse(AACBoardSymbolBase):
+class AACBoardSymbolResponse(AACBoardSymbolBase, ORMBase):
     id: str
     boardId: str
-    symbol: Optional[AACSymbolResponse] = None
-
-    class Config:
-        from_attributes = True
+    symbol: AACSymbolResponse | None = None
 
 
 # ===== Board Schemas =====
@@ -156,29 +138,19 @@ class AACBoardBase(BaseModel):
 
 class AACBoardCreate(AACBoardBase):
     learnerId: str
-    symbols: Optional[List[AACBoardSymbolCreate]] = None
+    symbols: list[AACBoardSymbolCreate] | None = None
 
 
-class AACBoardUpdate(BaseModel):
-    name: Optional[str] = None
-    boardType: Optional[AACBoardType] = None
-    rows: Optional[int] = None
-    columns: Optional[int] = None
-    backgroundColor: Optional[str] = None
-    isDefault: Optional[bool] = None
-    displayOrder: Optional[int] = None
+AACBoardUpdate = make_partial(AACBoardBase)
 
 
-class AACBoardResponse(AACBoardBase):
+class AACBoardResponse(AACBoardBase, ORMBase):
     id: str
     learnerId: str
-    symbols: List[AACBoardSymbolResponse] = []
+    symbols: list[AACBoardSymbolResponse] = Field(default_factory=list)
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== System Schemas =====
 
@@ -187,7 +159,7 @@ class AACSystemBase(BaseModel):
     accessMethod: AACAccessMethod = AACAccessMethod.DIRECT_SELECT
     gridSize: int = 20
     vocabularySize: int = 200
-    voiceId: Optional[str] = None
+    voiceId: str | None = None
     speechRate: float = 1.0
     scanSpeed: float = 1.0
     dwellTime: float = 1.0
@@ -195,68 +167,51 @@ class AACSystemBase(BaseModel):
     largeTargets: bool = False
     auditoryFeedback: bool = True
     visualFeedback: bool = True
-    settings: Optional[Dict[str, Any]] = None
+    settings: dict[str, Any] | None = None
 
 
 class AACSystemCreate(AACSystemBase):
     learnerId: str
 
 
-class AACSystemUpdate(BaseModel):
-    systemType: Optional[AACSystemType] = None
-    accessMethod: Optional[AACAccessMethod] = None
-    gridSize: Optional[int] = None
-    vocabularySize: Optional[int] = None
-    voiceId: Optional[str] = None
-    speechRate: Optional[float] = None
-    scanSpeed: Optional[float] = None
-    dwellTime: Optional[float] = None
-    highContrastMode: Optional[bool] = None
-    largeTargets: Optional[bool] = None
-    auditoryFeedback: Optional[bool] = None
-    visualFeedback: Optional[bool] = None
-    settings: Optional[Dict[str, Any]] = None
+AACSystemUpdate = make_partial(AACSystemBase)
 
 
-class AACSystemResponse(AACSystemBase):
+class AACSystemResponse(AACSystemBase, ORMBase):
     id: str
+    settings: SkipValidation[dict[str, Any]] | None = None
     learnerId: str
     isActive: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== Usage Log Schemas =====
 
 class AACUsageLogBase(BaseModel):
     symbolId: str
-    boardId: Optional[str] = None
+    boardId: str | None = None
     communicativeFunction: AACCommunicativeFunction
-    contextActivity: Optional[str] = None
+    contextActivity: str | None = None
     wasPrompted: bool = False
-    promptLevel: Optional[str] = None
-    responseLatency: Optional[float] = None
+    promptLevel: str | None = None
+    responseLatency: float | None = None
     wasSuccessful: bool = True
-    partnerResponse: Optional[str] = None
-    notes: Optional[str] = None
-    metadata: Optional[Dict[str, Any]] = None
+    partnerResponse: str | None = None
+    notes: str | None = None
+    metadata: dict[str, Any] | None = None
 
 
 class AACUsageLogCreate(AACUsageLogBase):
     learnerId: str
 
 
-class AACUsageLogResponse(AACUsageLogBase):
+class AACUsageLogResponse(AACUsageLogBase, ORMBase):
     id: str
+    metadata: SkipValidation[dict[str, Any]] | None = None
     learnerId: str
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== Vocabulary Goal Schemas =====
 
@@ -265,8 +220,8 @@ class AACVocabularyGoalBase(BaseModel):
     targetMastery: AACMasteryLevel = AACMasteryLevel.MASTERED
     targetTrials: int = 10
     targetAccuracy: float = 0.8
-    contextDescription: Optional[str] = None
-    notes: Optional[str] = None
+    contextDescription: str | None = None
+    notes: str | None = None
 
 
 class AACVocabularyGoalCreate(AACVocabularyGoalBase):
@@ -274,32 +229,29 @@ class AACVocabularyGoalCreate(AACVocabularyGoalBase):
 
 
 class AACVocabularyGoalUpdate(BaseModel):
-    currentMastery: Optional[AACMasteryLevel] = None
-    targetMastery: Optional[AACMasteryLevel] = None
-    completedTrials: Optional[int] = None
-    targetTrials: Optional[int] = None
-    successRate: Optional[float] = None
-    targetAccuracy: Optional[float] = None
-    contextDescription: Optional[str] = None
-    notes: Optional[str] = None
-    isAchieved: Optional[bool] = None
-
-
-class AACVocabularyGoalResponse(AACVocabularyGoalBase):
+    currentMastery: AACMasteryLevel | None = None
+    targetMastery: AACMasteryLevel | None = None
+    completedTrials: int | None = None
+    targetTrials: int | None = None
+    successRate: float | None = None
+    targetAccuracy: float | None = None
+    contextDescription: str | None = None
+    notes: str | None = None
+    isAchieved: bool | None = None
+
+
+class AACVocabularyGoalResponse(AACVocabularyGoalBase, ORMBase):
     id: str
     learnerId: str
     currentMastery: AACMasteryLevel
     completedTrials: int
     successRate: float
     isAchieved: bool
-    achievedAt: Optional[datetime] = None
-    symbol: Optional[AACSymbolResponse] = None
+    achievedAt: datetime | None = None
+    symbol: AACSymbolResponse | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== Progress Report Schemas =====
 
@@ -310,29 +262,36 @@ class AACProgressReportBase(BaseModel):
     totalUtterances: int = 0
     uniqueSymbolsUsed: int = 0
     averageUtteranceLength: float = 0.0
-    mostUsedSymbols: List[str] = []
-    communicativeFunctions: Dict[str, int] = {}
-    promptingData: Dict[str, Any] = {}
-    goalsProgress: List[Dict[str, Any]] = []
-    recommendations: List[str] = []
-    notes: Optional[str] = None
+    mostUsedSymbols: list[str] = Field(default_factory=list)
+    communicativeFunctions: dict[str, int] = Field(default_factory=dict)
+    promptingData: dict[str, Any] = Field(default_factory=dict)
+    goalsProgress: list[dict[str, Any]] = Field(default_factory=list)
+    recommendations: list[str] = Field(default_factory=list)
+    notes: str | None = None
 
 
 class AACProgressReportCreate(AACProgressReportBase):
     learnerId: str
 
 
-class AACProgressReportResponse(AACProgressReportBase):
+class AACProgressReportResponse(AACProgressReportBase, ORMBase):
     id: str
     learnerId: str
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== Aggregated/Utility Schemas =====
 
+# Count payloads keyed by enum value. Every member is always present (zero
+# when unused), so pydantic validates a fixed set of keys.
+SymbolCategoryCounts = TypedDict(
+    "SymbolCategoryCounts", {category.value: int for category in AACSymbolCategory}
+)
+CommunicativeFunctionCounts = TypedDict(
+    "CommunicativeFunctionCounts", {function.value: int for function in AACCommunicativeFunction}
+)
+
+
 class AACDashboardStats(BaseModel):
     totalSymbolsAvailable: int
     symbolsUsedToday: int
@@ -340,9 +299,9 @@ class AACDashboardStats(BaseModel):
     averageUtterancesPerDay: float
     goalsInProgress: int
     goalsAchieved: int
-    mostUsedSymbols: List[Dict[str, Any]]
-    communicativeFunctionBreakdown: Dict[str, int]
-    recentActivity: List[AACUsageLogResponse]
+    mostUsedSymbols: list[dict[str, Any]]
+    communicativeFunctionBreakdown: CommunicativeFunctionCounts
+    recentActivity: list[AACUsageLogResponse]
 
 
 class AACRecommendation(BaseModel):
@@ -350,50 +309,71 @@ class AACRecommendation(BaseModel):
     priority: str  # "high", "medium", "low"
     title: str
     description: str
-    symbolId: Optional[str] = None
-    actionData: Optional[Dict[str, Any]] = None
+    symbolId: str | None = None
+    actionData: dict[str, Any] | None = None
 
 
 class AACSymbolSearch(BaseModel):
-    query: Optional[str] = None
-    category: Optional[AACSymbolCategory] = None
-    isCore: Optional[bool] = None
-    symbolSet: Optional[str] = None
+    query: str | None = None
+    category: AACSymbolCategory | None = None
+    isCore: bool | None = None
+    symbolSet: str | None = None
     limit: int = 50
     offset: int = 0
 
 
 class AACBulkSymbolAdd(BaseModel):
     boardId: str
-    symbols: List[AACBoardSymbolCreate]
+    symbols: list[AACBoardSymbolCreate]
 
 
 class AACUtterance(BaseModel):
     """Represents a multi-symbol utterance"""
     learnerId: str
-    symbolIds: List[str]
-    boardId: Optional[str] = None
+    symbolIds: list[str]
+    boardId: str | None = None
     communicativeFunction: AACCommunicativeFunction
-    contextActivity: Optional[str] = None
+    contextActivity: str | None = None
     wasPrompted: bool = False
-    promptLevel: Optional[str] = None
+    promptLevel: str | None = None
 
 
 class AACAnalyticsRequest(BaseModel):
     learnerId: str
-    startDate: Optional[datetime] = None
-    endDate: Optional[datetime] = None
-    groupBy: str = "day"  # "day", "week", "month"
+    startDate: datetime | None = None
+    endDate: datetime | None = None
+    groupBy: Literal["day", "week", "month"] = "day"
+
+
+# Analytics series are columnar: one typed list per metric, index-aligned
+# with `dates`/`symbolIds`, instead of one dict per row.
+
+class AACDailyTrends(BaseModel):
+    dates: list[date] = Field(default_factory=list)
+    utteranceCount: list[int] = Field(default_factory=list)
+    uniqueSymbols: list[int] = Field(default_factory=list)
+
+
+class AACTopSymbols(BaseModel):
+    symbolIds: list[str] = Field(default_factory=list)
+    labels: list[str] = Field(default_factory=list)
+    counts: list[int] = Field(default_factory=list)
+
+
+class AACProgressOverTime(BaseModel):
+    dates: list[date] = Field(default_factory=list)
+    successRate: list[float] = Field(default_factory=list)
+    promptedRate: list[float] = Field(default_factory=list)
 
 
 class AACAnalyticsResponse(BaseModel):
     learnerId: str
-    period: Dict[str, str]
+    period: dict[str, str]
     totalUtterances: int
     uniqueSymbols: int
     averageUtteranceLength: float
-    symbolUsageByCategory: Dict[str, int]
-    communicativeFunctionUsage: Dict[str, int]
-    dailyTrends: List[Dict[str, Any]]
-    topSymbols: List[Dict[str, Any]]
-    progressOverTime: List[Dict[str, Any]]
+    symbolUsageByCategory: SymbolCategoryCounts
+    communicativeFunctionUsage: CommunicativeFunctionCounts
+    dailyTrends: AACDailyTrends
+    topSymbols: AACTopSymbols
+    progressOverTime: AACProgressOverTime
@@ -0,0 +1,147 @@
+"""
+ADHD/Executive Function Support System Schemas
+
+Pydantic models for organizational tools, project breakdown,
+daily planning, and EF skill assessment.
+
+Each domain lives in its own submodule and is imported on first
+attribute access, so importing one schema does not build the
+pydantic-core schemas of every other domain.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+from api.schemas.adhd.enums import (
+    EFDomain,
+    UrgencyLevel,
+    AssignmentStatus,
+    TimeBlockCategory,
+    CheckInSchedule,
+    StudyTechnique,
+    IntervalType,
+    ReminderType,
+    ReminderChannel,
+    SelfCheckType,
+    PromptType,
+    ImplementedBy,
+    CheckInStatus,
+)
+
+if TYPE_CHECKING:
+    from api.schemas.adhd.ef_profile import (
+        EFDomainRatings, EFProfileCreate, EFProfileUpdate, EFProfileResponse,
+    )
+    from api.schemas.adhd.assignments import (
+        RecurrencePattern, AssignmentCreate, AssignmentUpdate, AssignmentResponse,
+        AssignmentListResponse,
+    )
+    from api.schemas.adhd.breakdown import (
+        ProjectStep, ProjectBreakdownCreate, ProjectBreakdownUpdate, ProjectBreakdownResponse,
+        AIBreakdownRequest, AIBreakdownResponse,
+    )
+    from api.schemas.adhd.daily_plan import (
+        TimeBlock, DailyPlanCreate, DailyPlanUpdate, DailyPlanResponse,
+        AIDailyPlanRequest, AIDailyPlanResponse,
+    )
+    from api.schemas.adhd.binder import (
+        BinderSection, BinderCheckInRecord, BinderOrganizationCreate, BinderOrganizationUpdate,
+        BinderOrganizationResponse, BinderCheckInRequest,
+    )
+    from api.schemas.adhd.study import (
+        PomodoroSettings, StudyInterval, StudySessionCreate, StudySessionUpdate,
+        StudySessionResponse, RecordIntervalRequest,
+    )
+    from api.schemas.adhd.reminders import (
+        ReminderCreate, ReminderResponse, AcknowledgeReminderRequest, AcknowledgeReminderBatchItem,
+        ACKNOWLEDGE_REMINDERS_ADAPTER,
+    )
+    from api.schemas.adhd.interventions import (
+        EffectivenessRating, EFInterventionCreate, AI_SUGGESTIONS_ADAPTER, EFInterventionUpdate,
+        EFInterventionResponse, RateInterventionRequest, RateInterventionBatchItem, RATE_INTERVENTIONS_ADAPTER,
+        AIStrategiesRequest, AIStrategiesResponse,
+    )
+    from api.schemas.adhd.self_monitoring import (
+        SelfMonitoringLogCreate, SelfMonitoringLogResponse, CheckTypeStats, SelfMonitoringSummary,
+    )
+    from api.schemas.adhd.dashboard import DashboardAlert, ParentDashboardResponse
+    from api.schemas.adhd.urgency import UrgencyCalculationRequest, UrgencyItem, UrgencyCalculationResponse
+
+
+_SUBMODULES = {
+    "ef_profile": (
+        "EFDomainRatings", "EFProfileCreate", "EFProfileUpdate", "EFProfileResponse",
+    ),
+    "assignments": (
+        "RecurrencePattern", "AssignmentCreate", "AssignmentUpdate", "AssignmentResponse",
+        "AssignmentListResponse",
+    ),
+    "breakdown": (
+        "ProjectStep", "ProjectBreakdownCreate", "ProjectBreakdownUpdate", "ProjectBreakdownResponse",
+        "AIBreakdownRequest", "AIBreakdownResponse",
+    ),
+    "daily_plan": (
+        "TimeBlock", "DailyPlanCreate", "DailyPlanUpdate", "DailyPlanResponse",
+        "AIDailyPlanRequest", "AIDailyPlanResponse",
+    ),
+    "binder": (
+        "BinderSection", "BinderCheckInRecord", "BinderOrganizationCreate", "BinderOrganizationUpdate",
+        "BinderOrganizationResponse", "BinderCheckInRequest",
+    ),
+    "study": (
+        "PomodoroSettings", "StudyInterval", "StudySessionCreate", "StudySessionUpdate",
+        "StudySessionResponse", "RecordIntervalRequest",
+    ),
+    "reminders": (
+        "ReminderCreate", "ReminderResponse", "AcknowledgeReminderRequest", "AcknowledgeReminderBatchItem",
+        "ACKNOWLEDGE_REMINDERS_ADAPTER",
+    ),
+    "interventions": (
+        "EffectivenessRating", "EFInterventionCreate", "AI_SUGGESTIONS_ADAPTER", "EFInterventionUpdate",
+        "EFInterventionResponse", "RateInterventionRequest", "RateInterventionBatchItem", "RATE_INTERVENTIONS_ADAPTER",
+        "AIStrategiesRequest", "AIStrategiesResponse",
+    ),
+    "self_monitoring": (
+        "SelfMonitoringLogCreate", "SelfMonitoringLogResponse", "CheckTypeStats", "SelfMonitoringSummary",
+    ),
+    "dashboard": (
+        "DashboardAlert", "ParentDashboardResponse",
+    ),
+    "urgency": (
+        "UrgencyCalculationRequest", "UrgencyItem", "UrgencyCalculationResponse",
+    ),
+}
+
+_LAZY = {name: module for module, names in _SUBMODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    """Import the owning submodule on first access (PEP 562)."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
+
+
+__all__ = [
+    "EFDomain",
+    "UrgencyLevel",
+    "AssignmentStatus",
+    "TimeBlockCategory",
+    "CheckInSchedule",
+    "StudyTechnique",
+    "IntervalType",
+    "ReminderType",
+    "ReminderChannel",
+    "SelfCheckType",
+    "PromptType",
+    "ImplementedBy",
+    "CheckInStatus",
+    *_LAZY,
+]
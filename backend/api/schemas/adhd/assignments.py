@@ -0,0 +1,130 @@
+"""
+Assignment schemas.
+"""
+
+from datetime import datetime, date
+from pydantic import Field, computed_field
+from typing_extensions import TypedDict
+
+from api.schemas.adhd.enums import UrgencyLevel, AssignmentStatus
+from api.schemas.common import ORMBase, PayloadBase, ResponseBase, request_now
+
+
+# ==========================================
+# ASSIGNMENTS
+# ==========================================
+
+_CLOSED_ASSIGNMENT_STATUSES = frozenset({AssignmentStatus.COMPLETED.value, AssignmentStatus.EXCUSED.value})
+
+
+class RecurrencePattern(PayloadBase):
+    """Recurrence pattern for assignments."""
+    frequency: str  # 'daily', 'weekly', 'biweekly', 'monthly'
+    days: list[int] | None = None  # Days of week (0-6)
+    until: date | None = None
+
+
+class AssignmentCreate(PayloadBase):
+    """Create a new assignment."""
+    learner_id: str
+    class_id: str | None = None
+    title: str
+    description: str | None = None
+    subject: str | None = None
+    instructions: str | None = None
+    attachment_urls: list[str] = Field(default_factory=list)
+    external_url: str | None = None
+    due_date: datetime
+    assigned_date: datetime | None = None
+    estimated_minutes: int | None = None
+    parent_visible: bool = True
+    teacher_notes: str | None = None
+    is_recurring: bool = False
+    recurrence_pattern: RecurrencePattern | None = None
+    points_possible: float | None = None
+
+
+class AssignmentUpdate(PayloadBase):
+    """Update an assignment."""
+    title: str | None = None
+    description: str | None = None
+    subject: str | None = None
+    instructions: str | None = None
+    attachment_urls: list[str] | None = None
+    external_url: str | None = None
+    due_date: datetime | None = None
+    estimated_minutes: int | None = None
+    status: AssignmentStatus | None = None
+    percent_complete: int | None = Field(None, ge=0, le=100)
+    completed_at: datetime | None = None
+    submitted_at: datetime | None = None
+    parent_visible: bool | None = None
+    teacher_notes: str | None = None
+    learner_notes: str | None = None
+    actual_minutes: int | None = None
+    points_earned: float | None = None
+    grade: str | None = None
+    feedback: str | None = None
+
+
+class AssignmentResponse(ORMBase):
+    """Assignment response."""
+    id: str
+    learner_id: str
+    class_id: str | None = None
+    title: str
+    description: str | None = None
+    subject: str | None = None
+    instructions: str | None = None
+    attachment_urls: list[str]
+    external_url: str | None = None
+    due_date: datetime
+    assigned_date: datetime
+    estimated_minutes: int | None = None
+    actual_minutes: int | None = None
+    urgency_level: UrgencyLevel
+    status: AssignmentStatus
+    percent_complete: int
+    completed_at: datetime | None = None
+    submitted_at: datetime | None = None
+    parent_visible: bool
+    teacher_notes: str | None = None
+    learner_notes: str | None = None
+    reminders_sent: list[datetime]
+    is_recurring: bool
+    recurrence_pattern: RecurrencePattern | None = None
+    points_possible: float | None = None
+    points_earned: float | None = None
+    grade: str | None = None
+    feedback: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    has_breakdown: bool = False
+
+    # Calculated fields (derived from due_date/status at serialization time)
+    @computed_field
+    @property
+    def days_until_due(self) -> int:
+        return (self.due_date - request_now(self.due_date.tzinfo)).days
+
+    @computed_field
+    @property
+    def is_overdue(self) -> bool:
+        return (
+            self.due_date < request_now(self.due_date.tzinfo)
+            and self.status not in _CLOSED_ASSIGNMENT_STATUSES
+        )
+
+
+# Per-enum counts with every member present (zero when empty)
+UrgencyCounts = TypedDict("UrgencyCounts", {level.value: int for level in UrgencyLevel})
+StatusCounts = TypedDict("StatusCounts", {status.value: int for status in AssignmentStatus})
+
+
+class AssignmentListResponse(ResponseBase):
+    """List of assignments with summary."""
+    assignments: list[AssignmentResponse]
+    total: int
+    by_urgency: UrgencyCounts  # { CRITICAL: 2, HIGH: 5, ... }
+    by_status: StatusCounts  # { NOT_STARTED: 3, IN_PROGRESS: 2, ... }
+    overdue_count: int
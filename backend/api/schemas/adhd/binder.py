@@ -0,0 +1,76 @@
+"""
+Binder organization schemas.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from api.schemas.adhd.enums import CheckInSchedule, CheckInStatus
+from api.schemas.common import ORMBase, PayloadBase, make_partial
+
+
+# ==========================================
+# BINDER ORGANIZATION
+# ==========================================
+
+class BinderSection(PayloadBase):
+    """A section in the binder."""
+    id: str
+    name: str
+    color: str
+    subjects: list[str] = Field(default_factory=list)
+    order: int
+    description: str | None = None
+
+
+class BinderCheckInRecord(PayloadBase):
+    """Record of a binder check-in."""
+    date: datetime
+    status: CheckInStatus
+    duration_minutes: int | None = None
+    sections_checked: list[str] = Field(default_factory=list)
+    issues_found: list[str] = Field(default_factory=list)
+    notes: str | None = None
+    completed_by: str | None = None
+
+
+class BinderOrganizationCreate(PayloadBase):
+    """Create binder organization."""
+    learner_id: str
+    sections: list[BinderSection]
+    check_in_schedule: CheckInSchedule = CheckInSchedule.WEEKLY
+    check_in_day: int | None = None  # 0-6
+    check_in_time: str | None = None
+    custom_tips: list[str] = Field(default_factory=list)
+    reminder_phrase: str | None = None
+
+
+BinderOrganizationUpdate = make_partial(BinderOrganizationCreate, "learner_id")
+
+
+class BinderOrganizationResponse(ORMBase):
+    """Binder organization response."""
+    id: str
+    learner_id: str
+    sections: list[BinderSection]
+    check_in_schedule: CheckInSchedule
+    check_in_day: int | None = None
+    check_in_time: str | None = None
+    last_check_in: datetime | None = None
+    next_check_in: datetime | None = None
+    streak_count: int
+    check_in_history: list[BinderCheckInRecord] | None = None
+    custom_tips: list[str]
+    reminder_phrase: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class BinderCheckInRequest(PayloadBase):
+    """Record a binder check-in."""
+    status: CheckInStatus
+    duration_minutes: int | None = None
+    sections_checked: list[str] = Field(default_factory=list)
+    issues_found: list[str] = Field(default_factory=list)
+    notes: str | None = None
+    completed_by: str | None = None
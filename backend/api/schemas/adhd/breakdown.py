@@ -0,0 +1,86 @@
+"""
+Project breakdown schemas.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from api.schemas.adhd.enums import AssignmentStatus
+from api.schemas.common import ORMBase, PayloadBase, ResponseBase
+
+
+# ==========================================
+# PROJECT BREAKDOWN
+# ==========================================
+
+class ProjectStep(PayloadBase):
+    """A single step in a project breakdown."""
+    step_number: int
+    title: str
+    description: str | None = None
+    estimated_minutes: int | None = None
+    due_date: datetime | None = None
+    status: AssignmentStatus = AssignmentStatus.NOT_STARTED
+    completed_at: datetime | None = None
+    notes: str | None = None
+
+
+class ProjectBreakdownCreate(PayloadBase):
+    """Create a project breakdown."""
+    assignment_id: str
+    learner_id: str
+    project_title: str
+    final_due_date: datetime
+    project_notes: str | None = None
+    steps: list[ProjectStep]
+    generated_by_ai: bool = False
+    ai_prompt: str | None = None
+
+
+class ProjectBreakdownUpdate(PayloadBase):
+    """Update a project breakdown."""
+    project_title: str | None = None
+    project_notes: str | None = None
+    steps: list[ProjectStep] | None = None
+    was_modified: bool = True
+
+
+class ProjectBreakdownResponse(ORMBase):
+    """Project breakdown response."""
+    id: str
+    assignment_id: str
+    learner_id: str
+    project_title: str
+    final_due_date: datetime
+    project_notes: str | None = None
+    steps: list[ProjectStep]
+    generated_by_ai: bool
+    ai_prompt: str | None = None
+    was_modified: bool
+    total_estimated_minutes: int | None = None
+    actual_time_spent: int | None = None
+    completed_steps: int
+    total_steps: int
+    completion_percentage: float = 0
+    created_at: datetime
+    updated_at: datetime
+
+
+class AIBreakdownRequest(PayloadBase):
+    """Request AI to generate project breakdown."""
+    assignment_id: str
+    learner_id: str
+    project_title: str
+    project_description: str
+    final_due_date: datetime
+    estimated_total_minutes: int | None = None
+    learner_grade_level: int | None = None
+    ef_challenges: list[str] | None = None  # To customize for learner's needs
+    num_steps: int = Field(default=5, ge=3, le=10)
+
+
+class AIBreakdownResponse(ResponseBase):
+    """AI-generated breakdown response."""
+    breakdown: ProjectBreakdownResponse
+    ai_explanation: str
+    suggested_schedule: list[dict] | None = None  # When to work on each step
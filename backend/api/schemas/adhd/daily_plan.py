@@ -0,0 +1,118 @@
+"""
+Daily plan schemas.
+"""
+
+import re
+from datetime import datetime, date
+from typing_extensions import Annotated
+from pydantic import AfterValidator, Field
+from pydantic_core import PydanticCustomError
+
+from api.schemas.adhd.enums import TimeBlockCategory
+from api.schemas.common import ORMBase, PayloadBase, ResponseBase
+
+
+_HHMM_MATCH = re.compile(r"([01]?\d|2[0-3]):[0-5]\d").fullmatch
+
+
+def _check_hhmm(value: str) -> str:
+    """Validate a 24-hour "HH:MM" clock time."""
+    if not _HHMM_MATCH(value):
+        raise PydanticCustomError("hhmm_time", "must be a time in HH:MM format")
+    return value
+
+
+# 24-hour "HH:MM" time string
+HHMM = Annotated[str, AfterValidator(_check_hhmm)]
+
+
+# ==========================================
+# DAILY PLAN
+# ==========================================
+
+class TimeBlock(PayloadBase):
+    """A time block in a daily plan."""
+    id: str
+    start_time: HHMM
+    end_time: HHMM
+    duration: int  # minutes
+    activity: str
+    category: TimeBlockCategory
+    linked_assignment_id: str | None = None
+    is_flexible: bool = False
+    is_completed: bool = False
+    notes: str | None = None
+
+
+class DailyPlanCreate(PayloadBase):
+    """Create a daily plan."""
+    learner_id: str
+    date: date
+    wake_time: HHMM | None = None
+    school_start_time: HHMM | None = None
+    school_end_time: HHMM | None = None
+    bed_time: HHMM | None = None
+    time_blocks: list[TimeBlock] = Field(default_factory=list)
+    morning_routine_notes: str | None = None
+    evening_routine_notes: str | None = None
+
+
+class DailyPlanUpdate(PayloadBase):
+    """Update a daily plan."""
+    wake_time: HHMM | None = None
+    school_start_time: HHMM | None = None
+    school_end_time: HHMM | None = None
+    bed_time: HHMM | None = None
+    time_blocks: list[TimeBlock] | None = None
+    morning_routine_notes: str | None = None
+    evening_routine_notes: str | None = None
+    parent_notes: str | None = None
+    learner_reflection: str | None = None
+    was_modified: bool = True
+
+
+class DailyPlanResponse(ORMBase):
+    """Daily plan response."""
+    id: str
+    learner_id: str
+    date: date
+    wake_time: str | None = None
+    school_start_time: str | None = None
+    school_end_time: str | None = None
+    bed_time: str | None = None
+    time_blocks: list[TimeBlock]
+    generated_by_ai: bool
+    ai_prompt: str | None = None
+    was_modified: bool
+    completion_rate: float
+    total_blocks: int
+    completed_blocks: int
+    morning_routine_notes: str | None = None
+    evening_routine_notes: str | None = None
+    parent_notes: str | None = None
+    learner_reflection: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class AIDailyPlanRequest(PayloadBase):
+    """Request AI to generate daily plan."""
+    learner_id: str
+    date: date
+    wake_time: HHMM = "07:00"
+    school_start_time: HHMM = "08:00"
+    school_end_time: HHMM = "15:00"
+    bed_time: HHMM = "21:00"
+    assignments_due: list[str] | None = None  # Assignment IDs
+    fixed_activities: list[TimeBlock] | None = None  # Pre-scheduled blocks
+    ef_profile_id: str | None = None  # To customize based on EF needs
+    include_breaks: bool = True
+    break_frequency_minutes: int = 45  # How often to schedule breaks
+    preferred_study_time: str | None = None  # "morning", "afternoon", "evening"
+
+
+class AIDailyPlanResponse(ResponseBase):
+    """AI-generated daily plan response."""
+    plan: DailyPlanResponse
+    ai_explanation: str
+    tips_for_success: list[str]
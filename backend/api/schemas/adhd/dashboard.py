@@ -0,0 +1,45 @@
+"""
+Parent dashboard schemas.
+"""
+
+from datetime import datetime
+from typing import Any
+from pydantic import SkipValidation
+
+from api.schemas.adhd.assignments import AssignmentResponse
+from api.schemas.adhd.daily_plan import DailyPlanResponse
+from api.schemas.adhd.self_monitoring import SelfMonitoringSummary
+from api.schemas.common import PayloadBase, ResponseBase
+
+
+# ==========================================
+# PARENT DASHBOARD
+# ==========================================
+
+class DashboardAlert(PayloadBase):
+    """Alert shown on the parent dashboard."""
+    type: str
+    message: str
+    severity: str
+    date: datetime
+
+
+class ParentDashboardResponse(ResponseBase):
+    """Parent dashboard view."""
+    learner_id: str
+    learner_name: str
+    # Assignments overview
+    upcoming_assignments: list[AssignmentResponse]
+    overdue_assignments: list[AssignmentResponse]
+    recently_completed: list[AssignmentResponse]
+    # Today's plan
+    todays_plan: DailyPlanResponse | None = None
+    # Progress
+    weekly_completion_rate: float
+    ef_profile_summary: SkipValidation[dict[str, Any]] | None = None  # Simplified EF info
+    # Interventions
+    active_interventions: SkipValidation[list[dict[str, Any]]]  # Simplified intervention info
+    # Alerts
+    alerts: list[DashboardAlert]
+    # Self-monitoring summary
+    recent_self_monitoring: SelfMonitoringSummary | None = None
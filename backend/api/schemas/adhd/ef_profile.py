@@ -0,0 +1,73 @@
+"""
+Executive function profile schemas.
+"""
+
+from datetime import datetime
+from typing import Any
+from pydantic import Field, SkipValidation
+
+from api.schemas.common import ORMBase, PayloadBase, make_partial
+
+
+# ==========================================
+# EXECUTIVE FUNCTION PROFILE
+# ==========================================
+
+class EFDomainRatings(PayloadBase):
+    """Ratings for each EF domain (1-5 scale)."""
+    organization: int = Field(ge=1, le=5)
+    time_management: int = Field(ge=1, le=5)
+    planning: int = Field(ge=1, le=5)
+    task_initiation: int = Field(ge=1, le=5)
+    working_memory: int = Field(ge=1, le=5)
+    metacognition: int = Field(ge=1, le=5)
+    emotional_control: int = Field(ge=1, le=5)
+    flexibility: int = Field(ge=1, le=5)
+
+
+class EFProfileCreate(PayloadBase):
+    """Create a new EF profile."""
+    learner_id: str
+    assessment_date: datetime | None = None
+    assessed_by: str | None = None
+    assessment_tool: str | None = None
+    ratings: EFDomainRatings
+    domain_notes: dict | None = None
+    strengths: list[str] = Field(default_factory=list)
+    challenges: list[str] = Field(default_factory=list)
+    recommended_strategies: list[str] = Field(default_factory=list)
+    accommodations: list[str] = Field(default_factory=list)
+    parent_observations: str | None = None
+    teacher_observations: str | None = None
+    learner_self_assessment: dict | None = None
+
+
+EFProfileUpdate = make_partial(EFProfileCreate, "learner_id")
+
+
+class EFProfileResponse(ORMBase):
+    """EF profile response."""
+    id: str
+    learner_id: str
+    assessment_date: datetime
+    assessed_by: str | None = None
+    assessment_tool: str | None = None
+    organization_rating: int
+    time_management_rating: int
+    planning_rating: int
+    task_initiation_rating: int
+    working_memory_rating: int
+    metacognition_rating: int
+    emotional_control_rating: int
+    flexibility_rating: int
+    domain_notes: SkipValidation[dict[str, Any]] | None = None
+    strengths: list[str]
+    challenges: list[str]
+    recommended_strategies: list[str]
+    accommodations: list[str]
+    parent_observations: str | None = None
+    teacher_observations: str | None = None
+    learner_self_assessment: SkipValidation[dict[str, Any]] | None = None
+    previous_assessments: SkipValidation[list[Any]] | None = None
+    created_at: datetime
+    updated_at: datetime
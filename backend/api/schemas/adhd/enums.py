@@ -0,0 +1,128 @@
+"""
+Enums shared across the ADHD/EF schemas.
+"""
+
+from enum import Enum
+
+
+# ==========================================
+# ENUMS
+# ==========================================
+
+class EFDomain(str, Enum):
+    """Executive Function domains."""
+    ORGANIZATION = "ORGANIZATION"
+    TIME_MANAGEMENT = "TIME_MANAGEMENT"
+    PLANNING = "PLANNING"
+    TASK_INITIATION = "TASK_INITIATION"
+    WORKING_MEMORY = "WORKING_MEMORY"
+    METACOGNITION = "METACOGNITION"
+    EMOTIONAL_CONTROL = "EMOTIONAL_CONTROL"
+    FLEXIBILITY = "FLEXIBILITY"
+
+
+class UrgencyLevel(str, Enum):
+    """Assignment urgency levels."""
+    CRITICAL = "CRITICAL"  # Due within 24 hours
+    HIGH = "HIGH"  # Due within 3 days
+    MEDIUM = "MEDIUM"  # Due within 7 days
+    LOW = "LOW"  # Due beyond 7 days
+
+
+class AssignmentStatus(str, Enum):
+    """Assignment completion status."""
+    NOT_STARTED = "NOT_STARTED"
+    IN_PROGRESS = "IN_PROGRESS"
+    COMPLETED = "COMPLETED"
+    LATE = "LATE"
+    EXCUSED = "EXCUSED"
+
+
+class TimeBlockCategory(str, Enum):
+    """Categories for daily plan time blocks."""
+    CLASS = "CLASS"
+    HOMEWORK = "HOMEWORK"
+    BREAK = "BREAK"
+    MEAL = "MEAL"
+    ACTIVITY = "ACTIVITY"
+    FREE_TIME = "FREE_TIME"
+    ROUTINE = "ROUTINE"
+    THERAPY = "THERAPY"
+    STUDY = "STUDY"
+
+
+class CheckInSchedule(str, Enum):
+    """Binder check-in frequency."""
+    DAILY = "DAILY"
+    TWICE_WEEKLY = "TWICE_WEEKLY"
+    WEEKLY = "WEEKLY"
+
+
+class StudyTechnique(str, Enum):
+    """Study session techniques."""
+    POMODORO = "POMODORO"
+    BLOCKED = "BLOCKED"
+    FREE_FORM = "FREE_FORM"
+    TIME_BOXING = "TIME_BOXING"
+    SPACED_PRACTICE = "SPACED_PRACTICE"
+
+
+class IntervalType(str, Enum):
+    """Pomodoro interval types."""
+    WORK = "WORK"
+    SHORT_BREAK = "SHORT_BREAK"
+    LONG_BREAK = "LONG_BREAK"
+
+
+class ReminderType(str, Enum):
+    """Reminder timing types."""
+    THREE_DAY = "THREE_DAY"
+    ONE_DAY = "ONE_DAY"
+    MORNING_OF = "MORNING_OF"
+    CUSTOM = "CUSTOM"
+    RECURRING = "RECURRING"
+
+
+class ReminderChannel(str, Enum):
+    """Reminder delivery channels."""
+    EMAIL = "EMAIL"
+    PUSH = "PUSH"
+    SMS = "SMS"
+    PARENT_EMAIL = "PARENT_EMAIL"
+    IN_APP = "IN_APP"
+
+
+class SelfCheckType(str, Enum):
+    """Self-monitoring check types."""
+    ATTENTION = "ATTENTION"
+    MATERIALS = "MATERIALS"
+    PROGRESS = "PROGRESS"
+    UNDERSTANDING = "UNDERSTANDING"
+    ON_TASK = "ON_TASK"
+    EMOTIONS = "EMOTIONS"
+
+
+class PromptType(str, Enum):
+    """How the self-monitoring check was prompted."""
+    SELF_INITIATED = "SELF_INITIATED"
+    TIMER = "TIMER"
+    TEACHER = "TEACHER"
+    PARENT = "PARENT"
+    SYSTEM = "SYSTEM"
+
+
+class ImplementedBy(str, Enum):
+    """Who implements an intervention."""
+    SELF = "SELF"
+    TEACHER = "TEACHER"
+    PARENT = "PARENT"
+    THERAPIST = "THERAPIST"
+    AIDE = "AIDE"
+
+
+class CheckInStatus(str, Enum):
+    """Binder check-in status."""
+    COMPLETED = "COMPLETED"
+    PARTIAL = "PARTIAL"
+    SKIPPED = "SKIPPED"
+    NEEDS_HELP = "NEEDS_HELP"
@@ -0,0 +1,127 @@
+"""
+EF intervention schemas.
+"""
+
+from datetime import datetime
+from pydantic import Field, TypeAdapter, computed_field
+
+from api.schemas.adhd.enums import EFDomain, ImplementedBy
+from api.schemas.common import InternedStr, ORMBase, PayloadBase, ResponseBase
+
+
+# ==========================================
+# EF INTERVENTIONS
+# ==========================================
+
+class EffectivenessRating(PayloadBase):
+    """Rating of intervention effectiveness."""
+    date: datetime
+    rating: int = Field(ge=1, le=5)
+    notes: str | None = None
+    rated_by: str | None = None
+
+
+class EFInterventionCreate(PayloadBase):
+    """Create an EF intervention."""
+    learner_id: str
+    domain: EFDomain
+    strategy_name: str
+    description: str
+    how_to_implement: str | None = None
+    materials: list[InternedStr] = Field(default_factory=list)
+    frequency: str | None = None
+    implemented_by: ImplementedBy = ImplementedBy.TEACHER
+    target_behavior: str | None = None
+    success_criteria: str | None = None
+    baseline_behavior: str | None = None
+    evidence_basis: str | None = None
+    source_url: str | None = None
+
+
+# Validates a batch of AI-suggested strategies in a single call
+AI_SUGGESTIONS_ADAPTER = TypeAdapter(list[EFInterventionCreate])
+
+
+class EFInterventionUpdate(PayloadBase):
+    """Update an EF intervention."""
+    strategy_name: str | None = None
+    description: str | None = None
+    how_to_implement: str | None = None
+    materials: list[InternedStr] | None = None
+    frequency: str | None = None
+    is_active: bool | None = None
+    implemented_by: ImplementedBy | None = None
+    end_date: datetime | None = None
+    target_behavior: str | None = None
+    success_criteria: str | None = None
+    teacher_notes: str | None = None
+    parent_notes: str | None = None
+    learner_notes: str | None = None
+
+
+class EFInterventionResponse(ORMBase):
+    """EF intervention response."""
+    id: str
+    learner_id: str
+    domain: EFDomain
+    strategy_name: str
+    description: str
+    how_to_implement: str | None = None
+    materials: list[InternedStr]
+    frequency: str | None = None
+    start_date: datetime
+    end_date: datetime | None = None
+    is_active: bool
+    implemented_by: ImplementedBy
+    effectiveness_ratings: list[EffectivenessRating] | None = None
+    total_ratings: int
+    target_behavior: str | None = None
+    success_criteria: str | None = None
+    baseline_behavior: str | None = None
+    teacher_notes: str | None = None
+    parent_notes: str | None = None
+    learner_notes: str | None = None
+    evidence_basis: str | None = None
+    source_url: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    # Derived from effectiveness_ratings at serialization time
+    @computed_field(repr=False)
+    @property
+    def average_effectiveness(self) -> float | None:
+        if not self.effectiveness_ratings:
+            return None
+        return sum(r.rating for r in self.effectiveness_ratings) / len(self.effectiveness_ratings)
+
+
+class RateInterventionRequest(PayloadBase):
+    """Rate an intervention's effectiveness."""
+    rating: int = Field(ge=1, le=5)
+    notes: str | None = None
+    rated_by: str | None = None
+
+
+class RateInterventionBatchItem(RateInterventionRequest):
+    """One rating in a bulk sync."""
+    intervention_id: str
+
+
+# Validates a whole bulk-rating body in one pydantic-core call
+RATE_INTERVENTIONS_ADAPTER = TypeAdapter(list[RateInterventionBatchItem])
+
+
+class AIStrategiesRequest(PayloadBase):
+    """Request AI-suggested strategies based on EF profile."""
+    learner_id: str
+    ef_profile_id: str
+    target_domains: list[EFDomain] | None = None  # If None, all challenging domains
+    context: str | None = None  # "classroom", "homework", "home"
+    max_suggestions: int = 5
+
+
+class AIStrategiesResponse(ResponseBase):
+    """AI-suggested strategies response."""
+    suggestions: list[EFInterventionCreate]
+    explanation: str
+    priority_order: list[str]  # Domain names in priority order
@@ -0,0 +1,66 @@
+"""
+Reminder schemas.
+"""
+
+from datetime import datetime
+from pydantic import TypeAdapter
+
+from api.schemas.adhd.enums import ReminderType, ReminderChannel
+from api.schemas.common import ORMBase, PayloadBase
+
+
+# ==========================================
+# REMINDERS
+# ==========================================
+
+class ReminderCreate(PayloadBase):
+    """Create a reminder."""
+    learner_id: str
+    assignment_id: str | None = None
+    reminder_type: ReminderType
+    scheduled_for: datetime
+    channel: ReminderChannel
+    recipient_email: str | None = None
+    recipient_phone: str | None = None
+    title: str
+    message: str
+    action_url: str | None = None
+    is_recurring: bool = False
+    next_occurrence: datetime | None = None
+
+
+class ReminderResponse(ORMBase):
+    """Reminder response."""
+    id: str
+    learner_id: str
+    assignment_id: str | None = None
+    reminder_type: ReminderType
+    scheduled_for: datetime
+    sent_at: datetime | None = None
+    channel: ReminderChannel
+    title: str
+    message: str
+    action_url: str | None = None
+    was_sent: bool
+    was_acknowledged: bool
+    acknowledged_at: datetime | None = None
+    was_delivered: bool | None = None
+    delivery_error: str | None = None
+    is_recurring: bool
+    next_occurrence: datetime | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class AcknowledgeReminderRequest(PayloadBase):
+    """Acknowledge a reminder."""
+    acknowledged_at: datetime | None = None  # Defaults to the request clock
+
+
+class AcknowledgeReminderBatchItem(AcknowledgeReminderRequest):
+    """One acknowledgement in a bulk sync."""
+    reminder_id: str
+
+
+# Validates a whole bulk-acknowledge body in one pydantic-core call
+ACKNOWLEDGE_REMINDERS_ADAPTER = TypeAdapter(list[AcknowledgeReminderBatchItem])
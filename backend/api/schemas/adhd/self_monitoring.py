@@ -0,0 +1,81 @@
+"""
+Self-monitoring schemas.
+"""
+
+from datetime import datetime, date, time
+from typing import Any
+from pydantic import Field, SkipValidation
+
+from api.schemas.adhd.enums import SelfCheckType, PromptType
+from api.schemas.common import ORMBase, PayloadBase
+
+
+# ==========================================
+# SELF-MONITORING
+# ==========================================
+
+class SelfMonitoringLogCreate(PayloadBase):
+    """Create a self-monitoring log entry."""
+    learner_id: str
+    date: date
+    time: time
+    check_type: SelfCheckType
+    prompt_type: PromptType = PromptType.TIMER
+    was_on_task: bool | None = None
+    on_task_percent: int | None = Field(None, ge=0, le=100)
+    activity: str | None = None
+    actual_activity: str | None = None
+    location: str | None = None
+    subject: str | None = None
+    had_materials: bool | None = None
+    understood_task: bool | None = None
+    needs_help: bool | None = None
+    emotion_rating: int | None = Field(None, ge=1, le=5)
+    notes: str | None = None
+
+
+class SelfMonitoringLogResponse(ORMBase):
+    """Self-monitoring log response."""
+    id: str
+    learner_id: str
+    date: date
+    time: time
+    timestamp: datetime
+    check_type: SelfCheckType
+    prompt_type: PromptType
+    was_on_task: bool | None = None
+    on_task_percent: int | None = None
+    activity: str | None = None
+    actual_activity: str | None = None
+    location: str | None = None
+    subject: str | None = None
+    had_materials: bool | None = None
+    understood_task: bool | None = None
+    needs_help: bool | None = None
+    emotion_rating: int | None = None
+    notes: str | None = None
+    teacher_note: str | None = None
+    action_taken: str | None = None
+    was_reviewed: bool
+    created_at: datetime
+
+
+class CheckTypeStats(PayloadBase):
+    """On-task counts for one self-check type."""
+    total: int
+    on_task_count: int
+    percentage: float
+
+
+class SelfMonitoringSummary(PayloadBase):
+    """Summary of self-monitoring data."""
+    learner_id: str
+    date_range_start: date
+    date_range_end: date
+    total_checks: int
+    on_task_percentage: float
+    by_check_type: dict[SelfCheckType, CheckTypeStats]
+    by_subject: SkipValidation[dict[str, Any]] | None = None
+    by_time_of_day: SkipValidation[dict[str, Any]]  # { morning, afternoon, etc. }
+    trends: list[str]  # Observed patterns
+    recommendations: list[str]
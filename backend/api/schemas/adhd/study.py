@@ -0,0 +1,105 @@
+"""
+Study session schemas.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from api.schemas.adhd.enums import StudyTechnique, IntervalType
+from api.schemas.common import ORMBase, PayloadBase
+
+
+# ==========================================
+# STUDY SESSION
+# ==========================================
+
+class PomodoroSettings(PayloadBase):
+    """Pomodoro timer settings."""
+    work_minutes: int = 25
+    short_break_minutes: int = 5
+    long_break_minutes: int = 15
+    long_break_after: int = 4  # After N work intervals
+    total_cycles: int | None = None
+
+
+class StudyInterval(PayloadBase):
+    """A single interval in a study session."""
+    id: str
+    start_time: datetime
+    end_time: datetime | None = None
+    interval_type: IntervalType
+    completed: bool = False
+    duration_minutes: int | None = None
+
+
+class StudySessionCreate(PayloadBase):
+    """Create a study session."""
+    learner_id: str
+    assignment_id: str | None = None
+    start_time: datetime
+    planned_duration: int  # minutes
+    technique: StudyTechnique = StudyTechnique.POMODORO
+    pomodoro_settings: PomodoroSettings | None = None
+    location: str | None = None
+    energy_before: int | None = Field(None, ge=1, le=5)
+
+
+class StudySessionUpdate(PayloadBase):
+    """Update a study session."""
+    end_time: datetime | None = None
+    actual_duration: int | None = None
+    intervals: list[StudyInterval] | None = None
+    distraction_count: int | None = None
+    focus_rating: int | None = Field(None, ge=1, le=5)
+    energy_after: int | None = Field(None, ge=1, le=5)
+    notes: str | None = None
+    accomplishments: list[str] | None = None
+    blockers: list[str] | None = None
+    next_steps: str | None = None
+    was_completed: bool | None = None
+    ended_early: bool | None = None
+    early_end_reason: str | None = None
+    location: str | None = None
+    music_playing: bool | None = None
+    noise_level: str | None = None
+    people_nearby: bool | None = None
+
+
+class StudySessionResponse(ORMBase):
+    """Study session response."""
+    id: str
+    learner_id: str
+    assignment_id: str | None = None
+    start_time: datetime
+    end_time: datetime | None = None
+    planned_duration: int
+    actual_duration: int | None = None
+    technique: StudyTechnique
+    pomodoro_settings: PomodoroSettings | None = None
+    intervals: list[StudyInterval] | None = None
+    distraction_count: int | None = None
+    focus_rating: int | None = None
+    energy_before: int | None = None
+    energy_after: int | None = None
+    location: str | None = None
+    music_playing: bool | None = None
+    noise_level: str | None = None
+    people_nearby: bool | None = None
+    notes: str | None = None
+    accomplishments: list[str]
+    blockers: list[str]
+    next_steps: str | None = None
+    was_completed: bool
+    ended_early: bool
+    early_end_reason: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class RecordIntervalRequest(PayloadBase):
+    """Record a study interval completion."""
+    interval_type: IntervalType
+    start_time: datetime
+    end_time: datetime
+    completed: bool = True
+    distraction_count: int | None = None
@@ -0,0 +1,33 @@
+"""
+Urgency calculation schemas.
+"""
+
+from api.schemas.adhd.enums import UrgencyLevel
+from api.schemas.common import PayloadBase, ResponseBase
+
+
+# ==========================================
+# URGENCY CALCULATION
+# ==========================================
+
+class UrgencyCalculationRequest(PayloadBase):
+    """Request to calculate urgency for assignments."""
+    assignment_ids: list[str]
+    include_estimated_time: bool = True
+
+
+class UrgencyItem(PayloadBase):
+    """Urgency result for a single assignment."""
+    assignment_id: str
+    urgency_level: UrgencyLevel
+    days_until_due: int
+    adjusted_urgency: UrgencyLevel  # After accounting for estimated work time
+
+
+class UrgencyCalculationResponse(ResponseBase):
+    """Urgency calculation results."""
+    calculations: list[UrgencyItem]
+    critical_count: int
+    high_count: int
+    medium_count: int
+    low_count: int
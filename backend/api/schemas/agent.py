@@ -4,51 +4,58 @@ Author: artpromedia
 Date: 2025-11-23
 """
 
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
+from pydantic import BaseModel, SkipValidation, TypeAdapter
+from typing import Any
 from datetime import datetime
 
 
 class AgentInteraction(BaseModel):
     learner_id: str
     type: str
-    content: Dict[str, Any]
-    response: Optional[str] = None
-    context: Optional[Dict[str, Any]] = None
+    content: dict[str, Any]
+    response: str | None = None
+    context: dict[str, Any] | None = None
 
 
+# Virtual Brain output is built server-side and passed through as-is, so
+# the nested payloads below skip validation.
+
 class AgentResponse(BaseModel):
     success: bool
     brain_id: str
-    adapted_content: Dict[str, Any]
+    adapted_content: SkipValidation[dict[str, Any]]
     ai_response: str
-    feedback: Optional[Dict[str, Any]] = None
-    state: Dict[str, Any]
-    performance: Dict[str, Any]
-    recommendations: List[Dict[str, Any]]
+    feedback: SkipValidation[dict[str, Any]] | None = None
+    state: SkipValidation[dict[str, Any]]
+    performance: SkipValidation[dict[str, Any]]
+    recommendations: SkipValidation[list[dict[str, Any]]]
     adaptation_applied: bool
     processing_time: float
     session_id: str
 
 
+# Built once at import; validates and serializes every /interact result
+AGENT_RESPONSE_ADAPTER = TypeAdapter(AgentResponse)
+
+
 class AgentState(BaseModel):
     brain_id: str
     learner_id: str
-    cognitive_state: Dict[str, Any]
-    performance_metrics: Dict[str, Any]
-    current_session: Dict[str, Any]
+    cognitive_state: SkipValidation[dict[str, Any]]
+    performance_metrics: SkipValidation[dict[str, Any]]
+    current_session: SkipValidation[dict[str, Any]]
     initialized: bool
 
 
 class AdaptationRequest(BaseModel):
     learner_id: str
-    content: Dict[str, Any]
+    content: dict[str, Any]
 
 
 class AdaptationResponse(BaseModel):
-    original_content: Dict[str, Any]
-    adapted_content: Dict[str, Any]
-    adaptations_applied: List[str]
+    original_content: SkipValidation[dict[str, Any]]
+    adapted_content: SkipValidation[dict[str, Any]]
+    adaptations_applied: list[str]
     learner_id: str
 
 
@@ -61,6 +68,6 @@ class SessionSummary(BaseModel):
     duration_minutes: float
     interactions_count: int
     adaptations_made: int
-    final_state: Dict[str, Any]
-    final_performance: Dict[str, Any]
-    recommendations: List[Dict[str, Any]]
+    final_state: SkipValidation[dict[str, Any]]
+    final_performance: SkipValidation[dict[str, Any]]
+    recommendations: SkipValidation[list[dict[str, Any]]]
@@ -5,9 +5,10 @@ Date: 2025-11-23
 """
 
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
 from datetime import datetime
 
+from api.schemas.common import ORMBase
+
 
 class UserSignup(BaseModel):
     email: EmailStr
@@ -23,7 +24,7 @@ class UserLogin(BaseModel):
     password: str
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMBase):
     id: str
     email: str
     full_name: str
@@ -31,9 +32,6 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class TokenResponse(BaseModel):
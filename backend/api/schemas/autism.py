@@ -5,10 +5,17 @@ Pydantic models for visual supports, social stories, behavior tracking,
 communication profiles, and transition support.
 """
 
+import re
 from datetime import datetime, date, time
 from enum import Enum
-from typing import Optional, List, Any
-from pydantic import BaseModel, Field
+from typing import Any, Literal, Union
+from typing_extensions import Annotated
+from pydantic import AfterValidator, Discriminator, Field, Tag, TypeAdapter, computed_field, model_validator
+from pydantic_core import PydanticCustomError
+
+from api.schemas.common import (
+    FastStrEnum, InternedStr, ORMBase, PayloadBase, ResponseBase, make_partial, value_object,
+)
 
 
 # ==========================================
@@ -55,6 +62,11 @@ class VisualSupportType(str, Enum):
     RULE_REMINDER = "RULE_REMINDER"
 
 
+# Field type for visual support kinds: validated as a string set lookup
+# instead of constructing VisualSupportType members on every request
+VisualSupportKind = Literal[tuple(member.value for member in VisualSupportType)]
+
+
 class SocialStorySentenceType(str, Enum):
     """Carol Gray's Social Story sentence types."""
     DESCRIPTIVE = "DESCRIPTIVE"  # Factual, objective statements
@@ -65,7 +77,7 @@ class SocialStorySentenceType(str, Enum):
     COOPERATIVE = "COOPERATIVE"  # What others will do to help
 
 
-class BehaviorFunction(str, Enum):
+class BehaviorFunction(FastStrEnum):
     """Hypothesized behavior functions."""
     ATTENTION = "ATTENTION"
     ESCAPE = "ESCAPE"
@@ -74,7 +86,7 @@ class BehaviorFunction(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-class BehaviorIntensity(str, Enum):
+class BehaviorIntensity(FastStrEnum):
     """Behavior intensity levels."""
     LOW = "LOW"
     MODERATE = "MODERATE"
@@ -82,7 +94,7 @@ class BehaviorIntensity(str, Enum):
     SEVERE = "SEVERE"
 
 
-class TransitionDifficulty(str, Enum):
+class TransitionDifficulty(FastStrEnum):
     """Transition difficulty levels."""
     NONE = "NONE"
     MILD = "MILD"
@@ -91,170 +103,152 @@ class TransitionDifficulty(str, Enum):
     SEVERE = "SEVERE"
 
 
+# Closed string vocabularies stored as plain strings in the database
+ExpressiveMode = Literal["speech", "sign", "AAC", "gestures", "mixed"]
+ScheduleType = Literal["daily", "weekly", "activity", "class", "custom"]
+ScheduleDisplayFormat = Literal["vertical", "horizontal", "grid"]
+ScheduleImageSize = Literal["small", "medium", "large"]
+
+
+_HEX_COLOR_MATCH = re.compile(r"#[0-9a-fA-F]{6}").fullmatch
+
+
+def _check_hex_color(value: str) -> str:
+    """Validate a "#RRGGBB" color."""
+    if not _HEX_COLOR_MATCH(value):
+        raise PydanticCustomError("hex_color", "must be a hex color in #RRGGBB format")
+    return value
+
+
+# "#RRGGBB" color string
+HexColor = Annotated[str, AfterValidator(_check_hex_color)]
+
+
 # ==========================================
 # AUTISM PROFILE
 # ==========================================
 
-class SpecialInterest(BaseModel):
+class SpecialInterest(PayloadBase):
     """A special interest that can be leveraged for engagement."""
     topic: str
     intensity: int = Field(ge=1, le=5)  # 1-5 scale
     can_use_for_rewards: bool = True
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
-class AutismProfileCreate(BaseModel):
+class AutismProfileCreate(PayloadBase):
     """Create an autism profile."""
     learner_id: str
-    diagnosis_date: Optional[datetime] = None
-    diagnosed_by: Optional[str] = None
-    support_level: Optional[int] = Field(None, ge=1, le=3)  # DSM-5 Level 1-3
-    assessment_notes: Optional[str] = None
+    diagnosis_date: datetime | None = None
+    diagnosed_by: str | None = None
+    support_level: int | None = Field(None, ge=1, le=3)  # DSM-5 Level 1-3
+    assessment_notes: str | None = None
     
     # Communication
     communication_style: CommunicationStyle = CommunicationStyle.VERBAL
-    expressive_language: Optional[int] = Field(None, ge=1, le=5)
-    receptive_language: Optional[int] = Field(None, ge=1, le=5)
+    expressive_language: int | None = Field(None, ge=1, le=5)
+    receptive_language: int | None = Field(None, ge=1, le=5)
     uses_aac: bool = False
-    aac_system_type: Optional[str] = None
-    communication_strengths: List[str] = []
-    communication_challenges: List[str] = []
+    aac_system_type: str | None = None
+    communication_strengths: list[str] = Field(default_factory=list)
+    communication_challenges: list[str] = Field(default_factory=list)
     
     # Social interaction
     social_interaction_level: SocialInteractionLevel = SocialInteractionLevel.DEVELOPING
-    joint_attention: Optional[int] = Field(None, ge=1, le=5)
-    peer_interaction: Optional[int] = Field(None, ge=1, le=5)
-    adult_interaction: Optional[int] = Field(None, ge=1, le=5)
-    social_strengths: List[str] = []
-    social_challenges: List[str] = []
+    joint_attention: int | None = Field(None, ge=1, le=5)
+    peer_interaction: int | None = Field(None, ge=1, le=5)
+    adult_interaction: int | None = Field(None, ge=1, le=5)
+    social_strengths: list[str] = Field(default_factory=list)
+    social_challenges: list[str] = Field(default_factory=list)
     
     # Flexibility and routines
     change_flexibility: ChangeFlexibility = ChangeFlexibility.MODERATELY_FLEXIBLE
     needs_visual_schedule: bool = True
     needs_transition_warnings: bool = True
     preferred_warning_time: int = 5
-    routine_preferences: Optional[dict] = None
+    routine_preferences: dict | None = None
     
     # Sensory and interests
-    sensory_profile_id: Optional[str] = None
-    primary_sensory_needs: List[str] = []
-    special_interests: List[SpecialInterest] = []
+    sensory_profile_id: str | None = None
+    primary_sensory_needs: list[str] = Field(default_factory=list)
+    special_interests: list[SpecialInterest] = Field(default_factory=list)
     
     # Behavior
-    common_triggers: List[str] = []
-    calming_strategies: List[str] = []
-    reinforcers: List[str] = []
+    common_triggers: list[InternedStr] = Field(default_factory=list)
+    calming_strategies: list[InternedStr] = Field(default_factory=list)
+    reinforcers: list[InternedStr] = Field(default_factory=list)
     
     # Support preferences
-    preferred_visual_support_types: List[VisualSupportType] = []
+    preferred_visual_support_types: list[VisualSupportKind] = Field(default_factory=list)
     needs_social_stories: bool = True
     needs_token_system: bool = False
-    token_goal_size: Optional[int] = None
+    token_goal_size: int | None = None
     
     # Team notes
-    parent_notes: Optional[str] = None
-    teacher_notes: Optional[str] = None
-    therapist_notes: Optional[str] = None
-
-
-class AutismProfileUpdate(BaseModel):
-    """Update an autism profile."""
-    diagnosis_date: Optional[datetime] = None
-    diagnosed_by: Optional[str] = None
-    support_level: Optional[int] = Field(None, ge=1, le=3)
-    assessment_notes: Optional[str] = None
-    communication_style: Optional[CommunicationStyle] = None
-    expressive_language: Optional[int] = Field(None, ge=1, le=5)
-    receptive_language: Optional[int] = Field(None, ge=1, le=5)
-    uses_aac: Optional[bool] = None
-    aac_system_type: Optional[str] = None
-    communication_strengths: Optional[List[str]] = None
-    communication_challenges: Optional[List[str]] = None
-    social_interaction_level: Optional[SocialInteractionLevel] = None
-    joint_attention: Optional[int] = Field(None, ge=1, le=5)
-    peer_interaction: Optional[int] = Field(None, ge=1, le=5)
-    adult_interaction: Optional[int] = Field(None, ge=1, le=5)
-    social_strengths: Optional[List[str]] = None
-    social_challenges: Optional[List[str]] = None
-    change_flexibility: Optional[ChangeFlexibility] = None
-    needs_visual_schedule: Optional[bool] = None
-    needs_transition_warnings: Optional[bool] = None
-    preferred_warning_time: Optional[int] = None
-    routine_preferences: Optional[dict] = None
-    sensory_profile_id: Optional[str] = None
-    primary_sensory_needs: Optional[List[str]] = None
-    special_interests: Optional[List[SpecialInterest]] = None
-    common_triggers: Optional[List[str]] = None
-    calming_strategies: Optional[List[str]] = None
-    reinforcers: Optional[List[str]] = None
-    preferred_visual_support_types: Optional[List[VisualSupportType]] = None
-    needs_social_stories: Optional[bool] = None
-    needs_token_system: Optional[bool] = None
-    token_goal_size: Optional[int] = None
-    parent_notes: Optional[str] = None
-    teacher_notes: Optional[str] = None
-    therapist_notes: Optional[str] = None
-
-
-class AutismProfileResponse(BaseModel):
+    parent_notes: str | None = None
+    teacher_notes: str | None = None
+    therapist_notes: str | None = None
+
+
+AutismProfileUpdate = make_partial(AutismProfileCreate, "learner_id")
+
+
+class AutismProfileResponse(ORMBase):
     """Autism profile response."""
     id: str
     learner_id: str
-    diagnosis_date: Optional[datetime]
-    diagnosed_by: Optional[str]
-    support_level: Optional[int]
-    assessment_notes: Optional[str]
+    diagnosis_date: datetime | None = None
+    diagnosed_by: str | None = None
+    support_level: int | None = None
+    assessment_notes: str | None = None
     communication_style: CommunicationStyle
-    expressive_language: Optional[int]
-    receptive_language: Optional[int]
+    expressive_language: int | None = None
+    receptive_language: int | None = None
     uses_aac: bool
-    aac_system_type: Optional[str]
-    communication_strengths: List[str]
-    communication_challenges: List[str]
+    aac_system_type: str | None = None
+    communication_strengths: list[str]
+    communication_challenges: list[str]
     social_interaction_level: SocialInteractionLevel
-    joint_attention: Optional[int]
-    peer_interaction: Optional[int]
-    adult_interaction: Optional[int]
-    social_strengths: List[str]
-    social_challenges: List[str]
+    joint_attention: int | None = None
+    peer_interaction: int | None = None
+    adult_interaction: int | None = None
+    social_strengths: list[str]
+    social_challenges: list[str]
     change_flexibility: ChangeFlexibility
     needs_visual_schedule: bool
     needs_transition_warnings: bool
     preferred_warning_time: int
-    routine_preferences: Optional[dict]
-    sensory_profile_id: Optional[str]
-    primary_sensory_needs: List[str]
-    special_interests: Optional[List[dict]]
-    common_triggers: List[str]
-    calming_strategies: List[str]
-    reinforcers: List[str]
-    preferred_visual_support_types: List[VisualSupportType]
+    routine_preferences: dict | None = None
+    sensory_profile_id: str | None = None
+    primary_sensory_needs: list[str]
+    special_interests: list[dict] | None = None
+    common_triggers: list[InternedStr]
+    calming_strategies: list[InternedStr]
+    reinforcers: list[InternedStr]
+    preferred_visual_support_types: list[VisualSupportKind]
     needs_social_stories: bool
     needs_token_system: bool
-    token_goal_size: Optional[int]
-    parent_notes: Optional[str]
-    teacher_notes: Optional[str]
-    therapist_notes: Optional[str]
+    token_goal_size: int | None = None
+    parent_notes: str | None = None
+    teacher_notes: str | None = None
+    therapist_notes: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # COMMUNICATION PROFILE
 # ==========================================
 
-class CommunicationProfileCreate(BaseModel):
+class CommunicationProfileCreate(PayloadBase):
     """Create a communication profile."""
     autism_profile_id: str
     
     # Expressive
-    primary_expressive_mode: str = "speech"
-    speech_clarity: Optional[int] = Field(None, ge=1, le=5)
-    average_utterance_length: Optional[int] = None
-    vocabulary_level: Optional[str] = None
+    primary_expressive_mode: ExpressiveMode = "speech"
+    speech_clarity: int | None = Field(None, ge=1, le=5)
+    average_utterance_length: int | None = None
+    vocabulary_level: str | None = None
     can_request_help: bool = False
     can_express_needs: bool = False
     can_ask_questions: bool = False
@@ -268,73 +262,41 @@ class CommunicationProfileCreate(BaseModel):
     understands_idioms: bool = False
     needs_visual_supports: bool = True
     needs_simplified_language: bool = False
-    processing_time: Optional[int] = None
+    processing_time: int | None = None
     
     # Pragmatic
     makes_eye_contact: bool = True
     initiates_conversation: bool = False
     maintains_conversation: bool = False
     takes_turns: bool = False
-    understood_by_familiar: Optional[int] = Field(None, ge=1, le=5)
-    understood_by_unfamiliar: Optional[int] = Field(None, ge=1, le=5)
+    understood_by_familiar: int | None = Field(None, ge=1, le=5)
+    understood_by_unfamiliar: int | None = Field(None, ge=1, le=5)
     
     # AAC
-    aac_device_type: Optional[str] = None
-    aac_app_or_system: Optional[str] = None
-    aac_vocabulary_size: Optional[int] = None
-    aac_proficiency: Optional[int] = Field(None, ge=1, le=5)
-    aac_supports_needed: List[str] = []
+    aac_device_type: str | None = None
+    aac_app_or_system: str | None = None
+    aac_vocabulary_size: int | None = None
+    aac_proficiency: int | None = Field(None, ge=1, le=5)
+    aac_supports_needed: list[str] = Field(default_factory=list)
     
     # Goals and strategies
-    current_goals: List[str] = []
-    target_skills: List[str] = []
-    effective_strategies: List[str] = []
-    ineffective_approaches: List[str] = []
-
-
-class CommunicationProfileUpdate(BaseModel):
-    """Update a communication profile."""
-    primary_expressive_mode: Optional[str] = None
-    speech_clarity: Optional[int] = Field(None, ge=1, le=5)
-    average_utterance_length: Optional[int] = None
-    vocabulary_level: Optional[str] = None
-    can_request_help: Optional[bool] = None
-    can_express_needs: Optional[bool] = None
-    can_ask_questions: Optional[bool] = None
-    can_tell_stories: Optional[bool] = None
-    follows_simple_directions: Optional[bool] = None
-    follows_multi_step_directions: Optional[bool] = None
-    understands_questions: Optional[bool] = None
-    understands_sarcasm: Optional[bool] = None
-    understands_idioms: Optional[bool] = None
-    needs_visual_supports: Optional[bool] = None
-    needs_simplified_language: Optional[bool] = None
-    processing_time: Optional[int] = None
-    makes_eye_contact: Optional[bool] = None
-    initiates_conversation: Optional[bool] = None
-    maintains_conversation: Optional[bool] = None
-    takes_turns: Optional[bool] = None
-    understood_by_familiar: Optional[int] = Field(None, ge=1, le=5)
-    understood_by_unfamiliar: Optional[int] = Field(None, ge=1, le=5)
-    aac_device_type: Optional[str] = None
-    aac_app_or_system: Optional[str] = None
-    aac_vocabulary_size: Optional[int] = None
-    aac_proficiency: Optional[int] = Field(None, ge=1, le=5)
-    aac_supports_needed: Optional[List[str]] = None
-    current_goals: Optional[List[str]] = None
-    target_skills: Optional[List[str]] = None
-    effective_strategies: Optional[List[str]] = None
-    ineffective_approaches: Optional[List[str]] = None
-
-
-class CommunicationProfileResponse(BaseModel):
+    current_goals: list[str] = Field(default_factory=list)
+    target_skills: list[str] = Field(default_factory=list)
+    effective_strategies: list[str] = Field(default_factory=list)
+    ineffective_approaches: list[str] = Field(default_factory=list)
+
+
+CommunicationProfileUpdate = make_partial(CommunicationProfileCreate, "autism_profile_id")
+
+
+class CommunicationProfileResponse(ORMBase):
     """Communication profile response."""
     id: str
     autism_profile_id: str
     primary_expressive_mode: str
-    speech_clarity: Optional[int]
-    average_utterance_length: Optional[int]
-    vocabulary_level: Optional[str]
+    speech_clarity: int | None = None
+    average_utterance_length: int | None = None
+    vocabulary_level: str | None = None
     can_request_help: bool
     can_express_needs: bool
     can_ask_questions: bool
@@ -346,215 +308,277 @@ class CommunicationProfileResponse(BaseModel):
     understands_idioms: bool
     needs_visual_supports: bool
     needs_simplified_language: bool
-    processing_time: Optional[int]
+    processing_time: int | None = None
     makes_eye_contact: bool
     initiates_conversation: bool
     maintains_conversation: bool
     takes_turns: bool
-    understood_by_familiar: Optional[int]
-    understood_by_unfamiliar: Optional[int]
-    aac_device_type: Optional[str]
-    aac_app_or_system: Optional[str]
-    aac_vocabulary_size: Optional[int]
-    aac_proficiency: Optional[int]
-    aac_supports_needed: List[str]
-    current_goals: List[str]
-    target_skills: List[str]
-    effective_strategies: List[str]
-    ineffective_approaches: List[str]
+    understood_by_familiar: int | None = None
+    understood_by_unfamiliar: int | None = None
+    aac_device_type: str | None = None
+    aac_app_or_system: str | None = None
+    aac_vocabulary_size: int | None = None
+    aac_proficiency: int | None = None
+    aac_supports_needed: list[str]
+    current_goals: list[str]
+    target_skills: list[str]
+    effective_strategies: list[str]
+    ineffective_approaches: list[str]
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # VISUAL SUPPORT
 # ==========================================
 
-class FirstThenContent(BaseModel):
+class FirstThenContent(PayloadBase):
     """Content for a First-Then board."""
+    kind: Literal["first_then"] = "first_then"
     first: dict  # { text, imageUrl }
     then: dict  # { text, imageUrl }
 
 
-class ChoiceBoardChoice(BaseModel):
+class ChoiceBoardChoice(PayloadBase):
     """A choice on a choice board."""
     id: str
     text: str
-    image_url: Optional[str] = None
+    image_url: str | None = None
+
 
+class ChoiceBoardContent(PayloadBase):
+    """Content for a choice board."""
+    kind: Literal["choice_board"] = "choice_board"
+    choices: list[ChoiceBoardChoice]
 
-class TaskStep(BaseModel):
+
+class TaskStep(PayloadBase):
     """A step in a task analysis."""
     step_number: int
     text: str
-    image_url: Optional[str] = None
+    image_url: str | None = None
     is_completed: bool = False
 
 
-class VisualSupportCreate(BaseModel):
+class TaskAnalysisContent(PayloadBase):
+    """Content for a task analysis."""
+    kind: Literal["task_analysis"] = "task_analysis"
+    steps: list[TaskStep]
+
+
+_TYPED_SUPPORT_CONTENT = frozenset({"first_then", "choice_board", "task_analysis"})
+
+
+def _support_content_kind(value: Any) -> str:
+    """Route content by its `kind` tag; untagged or other kinds stay free-form."""
+    kind = value.get("kind") if isinstance(value, dict) else getattr(value, "kind", None)
+    return kind if kind in _TYPED_SUPPORT_CONTENT else "other"
+
+
+# Tagged union: validation goes straight to the member named by `kind`
+# instead of trying each shape in turn. Support types without a dedicated
+# model (emotion charts, timers, coping cards, ...) keep a plain dict.
+VisualSupportContent = Annotated[
+    Union[
+        Annotated[FirstThenContent, Tag("first_then")],
+        Annotated[ChoiceBoardContent, Tag("choice_board")],
+        Annotated[TaskAnalysisContent, Tag("task_analysis")],
+        Annotated[dict[str, Any], Tag("other")],
+    ],
+    Discriminator(_support_content_kind),
+]
+
+
+class VisualSupportCreate(PayloadBase):
     """Create a visual support."""
     autism_profile_id: str
-    type: VisualSupportType
+    type: VisualSupportKind
     title: str
-    description: Optional[str] = None
-    instructions: Optional[str] = None
-    image_url: Optional[str] = None
-    image_urls: List[str] = []
-    content: Optional[dict] = None
+    description: str | None = None
+    instructions: str | None = None
+    image_url: str | None = None
+    image_urls: list[str] = Field(default_factory=list)
+    content: VisualSupportContent | None = None
     is_active: bool = True
     is_printable: bool = True
     show_on_dashboard: bool = False
     display_order: int = 0
-    contexts: List[str] = []
-    subjects: List[str] = []
-    activities: List[str] = []
+    contexts: list[InternedStr] = Field(default_factory=list)
+    subjects: list[InternedStr] = Field(default_factory=list)
+    activities: list[InternedStr] = Field(default_factory=list)
     is_shared_with_parent: bool = True
     is_template: bool = False
 
 
-class VisualSupportUpdate(BaseModel):
-    """Update a visual support."""
-    title: Optional[str] = None
-    description: Optional[str] = None
-    instructions: Optional[str] = None
-    image_url: Optional[str] = None
-    image_urls: Optional[List[str]] = None
-    content: Optional[dict] = None
-    is_active: Optional[bool] = None
-    is_printable: Optional[bool] = None
-    show_on_dashboard: Optional[bool] = None
-    display_order: Optional[int] = None
-    contexts: Optional[List[str]] = None
-    subjects: Optional[List[str]] = None
-    activities: Optional[List[str]] = None
-    is_shared_with_parent: Optional[bool] = None
-    is_template: Optional[bool] = None
-
-
-class VisualSupportResponse(BaseModel):
+VisualSupportUpdate = make_partial(VisualSupportCreate, "autism_profile_id", "type")
+
+
+class VisualSupportResponse(ORMBase):
     """Visual support response."""
     id: str
     autism_profile_id: str
-    created_by_id: Optional[str]
-    type: VisualSupportType
+    created_by_id: str | None = None
+    type: VisualSupportKind
     title: str
-    description: Optional[str]
-    instructions: Optional[str]
-    image_url: Optional[str]
-    image_urls: List[str]
-    content: Optional[dict]
+    description: str | None = None
+    instructions: str | None = None
+    image_url: str | None = None
+    image_urls: list[str]
+    content: VisualSupportContent | None = None
     is_active: bool
     is_printable: bool
     show_on_dashboard: bool
     display_order: int
-    contexts: List[str]
-    subjects: List[str]
-    activities: List[str]
+    contexts: list[InternedStr]
+    subjects: list[InternedStr]
+    activities: list[InternedStr]
     usage_count: int
-    last_used_at: Optional[datetime]
-    effectiveness_rating: Optional[int]
+    last_used_at: datetime | None = None
+    effectiveness_rating: int | None = None
     is_shared_with_parent: bool
     is_template: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class RecordVisualSupportUsage(BaseModel):
+class RecordVisualSupportUsage(PayloadBase):
     """Record usage of a visual support."""
-    effectiveness_rating: Optional[int] = Field(None, ge=1, le=5)
-    notes: Optional[str] = None
+    effectiveness_rating: int | None = Field(None, ge=1, le=5)
+    notes: str | None = None
 
 
 # ==========================================
 # VISUAL SCHEDULE
 # ==========================================
 
-class ScheduleItem(BaseModel):
+class ScheduleItem(PayloadBase):
     """An item in a visual schedule."""
     id: str
     order: int
     activity: str
-    image_url: Optional[str] = None
-    start_time: Optional[str] = None  # "08:00"
-    end_time: Optional[str] = None
-    duration: Optional[int] = None  # minutes
+    image_url: str | None = None
+    start_time: str | None = None  # "08:00"
+    end_time: str | None = None
+    duration: int | None = None  # minutes
     is_completed: bool = False
-    notes: Optional[str] = None
+    notes: str | None = None
+
+
+# Shared validator/serializer for schedule item lists
+SCHEDULE_ITEMS_ADAPTER = TypeAdapter(list[ScheduleItem])
+
+
+def days_to_mask(days: list[int]) -> int:
+    """Pack weekdays (0-6) into the 7-bit `applicable_days_mask`; [] = all days (0)."""
+    mask = 0
+    for day in days:
+        if type(day) is not int or not 0 <= day <= 6:
+            raise PydanticCustomError("applicable_days", "applicable_days must be weekdays 0-6")
+        mask |= 1 << day
+    return mask
+
+
+def mask_to_days(mask: int) -> list[int]:
+    """Weekday list for the stored `applicableDays Int[]` column; 0 = [] (all days)."""
+    return [day for day in range(7) if mask >> day & 1]
 
 
-class VisualScheduleCreate(BaseModel):
+def _accept_applicable_days(data: Any) -> Any:
+    """Map the legacy `applicable_days` list onto `applicable_days_mask` when no mask is sent."""
+    if isinstance(data, dict) and "applicable_days_mask" not in data:
+        days = data.get("applicable_days")
+        if days is not None:
+            if not isinstance(days, list):
+                raise PydanticCustomError("applicable_days", "applicable_days must be weekdays 0-6")
+            data = {**data, "applicable_days_mask": days_to_mask(days)}
+    return data
+
+
+class VisualScheduleCreate(PayloadBase):
     """Create a visual schedule."""
     autism_profile_id: str
     name: str
-    description: Optional[str] = None
-    schedule_type: str = "daily"  # "daily", "weekly", "activity", "class", "custom"
-    items: List[ScheduleItem] = []
-    display_format: str = "vertical"  # "vertical", "horizontal", "grid"
+    description: str | None = None
+    schedule_type: ScheduleType = "daily"
+    items: list[ScheduleItem] = Field(default_factory=list)
+    display_format: ScheduleDisplayFormat = "vertical"
     show_times: bool = True
     show_checkboxes: bool = True
-    image_size: str = "medium"  # "small", "medium", "large"
-    color_coding: Optional[dict] = None
-    applicable_days: List[int] = []  # 0-6 for days of week
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    image_size: ScheduleImageSize = "medium"
+    color_coding: dict[str, HexColor] | None = None  # { category: color }
+    applicable_days_mask: int = Field(0, ge=0, le=127)  # Bit d set = applies on day d (0-6); 0 = all days
+    start_time: str | None = None
+    end_time: str | None = None
     is_active: bool = True
     is_template: bool = False
 
+    _applicable_days = model_validator(mode="before")(_accept_applicable_days)
+
+    @property
+    def applicable_days(self) -> list[int]:
+        """Weekday list to write to the `applicableDays` column."""
+        return mask_to_days(self.applicable_days_mask)
+
 
-class VisualScheduleUpdate(BaseModel):
+class VisualScheduleUpdate(make_partial(VisualScheduleCreate, "autism_profile_id")):
     """Update a visual schedule."""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    schedule_type: Optional[str] = None
-    items: Optional[List[ScheduleItem]] = None
-    display_format: Optional[str] = None
-    show_times: Optional[bool] = None
-    show_checkboxes: Optional[bool] = None
-    image_size: Optional[str] = None
-    color_coding: Optional[dict] = None
-    applicable_days: Optional[List[int]] = None
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
-    is_active: Optional[bool] = None
-    is_template: Optional[bool] = None
-
-
-class VisualScheduleResponse(BaseModel):
+    _applicable_days = model_validator(mode="before")(_accept_applicable_days)
+
+
+class VisualScheduleResponse(ORMBase):
     """Visual schedule response."""
     id: str
     autism_profile_id: str
-    created_by_id: Optional[str]
+    created_by_id: str | None = None
     name: str
-    description: Optional[str]
+    description: str | None = None
     schedule_type: str
-    items: List[dict]
+    items: list[dict]
     display_format: str
     show_times: bool
     show_checkboxes: bool
     image_size: str
-    color_coding: Optional[dict]
-    applicable_days: List[int]
-    start_time: Optional[str]
-    end_time: Optional[str]
+    color_coding: dict | None = None
+    applicable_days_mask: int = 0
+    start_time: str | None = None
+    end_time: str | None = None
     is_active: bool
     is_template: bool
     times_used: int
-    last_used_at: Optional[datetime]
-    completion_rate: Optional[float]
+    last_used_at: datetime | None = None
+    completion_rate: float | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
-
-class MarkScheduleItemComplete(BaseModel):
+    @model_validator(mode="before")
+    @classmethod
+    def _from_applicable_days(cls, data: Any) -> Any:
+        # Rows carry the stored `applicableDays` list rather than a mask
+        if not isinstance(data, dict) and not hasattr(data, "applicable_days_mask"):
+            data = {name: getattr(data, name) for name in (*cls.model_fields, "applicable_days") if hasattr(data, name)}
+        return _accept_applicable_days(data)
+
+    @classmethod
+    def from_row(cls, row: Any) -> "VisualScheduleResponse":
+        """`ORMBase.from_row`, packing the row's `applicable_days` list into the mask."""
+        response = super().from_row(row)
+        days = getattr(row, "applicable_days", None)
+        if days and not hasattr(row, "applicable_days_mask"):
+            response = response.model_copy(update={"applicable_days_mask": days_to_mask(days)})
+        return response
+
+    # Day list derived from the mask, kept for clients that read applicable_days
+    @computed_field
+    @property
+    def applicable_days(self) -> list[int]:
+        return mask_to_days(self.applicable_days_mask)
+
+    def applies_on(self, day: int) -> bool:
+        """Whether the schedule is used on weekday `day` (0-6)."""
+        return not self.applicable_days_mask or bool(self.applicable_days_mask & (1 << day))
+
+
+class MarkScheduleItemComplete(PayloadBase):
     """Mark a schedule item as complete."""
     item_id: str
     is_completed: bool = True
@@ -564,67 +588,55 @@ class MarkScheduleItemComplete(BaseModel):
 # SOCIAL STORY
 # ==========================================
 
-class SocialStorySentence(BaseModel):
+@value_object
+class SocialStorySentence:
     """A sentence in a social story."""
     order: int
     text: str
     type: SocialStorySentenceType
-    image_url: Optional[str] = None
+    image_url: str | None = None
     emphasis: bool = False
 
 
-class ComprehensionQuestion(BaseModel):
+@value_object
+class ComprehensionQuestion:
     """A comprehension question for a social story."""
     question: str
     correct_answer: str
-    options: Optional[List[str]] = None  # For multiple choice
+    options: list[str] | None = None  # For multiple choice
 
 
-class SocialStoryCreate(BaseModel):
+class SocialStoryCreate(PayloadBase):
     """Create a social story."""
     autism_profile_id: str
     title: str
     topic: str
-    target_situation: Optional[str] = None
-    target_behavior: Optional[str] = None
-    sentences: List[SocialStorySentence] = []
+    target_situation: str | None = None
+    target_behavior: str | None = None
+    sentences: list[SocialStorySentence] = Field(default_factory=list)
     font_size: str = "large"
     show_images: bool = True
     read_aloud: bool = True
     page_per_sentence: bool = False
-    comprehension_questions: List[ComprehensionQuestion] = []
+    comprehension_questions: list[ComprehensionQuestion] = Field(default_factory=list)
     is_active: bool = True
     is_shared_with_parent: bool = True
     is_template: bool = False
 
 
-class SocialStoryUpdate(BaseModel):
-    """Update a social story."""
-    title: Optional[str] = None
-    topic: Optional[str] = None
-    target_situation: Optional[str] = None
-    target_behavior: Optional[str] = None
-    sentences: Optional[List[SocialStorySentence]] = None
-    font_size: Optional[str] = None
-    show_images: Optional[bool] = None
-    read_aloud: Optional[bool] = None
-    page_per_sentence: Optional[bool] = None
-    comprehension_questions: Optional[List[ComprehensionQuestion]] = None
-    is_active: Optional[bool] = None
-    is_shared_with_parent: Optional[bool] = None
-    is_template: Optional[bool] = None
-
-
-class SocialStoryResponse(BaseModel):
+SocialStoryUpdate = make_partial(SocialStoryCreate, "autism_profile_id")
+
+
+class SocialStoryResponse(ORMBase):
     """Social story response."""
     id: str
     autism_profile_id: str
-    created_by_id: Optional[str]
+    created_by_id: str | None = None
     title: str
     topic: str
-    target_situation: Optional[str]
-    target_behavior: Optional[str]
-    sentences: List[dict]
+    target_situation: str | None = None
+    target_behavior: str | None = None
+    sentences: list[SocialStorySentence]
     descriptive_count: int
     perspective_count: int
     directive_count: int
@@ -636,206 +648,160 @@ class SocialStoryResponse(BaseModel):
     show_images: bool
     read_aloud: bool
     page_per_sentence: bool
-    comprehension_questions: Optional[List[dict]]
+    comprehension_questions: list[ComprehensionQuestion] | None = None
     is_active: bool
     times_read: int
-    last_read_at: Optional[datetime]
-    comprehension_score: Optional[float]
-    behavior_improvement: Optional[int]
+    last_read_at: datetime | None = None
+    comprehension_score: float | None = None
+    behavior_improvement: int | None = None
     generated_by_ai: bool
-    ai_prompt: Optional[str]
+    ai_prompt: str | None = None
     was_edited: bool
     is_shared_with_parent: bool
     is_template: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
 
-
-class RecordSocialStoryReading(BaseModel):
+class RecordSocialStoryReading(PayloadBase):
     """Record a social story reading."""
-    comprehension_answers: Optional[List[dict]] = None  # [{ question_index, answer, is_correct }]
-    notes: Optional[str] = None
+    comprehension_answers: list[dict] | None = None  # [{ question_index, answer, is_correct }]
+    notes: str | None = None
 
 
-class AIGenerateSocialStoryRequest(BaseModel):
+class AIGenerateSocialStoryRequest(PayloadBase):
     """Request to generate a social story with AI."""
     autism_profile_id: str
     topic: str
     target_situation: str
-    target_behavior: Optional[str] = None
-    learner_age: Optional[int] = None
-    learner_interests: List[str] = []
+    target_behavior: str | None = None
+    learner_age: int | None = None
+    learner_interests: list[str] = Field(default_factory=list)
     include_images: bool = True
     reading_level: str = "simple"  # "simple", "intermediate", "advanced"
 
 
-class AIGenerateSocialStoryResponse(BaseModel):
+class AIGenerateSocialStoryResponse(ResponseBase):
     """AI-generated social story response."""
     title: str
-    sentences: List[SocialStorySentence]
-    comprehension_questions: List[ComprehensionQuestion]
+    sentences: list[SocialStorySentence]
+    comprehension_questions: list[ComprehensionQuestion]
     ratio_valid: bool
-    generation_notes: Optional[str] = None
+    generation_notes: str | None = None
 
 
 # ==========================================
 # BEHAVIOR INCIDENT (ABC Data)
 # ==========================================
 
-class BehaviorIncidentCreate(BaseModel):
+class BehaviorIncidentCreate(PayloadBase):
     """Create a behavior incident record (ABC data)."""
     autism_profile_id: str
     incident_date: date
     incident_time: time
-    location: Optional[str] = None
-    activity: Optional[str] = None
-    subject: Optional[str] = None
+    location: str | None = None
+    activity: str | None = None
+    subject: str | None = None
     antecedent: str
     behavior: str
     consequence: str
     hypothesized_function: BehaviorFunction = BehaviorFunction.UNKNOWN
     intensity: BehaviorIntensity = BehaviorIntensity.MODERATE
-    duration: Optional[int] = None  # minutes
-    frequency_in_period: Optional[int] = None
-    staff_present: List[str] = []
-    peers_present: Optional[int] = None
-    environment_factors: List[str] = []
-    physical_state: Optional[str] = None
-    intervention_used: Optional[str] = None
-    intervention_effective: Optional[bool] = None
-    debrief_notes: Optional[str] = None
+    duration: int | None = None  # minutes
+    frequency_in_period: int | None = None
+    staff_present: list[InternedStr] = Field(default_factory=list)
+    peers_present: int | None = None
+    environment_factors: list[InternedStr] = Field(default_factory=list)
+    physical_state: str | None = None
+    intervention_used: str | None = None
+    intervention_effective: bool | None = None
+    debrief_notes: str | None = None
     parent_notified: bool = False
 
 
-class BehaviorIncidentUpdate(BaseModel):
+class BehaviorIncidentUpdate(make_partial(BehaviorIncidentCreate, "autism_profile_id")):
     """Update a behavior incident."""
-    incident_date: Optional[date] = None
-    incident_time: Optional[time] = None
-    location: Optional[str] = None
-    activity: Optional[str] = None
-    subject: Optional[str] = None
-    antecedent: Optional[str] = None
-    behavior: Optional[str] = None
-    consequence: Optional[str] = None
-    hypothesized_function: Optional[BehaviorFunction] = None
-    intensity: Optional[BehaviorIntensity] = None
-    duration: Optional[int] = None
-    frequency_in_period: Optional[int] = None
-    staff_present: Optional[List[str]] = None
-    peers_present: Optional[int] = None
-    environment_factors: Optional[List[str]] = None
-    physical_state: Optional[str] = None
-    intervention_used: Optional[str] = None
-    intervention_effective: Optional[bool] = None
-    debrief_completed: Optional[bool] = None
-    debrief_notes: Optional[str] = None
-    parent_notified: Optional[bool] = None
-    pattern_id: Optional[str] = None
-
-
-class BehaviorIncidentResponse(BaseModel):
+    debrief_completed: bool | None = None
+    pattern_id: str | None = None
+
+
+class BehaviorIncidentResponse(ORMBase):
     """Behavior incident response."""
     id: str
     autism_profile_id: str
-    recorded_by_id: Optional[str]
+    recorded_by_id: str | None = None
     incident_date: date
     incident_time: time
-    location: Optional[str]
-    activity: Optional[str]
-    subject: Optional[str]
+    location: str | None = None
+    activity: str | None = None
+    subject: str | None = None
     antecedent: str
     behavior: str
     consequence: str
     hypothesized_function: BehaviorFunction
     intensity: BehaviorIntensity
-    duration: Optional[int]
-    frequency_in_period: Optional[int]
-    staff_present: List[str]
-    peers_present: Optional[int]
-    environment_factors: List[str]
-    physical_state: Optional[str]
-    intervention_used: Optional[str]
-    intervention_effective: Optional[bool]
+    duration: int | None = None
+    frequency_in_period: int | None = None
+    staff_present: list[str]
+    peers_present: int | None = None
+    environment_factors: list[str]
+    physical_state: str | None = None
+    intervention_used: str | None = None
+    intervention_effective: bool | None = None
     debrief_completed: bool
-    debrief_notes: Optional[str]
+    debrief_notes: str | None = None
     parent_notified: bool
-    parent_notified_at: Optional[datetime]
-    pattern_id: Optional[str]
+    parent_notified_at: datetime | None = None
+    pattern_id: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class BehaviorIncidentListResponse(BaseModel):
+class BehaviorIncidentListResponse(ResponseBase):
     """List of behavior incidents with summary."""
-    incidents: List[BehaviorIncidentResponse]
+    incidents: list[BehaviorIncidentResponse]
     total: int
-    function_breakdown: dict  # { function: count }
-    intensity_breakdown: dict  # { intensity: count }
+    function_breakdown: dict[BehaviorFunction, int]
+    intensity_breakdown: dict[BehaviorIntensity, int]
 
 
 # ==========================================
 # BEHAVIOR PATTERN
 # ==========================================
 
-class BehaviorPatternCreate(BaseModel):
+class BehaviorPatternCreate(PayloadBase):
     """Create a behavior pattern."""
     autism_profile_id: str
     pattern_name: str
     description: str
     primary_function: BehaviorFunction
-    secondary_function: Optional[BehaviorFunction] = None
-    function_evidence: Optional[str] = None
-    common_antecedents: List[str] = []
-    common_settings: List[str] = []
-    common_times: List[str] = []
-    trigger_themes: List[str] = []
-    topography_description: Optional[str] = None
-    average_intensity: Optional[BehaviorIntensity] = None
-    average_duration: Optional[int] = None
-    average_frequency: Optional[float] = None
-    prevention_strategies: List[str] = []
-    replacement_behaviors: List[str] = []
-    teaching_strategies: List[str] = []
-    consequence_strategies: List[str] = []
-    crisis_strategies: List[str] = []
-    incident_count_before: Optional[int] = None
-    intervention_start_date: Optional[datetime] = None
-
-
-class BehaviorPatternUpdate(BaseModel):
+    secondary_function: BehaviorFunction | None = None
+    function_evidence: str | None = None
+    common_antecedents: list[InternedStr] = Field(default_factory=list)
+    common_settings: list[InternedStr] = Field(default_factory=list)
+    common_times: list[InternedStr] = Field(default_factory=list)
+    trigger_themes: list[InternedStr] = Field(default_factory=list)
+    topography_description: str | None = None
+    average_intensity: BehaviorIntensity | None = None
+    average_duration: int | None = None
+    average_frequency: float | None = None
+    prevention_strategies: list[InternedStr] = Field(default_factory=list)
+    replacement_behaviors: list[InternedStr] = Field(default_factory=list)
+    teaching_strategies: list[InternedStr] = Field(default_factory=list)
+    consequence_strategies: list[InternedStr] = Field(default_factory=list)
+    crisis_strategies: list[InternedStr] = Field(default_factory=list)
+    incident_count_before: int | None = None
+    intervention_start_date: datetime | None = None
+
+
+class BehaviorPatternUpdate(make_partial(BehaviorPatternCreate, "autism_profile_id")):
     """Update a behavior pattern."""
-    pattern_name: Optional[str] = None
-    description: Optional[str] = None
-    primary_function: Optional[BehaviorFunction] = None
-    secondary_function: Optional[BehaviorFunction] = None
-    function_evidence: Optional[str] = None
-    common_antecedents: Optional[List[str]] = None
-    common_settings: Optional[List[str]] = None
-    common_times: Optional[List[str]] = None
-    trigger_themes: Optional[List[str]] = None
-    topography_description: Optional[str] = None
-    average_intensity: Optional[BehaviorIntensity] = None
-    average_duration: Optional[int] = None
-    average_frequency: Optional[float] = None
-    prevention_strategies: Optional[List[str]] = None
-    replacement_behaviors: Optional[List[str]] = None
-    teaching_strategies: Optional[List[str]] = None
-    consequence_strategies: Optional[List[str]] = None
-    crisis_strategies: Optional[List[str]] = None
-    incident_count_before: Optional[int] = None
-    incident_count_after: Optional[int] = None
-    percent_reduction: Optional[float] = None
-    intervention_start_date: Optional[datetime] = None
-    is_active: Optional[bool] = None
-
-
-class BehaviorPatternResponse(BaseModel):
+    incident_count_after: int | None = None
+    percent_reduction: float | None = None
+    is_active: bool | None = None
+
+
+class BehaviorPatternResponse(ORMBase):
     """Behavior pattern response."""
     id: str
     autism_profile_id: str
@@ -843,144 +809,126 @@ class BehaviorPatternResponse(BaseModel):
     description: str
     identified_date: datetime
     primary_function: BehaviorFunction
-    secondary_function: Optional[BehaviorFunction]
-    function_evidence: Optional[str]
-    common_antecedents: List[str]
-    common_settings: List[str]
-    common_times: List[str]
-    trigger_themes: List[str]
-    topography_description: Optional[str]
-    average_intensity: Optional[BehaviorIntensity]
-    average_duration: Optional[int]
-    average_frequency: Optional[float]
-    prevention_strategies: List[str]
-    replacement_behaviors: List[str]
-    teaching_strategies: List[str]
-    consequence_strategies: List[str]
-    crisis_strategies: List[str]
-    incident_count_before: Optional[int]
-    incident_count_after: Optional[int]
-    percent_reduction: Optional[float]
-    last_review_date: Optional[datetime]
+    secondary_function: BehaviorFunction | None = None
+    function_evidence: str | None = None
+    common_antecedents: list[str]
+    common_settings: list[str]
+    common_times: list[str]
+    trigger_themes: list[str]
+    topography_description: str | None = None
+    average_intensity: BehaviorIntensity | None = None
+    average_duration: int | None = None
+    average_frequency: float | None = None
+    prevention_strategies: list[str]
+    replacement_behaviors: list[str]
+    teaching_strategies: list[str]
+    consequence_strategies: list[str]
+    crisis_strategies: list[str]
+    incident_count_before: int | None = None
+    incident_count_after: int | None = None
+    percent_reduction: float | None = None
+    last_review_date: datetime | None = None
     is_active: bool
-    intervention_start_date: Optional[datetime]
+    intervention_start_date: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
 
-
-class BehaviorFunctionAnalysisRequest(BaseModel):
+class BehaviorFunctionAnalysisRequest(PayloadBase):
     """Request behavior function analysis."""
     autism_profile_id: str
-    incident_ids: List[str]
+    incident_ids: list[str]
     time_period_days: int = 30
 
 
-class BehaviorFunctionAnalysisResponse(BaseModel):
+class BehaviorFunctionAnalysisResponse(ResponseBase):
     """Behavior function analysis response."""
     total_incidents: int
-    function_breakdown: dict
+    function_breakdown: dict[BehaviorFunction, int]
     most_likely_function: BehaviorFunction
     confidence: float
-    common_antecedents: List[dict]  # [{ antecedent, count, percentage }]
-    common_settings: List[dict]
-    common_times: List[dict]
-    recommendations: List[str]
-    suggested_pattern: Optional[BehaviorPatternCreate] = None
+    common_antecedents: list[dict]  # [{ antecedent, count, percentage }]
+    common_settings: list[dict]
+    common_times: list[dict]
+    recommendations: list[str]
+    suggested_pattern: BehaviorPatternCreate | None = None
 
 
 # ==========================================
 # TOKEN BOARD
 # ==========================================
 
-class TokenHistoryEntry(BaseModel):
+@value_object
+class TokenHistoryEntry:
     """A token history entry."""
     earned_at: datetime
     criterion: str
-    awarded_by: Optional[str] = None
-    notes: Optional[str] = None
+    awarded_by: str | None = None
+    notes: str | None = None
 
 
-class TokenBoardCreate(BaseModel):
+class TokenBoardCreate(PayloadBase):
     """Create a token board."""
     autism_profile_id: str
     name: str
-    description: Optional[str] = None
-    token_image_url: Optional[str] = None
-    empty_token_url: Optional[str] = None
-    reward_image_url: Optional[str] = None
+    description: str | None = None
+    token_image_url: str | None = None
+    empty_token_url: str | None = None
+    reward_image_url: str | None = None
     total_tokens_needed: int = 5
     token_shape: str = "star"
     reward_name: str
-    reward_description: Optional[str] = None
+    reward_description: str | None = None
     is_reward_activity: bool = False
-    earning_criteria: List[str] = []
+    earning_criteria: list[InternedStr] = Field(default_factory=list)
     token_value: int = 1
     reset_frequency: str = "session"  # "session", "daily", "weekly", "manual"
 
 
-class TokenBoardUpdate(BaseModel):
+class TokenBoardUpdate(make_partial(TokenBoardCreate, "autism_profile_id")):
     """Update a token board."""
-    name: Optional[str] = None
-    description: Optional[str] = None
-    token_image_url: Optional[str] = None
-    empty_token_url: Optional[str] = None
-    reward_image_url: Optional[str] = None
-    total_tokens_needed: Optional[int] = None
-    token_shape: Optional[str] = None
-    reward_name: Optional[str] = None
-    reward_description: Optional[str] = None
-    is_reward_activity: Optional[bool] = None
-    earning_criteria: Optional[List[str]] = None
-    token_value: Optional[int] = None
-    reset_frequency: Optional[str] = None
-    is_active: Optional[bool] = None
-
-
-class TokenBoardResponse(BaseModel):
+    is_active: bool | None = None
+
+
+class TokenBoardResponse(ORMBase):
     """Token board response."""
     id: str
     autism_profile_id: str
     name: str
-    description: Optional[str]
-    token_image_url: Optional[str]
-    empty_token_url: Optional[str]
-    reward_image_url: Optional[str]
+    description: str | None = None
+    token_image_url: str | None = None
+    empty_token_url: str | None = None
+    reward_image_url: str | None = None
     total_tokens_needed: int
     current_tokens: int
     token_shape: str
     reward_name: str
-    reward_description: Optional[str]
+    reward_description: str | None = None
     is_reward_activity: bool
-    earning_criteria: List[str]
+    earning_criteria: list[str]
     token_value: int
     reset_frequency: str
-    last_reset_at: Optional[datetime]
-    token_history: Optional[List[dict]]
+    last_reset_at: datetime | None = None
+    token_history: list[TokenHistoryEntry] | None = None
     times_completed: int
     total_tokens_earned: int
-    average_to_completion: Optional[float]
+    average_to_completion: float | None = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class AwardTokenRequest(BaseModel):
+class AwardTokenRequest(PayloadBase):
     """Award a token."""
     criterion: str
-    awarded_by: Optional[str] = None
-    notes: Optional[str] = None
+    awarded_by: str | None = None
+    notes: str | None = None
     token_count: int = 1
 
 
-class ResetTokenBoardRequest(BaseModel):
+class ResetTokenBoardRequest(PayloadBase):
     """Reset a token board."""
-    reason: Optional[str] = None
+    reason: str | None = None
     award_reward: bool = False
 
 
@@ -988,15 +936,16 @@ class ResetTokenBoardRequest(BaseModel):
 # TRANSITION SUPPORT
 # ==========================================
 
-class TransitionStep(BaseModel):
+@value_object
+class TransitionStep:
     """A step in a transition routine."""
     order: int
     step: str
-    image_url: Optional[str] = None
-    duration: Optional[int] = None  # seconds
+    image_url: str | None = None
+    duration: int | None = None  # seconds
 
 
-class TransitionSupportCreate(BaseModel):
+class TransitionSupportCreate(PayloadBase):
     """Create a transition support."""
     autism_profile_id: str
     name: str
@@ -1004,47 +953,28 @@ class TransitionSupportCreate(BaseModel):
     to_activity: str
     transition_type: str = "activity"  # "activity", "location", "person", "schedule_change"
     difficulty: TransitionDifficulty = TransitionDifficulty.MODERATE
-    specific_challenges: List[str] = []
+    specific_challenges: list[InternedStr] = Field(default_factory=list)
     warning_time_minutes: int = 5
     warning_type: str = "verbal"  # "verbal", "visual", "timer", "song", "combination"
     uses_visual_timer: bool = True
     uses_first_then: bool = False
     uses_social_story: bool = False
     uses_countdown: bool = True
-    linked_visual_support_id: Optional[str] = None
-    linked_social_story_id: Optional[str] = None
-    transition_steps: List[TransitionStep] = []
-    sensory_supports_before: List[str] = []
-    sensory_supports_after: List[str] = []
+    linked_visual_support_id: str | None = None
+    linked_social_story_id: str | None = None
+    transition_steps: list[TransitionStep] = Field(default_factory=list)
+    sensory_supports_before: list[InternedStr] = Field(default_factory=list)
+    sensory_supports_after: list[InternedStr] = Field(default_factory=list)
     uses_reinforcement: bool = False
-    reinforcement_type: Optional[str] = None
+    reinforcement_type: str | None = None
 
 
-class TransitionSupportUpdate(BaseModel):
+class TransitionSupportUpdate(make_partial(TransitionSupportCreate, "autism_profile_id")):
     """Update a transition support."""
-    name: Optional[str] = None
-    from_activity: Optional[str] = None
-    to_activity: Optional[str] = None
-    transition_type: Optional[str] = None
-    difficulty: Optional[TransitionDifficulty] = None
-    specific_challenges: Optional[List[str]] = None
-    warning_time_minutes: Optional[int] = None
-    warning_type: Optional[str] = None
-    uses_visual_timer: Optional[bool] = None
-    uses_first_then: Optional[bool] = None
-    uses_social_story: Optional[bool] = None
-    uses_countdown: Optional[bool] = None
-    linked_visual_support_id: Optional[str] = None
-    linked_social_story_id: Optional[str] = None
-    transition_steps: Optional[List[TransitionStep]] = None
-    sensory_supports_before: Optional[List[str]] = None
-    sensory_supports_after: Optional[List[str]] = None
-    uses_reinforcement: Optional[bool] = None
-    reinforcement_type: Optional[str] = None
-    is_active: Optional[bool] = None
-
-
-class TransitionSupportResponse(BaseModel):
+    is_active: bool | None = None
+
+
+class TransitionSupportResponse(ORMBase):
     """Transition support response."""
     id: str
     autism_profile_id: str
@@ -1053,55 +983,52 @@ class TransitionSupportResponse(BaseModel):
     to_activity: str
     transition_type: str
     difficulty: TransitionDifficulty
-    specific_challenges: List[str]
+    specific_challenges: list[str]
     warning_time_minutes: int
     warning_type: str
     uses_visual_timer: bool
     uses_first_then: bool
     uses_social_story: bool
     uses_countdown: bool
-    linked_visual_support_id: Optional[str]
-    linked_social_story_id: Optional[str]
-    transition_steps: Optional[List[dict]]
-    sensory_supports_before: List[str]
-    sensory_supports_after: List[str]
+    linked_visual_support_id: str | None = None
+    linked_social_story_id: str | None = None
+    transition_steps: list[TransitionStep] | None = None
+    sensory_supports_before: list[str]
+    sensory_supports_after: list[str]
     uses_reinforcement: bool
-    reinforcement_type: Optional[str]
-    success_rate: Optional[float]
+    reinforcement_type: str | None = None
+    success_rate: float | None = None
     total_attempts: int
     successful_attempts: int
-    average_duration: Optional[int]
+    average_duration: int | None = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class RecordTransitionAttempt(BaseModel):
+class RecordTransitionAttempt(PayloadBase):
     """Record a transition attempt."""
     was_successful: bool
-    duration_seconds: Optional[int] = None
-    supports_used: List[str] = []
-    challenges_encountered: List[str] = []
-    notes: Optional[str] = None
+    duration_seconds: int | None = None
+    supports_used: list[str] = Field(default_factory=list)
+    challenges_encountered: list[str] = Field(default_factory=list)
+    notes: str | None = None
 
 
 # ==========================================
 # DASHBOARD AND SUMMARY
 # ==========================================
 
-class AutismDashboardResponse(BaseModel):
+class AutismDashboardResponse(ResponseBase):
     """Dashboard overview for autism support."""
     profile: AutismProfileResponse
-    communication_profile: Optional[CommunicationProfileResponse]
+    communication_profile: CommunicationProfileResponse | None = None
     active_visual_supports_count: int
     active_schedules_count: int
     active_social_stories_count: int
     recent_incidents_count: int
     active_patterns_count: int
-    active_token_boards: List[TokenBoardResponse]
-    upcoming_transitions: List[TransitionSupportResponse]
+    active_token_boards: list[TokenBoardResponse]
+    upcoming_transitions: list[TransitionSupportResponse]
     recent_behavior_summary: dict
     effectiveness_trends: dict
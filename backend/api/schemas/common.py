@@ -0,0 +1,200 @@
+"""
+Shared Schema Helpers
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone, tzinfo
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Self, get_args
+
+from typing_extensions import Annotated
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, GetCoreSchemaHandler, TypeAdapter, create_model
+from pydantic.dataclasses import dataclass
+from pydantic.fields import FieldInfo
+from pydantic_core import CoreSchema, SchemaValidator, core_schema
+
+
+# Wall-clock instant shared by everything serialized for the current request
+_request_now: ContextVar[datetime | None] = ContextVar("request_now", default=None)
+
+
+def pin_now(now: datetime | None = None) -> datetime:
+    """Fix the clock read by `request_now` for the current context"""
+    now = now or datetime.now(timezone.utc)
+    _request_now.set(now)
+    return now
+
+
+def request_now(tz: tzinfo | None = None) -> datetime:
+    """
+    Current time, read once per request when the clock has been pinned.
+
+    Mirrors `datetime.now(tz)`: aware in `tz` when given, naive local time
+    otherwise. Falls back to the system clock outside a pinned context.
+    """
+    now = _request_now.get()
+    if now is None:
+        return datetime.now(tz)
+    if tz is None:
+        return now.astimezone().replace(tzinfo=None)
+    return now.astimezone(tz)
+
+
+# Short tag-like string (context, subject, trigger...) interned so repeated
+# values share one object across every model instance that holds them
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# 0-100 scale: percentages, confidence and progress scores
+Percent = Annotated[float, Field(ge=0, le=100)]
+
+# 1-5 rating: difficulty, self-reports and skill ratings
+Rating = Annotated[int, Field(ge=1, le=5)]
+
+# Learner age in years and school grade level
+Age = Annotated[int, Field(ge=5, le=26)]
+GradeLevel = Annotated[int, Field(ge=0, le=12)]
+
+
+class FastStrEnum(str, Enum):
+    """
+    str-valued Enum that pydantic validates with one hash lookup.
+
+    The default lax validator calls `EnumType(value)` from Python for every
+    field. Here pydantic-core matches the string against the member values
+    itself and maps it to the member through a prebuilt dict. Strict mode,
+    `use_enum_values` and the JSON schema are unchanged.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        schema = handler(source)
+        enum_schema = handler.resolve_ref_schema(schema)
+        values = [sys.intern(member.value) for member in cls]
+        by_value = {member.value: member for member in cls}
+
+        # The default schema already honours the model's `use_enum_values`
+        keeps_values = not isinstance(SchemaValidator(enum_schema).validate_python(values[0]), cls)
+        expected = ", ".join(map(repr, values[:-1])) + f" or {values[-1]!r}" if len(values) > 1 else repr(values[0])
+        literal = core_schema.chain_schema([
+            core_schema.str_schema(),
+            core_schema.custom_error_schema(
+                core_schema.literal_schema(values), "enum", custom_error_context={"expected": expected},
+            ),
+        ])
+        enum_schema["lax_schema"] = (
+            literal if keeps_values
+            else core_schema.no_info_after_validator_function(by_value.__getitem__, literal)
+        )
+        return schema
+
+
+class PayloadBase(BaseModel):
+    """
+    Base for request bodies and nested schema objects.
+
+    Enum fields keep the validated plain string, so handlers and
+    serialization never go through `.value`.
+    """
+    model_config = ConfigDict(use_enum_values=True)
+
+
+# Small nested value type repeated many times inside list fields (sentences,
+# word attempts, history entries): slotted and frozen, so items carry no
+# per-instance __dict__ and are shared safely between parents
+value_object = dataclass(slots=True, frozen=True, config=ConfigDict(use_enum_values=True))
+
+
+class ResponseBase(PayloadBase):
+    """Base for response models assembled in handlers rather than loaded from rows."""
+    model_config = ConfigDict(frozen=True)
+
+
+class ORMBase(BaseModel):
+    """
+    Base for response models populated from ORM rows.
+
+    Responses are built once per request and never mutated, store enum
+    values as plain strings, and build their core schema on first use.
+    """
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        use_enum_values=True,
+        defer_build=True,
+    )
+
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        """
+        Build from a trusted ORM row without re-validating it.
+
+        Only for read paths where the row's attribute names match the
+        model's fields; attributes the row lacks fall back to field defaults.
+        Scalar fields are copied as-is. Fields typed as nested models or value
+        objects are still validated, so stored JSON dicts become instances.
+        """
+        nested = _nested_adapters(cls)
+        values = {}
+        for name in _field_names(cls):
+            value = getattr(row, name, _MISSING)
+            if value is not _MISSING:
+                adapter = nested.get(name)
+                values[name] = value if adapter is None else adapter.validate_python(value, from_attributes=True)
+        return cls.model_construct(**values)
+
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _field_names(model: type[BaseModel]) -> tuple[str, ...]:
+    """Field names of `model`, collected once per class for per-row loops"""
+    return tuple(model.model_fields)
+
+
+def _holds_model(annotation: Any) -> bool:
+    """True when `annotation` is, or contains, a pydantic model or dataclass"""
+    if isinstance(annotation, type) and hasattr(annotation, "__pydantic_validator__"):
+        return True
+    return any(_holds_model(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _nested_adapters(model: type[BaseModel]) -> dict[str, TypeAdapter]:
+    """Validators for the fields of `model` whose values are nested models"""
+    return {
+        name: TypeAdapter(Annotated[field.annotation, field])
+        for name, field in model.model_fields.items()
+        if _holds_model(field.annotation)
+    }
+
+
+@lru_cache(maxsize=None)
+def make_partial(model: type[BaseModel], *exclude: str) -> type[BaseModel]:
+    """
+    Build a PATCH-style model where every field of `model` is optional.
+
+    Field metadata (constraints, descriptions, aliases) is kept; only the
+    default becomes None. Results are cached per (model, exclude) so each
+    partial model builds its pydantic-core schema exactly once.
+    """
+    name = model.__name__.removesuffix("Base").removesuffix("Create") + "Update"
+    fields = {
+        field_name: (
+            field.annotation | None,
+            FieldInfo.merge_field_infos(field, default=None, default_factory=None),
+        )
+        for field_name, field in model.model_fields.items()
+        if field_name not in exclude
+    }
+    return create_model(
+        name,
+        __config__=model.model_config,
+        __doc__=f"Partial update for {model.__name__}; omitted fields are left unchanged.",
+        __module__=model.__module__,
+        **fields,
+    )
@@ -4,23 +4,24 @@ Structured literacy instruction based on Orton-Gillingham principles
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from api.schemas.common import FastStrEnum, InternedStr, ORMBase, Rating, make_partial, value_object
 
 
 # ==========================================
 # ENUMS
 # ==========================================
 
-class DyslexiaSeverity(str, Enum):
+class DyslexiaSeverity(FastStrEnum):
     MILD = "MILD"
     MODERATE = "MODERATE"
     SEVERE = "SEVERE"
     PROFOUND = "PROFOUND"
 
 
-class DyslexiaSubtype(str, Enum):
+class DyslexiaSubtype(FastStrEnum):
     PHONOLOGICAL = "PHONOLOGICAL"
     SURFACE = "SURFACE"
     MIXED = "MIXED"
@@ -28,7 +29,7 @@ class DyslexiaSubtype(str, Enum):
     DOUBLE_DEFICIT = "DOUBLE_DEFICIT"
 
 
-class PhonologicalSkillType(str, Enum):
+class PhonologicalSkillType(FastStrEnum):
     RHYME_RECOGNITION = "RHYME_RECOGNITION"
     RHYME_PRODUCTION = "RHYME_PRODUCTION"
     SYLLABLE_SEGMENTATION = "SYLLABLE_SEGMENTATION"
@@ -41,7 +42,7 @@ class PhonologicalSkillType(str, Enum):
     PHONEME_DELETION = "PHONEME_DELETION"
 
 
-class PhonicsMasteryLevel(str, Enum):
+class PhonicsMasteryLevel(FastStrEnum):
     NOT_INTRODUCED = "NOT_INTRODUCED"
     EMERGING = "EMERGING"
     DEVELOPING = "DEVELOPING"
@@ -50,7 +51,7 @@ class PhonicsMasteryLevel(str, Enum):
     AUTOMATICITY = "AUTOMATICITY"
 
 
-class PhonicsCategory(str, Enum):
+class PhonicsCategory(FastStrEnum):
     SINGLE_CONSONANTS = "SINGLE_CONSONANTS"
     SHORT_VOWELS = "SHORT_VOWELS"
     CONSONANT_DIGRAPHS = "CONSONANT_DIGRAPHS"
@@ -65,7 +66,7 @@ class PhonicsCategory(str, Enum):
     MORPHOLOGY = "MORPHOLOGY"
 
 
-class SightWordListType(str, Enum):
+class SightWordListType(FastStrEnum):
     DOLCH_PRE_PRIMER = "DOLCH_PRE_PRIMER"
     DOLCH_PRIMER = "DOLCH_PRIMER"
     DOLCH_FIRST = "DOLCH_FIRST"
@@ -79,7 +80,7 @@ class SightWordListType(str, Enum):
     HIGH_FREQUENCY_CUSTOM = "HIGH_FREQUENCY_CUSTOM"
 
 
-class ComprehensionSkillType(str, Enum):
+class ComprehensionSkillType(FastStrEnum):
     MAIN_IDEA = "MAIN_IDEA"
     SUPPORTING_DETAILS = "SUPPORTING_DETAILS"
     SEQUENCING = "SEQUENCING"
@@ -92,7 +93,7 @@ class ComprehensionSkillType(str, Enum):
     AUTHORS_PURPOSE = "AUTHORS_PURPOSE"
 
 
-class DyslexiaLessonType(str, Enum):
+class DyslexiaLessonType(FastStrEnum):
     PHONOLOGICAL_AWARENESS = "PHONOLOGICAL_AWARENESS"
     PHONICS_DECODING = "PHONICS_DECODING"
     FLUENCY = "FLUENCY"
@@ -103,7 +104,7 @@ class DyslexiaLessonType(str, Enum):
     MULTISENSORY_REVIEW = "MULTISENSORY_REVIEW"
 
 
-class SensoryModality(str, Enum):
+class SensoryModality(FastStrEnum):
     VISUAL = "VISUAL"
     AUDITORY = "AUDITORY"
     KINESTHETIC = "KINESTHETIC"
@@ -114,69 +115,54 @@ class SensoryModality(str, Enum):
     MULTISENSORY_VAKT = "MULTISENSORY_VAKT"
 
 
+# Keys of the decoding session errorTypes JSON column
+DecodingErrorType = Literal["omission", "substitution", "insertion", "reversal", "self_correction"]
+
+
 # ==========================================
 # DYSLEXIA PROFILE SCHEMAS
 # ==========================================
 
 class DyslexiaProfileBase(BaseModel):
     severity: DyslexiaSeverity = DyslexiaSeverity.MODERATE
-    subtypes: List[DyslexiaSubtype] = []
-    diagnosis_date: Optional[datetime] = None
-    diagnosing_professional: Optional[str] = None
-    diagnosis_notes: Optional[str] = None
-    current_reading_level: Optional[str] = None
-    grade_equivalent: Optional[float] = None
-    lexile_level: Optional[int] = None
-    target_reading_level: Optional[str] = None
+    subtypes: list[DyslexiaSubtype] = Field(default_factory=list)
+    diagnosis_date: datetime | None = None
+    diagnosing_professional: str | None = None
+    diagnosis_notes: str | None = None
+    current_reading_level: str | None = None
+    grade_equivalent: float | None = None
+    lexile_level: int | None = None
+    target_reading_level: str | None = None
     intervention_program: str = "Orton-Gillingham"
     current_phonics_level: int = 1
     sessions_per_week: int = 3
     session_duration_minutes: int = 45
-    preferred_modalities: List[SensoryModality] = []
-    accommodations: Optional[Dict[str, Any]] = None
-    assistive_technology: List[str] = []
+    preferred_modalities: list[SensoryModality] = Field(default_factory=list)
+    accommodations: dict[str, Any] | None = None
+    assistive_technology: list[InternedStr] = Field(default_factory=list)
 
 
 class DyslexiaProfileCreate(DyslexiaProfileBase):
     learner_id: str
 
 
-class DyslexiaProfileUpdate(BaseModel):
-    severity: Optional[DyslexiaSeverity] = None
-    subtypes: Optional[List[DyslexiaSubtype]] = None
-    diagnosis_date: Optional[datetime] = None
-    diagnosing_professional: Optional[str] = None
-    diagnosis_notes: Optional[str] = None
-    current_reading_level: Optional[str] = None
-    grade_equivalent: Optional[float] = None
-    lexile_level: Optional[int] = None
-    target_reading_level: Optional[str] = None
-    intervention_program: Optional[str] = None
-    current_phonics_level: Optional[int] = None
-    sessions_per_week: Optional[int] = None
-    session_duration_minutes: Optional[int] = None
-    preferred_modalities: Optional[List[SensoryModality]] = None
-    accommodations: Optional[Dict[str, Any]] = None
-    assistive_technology: Optional[List[str]] = None
-    last_assessment_date: Optional[datetime] = None
-    next_assessment_date: Optional[datetime] = None
-    overall_progress: Optional[float] = None
-    is_active: Optional[bool] = None
-
-
-class DyslexiaProfileResponse(DyslexiaProfileBase):
+class DyslexiaProfileUpdate(make_partial(DyslexiaProfileBase)):
+    last_assessment_date: datetime | None = None
+    next_assessment_date: datetime | None = None
+    overall_progress: float | None = None
+    is_active: bool | None = None
+
+
+class DyslexiaProfileResponse(DyslexiaProfileBase, ORMBase):
     id: str
     learner_id: str
-    last_assessment_date: Optional[datetime] = None
-    next_assessment_date: Optional[datetime] = None
+    last_assessment_date: datetime | None = None
+    next_assessment_date: datetime | None = None
     overall_progress: float = 0
     is_active: bool = True
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # PHONOLOGICAL AWARENESS SCHEMAS
@@ -186,40 +172,32 @@ class PhonologicalSkillBase(BaseModel):
     skill_type: PhonologicalSkillType
     mastery_level: PhonicsMasteryLevel = PhonicsMasteryLevel.NOT_INTRODUCED
     accuracy_percent: float = 0
-    assessment_notes: Optional[str] = None
+    assessment_notes: str | None = None
     target_mastery: PhonicsMasteryLevel = PhonicsMasteryLevel.MASTERED
-    target_date: Optional[datetime] = None
+    target_date: datetime | None = None
 
 
 class PhonologicalSkillCreate(PhonologicalSkillBase):
     learner_id: str
 
 
-class PhonologicalSkillUpdate(BaseModel):
-    mastery_level: Optional[PhonicsMasteryLevel] = None
-    accuracy_percent: Optional[float] = None
-    last_assessed_at: Optional[datetime] = None
-    assessment_notes: Optional[str] = None
-    total_attempts: Optional[int] = None
-    correct_attempts: Optional[int] = None
-    practice_minutes: Optional[int] = None
-    target_mastery: Optional[PhonicsMasteryLevel] = None
-    target_date: Optional[datetime] = None
+class PhonologicalSkillUpdate(make_partial(PhonologicalSkillBase, "skill_type")):
+    last_assessed_at: datetime | None = None
+    total_attempts: int | None = None
+    correct_attempts: int | None = None
+    practice_minutes: int | None = None
 
 
-class PhonologicalSkillResponse(PhonologicalSkillBase):
+class PhonologicalSkillResponse(PhonologicalSkillBase, ORMBase):
     id: str
     learner_id: str
-    last_assessed_at: Optional[datetime] = None
+    last_assessed_at: datetime | None = None
     total_attempts: int = 0
     correct_attempts: int = 0
     practice_minutes: int = 0
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # PHONICS SKILL SCHEMAS
@@ -230,10 +208,10 @@ class PhonicsSkillBase(BaseModel):
     level: int = 1
     pattern: str
     pattern_name: str
-    example_words: List[str] = []
+    example_words: list[InternedStr] = Field(default_factory=list)
     mastery_level: PhonicsMasteryLevel = PhonicsMasteryLevel.NOT_INTRODUCED
-    og_sequence_number: Optional[int] = None
-    prerequisite_ids: List[str] = []
+    og_sequence_number: int | None = None
+    prerequisite_ids: list[str] = Field(default_factory=list)
 
 
 class PhonicsSkillCreate(PhonicsSkillBase):
@@ -241,21 +219,21 @@ class PhonicsSkillCreate(PhonicsSkillBase):
 
 
 class PhonicsSkillUpdate(BaseModel):
-    mastery_level: Optional[PhonicsMasteryLevel] = None
-    introduced_at: Optional[datetime] = None
-    mastered_at: Optional[datetime] = None
-    reading_accuracy: Optional[float] = None
-    spelling_accuracy: Optional[float] = None
-    total_exposures: Optional[int] = None
-    correct_readings: Optional[int] = None
-    correct_spellings: Optional[int] = None
+    mastery_level: PhonicsMasteryLevel | None = None
+    introduced_at: datetime | None = None
+    mastered_at: datetime | None = None
+    reading_accuracy: float | None = None
+    spelling_accuracy: float | None = None
+    total_exposures: int | None = None
+    correct_readings: int | None = None
+    correct_spellings: int | None = None
 
 
-class PhonicsSkillResponse(PhonicsSkillBase):
+class PhonicsSkillResponse(PhonicsSkillBase, ORMBase):
     id: str
     learner_id: str
-    introduced_at: Optional[datetime] = None
-    mastered_at: Optional[datetime] = None
+    introduced_at: datetime | None = None
+    mastered_at: datetime | None = None
     reading_accuracy: float = 0
     spelling_accuracy: float = 0
     total_exposures: int = 0
@@ -264,51 +242,46 @@ class PhonicsSkillResponse(PhonicsSkillBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # DECODING SESSION SCHEMAS
 # ==========================================
 
-class WordAttempt(BaseModel):
+@value_object
+class WordAttempt:
     word: str
     correct: bool
-    errors: List[str] = []
-    time_ms: Optional[int] = None
+    errors: list[str] = Field(default_factory=list)
+    time_ms: int | None = None
 
 
 class DecodingSessionBase(BaseModel):
     duration_minutes: int
     word_list_type: str
-    words_attempted: List[WordAttempt]
+    words_attempted: list[WordAttempt]
     total_words: int
     correct_words: int
     accuracy: float
-    error_types: Optional[Dict[str, int]] = None
-    common_patterns: List[str] = []
-    words_per_minute: Optional[float] = None
+    error_types: dict[DecodingErrorType, int] | None = None
+    common_patterns: list[str] = Field(default_factory=list)
+    words_per_minute: float | None = None
     self_corrections: int = 0
-    teacher_notes: Optional[str] = None
-    focus_for_next: List[str] = []
+    teacher_notes: str | None = None
+    focus_for_next: list[str] = Field(default_factory=list)
 
 
 class DecodingSessionCreate(DecodingSessionBase):
     learner_id: str
-    session_date: Optional[datetime] = None
+    session_date: datetime | None = None
 
 
-class DecodingSessionResponse(DecodingSessionBase):
+class DecodingSessionResponse(DecodingSessionBase, ORMBase):
     id: str
     learner_id: str
     session_date: datetime
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # SIGHT WORD PROGRESS SCHEMAS
@@ -317,42 +290,32 @@ class DecodingSessionResponse(DecodingSessionBase):
 class SightWordProgressBase(BaseModel):
     total_words_learned: int = 0
     total_words_automatic: int = 0
-    dolch_progress: Optional[Dict[str, Any]] = None
-    fry_progress: Optional[Dict[str, Any]] = None
-    custom_words: Optional[Dict[str, Any]] = None
+    dolch_progress: dict[str, Any] | None = None
+    fry_progress: dict[str, Any] | None = None
+    custom_words: dict[str, Any] | None = None
     current_list: SightWordListType = SightWordListType.DOLCH_PRE_PRIMER
-    current_focus_words: List[str] = []
+    current_focus_words: list[InternedStr] = Field(default_factory=list)
 
 
 class SightWordProgressCreate(SightWordProgressBase):
     learner_id: str
 
 
-class SightWordProgressUpdate(BaseModel):
-    total_words_learned: Optional[int] = None
-    total_words_automatic: Optional[int] = None
-    dolch_progress: Optional[Dict[str, Any]] = None
-    fry_progress: Optional[Dict[str, Any]] = None
-    custom_words: Optional[Dict[str, Any]] = None
-    current_list: Optional[SightWordListType] = None
-    current_focus_words: Optional[List[str]] = None
-    total_practice_minutes: Optional[int] = None
-    last_practice_date: Optional[datetime] = None
-    streak: Optional[int] = None
+class SightWordProgressUpdate(make_partial(SightWordProgressBase)):
+    total_practice_minutes: int | None = None
+    last_practice_date: datetime | None = None
+    streak: int | None = None
 
 
-class SightWordProgressResponse(SightWordProgressBase):
+class SightWordProgressResponse(SightWordProgressBase, ORMBase):
     id: str
     learner_id: str
     total_practice_minutes: int = 0
-    last_practice_date: Optional[datetime] = None
+    last_practice_date: datetime | None = None
     streak: int = 0
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # FLUENCY ASSESSMENT SCHEMAS
@@ -367,37 +330,34 @@ class FluencyAssessmentBase(BaseModel):
     errors_count: int
     accuracy: float
     reading_time_seconds: int
-    expression_score: Optional[int] = Field(None, ge=1, le=4)
-    phrasing_score: Optional[int] = Field(None, ge=1, le=4)
-    smoothness_score: Optional[int] = Field(None, ge=1, le=4)
-    pace_score: Optional[int] = Field(None, ge=1, le=4)
-    prosody_total: Optional[int] = None
-    comprehension_questions: Optional[int] = None
-    comprehension_correct: Optional[int] = None
-    comprehension_percent: Optional[float] = None
+    expression_score: int | None = Field(None, ge=1, le=4)
+    phrasing_score: int | None = Field(None, ge=1, le=4)
+    smoothness_score: int | None = Field(None, ge=1, le=4)
+    pace_score: int | None = Field(None, ge=1, le=4)
+    prosody_total: int | None = None
+    comprehension_questions: int | None = None
+    comprehension_correct: int | None = None
+    comprehension_percent: float | None = None
     substitutions: int = 0
     omissions: int = 0
     insertions: int = 0
     self_corrections: int = 0
-    teacher_notes: Optional[str] = None
-    areas_for_improvement: List[str] = []
+    teacher_notes: str | None = None
+    areas_for_improvement: list[InternedStr] = Field(default_factory=list)
 
 
 class FluencyAssessmentCreate(FluencyAssessmentBase):
     learner_id: str
-    assessment_date: Optional[datetime] = None
+    assessment_date: datetime | None = None
 
 
-class FluencyAssessmentResponse(FluencyAssessmentBase):
+class FluencyAssessmentResponse(FluencyAssessmentBase, ORMBase):
     id: str
     learner_id: str
     assessment_date: datetime
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # COMPREHENSION SKILL SCHEMAS
@@ -407,42 +367,32 @@ class ComprehensionSkillBase(BaseModel):
     skill_type: ComprehensionSkillType
     mastery_level: PhonicsMasteryLevel = PhonicsMasteryLevel.NOT_INTRODUCED
     accuracy_percent: float = 0
-    strategies_introduced: List[str] = []
-    preferred_strategies: List[str] = []
+    strategies_introduced: list[str] = Field(default_factory=list)
+    preferred_strategies: list[str] = Field(default_factory=list)
     target_mastery: PhonicsMasteryLevel = PhonicsMasteryLevel.MASTERED
-    target_date: Optional[datetime] = None
-    notes: Optional[str] = None
+    target_date: datetime | None = None
+    notes: str | None = None
 
 
 class ComprehensionSkillCreate(ComprehensionSkillBase):
     learner_id: str
 
 
-class ComprehensionSkillUpdate(BaseModel):
-    mastery_level: Optional[PhonicsMasteryLevel] = None
-    accuracy_percent: Optional[float] = None
-    total_assessments: Optional[int] = None
-    correct_responses: Optional[int] = None
-    last_assessed_at: Optional[datetime] = None
-    strategies_introduced: Optional[List[str]] = None
-    preferred_strategies: Optional[List[str]] = None
-    target_mastery: Optional[PhonicsMasteryLevel] = None
-    target_date: Optional[datetime] = None
-    notes: Optional[str] = None
+class ComprehensionSkillUpdate(make_partial(ComprehensionSkillBase, "skill_type")):
+    total_assessments: int | None = None
+    correct_responses: int | None = None
+    last_assessed_at: datetime | None = None
 
 
-class ComprehensionSkillResponse(ComprehensionSkillBase):
+class ComprehensionSkillResponse(ComprehensionSkillBase, ORMBase):
     id: str
     learner_id: str
     total_assessments: int = 0
     correct_responses: int = 0
-    last_assessed_at: Optional[datetime] = None
+    last_assessed_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # SPELLING PATTERN SCHEMAS
@@ -451,9 +401,9 @@ class ComprehensionSkillResponse(ComprehensionSkillBase):
 class SpellingPatternBase(BaseModel):
     pattern: str
     category: PhonicsCategory
-    rule: Optional[str] = None
-    example_words: List[str] = []
-    exception_words: List[str] = []
+    rule: str | None = None
+    example_words: list[InternedStr] = Field(default_factory=list)
+    exception_words: list[str] = Field(default_factory=list)
     mastery_level: PhonicsMasteryLevel = PhonicsMasteryLevel.NOT_INTRODUCED
 
 
@@ -462,30 +412,27 @@ class SpellingPatternCreate(SpellingPatternBase):
 
 
 class SpellingPatternUpdate(BaseModel):
-    mastery_level: Optional[PhonicsMasteryLevel] = None
-    introduced_at: Optional[datetime] = None
-    mastered_at: Optional[datetime] = None
-    total_attempts: Optional[int] = None
-    correct_attempts: Optional[int] = None
-    accuracy: Optional[float] = None
-    frequent_errors: Optional[Dict[str, int]] = None
+    mastery_level: PhonicsMasteryLevel | None = None
+    introduced_at: datetime | None = None
+    mastered_at: datetime | None = None
+    total_attempts: int | None = None
+    correct_attempts: int | None = None
+    accuracy: float | None = None
+    frequent_errors: dict[str, int] | None = None
 
 
-class SpellingPatternResponse(SpellingPatternBase):
+class SpellingPatternResponse(SpellingPatternBase, ORMBase):
     id: str
     learner_id: str
-    introduced_at: Optional[datetime] = None
-    mastered_at: Optional[datetime] = None
+    introduced_at: datetime | None = None
+    mastered_at: datetime | None = None
     total_attempts: int = 0
     correct_attempts: int = 0
     accuracy: float = 0
-    frequent_errors: Optional[Dict[str, int]] = None
+    frequent_errors: dict[str, int] | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # DYSLEXIA LESSON SCHEMAS
@@ -495,37 +442,34 @@ class DyslexiaLessonBase(BaseModel):
     lesson_type: DyslexiaLessonType
     duration_minutes: int
     title: str
-    objectives: List[str] = []
-    materials_used: List[str] = []
-    review_component: Optional[Dict[str, Any]] = None
-    new_teaching_component: Optional[Dict[str, Any]] = None
-    practice_component: Optional[Dict[str, Any]] = None
-    phonics_focus: List[str] = []
-    sight_words_focus: List[str] = []
-    student_response: Optional[str] = None
+    objectives: list[str] = Field(default_factory=list)
+    materials_used: list[str] = Field(default_factory=list)
+    review_component: dict[str, Any] | None = None
+    new_teaching_component: dict[str, Any] | None = None
+    practice_component: dict[str, Any] | None = None
+    phonics_focus: list[str] = Field(default_factory=list)
+    sight_words_focus: list[str] = Field(default_factory=list)
+    student_response: str | None = None
     mastery_demonstrated: bool = False
-    accuracy_percent: Optional[float] = None
-    next_steps: List[str] = []
-    home_practice: List[str] = []
-    teacher_notes: Optional[str] = None
-    parent_communication: Optional[str] = None
+    accuracy_percent: float | None = None
+    next_steps: list[str] = Field(default_factory=list)
+    home_practice: list[str] = Field(default_factory=list)
+    teacher_notes: str | None = None
+    parent_communication: str | None = None
 
 
 class DyslexiaLessonCreate(DyslexiaLessonBase):
     learner_id: str
-    lesson_date: Optional[datetime] = None
+    lesson_date: datetime | None = None
 
 
-class DyslexiaLessonResponse(DyslexiaLessonBase):
+class DyslexiaLessonResponse(DyslexiaLessonBase, ORMBase):
     id: str
     learner_id: str
     lesson_date: datetime
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # MULTISENSORY ACTIVITY SCHEMAS
@@ -534,64 +478,43 @@ class DyslexiaLessonResponse(DyslexiaLessonBase):
 class MultisensoryActivityBase(BaseModel):
     name: str
     description: str
-    category: Optional[PhonicsCategory] = None
-    target_skills: List[str] = []
+    category: PhonicsCategory | None = None
+    target_skills: list[str] = Field(default_factory=list)
     primary_modality: SensoryModality
-    modalities: List[SensoryModality] = []
+    modalities: list[SensoryModality] = Field(default_factory=list)
     instructions: str
-    materials: List[str] = []
+    materials: list[str] = Field(default_factory=list)
     setup_time_minutes: int = 5
     activity_minutes: int = 10
-    difficulty_level: int = Field(1, ge=1, le=5)
-    grade_range: List[str] = []
-    phonics_levels: List[int] = []
-    image_url: Optional[str] = None
-    video_url: Optional[str] = None
-    printable_url: Optional[str] = None
-    variations: Optional[List[Dict[str, Any]]] = None
-    adaptations: Optional[Dict[str, Any]] = None
+    difficulty_level: Rating = 1
+    grade_range: list[str] = Field(default_factory=list)
+    phonics_levels: list[int] = Field(default_factory=list)
+    image_url: str | None = None
+    video_url: str | None = None
+    printable_url: str | None = None
+    variations: list[dict[str, Any]] | None = None
+    adaptations: dict[str, Any] | None = None
 
 
 class MultisensoryActivityCreate(MultisensoryActivityBase):
-    learner_id: Optional[str] = None
-
-
-class MultisensoryActivityUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    category: Optional[PhonicsCategory] = None
-    target_skills: Optional[List[str]] = None
-    primary_modality: Optional[SensoryModality] = None
-    modalities: Optional[List[SensoryModality]] = None
-    instructions: Optional[str] = None
-    materials: Optional[List[str]] = None
-    setup_time_minutes: Optional[int] = None
-    activity_minutes: Optional[int] = None
-    difficulty_level: Optional[int] = None
-    grade_range: Optional[List[str]] = None
-    phonics_levels: Optional[List[int]] = None
-    image_url: Optional[str] = None
-    video_url: Optional[str] = None
-    printable_url: Optional[str] = None
-    variations: Optional[List[Dict[str, Any]]] = None
-    adaptations: Optional[Dict[str, Any]] = None
-    usage_count: Optional[int] = None
-    avg_rating: Optional[float] = None
-    is_active: Optional[bool] = None
-
-
-class MultisensoryActivityResponse(MultisensoryActivityBase):
+    learner_id: str | None = None
+
+
+class MultisensoryActivityUpdate(make_partial(MultisensoryActivityBase)):
+    usage_count: int | None = None
+    avg_rating: float | None = None
+    is_active: bool | None = None
+
+
+class MultisensoryActivityResponse(MultisensoryActivityBase, ORMBase):
     id: str
-    learner_id: Optional[str] = None
+    learner_id: str | None = None
     usage_count: int = 0
-    avg_rating: Optional[float] = None
+    avg_rating: float | None = None
     is_active: bool = True
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # PARENT DYSLEXIA SUPPORT SCHEMAS
@@ -600,54 +523,52 @@ class MultisensoryActivityResponse(MultisensoryActivityBase):
 class ParentDyslexiaSupportBase(BaseModel):
     practice_type: str
     duration_minutes: int
-    activities_completed: List[str] = []
-    words_reviewed: List[str] = []
-    patterns_focused: List[str] = []
-    engagement_level: Optional[int] = Field(None, ge=1, le=5)
-    frustration_level: Optional[int] = Field(None, ge=1, le=5)
-    success_level: Optional[int] = Field(None, ge=1, le=5)
-    what_worked_well: Optional[str] = None
-    challenges: Optional[str] = None
-    questions_for_teacher: Optional[str] = None
-    materials_used: List[str] = []
-    games_played: List[str] = []
-    best_time_of_day: Optional[str] = None
-    best_location: Optional[str] = None
-    distractions_noted: List[str] = []
+    activities_completed: list[str] = Field(default_factory=list)
+    words_reviewed: list[str] = Field(default_factory=list)
+    patterns_focused: list[str] = Field(default_factory=list)
+    engagement_level: Rating | None = None
+    frustration_level: Rating | None = None
+    success_level: Rating | None = None
+    what_worked_well: str | None = None
+    challenges: str | None = None
+    questions_for_teacher: str | None = None
+    materials_used: list[str] = Field(default_factory=list)
+    games_played: list[str] = Field(default_factory=list)
+    best_time_of_day: str | None = None
+    best_location: str | None = None
+    distractions_noted: list[str] = Field(default_factory=list)
 
 
 class ParentDyslexiaSupportCreate(ParentDyslexiaSupportBase):
     learner_id: str
-    practice_date: Optional[datetime] = None
+    practice_date: datetime | None = None
 
 
-class ParentDyslexiaSupportResponse(ParentDyslexiaSupportBase):
+class ParentDyslexiaSupportResponse(ParentDyslexiaSupportBase, ORMBase):
     id: str
     learner_id: str
     practice_date: datetime
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # ORTON-GILLINGHAM SCOPE & SEQUENCE
 # ==========================================
 
-class OGPhonicsLevel(BaseModel):
+@value_object
+class OGPhonicsLevel:
     """Orton-Gillingham phonics progression level"""
     level: int
     name: str
-    patterns: List[str]
-    example_words: List[str]
-    skills: List[str]
-    prerequisites: List[int] = []
+    patterns: list[str]
+    example_words: list[str]
+    skills: list[str]
+    prerequisites: list[int] = Field(default_factory=list)
 
 
 # Complete OG Scope & Sequence
-OG_SCOPE_AND_SEQUENCE: List[OGPhonicsLevel] = [
+OG_SCOPE_AND_SEQUENCE: list[OGPhonicsLevel] = [
     OGPhonicsLevel(
         level=1,
         name="Single Consonants & Short Vowels",
@@ -745,6 +666,10 @@ OG_SCOPE_AND_SEQUENCE: List[OGPhonicsLevel] = [
     )
 ]
 
+# The sequence never changes, so it is serialized once here and spliced
+# into every response that carries it
+OG_SCOPE_AND_SEQUENCE_JSON: bytes = TypeAdapter(list[OGPhonicsLevel]).dump_json(OG_SCOPE_AND_SEQUENCE)
+
 
 # ==========================================
 # DASHBOARD & ANALYTICS SCHEMAS
@@ -753,7 +678,7 @@ OG_SCOPE_AND_SEQUENCE: List[OGPhonicsLevel] = [
 class DyslexiaProgressSummary(BaseModel):
     """Summary of learner's dyslexia intervention progress"""
     learner_id: str
-    profile: Optional[DyslexiaProfileResponse] = None
+    profile: DyslexiaProfileResponse | None = None
     
     # Phonological Awareness
     phonological_skills_count: int = 0
@@ -770,12 +695,12 @@ class DyslexiaProgressSummary(BaseModel):
     # Sight Words
     sight_words_learned: int = 0
     sight_words_automatic: int = 0
-    current_sight_word_list: Optional[str] = None
+    current_sight_word_list: str | None = None
     
     # Fluency
-    latest_wcpm: Optional[float] = None
-    fluency_trend: Optional[str] = None  # "improving", "stable", "declining"
-    latest_prosody_score: Optional[int] = None
+    latest_wcpm: float | None = None
+    fluency_trend: str | None = None  # "improving", "stable", "declining"
+    latest_prosody_score: int | None = None
     
     # Comprehension
     comprehension_skills_mastered: int = 0
@@ -785,15 +710,19 @@ class DyslexiaProgressSummary(BaseModel):
     total_lessons: int = 0
     lessons_this_week: int = 0
     total_practice_minutes: int = 0
-    last_session_date: Optional[datetime] = None
+    last_session_date: datetime | None = None
 
 
 class DyslexiaDashboardData(BaseModel):
     """Complete dashboard data for dyslexia intervention"""
+    # Every field is always written, so keep them all required in the response schema
+    model_config = ConfigDict(json_schema_serialization_defaults_required=True)
+
     summary: DyslexiaProgressSummary
-    recent_lessons: List[DyslexiaLessonResponse] = []
-    recent_decoding_sessions: List[DecodingSessionResponse] = []
-    recent_fluency_assessments: List[FluencyAssessmentResponse] = []
-    phonics_progression: List[PhonicsSkillResponse] = []
-    recommended_activities: List[MultisensoryActivityResponse] = []
-    og_scope_sequence: List[OGPhonicsLevel] = OG_SCOPE_AND_SEQUENCE
+    recent_lessons: list[DyslexiaLessonResponse] = Field(default_factory=list)
+    recent_decoding_sessions: list[DecodingSessionResponse] = Field(default_factory=list)
+    recent_fluency_assessments: list[FluencyAssessmentResponse] = Field(default_factory=list)
+    phonics_progression: list[PhonicsSkillResponse] = Field(default_factory=list)
+    recommended_activities: list[MultisensoryActivityResponse] = Field(default_factory=list)
+    # Filled from OG_SCOPE_AND_SEQUENCE_JSON when the response is written
+    og_scope_sequence: list[OGPhonicsLevel] = Field(default_factory=list)
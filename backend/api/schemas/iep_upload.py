@@ -4,16 +4,17 @@ Handles document upload, OCR processing, AI extraction, and verification.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Any
+from pydantic import BaseModel, Field
+
+from api.schemas.common import FastStrEnum, ORMBase, Percent, make_partial, value_object
 
 
 # ==========================================
 # ENUMS
 # ==========================================
 
-class IEPDocumentStatus(str, Enum):
+class IEPDocumentStatus(FastStrEnum):
     PENDING = "PENDING"
     PROCESSING = "PROCESSING"
     EXTRACTED = "EXTRACTED"
@@ -22,14 +23,14 @@ class IEPDocumentStatus(str, Enum):
     APPROVED = "APPROVED"
 
 
-class VirusScanStatus(str, Enum):
+class VirusScanStatus(FastStrEnum):
     PENDING = "PENDING"
     CLEAN = "CLEAN"
     INFECTED = "INFECTED"
     ERROR = "ERROR"
 
 
-class IEPGoalDomain(str, Enum):
+class IEPGoalDomain(FastStrEnum):
     READING = "READING"
     MATH = "MATH"
     WRITING = "WRITING"
@@ -44,7 +45,7 @@ class IEPGoalDomain(str, Enum):
     OTHER = "OTHER"
 
 
-class IEPServiceType(str, Enum):
+class IEPServiceType(FastStrEnum):
     SPEECH = "SPEECH"
     OT = "OT"
     PT = "PT"
@@ -62,7 +63,7 @@ class IEPServiceType(str, Enum):
     OTHER = "OTHER"
 
 
-class AccommodationCategory(str, Enum):
+class AccommodationCategory(FastStrEnum):
     PRESENTATION = "PRESENTATION"
     RESPONSE = "RESPONSE"
     SETTING = "SETTING"
@@ -73,7 +74,7 @@ class AccommodationCategory(str, Enum):
     SOCIAL_EMOTIONAL = "SOCIAL_EMOTIONAL"
 
 
-class AccommodationScope(str, Enum):
+class AccommodationScope(FastStrEnum):
     CLASSROOM = "CLASSROOM"
     TESTING = "TESTING"
     HOMEWORK = "HOMEWORK"
@@ -84,7 +85,8 @@ class AccommodationScope(str, Enum):
 # BOUNDING BOX & LOCATION
 # ==========================================
 
-class BoundingBox(BaseModel):
+@value_object
+class BoundingBox:
     """Location of extracted text in the PDF"""
     x: float = Field(..., description="X coordinate (percentage)")
     y: float = Field(..., description="Y coordinate (percentage)")
@@ -96,12 +98,13 @@ class BoundingBox(BaseModel):
 # SMART CRITERIA ANALYSIS
 # ==========================================
 
-class SMARTCriterion(BaseModel):
+@value_object
+class SMARTCriterion:
     """Analysis of a single SMART criterion"""
     met: bool = Field(..., description="Whether the criterion is met")
-    score: float = Field(..., ge=0, le=100, description="Score 0-100")
+    score: Percent = Field(..., description="Score 0-100")
     feedback: str = Field(..., description="Feedback or suggestion")
-    evidence: Optional[str] = Field(None, description="Text evidence from goal")
+    evidence: str | None = Field(None, description="Text evidence from goal")
 
 
 class SMARTAnalysis(BaseModel):
@@ -111,9 +114,9 @@ class SMARTAnalysis(BaseModel):
     achievable: SMARTCriterion
     relevant: SMARTCriterion
     time_bound: SMARTCriterion
-    overall_score: float = Field(..., ge=0, le=100)
+    overall_score: Percent
     is_compliant: bool = Field(..., description="Meets minimum SMART requirements")
-    suggestions: List[str] = Field(default_factory=list)
+    suggestions: list[str] = Field(default_factory=list)
 
 
 # ==========================================
@@ -136,60 +139,54 @@ class IEPDocumentCreate(IEPDocumentBase):
 
 class IEPDocumentUpdate(BaseModel):
     """Schema for updating IEP document"""
-    status: Optional[IEPDocumentStatus] = None
-    virus_scan_status: Optional[VirusScanStatus] = None
-    processing_error: Optional[str] = None
-    ocr_confidence: Optional[float] = None
-    extracted_data: Optional[Dict[str, Any]] = None
-    page_count: Optional[int] = None
-    reviewed_by_id: Optional[str] = None
-    review_notes: Optional[str] = None
-    iep_start_date: Optional[datetime] = None
-    iep_end_date: Optional[datetime] = None
-    school_year: Optional[str] = None
-
-
-class IEPDocumentResponse(IEPDocumentBase):
+    status: IEPDocumentStatus | None = None
+    virus_scan_status: VirusScanStatus | None = None
+    processing_error: str | None = None
+    ocr_confidence: float | None = None
+    extracted_data: dict[str, Any] | None = None
+    page_count: int | None = None
+    reviewed_by_id: str | None = None
+    review_notes: str | None = None
+    iep_start_date: datetime | None = None
+    iep_end_date: datetime | None = None
+    school_year: str | None = None
+
+
+class IEPDocumentResponse(IEPDocumentBase, ORMBase):
     """Schema for IEP document response"""
     id: str
     learner_id: str
     uploaded_by_id: str
     file_url: str
     file_size: int
-    page_count: Optional[int]
+    page_count: int | None = None
     status: IEPDocumentStatus
     virus_scan_status: VirusScanStatus
-    processing_error: Optional[str]
-    ocr_confidence: Optional[float]
-    reviewed_by_id: Optional[str]
-    reviewed_at: Optional[datetime]
-    review_notes: Optional[str]
-    iep_start_date: Optional[datetime]
-    iep_end_date: Optional[datetime]
-    school_year: Optional[str]
+    processing_error: str | None = None
+    ocr_confidence: float | None = None
+    reviewed_by_id: str | None = None
+    reviewed_at: datetime | None = None
+    review_notes: str | None = None
+    iep_start_date: datetime | None = None
+    iep_end_date: datetime | None = None
+    school_year: str | None = None
     uploaded_at: datetime
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class IEPDocumentSummary(BaseModel):
+class IEPDocumentSummary(ORMBase):
     """Summary of IEP document for list view"""
     id: str
     file_name: str
     status: IEPDocumentStatus
     uploaded_at: datetime
-    ocr_confidence: Optional[float]
+    ocr_confidence: float | None = None
     goal_count: int = 0
     service_count: int = 0
     accommodation_count: int = 0
     present_level_count: int = 0
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXTRACTED GOAL SCHEMAS
@@ -198,55 +195,46 @@ class IEPDocumentSummary(BaseModel):
 class ExtractedGoalBase(BaseModel):
     """Base schema for extracted goal"""
     domain: IEPGoalDomain
-    goal_number: Optional[str] = None
+    goal_number: str | None = None
     goal_text: str
-    baseline: Optional[str] = None
-    target_criteria: Optional[str] = None
-    measurement_method: Optional[str] = None
-    frequency: Optional[str] = None
+    baseline: str | None = None
+    target_criteria: str | None = None
+    measurement_method: str | None = None
+    frequency: str | None = None
 
 
 class ExtractedGoalCreate(ExtractedGoalBase):
     """Schema for creating extracted goal"""
     document_id: str
     learner_id: str
-    confidence: float = Field(..., ge=0, le=100)
-    page_number: Optional[int] = None
-    bounding_box: Optional[BoundingBox] = None
-    smart_analysis: Optional[SMARTAnalysis] = None
+    confidence: Percent
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
+    smart_analysis: SMARTAnalysis | None = None
 
 
-class ExtractedGoalUpdate(BaseModel):
+class ExtractedGoalUpdate(make_partial(ExtractedGoalBase, "goal_number")):
     """Schema for updating extracted goal"""
-    domain: Optional[IEPGoalDomain] = None
-    goal_text: Optional[str] = None
-    baseline: Optional[str] = None
-    target_criteria: Optional[str] = None
-    measurement_method: Optional[str] = None
-    frequency: Optional[str] = None
-    is_verified: Optional[bool] = None
-    verified_by_id: Optional[str] = None
+    is_verified: bool | None = None
+    verified_by_id: str | None = None
 
 
-class ExtractedGoalResponse(ExtractedGoalBase):
+class ExtractedGoalResponse(ExtractedGoalBase, ORMBase):
     """Schema for extracted goal response"""
     id: str
     document_id: str
     learner_id: str
     confidence: float
-    page_number: Optional[int]
-    bounding_box: Optional[Dict[str, Any]]
-    smart_analysis: Optional[Dict[str, Any]]
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
+    smart_analysis: dict[str, Any] | None = None
     is_verified: bool
-    verified_by_id: Optional[str]
-    verified_at: Optional[datetime]
-    linked_iep_goal_id: Optional[str]
+    verified_by_id: str | None = None
+    verified_at: datetime | None = None
+    linked_iep_goal_id: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXTRACTED SERVICE SCHEMAS
@@ -256,52 +244,43 @@ class ExtractedServiceBase(BaseModel):
     """Base schema for extracted service"""
     service_type: IEPServiceType
     description: str
-    frequency: Optional[str] = None
-    duration: Optional[str] = None
-    location: Optional[str] = None
-    provider: Optional[str] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    frequency: str | None = None
+    duration: str | None = None
+    location: str | None = None
+    provider: str | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
 
 
 class ExtractedServiceCreate(ExtractedServiceBase):
     """Schema for creating extracted service"""
     document_id: str
     learner_id: str
-    confidence: float = Field(..., ge=0, le=100)
-    page_number: Optional[int] = None
-    bounding_box: Optional[BoundingBox] = None
+    confidence: Percent
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
 
 
-class ExtractedServiceUpdate(BaseModel):
+class ExtractedServiceUpdate(make_partial(ExtractedServiceBase, "start_date", "end_date")):
     """Schema for updating extracted service"""
-    service_type: Optional[IEPServiceType] = None
-    description: Optional[str] = None
-    frequency: Optional[str] = None
-    duration: Optional[str] = None
-    location: Optional[str] = None
-    provider: Optional[str] = None
-    is_verified: Optional[bool] = None
-    verified_by_id: Optional[str] = None
+    is_verified: bool | None = None
+    verified_by_id: str | None = None
 
 
-class ExtractedServiceResponse(ExtractedServiceBase):
+class ExtractedServiceResponse(ExtractedServiceBase, ORMBase):
     """Schema for extracted service response"""
     id: str
     document_id: str
     learner_id: str
     confidence: float
-    page_number: Optional[int]
-    bounding_box: Optional[Dict[str, Any]]
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
     is_verified: bool
-    verified_by_id: Optional[str]
-    verified_at: Optional[datetime]
+    verified_by_id: str | None = None
+    verified_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXTRACTED ACCOMMODATION SCHEMAS
@@ -311,46 +290,39 @@ class ExtractedAccommodationBase(BaseModel):
     """Base schema for extracted accommodation"""
     category: AccommodationCategory
     description: str
-    details: Optional[str] = None
-    applies_to: List[AccommodationScope] = Field(default_factory=lambda: [AccommodationScope.ALL])
+    details: str | None = None
+    applies_to: list[AccommodationScope] = Field(default_factory=lambda: [AccommodationScope.ALL])
 
 
 class ExtractedAccommodationCreate(ExtractedAccommodationBase):
     """Schema for creating extracted accommodation"""
     document_id: str
     learner_id: str
-    confidence: float = Field(..., ge=0, le=100)
-    page_number: Optional[int] = None
-    bounding_box: Optional[BoundingBox] = None
+    confidence: Percent
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
 
 
-class ExtractedAccommodationUpdate(BaseModel):
+class ExtractedAccommodationUpdate(make_partial(ExtractedAccommodationBase)):
     """Schema for updating extracted accommodation"""
-    category: Optional[AccommodationCategory] = None
-    description: Optional[str] = None
-    details: Optional[str] = None
-    applies_to: Optional[List[AccommodationScope]] = None
-    is_verified: Optional[bool] = None
-    verified_by_id: Optional[str] = None
+    is_verified: bool | None = None
+    verified_by_id: str | None = None
 
 
-class ExtractedAccommodationResponse(ExtractedAccommodationBase):
+class ExtractedAccommodationResponse(ExtractedAccommodationBase, ORMBase):
     """Schema for extracted accommodation response"""
     id: str
     document_id: str
     learner_id: str
     confidence: float
-    page_number: Optional[int]
-    bounding_box: Optional[Dict[str, Any]]
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
     is_verified: bool
-    verified_by_id: Optional[str]
-    verified_at: Optional[datetime]
+    verified_by_id: str | None = None
+    verified_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXTRACTED PRESENT LEVEL SCHEMAS
@@ -360,50 +332,42 @@ class ExtractedPresentLevelBase(BaseModel):
     """Base schema for extracted present level (PLAAFP)"""
     domain: IEPGoalDomain
     current_performance: str
-    strengths: List[str] = Field(default_factory=list)
-    needs: List[str] = Field(default_factory=list)
-    parent_input: Optional[str] = None
-    how_disability_affects: Optional[str] = None
-    educational_implications: Optional[str] = None
+    strengths: list[str] = Field(default_factory=list)
+    needs: list[str] = Field(default_factory=list)
+    parent_input: str | None = None
+    how_disability_affects: str | None = None
+    educational_implications: str | None = None
 
 
 class ExtractedPresentLevelCreate(ExtractedPresentLevelBase):
     """Schema for creating extracted present level"""
     document_id: str
     learner_id: str
-    confidence: float = Field(..., ge=0, le=100)
-    page_number: Optional[int] = None
-    bounding_box: Optional[BoundingBox] = None
+    confidence: Percent
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
 
 
-class ExtractedPresentLevelUpdate(BaseModel):
+class ExtractedPresentLevelUpdate(make_partial(ExtractedPresentLevelBase, "domain", "educational_implications")):
     """Schema for updating extracted present level"""
-    current_performance: Optional[str] = None
-    strengths: Optional[List[str]] = None
-    needs: Optional[List[str]] = None
-    parent_input: Optional[str] = None
-    how_disability_affects: Optional[str] = None
-    is_verified: Optional[bool] = None
-    verified_by_id: Optional[str] = None
+    is_verified: bool | None = None
+    verified_by_id: str | None = None
 
 
-class ExtractedPresentLevelResponse(ExtractedPresentLevelBase):
+class ExtractedPresentLevelResponse(ExtractedPresentLevelBase, ORMBase):
     """Schema for extracted present level response"""
     id: str
     document_id: str
     learner_id: str
     confidence: float
-    page_number: Optional[int]
-    bounding_box: Optional[Dict[str, Any]]
+    page_number: int | None = None
+    bounding_box: BoundingBox | None = None
     is_verified: bool
-    verified_by_id: Optional[str]
-    verified_at: Optional[datetime]
+    verified_by_id: str | None = None
+    verified_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # GOAL TEMPLATE SCHEMAS
@@ -414,46 +378,40 @@ class GoalTemplateBase(BaseModel):
     domain: IEPGoalDomain
     category: str
     template_text: str = Field(..., description="Template with {{placeholders}}")
-    measurement_options: List[str] = Field(default_factory=list)
-    frequency_options: List[str] = Field(default_factory=list)
-    baseline_prompts: List[str] = Field(default_factory=list)
-    criteria_examples: List[str] = Field(default_factory=list)
+    measurement_options: list[str] = Field(default_factory=list)
+    frequency_options: list[str] = Field(default_factory=list)
+    baseline_prompts: list[str] = Field(default_factory=list)
+    criteria_examples: list[str] = Field(default_factory=list)
 
 
 class GoalTemplateCreate(GoalTemplateBase):
     """Schema for creating goal template"""
-    grade_level: Optional[int] = None
-    grade_levels: List[int] = Field(default_factory=list)
-    smart_guidance: Optional[Dict[str, Any]] = None
-    source: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
+    grade_level: int | None = None
+    grade_levels: list[int] = Field(default_factory=list)
+    smart_guidance: dict[str, Any] | None = None
+    source: str | None = None
+    tags: list[str] = Field(default_factory=list)
 
 
-class GoalTemplateUpdate(BaseModel):
+class GoalTemplateUpdate(make_partial(GoalTemplateBase, "domain", "category", "baseline_prompts", "criteria_examples")):
     """Schema for updating goal template"""
-    template_text: Optional[str] = None
-    measurement_options: Optional[List[str]] = None
-    frequency_options: Optional[List[str]] = None
-    is_active: Optional[bool] = None
+    is_active: bool | None = None
 
 
-class GoalTemplateResponse(GoalTemplateBase):
+class GoalTemplateResponse(GoalTemplateBase, ORMBase):
     """Schema for goal template response"""
     id: str
-    grade_level: Optional[int]
-    grade_levels: List[int]
-    smart_guidance: Optional[Dict[str, Any]]
+    grade_level: int | None = None
+    grade_levels: list[int]
+    smart_guidance: dict[str, Any] | None = None
     is_active: bool
     usage_count: int
-    rating: Optional[float]
-    source: Optional[str]
-    tags: List[str]
+    rating: float | None = None
+    source: str | None = None
+    tags: list[str]
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXTRACTION RESPONSE SCHEMAS
@@ -462,11 +420,11 @@ class GoalTemplateResponse(GoalTemplateBase):
 class FullExtractionResponse(BaseModel):
     """Complete extraction response with all data"""
     document: IEPDocumentResponse
-    goals: List[ExtractedGoalResponse]
-    services: List[ExtractedServiceResponse]
-    accommodations: List[ExtractedAccommodationResponse]
-    present_levels: List[ExtractedPresentLevelResponse]
-    extraction_summary: Dict[str, Any]
+    goals: list[ExtractedGoalResponse]
+    services: list[ExtractedServiceResponse]
+    accommodations: list[ExtractedAccommodationResponse]
+    present_levels: list[ExtractedPresentLevelResponse]
+    extraction_summary: dict[str, Any]
 
 
 class ExtractionSummary(BaseModel):
@@ -491,11 +449,11 @@ class ProcessingStatus(BaseModel):
     status: IEPDocumentStatus
     virus_scan_status: VirusScanStatus
     current_step: str
-    progress_percent: float = Field(..., ge=0, le=100)
-    steps_completed: List[str]
-    steps_remaining: List[str]
-    estimated_time_remaining: Optional[int] = Field(None, description="Seconds remaining")
-    error_message: Optional[str] = None
+    progress_percent: Percent
+    steps_completed: list[str]
+    steps_remaining: list[str]
+    estimated_time_remaining: int | None = Field(None, description="Seconds remaining")
+    error_message: str | None = None
 
 
 # ==========================================
@@ -513,16 +471,16 @@ class UploadResponse(BaseModel):
 class VerifyItemRequest(BaseModel):
     """Request to verify an extracted item"""
     is_verified: bool
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
 class ApprovalRequest(BaseModel):
     """Request to approve extractions and create IEP goals"""
-    goal_ids: List[str] = Field(..., description="IDs of extracted goals to approve")
-    service_ids: List[str] = Field(default_factory=list)
-    accommodation_ids: List[str] = Field(default_factory=list)
-    present_level_ids: List[str] = Field(default_factory=list)
-    review_notes: Optional[str] = None
+    goal_ids: list[str] = Field(..., description="IDs of extracted goals to approve")
+    service_ids: list[str] = Field(default_factory=list)
+    accommodation_ids: list[str] = Field(default_factory=list)
+    present_level_ids: list[str] = Field(default_factory=list)
+    review_notes: str | None = None
 
 
 class ApprovalResponse(BaseModel):
@@ -542,16 +500,16 @@ class ApprovalResponse(BaseModel):
 class AIExtractionRequest(BaseModel):
     """Request for AI extraction"""
     document_id: str
-    page_images: List[str] = Field(..., description="Base64 encoded page images")
+    page_images: list[str] = Field(..., description="Base64 encoded page images")
     ocr_text: str
-    extraction_config: Optional[Dict[str, Any]] = None
+    extraction_config: dict[str, Any] | None = None
 
 
 class AIExtractionResult(BaseModel):
     """Result from AI extraction"""
-    goals: List[ExtractedGoalCreate]
-    services: List[ExtractedServiceCreate]
-    accommodations: List[ExtractedAccommodationCreate]
-    present_levels: List[ExtractedPresentLevelCreate]
-    iep_metadata: Dict[str, Any]
-    processing_notes: List[str]
+    goals: list[ExtractedGoalCreate]
+    services: list[ExtractedServiceCreate]
+    accommodations: list[ExtractedAccommodationCreate]
+    present_levels: list[ExtractedPresentLevelCreate]
+    iep_metadata: dict[str, Any]
+    processing_notes: list[str]
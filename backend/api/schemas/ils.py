@@ -5,17 +5,20 @@ Author: artpromedia
 Date: 2025-11-29
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, SkipValidation, computed_field
+from typing import Any
 from datetime import datetime
-from enum import Enum
+
+from api.schemas.common import (
+    Age, FastStrEnum, GradeLevel, InternedStr, ORMBase, Percent, Rating, request_now, value_object,
+)
 
 
 # ==========================================
 # ENUMS
 # ==========================================
 
-class IndependentLivingDomain(str, Enum):
+class IndependentLivingDomain(FastStrEnum):
     MONEY_MANAGEMENT = "MONEY_MANAGEMENT"
     COOKING_NUTRITION = "COOKING_NUTRITION"
     TRANSPORTATION = "TRANSPORTATION"
@@ -24,7 +27,7 @@ class IndependentLivingDomain(str, Enum):
     COMMUNITY_RESOURCES = "COMMUNITY_RESOURCES"
 
 
-class SkillMasteryLevel(str, Enum):
+class SkillMasteryLevel(FastStrEnum):
     NOT_INTRODUCED = "NOT_INTRODUCED"
     AWARENESS = "AWARENESS"
     EMERGING = "EMERGING"
@@ -35,7 +38,7 @@ class SkillMasteryLevel(str, Enum):
     GENERALIZED = "GENERALIZED"
 
 
-class PromptLevel(str, Enum):
+class PromptLevel(FastStrEnum):
     FULL_PHYSICAL = "FULL_PHYSICAL"
     PARTIAL_PHYSICAL = "PARTIAL_PHYSICAL"
     MODELING = "MODELING"
@@ -46,7 +49,7 @@ class PromptLevel(str, Enum):
     INDEPENDENT = "INDEPENDENT"
 
 
-class DataCollectionMethod(str, Enum):
+class DataCollectionMethod(FastStrEnum):
     TASK_ANALYSIS = "TASK_ANALYSIS"
     FREQUENCY = "FREQUENCY"
     DURATION = "DURATION"
@@ -58,7 +61,7 @@ class DataCollectionMethod(str, Enum):
     PERMANENT_PRODUCT = "PERMANENT_PRODUCT"
 
 
-class SettingType(str, Enum):
+class SettingType(FastStrEnum):
     CLASSROOM = "CLASSROOM"
     HOME = "HOME"
     SCHOOL_CAFETERIA = "SCHOOL_CAFETERIA"
@@ -77,7 +80,7 @@ class SettingType(str, Enum):
     VIRTUAL = "VIRTUAL"
 
 
-class CBIStatus(str, Enum):
+class CBIStatus(FastStrEnum):
     PLANNED = "PLANNED"
     IN_PROGRESS = "IN_PROGRESS"
     COMPLETED = "COMPLETED"
@@ -85,7 +88,7 @@ class CBIStatus(str, Enum):
     RESCHEDULED = "RESCHEDULED"
 
 
-class ILSGoalStatus(str, Enum):
+class ILSGoalStatus(FastStrEnum):
     DRAFT = "DRAFT"
     ACTIVE = "ACTIVE"
     ON_HOLD = "ON_HOLD"
@@ -98,32 +101,40 @@ class ILSGoalStatus(str, Enum):
 # TASK ANALYSIS SCHEMAS
 # ==========================================
 
+# Most to least support; copied into each step rather than deep-copied
+DEFAULT_PROMPT_HIERARCHY = [
+    PromptLevel.FULL_PHYSICAL, PromptLevel.PARTIAL_PHYSICAL,
+    PromptLevel.MODELING, PromptLevel.GESTURAL,
+    PromptLevel.VERBAL_DIRECT, PromptLevel.INDEPENDENT,
+]
+
 class TaskStep(BaseModel):
     """A single step in a task analysis"""
     step_number: int = Field(..., ge=1, description="Step number in sequence")
     description: str = Field(..., description="Description of the step")
-    prompt_hierarchy: List[PromptLevel] = Field(
-        default=[PromptLevel.FULL_PHYSICAL, PromptLevel.PARTIAL_PHYSICAL, 
-                 PromptLevel.MODELING, PromptLevel.GESTURAL, 
-                 PromptLevel.VERBAL_DIRECT, PromptLevel.INDEPENDENT],
-        description="Prompt levels for this step from most to least support"
+    prompt_hierarchy: list[PromptLevel] = Field(
+        default_factory=DEFAULT_PROMPT_HIERARCHY.copy,
+        description="Prompt levels for this step from most to least support",
+        json_schema_extra={"default": DEFAULT_PROMPT_HIERARCHY},
     )
     critical_step: bool = Field(default=False, description="Is this a critical/safety step")
-    notes: Optional[str] = Field(None, description="Teaching notes for this step")
+    notes: str | None = Field(None, description="Teaching notes for this step")
 
 
-class VisualSupport(BaseModel):
+@value_object
+class VisualSupport:
     """Visual support resource for skill instruction"""
     name: str = Field(..., description="Name of the visual support")
-    url: str = Field(..., description="URL to the resource")
-    type: str = Field(..., description="Type: image, video, pdf, interactive")
+    url: InternedStr = Field(..., description="URL to the resource")
+    type: InternedStr = Field(..., description="Type: image, video, pdf, interactive")
 
 
-class StepProgressData(BaseModel):
+@value_object
+class StepProgressData:
     """Progress data for a single task analysis step"""
     step_number: int = Field(..., ge=1)
     mastery_level: SkillMasteryLevel = Field(default=SkillMasteryLevel.NOT_INTRODUCED)
-    last_prompt_level: Optional[PromptLevel] = None
+    last_prompt_level: PromptLevel | None = None
     trials_correct: int = Field(default=0)
     trials_total: int = Field(default=0)
 
@@ -138,31 +149,31 @@ class FunctionalSkillBase(BaseModel):
     name: str = Field(..., min_length=3, max_length=200)
     description: str = Field(..., min_length=10)
     
-    task_steps: List[TaskStep]
-    total_steps: int = Field(..., ge=1)
+    task_steps: list[TaskStep] = Field(..., min_length=1)
     
-    prerequisite_skill_ids: List[str] = Field(default=[])
-    scaffolding_notes: Optional[str] = None
+    prerequisite_skill_ids: list[str] = Field(default_factory=list)
+    scaffolding_notes: str | None = None
     
-    min_age: Optional[int] = Field(None, ge=5, le=26)
-    max_age: Optional[int] = Field(None, ge=5, le=26)
-    min_grade_level: Optional[int] = Field(None, ge=0, le=12)
-    max_grade_level: Optional[int] = Field(None, ge=0, le=12)
+    min_age: Age | None = None
+    max_age: Age | None = None
+    min_grade_level: GradeLevel | None = None
+    max_grade_level: GradeLevel | None = None
     
-    materials_needed: List[str] = Field(default=[])
-    visual_supports: List[VisualSupport] = Field(default=[])
-    video_modeling_urls: List[str] = Field(default=[])
-    social_story_url: Optional[str] = None
+    materials_needed: list[str] = Field(default_factory=list)
+    visual_supports: list[VisualSupport] = Field(default_factory=list)
+    # The same resources are shared across many skills
+    video_modeling_urls: list[InternedStr] = Field(default_factory=list)
+    social_story_url: InternedStr | None = None
     
-    target_settings: List[SettingType] = Field(default=[])
+    target_settings: list[SettingType] = Field(default_factory=list)
     
     mastery_threshold: float = Field(default=0.9, ge=0.5, le=1.0)
     data_collection_method: DataCollectionMethod = Field(default=DataCollectionMethod.TASK_ANALYSIS)
     min_trials_for_mastery: int = Field(default=3, ge=1, le=10)
     
     is_critical_safety: bool = Field(default=False)
-    community_relevance: int = Field(default=3, ge=1, le=5)
-    employment_relevance: int = Field(default=3, ge=1, le=5)
+    community_relevance: Rating = 3
+    employment_relevance: Rating = 3
 
 
 class FunctionalSkillCreate(FunctionalSkillBase):
@@ -172,41 +183,43 @@ class FunctionalSkillCreate(FunctionalSkillBase):
 
 class FunctionalSkillUpdate(BaseModel):
     """Schema for updating a functional skill"""
-    name: Optional[str] = Field(None, min_length=3, max_length=200)
-    description: Optional[str] = Field(None, min_length=10)
-    task_steps: Optional[List[TaskStep]] = None
-    total_steps: Optional[int] = Field(None, ge=1)
-    prerequisite_skill_ids: Optional[List[str]] = None
-    scaffolding_notes: Optional[str] = None
-    min_age: Optional[int] = Field(None, ge=5, le=26)
-    max_age: Optional[int] = Field(None, ge=5, le=26)
-    materials_needed: Optional[List[str]] = None
-    visual_supports: Optional[List[VisualSupport]] = None
-    video_modeling_urls: Optional[List[str]] = None
-    social_story_url: Optional[str] = None
-    target_settings: Optional[List[SettingType]] = None
-    mastery_threshold: Optional[float] = Field(None, ge=0.5, le=1.0)
-    data_collection_method: Optional[DataCollectionMethod] = None
-    is_critical_safety: Optional[bool] = None
-    community_relevance: Optional[int] = Field(None, ge=1, le=5)
-    employment_relevance: Optional[int] = Field(None, ge=1, le=5)
-    is_active: Optional[bool] = None
-
-
-class FunctionalSkillResponse(FunctionalSkillBase):
+    name: str | None = Field(None, min_length=3, max_length=200)
+    description: str | None = Field(None, min_length=10)
+    task_steps: list[TaskStep] | None = Field(None, min_length=1)
+    prerequisite_skill_ids: list[str] | None = None
+    scaffolding_notes: str | None = None
+    min_age: Age | None = None
+    max_age: Age | None = None
+    materials_needed: list[str] | None = None
+    visual_supports: list[VisualSupport] | None = None
+    video_modeling_urls: list[str] | None = None
+    social_story_url: str | None = None
+    target_settings: list[SettingType] | None = None
+    mastery_threshold: float | None = Field(None, ge=0.5, le=1.0)
+    data_collection_method: DataCollectionMethod | None = None
+    is_critical_safety: bool | None = None
+    community_relevance: Rating | None = None
+    employment_relevance: Rating | None = None
+    is_active: bool | None = None
+
+
+class FunctionalSkillResponse(FunctionalSkillBase, ORMBase):
     """Schema for functional skill response"""
     id: str
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    # Derived from the steps, so it can never disagree with them
+    @computed_field
+    @property
+    def total_steps(self) -> int:
+        return len(self.task_steps)
 
 
 class FunctionalSkillListResponse(BaseModel):
     """Paginated list of functional skills"""
-    skills: List[FunctionalSkillResponse]
+    skills: list[FunctionalSkillResponse]
     total: int
     page: int
     page_size: int
@@ -223,90 +236,90 @@ class LearnerSkillProgressBase(BaseModel):
     skill_id: str
     
     mastery_level: SkillMasteryLevel = Field(default=SkillMasteryLevel.NOT_INTRODUCED)
-    percent_mastered: float = Field(default=0.0, ge=0, le=100)
+    percent_mastered: Percent = 0.0
     
-    step_progress: Optional[List[StepProgressData]] = None
+    step_progress: list[StepProgressData] | None = None
     
-    baseline_date: Optional[datetime] = None
-    baseline_score: Optional[float] = Field(None, ge=0, le=100)
-    target_mastery_date: Optional[datetime] = None
+    baseline_date: datetime | None = None
+    baseline_score: Percent | None = None
+    target_mastery_date: datetime | None = None
     
     current_prompt_level: PromptLevel = Field(default=PromptLevel.FULL_PHYSICAL)
     
-    settings_mastered: List[SettingType] = Field(default=[])
-    generalization_score: Optional[float] = Field(None, ge=0, le=100)
+    settings_mastered: list[SettingType] = Field(default_factory=list)
+    generalization_score: Percent | None = None
     
-    teacher_notes: Optional[str] = None
-    parent_notes: Optional[str] = None
+    teacher_notes: str | None = None
+    parent_notes: str | None = None
 
 
 class LearnerSkillProgressCreate(BaseModel):
     """Schema for creating learner skill progress"""
     skill_id: str
-    baseline_date: Optional[datetime] = None
-    baseline_score: Optional[float] = Field(None, ge=0, le=100)
-    target_mastery_date: Optional[datetime] = None
-    teacher_notes: Optional[str] = None
+    baseline_date: datetime | None = None
+    baseline_score: Percent | None = None
+    target_mastery_date: datetime | None = None
+    teacher_notes: str | None = None
 
 
 class LearnerSkillProgressUpdate(BaseModel):
     """Schema for updating learner skill progress"""
-    mastery_level: Optional[SkillMasteryLevel] = None
-    percent_mastered: Optional[float] = Field(None, ge=0, le=100)
-    step_progress: Optional[List[StepProgressData]] = None
-    target_mastery_date: Optional[datetime] = None
-    current_prompt_level: Optional[PromptLevel] = None
-    teacher_notes: Optional[str] = None
-    parent_notes: Optional[str] = None
-    is_active: Optional[bool] = None
+    mastery_level: SkillMasteryLevel | None = None
+    percent_mastered: Percent | None = None
+    step_progress: list[StepProgressData] | None = None
+    target_mastery_date: datetime | None = None
+    current_prompt_level: PromptLevel | None = None
+    teacher_notes: str | None = None
+    parent_notes: str | None = None
+    is_active: bool | None = None
 
 
-class LearnerSkillProgressResponse(LearnerSkillProgressBase):
+class LearnerSkillProgressResponse(LearnerSkillProgressBase, ORMBase):
     """Schema for learner skill progress response"""
     id: str
     current_streak: int
     total_practice_minutes: int
-    last_practice_date: Optional[datetime]
-    prompt_fading_history: Optional[List[Dict[str, Any]]]
+    last_practice_date: datetime | None = None
+    # Free-form JSON column, returned as loaded rather than re-walked
+    prompt_fading_history: SkipValidation[list[dict[str, Any]] | None] = None
     is_active: bool
     created_at: datetime
     updated_at: datetime
     
     # Include skill details for convenience
-    skill: Optional[FunctionalSkillResponse] = None
-    
-    class Config:
-        from_attributes = True
+    skill: FunctionalSkillResponse | None = None
 
 
 class LearnerSkillProgressListResponse(BaseModel):
     """List of learner skill progress"""
-    progress: List[LearnerSkillProgressResponse]
+    progress: list[LearnerSkillProgressResponse]
     total: int
-    by_domain: Dict[str, int]  # Count by domain
-    by_mastery_level: Dict[str, int]  # Count by mastery level
+    by_domain: dict[str, int]  # Count by domain
+    by_mastery_level: dict[str, int]  # Count by mastery level
 
 
 # ==========================================
 # DATA POINT SCHEMAS
 # ==========================================
 
-class StepDataEntry(BaseModel):
+@value_object
+class StepDataEntry:
     """Data for a single step in a data collection session"""
     step_number: int = Field(..., ge=1)
     completed: bool = Field(default=False)
     prompt_level: PromptLevel = Field(default=PromptLevel.FULL_PHYSICAL)
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
-class EnvironmentalFactors(BaseModel):
+@value_object
+class EnvironmentalFactors:
     """Environmental factors during data collection"""
-    noise_level: Optional[str] = None  # low, medium, high
-    distractions: Optional[str] = None
-    support_level: Optional[str] = None
-    peer_presence: Optional[bool] = None
-    familiar_environment: Optional[bool] = None
-    other: Optional[str] = None
+    noise_level: InternedStr | None = None  # low, medium, high
+    distractions: InternedStr | None = None
+    support_level: InternedStr | None = None
+    peer_presence: bool | None = None
+    familiar_environment: bool | None = None
+    other: str | None = None
 
 
 class SkillDataPointBase(BaseModel):
@@ -314,86 +327,85 @@ class SkillDataPointBase(BaseModel):
     skill_id: str
     learner_id: str
     
-    session_date: datetime = Field(default_factory=datetime.now)
+    session_date: datetime = Field(default_factory=request_now)
     setting: SettingType
-    duration: Optional[int] = Field(None, ge=1, description="Duration in minutes")
-    instructor: Optional[str] = None
+    duration: int | None = Field(None, ge=1, description="Duration in minutes")
+    instructor: str | None = None
     
     collection_method: DataCollectionMethod
     
     # Task Analysis Data
-    steps_attempted: Optional[int] = Field(None, ge=0)
-    steps_completed: Optional[int] = Field(None, ge=0)
-    step_by_step_data: Optional[List[StepDataEntry]] = None
+    steps_attempted: int | None = Field(None, ge=0)
+    steps_completed: int | None = Field(None, ge=0)
+    step_by_step_data: list[StepDataEntry] | None = None
     
     # Frequency/Duration Data
-    frequency: Optional[int] = Field(None, ge=0)
-    duration_seconds: Optional[int] = Field(None, ge=0)
-    latency_seconds: Optional[int] = Field(None, ge=0)
+    frequency: int | None = Field(None, ge=0)
+    duration_seconds: int | None = Field(None, ge=0)
+    latency_seconds: int | None = Field(None, ge=0)
     
     # Prompts
-    highest_prompt_used: Optional[PromptLevel] = None
-    lowest_prompt_used: Optional[PromptLevel] = None
-    prompts_provided: Optional[List[Dict[str, Any]]] = None
+    highest_prompt_used: PromptLevel | None = None
+    lowest_prompt_used: PromptLevel | None = None
+    prompts_provided: list[dict[str, Any]] | None = None
     
     # Scores
-    accuracy_percent: Optional[float] = Field(None, ge=0, le=100)
-    independence_percent: Optional[float] = Field(None, ge=0, le=100)
+    accuracy_percent: Percent | None = None
+    independence_percent: Percent | None = None
     
     # Notes
-    behavior_notes: Optional[str] = None
-    antecedents: Optional[str] = None
-    consequences: Optional[str] = None
+    behavior_notes: str | None = None
+    antecedents: str | None = None
+    consequences: str | None = None
     
-    environmental_factors: Optional[EnvironmentalFactors] = None
+    environmental_factors: EnvironmentalFactors | None = None
 
 
 class SkillDataPointCreate(BaseModel):
     """Schema for creating a data point"""
     skill_id: str
-    session_date: Optional[datetime] = None
+    session_date: datetime | None = None
     setting: SettingType
-    duration: Optional[int] = Field(None, ge=1)
-    instructor: Optional[str] = None
+    duration: int | None = Field(None, ge=1)
+    instructor: str | None = None
     collection_method: DataCollectionMethod = Field(default=DataCollectionMethod.TASK_ANALYSIS)
     
-    steps_attempted: Optional[int] = Field(None, ge=0)
-    steps_completed: Optional[int] = Field(None, ge=0)
-    step_by_step_data: Optional[List[StepDataEntry]] = None
+    steps_attempted: int | None = Field(None, ge=0)
+    steps_completed: int | None = Field(None, ge=0)
+    step_by_step_data: list[StepDataEntry] | None = None
     
-    frequency: Optional[int] = Field(None, ge=0)
-    duration_seconds: Optional[int] = Field(None, ge=0)
-    latency_seconds: Optional[int] = Field(None, ge=0)
+    frequency: int | None = Field(None, ge=0)
+    duration_seconds: int | None = Field(None, ge=0)
+    latency_seconds: int | None = Field(None, ge=0)
     
-    highest_prompt_used: Optional[PromptLevel] = None
-    lowest_prompt_used: Optional[PromptLevel] = None
+    highest_prompt_used: PromptLevel | None = None
+    lowest_prompt_used: PromptLevel | None = None
     
-    accuracy_percent: Optional[float] = Field(None, ge=0, le=100)
-    independence_percent: Optional[float] = Field(None, ge=0, le=100)
+    accuracy_percent: Percent | None = None
+    independence_percent: Percent | None = None
     
-    behavior_notes: Optional[str] = None
-    antecedents: Optional[str] = None
-    consequences: Optional[str] = None
-    environmental_factors: Optional[EnvironmentalFactors] = None
+    behavior_notes: str | None = None
+    antecedents: str | None = None
+    consequences: str | None = None
+    environmental_factors: EnvironmentalFactors | None = None
 
 
-class SkillDataPointResponse(SkillDataPointBase):
+class SkillDataPointResponse(SkillDataPointBase, ORMBase):
     """Schema for data point response"""
     id: str
-    verified_by: Optional[str]
+    # Validated on the way in; returned as loaded rather than re-walked
+    prompts_provided: SkipValidation[list[dict[str, Any]] | None] = None
+    verified_by: str | None = None
     parent_signoff: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class SkillDataPointListResponse(BaseModel):
     """List of data points with aggregations"""
-    data_points: List[SkillDataPointResponse]
+    data_points: list[SkillDataPointResponse]
     total: int
-    average_accuracy: Optional[float]
-    average_independence: Optional[float]
+    average_accuracy: float | None = None
+    average_independence: float | None = None
     sessions_this_week: int
     sessions_this_month: int
 
@@ -408,64 +420,61 @@ class GeneralizationRecordBase(BaseModel):
     learner_id: str
     
     setting: SettingType
-    location_name: Optional[str] = None
+    location_name: str | None = None
     
     is_introduced: bool = Field(default=False)
-    introduced_date: Optional[datetime] = None
+    introduced_date: datetime | None = None
     is_mastered: bool = Field(default=False)
-    mastered_date: Optional[datetime] = None
+    mastered_date: datetime | None = None
     
     trials_attempted: int = Field(default=0, ge=0)
     trials_successful: int = Field(default=0, ge=0)
-    success_rate: Optional[float] = Field(None, ge=0, le=100)
+    success_rate: Percent | None = None
     
-    current_prompt_level: Optional[PromptLevel] = None
-    supports_needed: List[str] = Field(default=[])
+    current_prompt_level: PromptLevel | None = None
+    supports_needed: list[str] = Field(default_factory=list)
     
-    barriers: List[str] = Field(default=[])
-    accommodations: List[str] = Field(default=[])
+    barriers: list[str] = Field(default_factory=list)
+    accommodations: list[str] = Field(default_factory=list)
     
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
 class GeneralizationRecordCreate(BaseModel):
     """Schema for creating generalization record"""
     skill_id: str
     setting: SettingType
-    location_name: Optional[str] = None
-    notes: Optional[str] = None
+    location_name: str | None = None
+    notes: str | None = None
 
 
 class GeneralizationRecordUpdate(BaseModel):
     """Schema for updating generalization record"""
-    location_name: Optional[str] = None
-    is_introduced: Optional[bool] = None
-    introduced_date: Optional[datetime] = None
-    is_mastered: Optional[bool] = None
-    mastered_date: Optional[datetime] = None
-    current_prompt_level: Optional[PromptLevel] = None
-    supports_needed: Optional[List[str]] = None
-    barriers: Optional[List[str]] = None
-    accommodations: Optional[List[str]] = None
-    notes: Optional[str] = None
-
-
-class GeneralizationRecordResponse(GeneralizationRecordBase):
+    location_name: str | None = None
+    is_introduced: bool | None = None
+    introduced_date: datetime | None = None
+    is_mastered: bool | None = None
+    mastered_date: datetime | None = None
+    current_prompt_level: PromptLevel | None = None
+    supports_needed: list[str] | None = None
+    barriers: list[str] | None = None
+    accommodations: list[str] | None = None
+    notes: str | None = None
+
+
+class GeneralizationRecordResponse(GeneralizationRecordBase, ORMBase):
     """Schema for generalization record response"""
     id: str
-    last_attempt_date: Optional[datetime]
+    last_attempt_date: datetime | None = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class GeneralizationMatrixResponse(BaseModel):
     """Matrix view of generalization across settings"""
     skill_id: str
     skill_name: str
-    settings: Dict[str, GeneralizationRecordResponse]  # Setting -> Record
+    settings: dict[str, GeneralizationRecordResponse]  # Setting -> Record
     total_settings: int
     mastered_settings: int
     introduced_settings: int
@@ -480,9 +489,9 @@ class CBIActivityBase(BaseModel):
     """Base schema for CBI activities"""
     skill_id: str
     activity_name: str = Field(..., min_length=3)
-    activity_description: Optional[str] = None
+    activity_description: str | None = None
     order_in_session: int = Field(default=1, ge=1)
-    target_steps: List[int] = Field(default=[])
+    target_steps: list[int] = Field(default_factory=list)
     target_prompt_level: PromptLevel = Field(default=PromptLevel.VERBAL_DIRECT)
 
 
@@ -493,29 +502,26 @@ class CBIActivityCreate(CBIActivityBase):
 
 class CBIActivityUpdate(BaseModel):
     """Schema for updating CBI activity"""
-    activity_name: Optional[str] = None
-    activity_description: Optional[str] = None
-    order_in_session: Optional[int] = Field(None, ge=1)
-    target_steps: Optional[List[int]] = None
-    target_prompt_level: Optional[PromptLevel] = None
-    was_completed: Optional[bool] = None
-    steps_completed: Optional[int] = None
-    actual_prompt_level: Optional[PromptLevel] = None
-    notes: Optional[str] = None
-
-
-class CBIActivityResponse(CBIActivityBase):
+    activity_name: str | None = None
+    activity_description: str | None = None
+    order_in_session: int | None = Field(None, ge=1)
+    target_steps: list[int] | None = None
+    target_prompt_level: PromptLevel | None = None
+    was_completed: bool | None = None
+    steps_completed: int | None = None
+    actual_prompt_level: PromptLevel | None = None
+    notes: str | None = None
+
+
+class CBIActivityResponse(CBIActivityBase, ORMBase):
     """Schema for CBI activity response"""
     id: str
     cbi_id: str
     was_completed: bool
-    steps_completed: Optional[int]
-    actual_prompt_level: Optional[PromptLevel]
-    notes: Optional[str]
+    steps_completed: int | None = None
+    actual_prompt_level: PromptLevel | None = None
+    notes: str | None = None
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class CommunityBasedInstructionBase(BaseModel):
@@ -523,123 +529,120 @@ class CommunityBasedInstructionBase(BaseModel):
     learner_id: str
     
     scheduled_date: datetime
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
     status: CBIStatus = Field(default=CBIStatus.PLANNED)
     
     location_name: str = Field(..., min_length=3)
-    location_address: Optional[str] = None
+    location_address: str | None = None
     setting_type: SettingType
     
     instructor_name: str = Field(..., min_length=2)
-    staff_ratio: Optional[str] = None
-    additional_staff: List[str] = Field(default=[])
+    staff_ratio: str | None = None
+    additional_staff: list[str] = Field(default_factory=list)
     
-    transportation_type: Optional[str] = None
-    transportation_notes: Optional[str] = None
+    transportation_type: str | None = None
+    transportation_notes: str | None = None
     
     parent_permission: bool = Field(default=False)
-    permission_form_date: Optional[datetime] = None
-    emergency_contact: Optional[str] = None
-    emergency_phone: Optional[str] = None
-    medical_notes: Optional[str] = None
+    permission_form_date: datetime | None = None
+    emergency_contact: str | None = None
+    emergency_phone: str | None = None
+    medical_notes: str | None = None
     
     pre_teaching_completed: bool = Field(default=False)
-    pre_teaching_notes: Optional[str] = None
-    visual_schedule_url: Optional[str] = None
-    social_story_url: Optional[str] = None
+    pre_teaching_notes: str | None = None
+    visual_schedule_url: str | None = None
+    social_story_url: str | None = None
 
 
 class CommunityBasedInstructionCreate(BaseModel):
     """Schema for creating CBI session"""
     scheduled_date: datetime
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
     
     location_name: str = Field(..., min_length=3)
-    location_address: Optional[str] = None
+    location_address: str | None = None
     setting_type: SettingType
     
     instructor_name: str = Field(..., min_length=2)
-    staff_ratio: Optional[str] = None
-    additional_staff: List[str] = Field(default=[])
+    staff_ratio: str | None = None
+    additional_staff: list[str] = Field(default_factory=list)
     
-    transportation_type: Optional[str] = None
-    transportation_notes: Optional[str] = None
+    transportation_type: str | None = None
+    transportation_notes: str | None = None
     
-    emergency_contact: Optional[str] = None
-    emergency_phone: Optional[str] = None
-    medical_notes: Optional[str] = None
+    emergency_contact: str | None = None
+    emergency_phone: str | None = None
+    medical_notes: str | None = None
     
-    pre_teaching_notes: Optional[str] = None
+    pre_teaching_notes: str | None = None
     
     # Activities to include
-    activities: List[CBIActivityCreate] = Field(default=[])
+    activities: list[CBIActivityCreate] = Field(default_factory=list)
 
 
 class CommunityBasedInstructionUpdate(BaseModel):
     """Schema for updating CBI session"""
-    scheduled_date: Optional[datetime] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-    status: Optional[CBIStatus] = None
+    scheduled_date: datetime | None = None
+    start_time: datetime | None = None
+    end_time: datetime | None = None
+    status: CBIStatus | None = None
     
-    location_name: Optional[str] = None
-    location_address: Optional[str] = None
-    setting_type: Optional[SettingType] = None
+    location_name: str | None = None
+    location_address: str | None = None
+    setting_type: SettingType | None = None
     
-    instructor_name: Optional[str] = None
-    staff_ratio: Optional[str] = None
-    additional_staff: Optional[List[str]] = None
+    instructor_name: str | None = None
+    staff_ratio: str | None = None
+    additional_staff: list[str] | None = None
     
-    transportation_type: Optional[str] = None
-    transportation_notes: Optional[str] = None
+    transportation_type: str | None = None
+    transportation_notes: str | None = None
     
-    parent_permission: Optional[bool] = None
-    permission_form_date: Optional[datetime] = None
-    emergency_contact: Optional[str] = None
-    emergency_phone: Optional[str] = None
-    medical_notes: Optional[str] = None
+    parent_permission: bool | None = None
+    permission_form_date: datetime | None = None
+    emergency_contact: str | None = None
+    emergency_phone: str | None = None
+    medical_notes: str | None = None
     
-    pre_teaching_completed: Optional[bool] = None
-    pre_teaching_notes: Optional[str] = None
-    visual_schedule_url: Optional[str] = None
-    social_story_url: Optional[str] = None
+    pre_teaching_completed: bool | None = None
+    pre_teaching_notes: str | None = None
+    visual_schedule_url: str | None = None
+    social_story_url: str | None = None
     
     # Outcomes
-    actual_start_time: Optional[datetime] = None
-    actual_end_time: Optional[datetime] = None
-    overall_success_rating: Optional[int] = Field(None, ge=1, le=5)
-    behavior_notes: Optional[str] = None
-    general_notes: Optional[str] = None
+    actual_start_time: datetime | None = None
+    actual_end_time: datetime | None = None
+    overall_success_rating: Rating | None = None
+    behavior_notes: str | None = None
+    general_notes: str | None = None
     
-    follow_up_needed: Optional[bool] = None
-    follow_up_notes: Optional[str] = None
-    next_cbi_date: Optional[datetime] = None
+    follow_up_needed: bool | None = None
+    follow_up_notes: str | None = None
+    next_cbi_date: datetime | None = None
 
 
-class CommunityBasedInstructionResponse(CommunityBasedInstructionBase):
+class CommunityBasedInstructionResponse(CommunityBasedInstructionBase, ORMBase):
     """Schema for CBI session response"""
     id: str
-    actual_start_time: Optional[datetime]
-    actual_end_time: Optional[datetime]
-    overall_success_rating: Optional[int]
-    behavior_notes: Optional[str]
-    general_notes: Optional[str]
+    actual_start_time: datetime | None = None
+    actual_end_time: datetime | None = None
+    overall_success_rating: int | None = None
+    behavior_notes: str | None = None
+    general_notes: str | None = None
     follow_up_needed: bool
-    follow_up_notes: Optional[str]
-    next_cbi_date: Optional[datetime]
-    activities: List[CBIActivityResponse] = Field(default=[])
+    follow_up_notes: str | None = None
+    next_cbi_date: datetime | None = None
+    activities: list[CBIActivityResponse] = Field(default_factory=list)
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class CBIListResponse(BaseModel):
     """List of CBI sessions"""
-    sessions: List[CommunityBasedInstructionResponse]
+    sessions: list[CommunityBasedInstructionResponse]
     total: int
     upcoming: int
     completed_this_month: int
@@ -651,7 +654,7 @@ class CBIListResponse(BaseModel):
 
 class ILSGoalObjectiveBase(BaseModel):
     """Base schema for ILS goal objectives"""
-    skill_id: Optional[str] = None
+    skill_id: str | None = None
     objective_number: int = Field(..., ge=1)
     objective_statement: str = Field(..., min_length=10)
     target_criteria: str = Field(..., min_length=10)
@@ -664,35 +667,33 @@ class ILSGoalObjectiveCreate(ILSGoalObjectiveBase):
 
 class ILSGoalObjectiveUpdate(BaseModel):
     """Schema for updating goal objective"""
-    objective_statement: Optional[str] = None
-    target_criteria: Optional[str] = None
-    is_completed: Optional[bool] = None
-    completed_date: Optional[datetime] = None
-    current_performance: Optional[float] = Field(None, ge=0, le=100)
-    notes: Optional[str] = None
+    objective_statement: str | None = None
+    target_criteria: str | None = None
+    is_completed: bool | None = None
+    completed_date: datetime | None = None
+    current_performance: Percent | None = None
+    notes: str | None = None
 
 
-class ILSGoalObjectiveResponse(ILSGoalObjectiveBase):
+class ILSGoalObjectiveResponse(ILSGoalObjectiveBase, ORMBase):
     """Schema for goal objective response"""
     id: str
     goal_id: str
     is_completed: bool
-    completed_date: Optional[datetime]
-    current_performance: Optional[float]
+    completed_date: datetime | None = None
+    current_performance: float | None = None
     data_points: int
-    notes: Optional[str]
+    notes: str | None = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
-class ProgressNote(BaseModel):
+@value_object
+class ProgressNote:
     """A progress note entry"""
     date: datetime
     note: str
-    performance: Optional[float] = None
+    performance: float | None = None
 
 
 class ILSGoalBase(BaseModel):
@@ -700,85 +701,82 @@ class ILSGoalBase(BaseModel):
     learner_id: str
     domain: IndependentLivingDomain
     goal_statement: str = Field(..., min_length=20)
-    rationale: Optional[str] = None
+    rationale: str | None = None
     
-    start_date: datetime = Field(default_factory=datetime.now)
+    start_date: datetime = Field(default_factory=request_now)
     target_date: datetime
     status: ILSGoalStatus = Field(default=ILSGoalStatus.DRAFT)
     
-    baseline_description: Optional[str] = None
-    baseline_date: Optional[datetime] = None
-    baseline_performance: Optional[float] = Field(None, ge=0, le=100)
+    baseline_description: str | None = None
+    baseline_date: datetime | None = None
+    baseline_performance: Percent | None = None
     
-    linked_iep_goal_id: Optional[str] = None
+    linked_iep_goal_id: str | None = None
     
-    review_schedule: Optional[str] = None
+    review_schedule: str | None = None
 
 
 class ILSGoalCreate(BaseModel):
     """Schema for creating ILS goal"""
     domain: IndependentLivingDomain
     goal_statement: str = Field(..., min_length=20)
-    rationale: Optional[str] = None
+    rationale: str | None = None
     
-    start_date: Optional[datetime] = None
+    start_date: datetime | None = None
     target_date: datetime
     
-    baseline_description: Optional[str] = None
-    baseline_date: Optional[datetime] = None
-    baseline_performance: Optional[float] = Field(None, ge=0, le=100)
+    baseline_description: str | None = None
+    baseline_date: datetime | None = None
+    baseline_performance: Percent | None = None
     
-    linked_iep_goal_id: Optional[str] = None
-    review_schedule: Optional[str] = None
+    linked_iep_goal_id: str | None = None
+    review_schedule: str | None = None
     
     # Objectives to create
-    objectives: List[ILSGoalObjectiveCreate] = Field(default=[])
+    objectives: list[ILSGoalObjectiveCreate] = Field(default_factory=list)
 
 
 class ILSGoalUpdate(BaseModel):
     """Schema for updating ILS goal"""
-    goal_statement: Optional[str] = None
-    rationale: Optional[str] = None
-    target_date: Optional[datetime] = None
-    status: Optional[ILSGoalStatus] = None
+    goal_statement: str | None = None
+    rationale: str | None = None
+    target_date: datetime | None = None
+    status: ILSGoalStatus | None = None
     
-    baseline_description: Optional[str] = None
-    baseline_performance: Optional[float] = Field(None, ge=0, le=100)
+    baseline_description: str | None = None
+    baseline_performance: Percent | None = None
     
-    current_performance: Optional[float] = Field(None, ge=0, le=100)
+    current_performance: Percent | None = None
     
-    linked_iep_goal_id: Optional[str] = None
-    review_schedule: Optional[str] = None
+    linked_iep_goal_id: str | None = None
+    review_schedule: str | None = None
     
-    completed_date: Optional[datetime] = None
-    completion_notes: Optional[str] = None
+    completed_date: datetime | None = None
+    completion_notes: str | None = None
 
 
-class ILSGoalResponse(ILSGoalBase):
+class ILSGoalResponse(ILSGoalBase, ORMBase):
     """Schema for ILS goal response"""
     id: str
-    current_performance: Optional[float]
-    last_progress_date: Optional[datetime]
-    progress_notes: Optional[List[ProgressNote]]
-    objectives: List[ILSGoalObjectiveResponse] = Field(default=[])
-    last_review_date: Optional[datetime]
-    next_review_date: Optional[datetime]
-    completed_date: Optional[datetime]
-    completion_notes: Optional[str]
+    current_performance: float | None = None
+    last_progress_date: datetime | None = None
+    progress_notes: list[ProgressNote] | None = None
+    objectives: list[ILSGoalObjectiveResponse] = Field(default_factory=list)
+    last_review_date: datetime | None = None
+    next_review_date: datetime | None = None
+    completed_date: datetime | None = None
+    completion_notes: str | None = None
     created_at: datetime
     updated_at: datetime
-    
-    class Config:
-        from_attributes = True
 
 
 class ILSGoalListResponse(BaseModel):
     """List of ILS goals"""
-    goals: List[ILSGoalResponse]
+    goals: list[ILSGoalResponse]
     total: int
     active: int
     achieved: int
-    by_domain: Dict[str, int]
+    by_domain: dict[str, int]
 
 
 # ==========================================
@@ -810,20 +808,20 @@ class ILSDashboardResponse(BaseModel):
     overall_mastery_percent: float
     
     # By Domain
-    domain_summaries: List[DomainSummary]
+    domain_summaries: list[DomainSummary]
     
     # Recent Activity
     recent_data_points: int
     recent_cbi_sessions: int
-    last_activity_date: Optional[datetime]
+    last_activity_date: datetime | None = None
     
     # Goals
     active_goals: int
     goals_achieved_this_year: int
     
     # Recommendations
-    priority_skills: List[str]  # Skill IDs needing attention
-    upcoming_cbis: List[CommunityBasedInstructionResponse]
+    priority_skills: list[str]  # Skill IDs needing attention
+    upcoming_cbis: list[CommunityBasedInstructionResponse]
 
 
 class ILSProgressReportRequest(BaseModel):
@@ -831,7 +829,7 @@ class ILSProgressReportRequest(BaseModel):
     learner_id: str
     start_date: datetime
     end_date: datetime
-    domains: Optional[List[IndependentLivingDomain]] = None
+    domains: list[IndependentLivingDomain] | None = None
     include_data_points: bool = Field(default=True)
     include_goals: bool = Field(default=True)
     include_cbi: bool = Field(default=True)
@@ -849,7 +847,7 @@ class SkillProgressSummary(BaseModel):
     end_percent: float
     growth: float
     data_points_collected: int
-    settings_practiced: List[SettingType]
+    settings_practiced: list[SettingType]
 
 
 class ILSProgressReportResponse(BaseModel):
@@ -867,20 +865,20 @@ class ILSProgressReportResponse(BaseModel):
     average_growth: float
     
     # Detailed Progress
-    skill_progress: List[SkillProgressSummary]
+    skill_progress: list[SkillProgressSummary]
     
     # Goals Progress
-    goals_summary: Optional[Dict[str, Any]] = None
+    goals_summary: SkipValidation[dict[str, Any] | None] = None
     
     # CBI Summary
-    cbi_summary: Optional[Dict[str, Any]] = None
+    cbi_summary: SkipValidation[dict[str, Any] | None] = None
     
     # Generalization Summary
-    generalization_summary: Optional[Dict[str, Any]] = None
+    generalization_summary: SkipValidation[dict[str, Any] | None] = None
     
     # Recommendations
-    recommendations: List[str]
-    next_steps: List[str]
+    recommendations: list[str]
+    next_steps: list[str]
 
 
 # ==========================================
@@ -890,19 +888,19 @@ class ILSProgressReportResponse(BaseModel):
 class BulkSkillAssignRequest(BaseModel):
     """Assign multiple skills to a learner"""
     learner_id: str
-    skill_ids: List[str]
-    target_mastery_date: Optional[datetime] = None
+    skill_ids: list[str]
+    target_mastery_date: datetime | None = None
 
 
 class BulkDataPointCreate(BaseModel):
     """Create data points for multiple skills in one session"""
     session_date: datetime
     setting: SettingType
-    instructor: Optional[str] = None
-    data_points: List[SkillDataPointCreate]
+    instructor: str | None = None
+    data_points: list[SkillDataPointCreate]
 
 
 class BulkGeneralizationUpdate(BaseModel):
     """Update generalization for multiple settings"""
     skill_id: str
-    updates: List[GeneralizationRecordUpdate]
+    updates: list[GeneralizationRecordUpdate]
@@ -6,16 +6,17 @@ Date: 2025-11-29
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Any
 from datetime import datetime
-from enum import Enum
+
+from api.schemas.common import FastStrEnum, ORMBase, make_partial
 
 
 # ==========================================
 # ENUMS
 # ==========================================
 
-class SLPDiagnosis(str, Enum):
+class SLPDiagnosis(FastStrEnum):
     ARTICULATION = "ARTICULATION"
     FLUENCY = "FLUENCY"
     RECEPTIVE_LANGUAGE = "RECEPTIVE_LANGUAGE"
@@ -26,14 +27,14 @@ class SLPDiagnosis(str, Enum):
     DYSARTHRIA = "DYSARTHRIA"
 
 
-class SLPSeverity(str, Enum):
+class SLPSeverity(FastStrEnum):
     MILD = "MILD"
     MODERATE = "MODERATE"
     SEVERE = "SEVERE"
     PROFOUND = "PROFOUND"
 
 
-class PhonemePosition(str, Enum):
+class PhonemePosition(FastStrEnum):
     INITIAL = "INITIAL"
     MEDIAL = "MEDIAL"
     FINAL = "FINAL"
@@ -41,7 +42,7 @@ class PhonemePosition(str, Enum):
     ALL_POSITIONS = "ALL_POSITIONS"
 
 
-class ArticulationLevel(str, Enum):
+class ArticulationLevel(FastStrEnum):
     ISOLATION = "ISOLATION"
     SYLLABLE = "SYLLABLE"
     WORD = "WORD"
@@ -51,14 +52,14 @@ class ArticulationLevel(str, Enum):
     GENERALIZATION = "GENERALIZATION"
 
 
-class ArticulationErrorType(str, Enum):
+class ArticulationErrorType(FastStrEnum):
     SUBSTITUTION = "SUBSTITUTION"
     OMISSION = "OMISSION"
     DISTORTION = "DISTORTION"
     ADDITION = "ADDITION"
 
 
-class PromptLevelSLP(str, Enum):
+class PromptLevelSLP(FastStrEnum):
     NONE = "NONE"
     VISUAL = "VISUAL"
     VERBAL = "VERBAL"
@@ -66,14 +67,14 @@ class PromptLevelSLP(str, Enum):
     TACTILE = "TACTILE"
 
 
-class StutteringType(str, Enum):
+class StutteringType(FastStrEnum):
     REPETITION = "REPETITION"
     PROLONGATION = "PROLONGATION"
     BLOCK = "BLOCK"
     INTERJECTION = "INTERJECTION"
 
 
-class SecondaryBehavior(str, Enum):
+class SecondaryBehavior(FastStrEnum):
     EYE_BLINK = "EYE_BLINK"
     HEAD_NOD = "HEAD_NOD"
     FILLER_WORDS = "FILLER_WORDS"
@@ -82,7 +83,7 @@ class SecondaryBehavior(str, Enum):
     BODY_MOVEMENT = "BODY_MOVEMENT"
 
 
-class FluencyTaskType(str, Enum):
+class FluencyTaskType(FastStrEnum):
     READING = "READING"
     MONOLOGUE = "MONOLOGUE"
     CONVERSATION = "CONVERSATION"
@@ -90,7 +91,7 @@ class FluencyTaskType(str, Enum):
     SPONTANEOUS = "SPONTANEOUS"
 
 
-class PragmaticSkillType(str, Enum):
+class PragmaticSkillType(FastStrEnum):
     TURN_TAKING = "TURN_TAKING"
     TOPIC_MAINTENANCE = "TOPIC_MAINTENANCE"
     INITIATING = "INITIATING"
@@ -104,7 +105,7 @@ class PragmaticSkillType(str, Enum):
     EYE_CONTACT = "EYE_CONTACT"
 
 
-class PragmaticSettingType(str, Enum):
+class PragmaticSettingType(FastStrEnum):
     STRUCTURED = "STRUCTURED"
     UNSTRUCTURED = "UNSTRUCTURED"
     PEER = "PEER"
@@ -113,7 +114,7 @@ class PragmaticSettingType(str, Enum):
     ONE_ON_ONE = "ONE_ON_ONE"
 
 
-class SkillRating(str, Enum):
+class SkillRating(FastStrEnum):
     NOT_OBSERVED = "NOT_OBSERVED"
     EMERGING = "EMERGING"
     DEVELOPING = "DEVELOPING"
@@ -121,19 +122,19 @@ class SkillRating(str, Enum):
     MASTERED = "MASTERED"
 
 
-class VoicePitch(str, Enum):
+class VoicePitch(FastStrEnum):
     LOW = "LOW"
     NORMAL = "NORMAL"
     HIGH = "HIGH"
 
 
-class VoiceLoudness(str, Enum):
+class VoiceLoudness(FastStrEnum):
     SOFT = "SOFT"
     NORMAL = "NORMAL"
     LOUD = "LOUD"
 
 
-class VoiceQuality(str, Enum):
+class VoiceQuality(FastStrEnum):
     CLEAR = "CLEAR"
     HOARSE = "HOARSE"
     BREATHY = "BREATHY"
@@ -142,14 +143,14 @@ class VoiceQuality(str, Enum):
     HARSH = "HARSH"
 
 
-class VoiceResonance(str, Enum):
+class VoiceResonance(FastStrEnum):
     NORMAL = "NORMAL"
     HYPONASAL = "HYPONASAL"
     HYPERNASAL = "HYPERNASAL"
     MIXED = "MIXED"
 
 
-class SLPSessionType(str, Enum):
+class SLPSessionType(FastStrEnum):
     ARTICULATION = "ARTICULATION"
     FLUENCY = "FLUENCY"
     LANGUAGE = "LANGUAGE"
@@ -159,7 +160,7 @@ class SLPSessionType(str, Enum):
     EVALUATION = "EVALUATION"
 
 
-class SLPGoalDomain(str, Enum):
+class SLPGoalDomain(FastStrEnum):
     ARTICULATION = "ARTICULATION"
     FLUENCY = "FLUENCY"
     RECEPTIVE_LANGUAGE = "RECEPTIVE_LANGUAGE"
@@ -169,7 +170,7 @@ class SLPGoalDomain(str, Enum):
     ORAL_MOTOR = "ORAL_MOTOR"
 
 
-class SLPGoalStatus(str, Enum):
+class SLPGoalStatus(FastStrEnum):
     DRAFT = "DRAFT"
     ACTIVE = "ACTIVE"
     ON_HOLD = "ON_HOLD"
@@ -185,14 +186,14 @@ class SLPGoalStatus(str, Enum):
 class SLPProfileBase(BaseModel):
     """Base schema for SLP profile"""
     primaryDiagnosis: SLPDiagnosis
-    secondaryDiagnoses: List[SLPDiagnosis] = Field(default=[])
+    secondaryDiagnoses: list[SLPDiagnosis] = Field(default_factory=list)
     severity: SLPSeverity
     therapyFrequency: str = Field(..., min_length=1, description="e.g., '2x weekly'")
     sessionDuration: int = Field(..., ge=15, le=120, description="minutes")
     serviceSetting: str = Field(..., min_length=1, description="e.g., 'Pull-out'")
-    medicalHistory: Optional[str] = None
-    hearingStatus: Optional[str] = None
-    oralMotorNotes: Optional[str] = None
+    medicalHistory: str | None = None
+    hearingStatus: str | None = None
+    oralMotorNotes: str | None = None
 
 
 class SLPProfileCreate(SLPProfileBase):
@@ -202,19 +203,19 @@ class SLPProfileCreate(SLPProfileBase):
 
 class SLPProfileUpdate(BaseModel):
     """Schema for updating SLP profile"""
-    primaryDiagnosis: Optional[SLPDiagnosis] = None
-    secondaryDiagnoses: Optional[List[SLPDiagnosis]] = None
-    severity: Optional[SLPSeverity] = None
-    therapyFrequency: Optional[str] = None
-    sessionDuration: Optional[int] = Field(None, ge=15, le=120)
-    serviceSetting: Optional[str] = None
-    medicalHistory: Optional[str] = None
-    hearingStatus: Optional[str] = None
-    oralMotorNotes: Optional[str] = None
-    isActive: Optional[bool] = None
-
-
-class SLPProfileResponse(SLPProfileBase):
+    primaryDiagnosis: SLPDiagnosis | None = None
+    secondaryDiagnoses: list[SLPDiagnosis] | None = None
+    severity: SLPSeverity | None = None
+    therapyFrequency: str | None = None
+    sessionDuration: int | None = Field(None, ge=15, le=120)
+    serviceSetting: str | None = None
+    medicalHistory: str | None = None
+    hearingStatus: str | None = None
+    oralMotorNotes: str | None = None
+    isActive: bool | None = None
+
+
+class SLPProfileResponse(SLPProfileBase, ORMBase):
     """Schema for SLP profile response"""
     id: str
     learnerId: str
@@ -222,9 +223,6 @@ class SLPProfileResponse(SLPProfileBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # ARTICULATION TARGET SCHEMAS
@@ -237,7 +235,7 @@ class ArticulationTargetBase(BaseModel):
     targetLevel: ArticulationLevel = Field(default=ArticulationLevel.ISOLATION)
     currentAccuracy: float = Field(default=0, ge=0, le=100)
     targetAccuracy: float = Field(default=80, ge=0, le=100)
-    practiceWords: List[str] = Field(default=[])
+    practiceWords: list[str] = Field(default_factory=list)
 
 
 class ArticulationTargetCreate(ArticulationTargetBase):
@@ -247,30 +245,27 @@ class ArticulationTargetCreate(ArticulationTargetBase):
 
 class ArticulationTargetUpdate(BaseModel):
     """Schema for updating articulation target"""
-    position: Optional[PhonemePosition] = None
-    targetLevel: Optional[ArticulationLevel] = None
-    currentAccuracy: Optional[float] = Field(None, ge=0, le=100)
-    targetAccuracy: Optional[float] = Field(None, ge=0, le=100)
-    practiceWords: Optional[List[str]] = None
-    isActive: Optional[bool] = None
+    position: PhonemePosition | None = None
+    targetLevel: ArticulationLevel | None = None
+    currentAccuracy: float | None = Field(None, ge=0, le=100)
+    targetAccuracy: float | None = Field(None, ge=0, le=100)
+    practiceWords: list[str] | None = None
+    isActive: bool | None = None
 
 
-class ArticulationTargetResponse(ArticulationTargetBase):
+class ArticulationTargetResponse(ArticulationTargetBase, ORMBase):
     """Schema for articulation target response"""
     id: str
     learnerId: str
     isActive: bool
-    masteredAt: Optional[datetime]
+    masteredAt: datetime | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ArticulationTargetListResponse(BaseModel):
     """List of articulation targets"""
-    targets: List[ArticulationTargetResponse]
+    targets: list[ArticulationTargetResponse]
     total: int
     activeCount: int
     masteredCount: int
@@ -285,40 +280,37 @@ class ArticulationTrialBase(BaseModel):
     word: str = Field(..., min_length=1)
     position: PhonemePosition
     wasCorrect: bool
-    errorType: Optional[ArticulationErrorType] = None
-    substitutedSound: Optional[str] = None
+    errorType: ArticulationErrorType | None = None
+    substitutedSound: str | None = None
     promptLevel: PromptLevelSLP = Field(default=PromptLevelSLP.NONE)
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
 class ArticulationTrialCreate(ArticulationTrialBase):
     """Schema for creating articulation trial"""
     targetId: str
-    sessionId: Optional[str] = None
+    sessionId: str | None = None
 
 
 class ArticulationTrialBatchCreate(BaseModel):
     """Schema for batch creating trials"""
     targetId: str
-    sessionId: Optional[str] = None
-    trials: List[ArticulationTrialBase]
+    sessionId: str | None = None
+    trials: list[ArticulationTrialBase]
 
 
-class ArticulationTrialResponse(ArticulationTrialBase):
+class ArticulationTrialResponse(ArticulationTrialBase, ORMBase):
     """Schema for articulation trial response"""
     id: str
     targetId: str
-    sessionId: Optional[str]
+    sessionId: str | None = None
     timestamp: datetime
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ArticulationTrialListResponse(BaseModel):
     """List of articulation trials with stats"""
-    trials: List[ArticulationTrialResponse]
+    trials: list[ArticulationTrialResponse]
     total: int
     correct: int
     incorrect: int
@@ -338,7 +330,7 @@ class ArticulationAccuracyOverTime(BaseModel):
     targetId: str
     phoneme: str
     position: PhonemePosition
-    dataPoints: List[ArticulationAccuracyDataPoint]
+    dataPoints: list[ArticulationAccuracyDataPoint]
     overallAccuracy: float
     trendDirection: str  # "improving", "declining", "stable"
 
@@ -349,12 +341,12 @@ class ArticulationAccuracyOverTime(BaseModel):
 
 class FluencyProfileBase(BaseModel):
     """Base schema for fluency profile"""
-    stutteringTypes: List[StutteringType] = Field(default=[])
-    secondaryBehaviors: List[SecondaryBehavior] = Field(default=[])
-    averageSyllablesPerMinute: Optional[float] = None
-    percentageDisfluency: Optional[float] = Field(None, ge=0, le=100)
-    situationalTriggers: List[str] = Field(default=[])
-    copingStrategies: List[str] = Field(default=[])
+    stutteringTypes: list[StutteringType] = Field(default_factory=list)
+    secondaryBehaviors: list[SecondaryBehavior] = Field(default_factory=list)
+    averageSyllablesPerMinute: float | None = None
+    percentageDisfluency: float | None = Field(None, ge=0, le=100)
+    situationalTriggers: list[str] = Field(default_factory=list)
+    copingStrategies: list[str] = Field(default_factory=list)
 
 
 class FluencyProfileCreate(FluencyProfileBase):
@@ -362,26 +354,16 @@ class FluencyProfileCreate(FluencyProfileBase):
     pass
 
 
-class FluencyProfileUpdate(BaseModel):
-    """Schema for updating fluency profile"""
-    stutteringTypes: Optional[List[StutteringType]] = None
-    secondaryBehaviors: Optional[List[SecondaryBehavior]] = None
-    averageSyllablesPerMinute: Optional[float] = None
-    percentageDisfluency: Optional[float] = Field(None, ge=0, le=100)
-    situationalTriggers: Optional[List[str]] = None
-    copingStrategies: Optional[List[str]] = None
+FluencyProfileUpdate = make_partial(FluencyProfileCreate)
 
 
-class FluencyProfileResponse(FluencyProfileBase):
+class FluencyProfileResponse(FluencyProfileBase, ORMBase):
     """Schema for fluency profile response"""
     id: str
     learnerId: str
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # FLUENCY SESSION SCHEMAS
@@ -392,38 +374,35 @@ class FluencySessionBase(BaseModel):
     taskType: FluencyTaskType
     totalSyllables: int = Field(..., ge=1)
     disfluencies: int = Field(..., ge=0)
-    stutteringCounts: Dict[str, int] = Field(default={})
-    secondaryBehaviors: List[SecondaryBehavior] = Field(default=[])
-    strategiesUsed: List[str] = Field(default=[])
-    strategyEffectiveness: Optional[Dict[str, int]] = None
-    notes: Optional[str] = None
+    stutteringCounts: dict[str, int] = Field(default_factory=dict)
+    secondaryBehaviors: list[SecondaryBehavior] = Field(default_factory=list)
+    strategiesUsed: list[str] = Field(default_factory=list)
+    strategyEffectiveness: dict[str, int] | None = None
+    notes: str | None = None
 
 
 class FluencySessionCreate(FluencySessionBase):
     """Schema for creating fluency session"""
     profileId: str
-    sessionId: Optional[str] = None
+    sessionId: str | None = None
 
 
-class FluencySessionResponse(FluencySessionBase):
+class FluencySessionResponse(FluencySessionBase, ORMBase):
     """Schema for fluency session response"""
     id: str
     profileId: str
-    sessionId: Optional[str]
+    sessionId: str | None = None
     date: datetime
     percentDisfluent: float
     createdAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class FluencySessionListResponse(BaseModel):
     """List of fluency sessions"""
-    sessions: List[FluencySessionResponse]
+    sessions: list[FluencySessionResponse]
     total: int
     averagePercentDisfluent: float
-    averageSyllablesPerMinute: Optional[float]
+    averageSyllablesPerMinute: float | None = None
 
 
 # ==========================================
@@ -432,16 +411,16 @@ class FluencySessionListResponse(BaseModel):
 
 class ReceptiveLanguageBase(BaseModel):
     """Base schema for receptive language assessment"""
-    oneStepDirections: Optional[float] = Field(None, ge=0, le=100)
-    twoStepDirections: Optional[float] = Field(None, ge=0, le=100)
-    threeStepDirections: Optional[float] = Field(None, ge=0, le=100)
-    vocabularyComprehension: Optional[float] = None
-    grammarComprehension: Optional[float] = None
-    inferencing: Optional[float] = None
-    listeningComprehension: Optional[float] = None
-    strengthAreas: List[str] = Field(default=[])
-    targetAreas: List[str] = Field(default=[])
-    recommendations: Optional[str] = None
+    oneStepDirections: float | None = Field(None, ge=0, le=100)
+    twoStepDirections: float | None = Field(None, ge=0, le=100)
+    threeStepDirections: float | None = Field(None, ge=0, le=100)
+    vocabularyComprehension: float | None = None
+    grammarComprehension: float | None = None
+    inferencing: float | None = None
+    listeningComprehension: float | None = None
+    strengthAreas: list[str] = Field(default_factory=list)
+    targetAreas: list[str] = Field(default_factory=list)
+    recommendations: str | None = None
 
 
 class ReceptiveLanguageCreate(ReceptiveLanguageBase):
@@ -454,7 +433,7 @@ class ReceptiveLanguageUpdate(ReceptiveLanguageBase):
     pass
 
 
-class ReceptiveLanguageResponse(ReceptiveLanguageBase):
+class ReceptiveLanguageResponse(ReceptiveLanguageBase, ORMBase):
     """Schema for receptive assessment response"""
     id: str
     learnerId: str
@@ -462,9 +441,6 @@ class ReceptiveLanguageResponse(ReceptiveLanguageBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # EXPRESSIVE LANGUAGE SCHEMAS
@@ -472,14 +448,14 @@ class ReceptiveLanguageResponse(ReceptiveLanguageBase):
 
 class ExpressiveLanguageBase(BaseModel):
     """Base schema for expressive language assessment"""
-    meanLengthUtterance: Optional[float] = None
-    vocabularyDiversity: Optional[float] = None
-    grammarAccuracy: Optional[float] = Field(None, ge=0, le=100)
-    narrativeSkills: Optional[float] = None
-    wordFinding: Optional[float] = None
-    strengthAreas: List[str] = Field(default=[])
-    targetAreas: List[str] = Field(default=[])
-    recommendations: Optional[str] = None
+    meanLengthUtterance: float | None = None
+    vocabularyDiversity: float | None = None
+    grammarAccuracy: float | None = Field(None, ge=0, le=100)
+    narrativeSkills: float | None = None
+    wordFinding: float | None = None
+    strengthAreas: list[str] = Field(default_factory=list)
+    targetAreas: list[str] = Field(default_factory=list)
+    recommendations: str | None = None
 
 
 class ExpressiveLanguageCreate(ExpressiveLanguageBase):
@@ -492,7 +468,7 @@ class ExpressiveLanguageUpdate(ExpressiveLanguageBase):
     pass
 
 
-class ExpressiveLanguageResponse(ExpressiveLanguageBase):
+class ExpressiveLanguageResponse(ExpressiveLanguageBase, ORMBase):
     """Schema for expressive assessment response"""
     id: str
     learnerId: str
@@ -500,9 +476,6 @@ class ExpressiveLanguageResponse(ExpressiveLanguageBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # PRAGMATIC LANGUAGE SCHEMAS
@@ -513,8 +486,8 @@ class PragmaticSkillBase(BaseModel):
     skill: PragmaticSkillType
     setting: PragmaticSettingType
     rating: SkillRating = Field(default=SkillRating.NOT_OBSERVED)
-    observations: List[str] = Field(default=[])
-    interventions: List[str] = Field(default=[])
+    observations: list[str] = Field(default_factory=list)
+    interventions: list[str] = Field(default_factory=list)
 
 
 class PragmaticSkillCreate(PragmaticSkillBase):
@@ -522,14 +495,10 @@ class PragmaticSkillCreate(PragmaticSkillBase):
     pass
 
 
-class PragmaticSkillUpdate(BaseModel):
-    """Schema for updating pragmatic skill"""
-    rating: Optional[SkillRating] = None
-    observations: Optional[List[str]] = None
-    interventions: Optional[List[str]] = None
+PragmaticSkillUpdate = make_partial(PragmaticSkillCreate, "setting", "skill")
 
 
-class PragmaticSkillResponse(PragmaticSkillBase):
+class PragmaticSkillResponse(PragmaticSkillBase, ORMBase):
     """Schema for pragmatic skill response"""
     id: str
     learnerId: str
@@ -537,16 +506,13 @@ class PragmaticSkillResponse(PragmaticSkillBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class PragmaticSkillsMatrix(BaseModel):
     """Matrix of all pragmatic skills × settings"""
     learnerId: str
-    skills: Dict[str, Dict[str, PragmaticSkillResponse]]  # skill -> setting -> response
-    skillSummary: Dict[str, float]  # Average rating per skill
-    settingSummary: Dict[str, float]  # Average rating per setting
+    skills: dict[str, dict[str, PragmaticSkillResponse]]  # skill -> setting -> response
+    skillSummary: dict[str, float]  # Average rating per skill
+    settingSummary: dict[str, float]  # Average rating per setting
 
 
 # ==========================================
@@ -556,15 +522,15 @@ class PragmaticSkillsMatrix(BaseModel):
 class VoiceAssessmentBase(BaseModel):
     """Base schema for voice assessment"""
     pitch: VoicePitch = Field(default=VoicePitch.NORMAL)
-    pitchVariability: Optional[str] = None
+    pitchVariability: str | None = None
     loudness: VoiceLoudness = Field(default=VoiceLoudness.NORMAL)
-    loudnessControl: Optional[str] = None
+    loudnessControl: str | None = None
     quality: VoiceQuality = Field(default=VoiceQuality.CLEAR)
-    qualityNotes: Optional[str] = None
+    qualityNotes: str | None = None
     resonance: VoiceResonance = Field(default=VoiceResonance.NORMAL)
-    vocalAbuse: List[str] = Field(default=[])
-    recommendations: List[str] = Field(default=[])
-    referrals: Optional[str] = None
+    vocalAbuse: list[str] = Field(default_factory=list)
+    recommendations: list[str] = Field(default_factory=list)
+    referrals: str | None = None
 
 
 class VoiceAssessmentCreate(VoiceAssessmentBase):
@@ -577,7 +543,7 @@ class VoiceAssessmentUpdate(VoiceAssessmentBase):
     pass
 
 
-class VoiceAssessmentResponse(VoiceAssessmentBase):
+class VoiceAssessmentResponse(VoiceAssessmentBase, ORMBase):
     """Schema for voice assessment response"""
     id: str
     learnerId: str
@@ -585,9 +551,6 @@ class VoiceAssessmentResponse(VoiceAssessmentBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # SLP SESSION SCHEMAS
@@ -597,35 +560,25 @@ class SLPSessionBase(BaseModel):
     """Base schema for SLP session"""
     duration: int = Field(..., ge=1, le=180, description="minutes")
     sessionType: SLPSessionType
-    activities: List[str] = Field(default=[])
-    materialsUsed: List[str] = Field(default=[])
-    progress: Optional[str] = None
-    challenges: Optional[str] = None
-    nextSteps: Optional[str] = None
-    parentHomework: List[str] = Field(default=[])
-    parentNotes: Optional[str] = None
+    activities: list[str] = Field(default_factory=list)
+    materialsUsed: list[str] = Field(default_factory=list)
+    progress: str | None = None
+    challenges: str | None = None
+    nextSteps: str | None = None
+    parentHomework: list[str] = Field(default_factory=list)
+    parentNotes: str | None = None
 
 
 class SLPSessionCreate(SLPSessionBase):
     """Schema for creating SLP session"""
     therapistId: str
-    date: Optional[datetime] = None
+    date: datetime | None = None
 
 
-class SLPSessionUpdate(BaseModel):
-    """Schema for updating SLP session"""
-    duration: Optional[int] = Field(None, ge=1, le=180)
-    sessionType: Optional[SLPSessionType] = None
-    activities: Optional[List[str]] = None
-    materialsUsed: Optional[List[str]] = None
-    progress: Optional[str] = None
-    challenges: Optional[str] = None
-    nextSteps: Optional[str] = None
-    parentHomework: Optional[List[str]] = None
-    parentNotes: Optional[str] = None
+SLPSessionUpdate = make_partial(SLPSessionCreate, "date", "therapistId")
 
 
-class SLPSessionResponse(SLPSessionBase):
+class SLPSessionResponse(SLPSessionBase, ORMBase):
     """Schema for SLP session response"""
     id: str
     learnerId: str
@@ -634,15 +587,12 @@ class SLPSessionResponse(SLPSessionBase):
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SLPSessionListResponse(BaseModel):
     """List of SLP sessions"""
-    sessions: List[SLPSessionResponse]
+    sessions: list[SLPSessionResponse]
     total: int
-    bySessionType: Dict[str, int]
+    bySessionType: dict[str, int]
 
 
 # ==========================================
@@ -663,27 +613,24 @@ class SLPObjectiveCreate(SLPObjectiveBase):
 
 class SLPObjectiveUpdate(BaseModel):
     """Schema for updating SLP objective"""
-    objectiveText: Optional[str] = None
-    targetCriteria: Optional[str] = None
-    currentProgress: Optional[float] = Field(None, ge=0, le=100)
-    isAchieved: Optional[bool] = None
-    notes: Optional[str] = None
+    objectiveText: str | None = None
+    targetCriteria: str | None = None
+    currentProgress: float | None = Field(None, ge=0, le=100)
+    isAchieved: bool | None = None
+    notes: str | None = None
 
 
-class SLPObjectiveResponse(SLPObjectiveBase):
+class SLPObjectiveResponse(SLPObjectiveBase, ORMBase):
     """Schema for SLP objective response"""
     id: str
     goalId: str
-    currentProgress: Optional[float]
+    currentProgress: float | None = None
     isAchieved: bool
-    achievedDate: Optional[datetime]
-    notes: Optional[str]
+    achievedDate: datetime | None = None
+    notes: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SLPGoalBase(BaseModel):
     """Base schema for SLP goal"""
@@ -692,61 +639,58 @@ class SLPGoalBase(BaseModel):
     baseline: float = Field(..., ge=0, le=100)
     target: float = Field(..., ge=0, le=100)
     measurementMethod: str = Field(..., min_length=10)
-    targetDate: Optional[datetime] = None
+    targetDate: datetime | None = None
 
 
 class SLPGoalCreate(SLPGoalBase):
     """Schema for creating SLP goal"""
-    objectives: List[SLPObjectiveCreate] = Field(default=[])
+    objectives: list[SLPObjectiveCreate] = Field(default_factory=list)
 
 
 class SLPGoalUpdate(BaseModel):
     """Schema for updating SLP goal"""
-    goalText: Optional[str] = None
-    target: Optional[float] = Field(None, ge=0, le=100)
-    measurementMethod: Optional[str] = None
-    currentProgress: Optional[float] = Field(None, ge=0, le=100)
-    status: Optional[SLPGoalStatus] = None
-    targetDate: Optional[datetime] = None
+    goalText: str | None = None
+    target: float | None = Field(None, ge=0, le=100)
+    measurementMethod: str | None = None
+    currentProgress: float | None = Field(None, ge=0, le=100)
+    status: SLPGoalStatus | None = None
+    targetDate: datetime | None = None
 
 
 class SLPGoalDataPoint(BaseModel):
     """Single data point for goal progress"""
     date: datetime
     value: float
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
-class SLPGoalResponse(SLPGoalBase):
+class SLPGoalResponse(SLPGoalBase, ORMBase):
     """Schema for SLP goal response"""
     id: str
     learnerId: str
-    dataPoints: Optional[List[SLPGoalDataPoint]]
-    currentProgress: Optional[float]
+    dataPoints: list[SLPGoalDataPoint] | None = None
+    currentProgress: float | None = None
     status: SLPGoalStatus
     startDate: datetime
-    achievedDate: Optional[datetime]
-    shortTermObjectives: List[SLPObjectiveResponse] = Field(default=[])
+    achievedDate: datetime | None = None
+    shortTermObjectives: list[SLPObjectiveResponse] = Field(default_factory=list)
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SLPGoalListResponse(BaseModel):
     """List of SLP goals"""
-    goals: List[SLPGoalResponse]
+    goals: list[SLPGoalResponse]
     total: int
     activeCount: int
     achievedCount: int
-    byDomain: Dict[str, int]
+    byDomain: dict[str, int]
 
 
 class SLPGoalProgressUpdate(BaseModel):
     """Schema for adding progress data point"""
     value: float = Field(..., ge=0, le=100)
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
 # ==========================================
@@ -758,9 +702,9 @@ class ParentHomeworkBase(BaseModel):
     activity: str = Field(..., min_length=5)
     targetSkill: str = Field(..., min_length=3)
     instructions: str = Field(..., min_length=10)
-    practiceWords: List[str] = Field(default=[])
+    practiceWords: list[str] = Field(default_factory=list)
     practiceMinutes: int = Field(default=10, ge=1, le=60)
-    dueDate: Optional[datetime] = None
+    dueDate: datetime | None = None
 
 
 class ParentHomeworkCreate(ParentHomeworkBase):
@@ -770,18 +714,18 @@ class ParentHomeworkCreate(ParentHomeworkBase):
 
 class ParentHomeworkUpdate(BaseModel):
     """Schema for updating parent homework"""
-    activity: Optional[str] = None
-    targetSkill: Optional[str] = None
-    instructions: Optional[str] = None
-    practiceWords: Optional[List[str]] = None
-    practiceMinutes: Optional[int] = Field(None, ge=1, le=60)
-    dueDate: Optional[datetime] = None
+    activity: str | None = None
+    targetSkill: str | None = None
+    instructions: str | None = None
+    practiceWords: list[str] | None = None
+    practiceMinutes: int | None = Field(None, ge=1, le=60)
+    dueDate: datetime | None = None
 
 
 class ParentHomeworkComplete(BaseModel):
     """Schema for parent completing homework"""
-    parentNotes: Optional[str] = None
-    difficultyRating: Optional[int] = Field(None, ge=1, le=5)
+    parentNotes: str | None = None
+    difficultyRating: int | None = Field(None, ge=1, le=5)
 
 
 class ParentHomeworkReview(BaseModel):
@@ -789,27 +733,24 @@ class ParentHomeworkReview(BaseModel):
     therapistFeedback: str
 
 
-class ParentHomeworkResponse(ParentHomeworkBase):
+class ParentHomeworkResponse(ParentHomeworkBase, ORMBase):
     """Schema for parent homework response"""
     id: str
     learnerId: str
     assignedDate: datetime
     parentCompleted: bool
-    completedDate: Optional[datetime]
-    parentNotes: Optional[str]
-    difficultyRating: Optional[int]
+    completedDate: datetime | None = None
+    parentNotes: str | None = None
+    difficultyRating: int | None = None
     therapistReviewed: bool
-    therapistFeedback: Optional[str]
+    therapistFeedback: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ParentHomeworkListResponse(BaseModel):
     """List of parent homework"""
-    homework: List[ParentHomeworkResponse]
+    homework: list[ParentHomeworkResponse]
     total: int
     pending: int
     completed: int
@@ -838,15 +779,15 @@ class FluencyProgressSummary(BaseModel):
     currentPercentDisfluent: float
     change: float
     sessionsCompleted: int
-    strategiesLearned: List[str]
+    strategiesLearned: list[str]
 
 
 class LanguageProgressSummary(BaseModel):
     """Language progress for report"""
     domain: str  # receptive or expressive
-    areasImproved: List[str]
-    currentStrengths: List[str]
-    continuedTargets: List[str]
+    areasImproved: list[str]
+    currentStrengths: list[str]
+    continuedTargets: list[str]
 
 
 class GoalProgressSummary(BaseModel):
@@ -868,7 +809,7 @@ class SLPProgressReportRequest(BaseModel):
     learnerId: str
     startDate: datetime
     endDate: datetime
-    includeDomains: Optional[List[SLPGoalDomain]] = None
+    includeDomains: list[SLPGoalDomain] | None = None
     includeTrialData: bool = Field(default=True)
     includeGoals: bool = Field(default=True)
     includeHomework: bool = Field(default=True)
@@ -878,7 +819,7 @@ class SLPProgressReportResponse(BaseModel):
     """Comprehensive SLP progress report"""
     learnerId: str
     learnerName: str
-    reportPeriod: Dict[str, datetime]
+    reportPeriod: dict[str, datetime]
     generatedAt: datetime
     
     # Profile Summary
@@ -889,24 +830,24 @@ class SLPProgressReportResponse(BaseModel):
     # Session Summary
     totalSessions: int
     totalMinutes: int
-    sessionBreakdown: Dict[str, int]  # By type
+    sessionBreakdown: dict[str, int]  # By type
     
     # Domain Progress
-    articulationProgress: Optional[List[ArticulationProgressSummary]]
-    fluencyProgress: Optional[FluencyProgressSummary]
-    languageProgress: Optional[List[LanguageProgressSummary]]
-    pragmaticProgress: Optional[Dict[str, Dict[str, str]]]  # skill -> setting -> rating
-    voiceSummary: Optional[Dict[str, str]]
+    articulationProgress: list[ArticulationProgressSummary] | None = None
+    fluencyProgress: FluencyProgressSummary | None = None
+    languageProgress: list[LanguageProgressSummary] | None = None
+    pragmaticProgress: dict[str, dict[str, str]] | None = None  # skill -> setting -> rating
+    voiceSummary: dict[str, str] | None = None
     
     # Goals
-    goalsProgress: Optional[List[GoalProgressSummary]]
+    goalsProgress: list[GoalProgressSummary] | None = None
     
     # Homework
-    homeworkCompliance: Optional[float]  # Percentage completed
+    homeworkCompliance: float | None = None  # Percentage completed
     
     # Recommendations
-    recommendations: List[str]
-    nextSteps: List[str]
+    recommendations: list[str]
+    nextSteps: list[str]
 
 
 # ==========================================
@@ -917,7 +858,7 @@ class SLPDashboardResponse(BaseModel):
     """SLP dashboard for a learner"""
     learnerId: str
     learnerName: str
-    profile: Optional[SLPProfileResponse]
+    profile: SLPProfileResponse | None = None
     
     # Quick Stats
     activeTargets: int
@@ -926,8 +867,8 @@ class SLPDashboardResponse(BaseModel):
     goalsOnTrack: int
     
     # Recent Activity
-    lastSessionDate: Optional[datetime]
-    recentAccuracy: Optional[float]
+    lastSessionDate: datetime | None = None
+    recentAccuracy: float | None = None
     
     # Alerts
-    alerts: List[str]  # e.g., "Homework overdue", "Goal review needed"
+    alerts: list[str]  # e.g., "Homework overdue", "Goal review needed"
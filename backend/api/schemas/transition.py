@@ -6,16 +6,17 @@ Date: 2025-11-29
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import Any
 from datetime import datetime
-from enum import Enum
+
+from api.schemas.common import FastStrEnum, ORMBase
 
 
 # ==========================================
 # ENUMS
 # ==========================================
 
-class TransitionPlanStatus(str, Enum):
+class TransitionPlanStatus(FastStrEnum):
     DRAFT = "DRAFT"
     ACTIVE = "ACTIVE"
     UNDER_REVIEW = "UNDER_REVIEW"
@@ -23,13 +24,13 @@ class TransitionPlanStatus(str, Enum):
     ARCHIVED = "ARCHIVED"
 
 
-class PostSecondaryGoalCategory(str, Enum):
+class PostSecondaryGoalCategory(FastStrEnum):
     EDUCATION = "EDUCATION"
     EMPLOYMENT = "EMPLOYMENT"
     INDEPENDENT_LIVING = "INDEPENDENT_LIVING"
 
 
-class CollegeApplicationStatus(str, Enum):
+class CollegeApplicationStatus(FastStrEnum):
     NOT_STARTED = "NOT_STARTED"
     IN_PROGRESS = "IN_PROGRESS"
     SUBMITTED = "SUBMITTED"
@@ -41,7 +42,7 @@ class CollegeApplicationStatus(str, Enum):
     DEFERRED = "DEFERRED"
 
 
-class AccommodationRequestStatus(str, Enum):
+class AccommodationRequestStatus(FastStrEnum):
     DRAFT = "DRAFT"
     SUBMITTED = "SUBMITTED"
     UNDER_REVIEW = "UNDER_REVIEW"
@@ -50,7 +51,7 @@ class AccommodationRequestStatus(str, Enum):
     NEEDS_INFO = "NEEDS_INFO"
 
 
-class WorkExperienceType(str, Enum):
+class WorkExperienceType(FastStrEnum):
     JOB_SHADOWING = "JOB_SHADOWING"
     INTERNSHIP = "INTERNSHIP"
     PAID_EMPLOYMENT = "PAID_EMPLOYMENT"
@@ -59,7 +60,7 @@ class WorkExperienceType(str, Enum):
     WORK_STUDY = "WORK_STUDY"
 
 
-class TradeType(str, Enum):
+class TradeType(FastStrEnum):
     CNA = "CNA"
     HVAC = "HVAC"
     AUTOMOTIVE = "AUTOMOTIVE"
@@ -92,7 +93,7 @@ class TradeType(str, Enum):
     WIND_TECH = "WIND_TECH"
 
 
-class ProgramApplicationStatus(str, Enum):
+class ProgramApplicationStatus(FastStrEnum):
     NOT_STARTED = "NOT_STARTED"
     IN_PROGRESS = "IN_PROGRESS"
     SUBMITTED = "SUBMITTED"
@@ -102,7 +103,7 @@ class ProgramApplicationStatus(str, Enum):
     WITHDRAWN = "WITHDRAWN"
 
 
-class TransitionGoalCategory(str, Enum):
+class TransitionGoalCategory(FastStrEnum):
     POST_SECONDARY_EDUCATION = "POST_SECONDARY_EDUCATION"
     EMPLOYMENT = "EMPLOYMENT"
     INDEPENDENT_LIVING = "INDEPENDENT_LIVING"
@@ -115,7 +116,7 @@ class TransitionGoalCategory(str, Enum):
     RECREATION_LEISURE = "RECREATION_LEISURE"
 
 
-class IDEARequirementCategory(str, Enum):
+class IDEARequirementCategory(FastStrEnum):
     AGE_APPROPRIATE_ASSESSMENTS = "AGE_APPROPRIATE_ASSESSMENTS"
     MEASURABLE_GOALS = "MEASURABLE_GOALS"
     COURSE_OF_STUDY = "COURSE_OF_STUDY"
@@ -131,11 +132,11 @@ class IDEARequirementCategory(str, Enum):
 
 class TransitionPlanBase(BaseModel):
     projectedGraduationDate: datetime
-    primaryEducationGoal: Optional[str] = None
-    primaryEmploymentGoal: Optional[str] = None
-    primaryLivingGoal: Optional[str] = None
-    ageOfMajority: Optional[datetime] = None
-    transferOfRightsDate: Optional[datetime] = None
+    primaryEducationGoal: str | None = None
+    primaryEmploymentGoal: str | None = None
+    primaryLivingGoal: str | None = None
+    ageOfMajority: datetime | None = None
+    transferOfRightsDate: datetime | None = None
 
 
 class TransitionPlanCreate(TransitionPlanBase):
@@ -143,33 +144,30 @@ class TransitionPlanCreate(TransitionPlanBase):
 
 
 class TransitionPlanUpdate(BaseModel):
-    status: Optional[TransitionPlanStatus] = None
-    projectedGraduationDate: Optional[datetime] = None
-    primaryEducationGoal: Optional[str] = None
-    primaryEmploymentGoal: Optional[str] = None
-    primaryLivingGoal: Optional[str] = None
-    ideaRequirementsChecklist: Optional[Dict[str, Any]] = None
-    lastAnnualReviewDate: Optional[datetime] = None
-    nextAnnualReviewDate: Optional[datetime] = None
+    status: TransitionPlanStatus | None = None
+    projectedGraduationDate: datetime | None = None
+    primaryEducationGoal: str | None = None
+    primaryEmploymentGoal: str | None = None
+    primaryLivingGoal: str | None = None
+    ideaRequirementsChecklist: dict[str, Any] | None = None
+    lastAnnualReviewDate: datetime | None = None
+    nextAnnualReviewDate: datetime | None = None
 
 
-class TransitionPlanResponse(TransitionPlanBase):
+class TransitionPlanResponse(TransitionPlanBase, ORMBase):
     id: str
     learnerId: str
     status: TransitionPlanStatus
     startDate: datetime
-    ideaRequirementsChecklist: Optional[Dict[str, Any]] = None
-    lastAnnualReviewDate: Optional[datetime] = None
-    nextAnnualReviewDate: Optional[datetime] = None
+    ideaRequirementsChecklist: dict[str, Any] | None = None
+    lastAnnualReviewDate: datetime | None = None
+    nextAnnualReviewDate: datetime | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TransitionPlanWithDetails(TransitionPlanResponse):
-    postSecondaryGoals: List["PostSecondaryGoalResponse"] = []
+    postSecondaryGoals: list["PostSecondaryGoalResponse"] = Field(default_factory=list)
     collegeApplicationsCount: int = 0
     workExperiencesCount: int = 0
     certificationsCount: int = 0
@@ -182,10 +180,10 @@ class TransitionPlanWithDetails(TransitionPlanResponse):
 class PostSecondaryGoalBase(BaseModel):
     category: PostSecondaryGoalCategory
     goalStatement: str
-    currentLevel: Optional[str] = None
-    assessmentBasis: Optional[str] = None
+    currentLevel: str | None = None
+    assessmentBasis: str | None = None
     targetDate: datetime
-    alignedIEPGoalIds: List[str] = []
+    alignedIEPGoalIds: list[str] = Field(default_factory=list)
 
 
 class PostSecondaryGoalCreate(PostSecondaryGoalBase):
@@ -193,25 +191,22 @@ class PostSecondaryGoalCreate(PostSecondaryGoalBase):
 
 
 class PostSecondaryGoalUpdate(BaseModel):
-    goalStatement: Optional[str] = None
-    currentLevel: Optional[str] = None
-    progress: Optional[int] = None
-    progressNotes: Optional[List[Dict[str, Any]]] = None
-    isActive: Optional[bool] = None
+    goalStatement: str | None = None
+    currentLevel: str | None = None
+    progress: int | None = None
+    progressNotes: list[dict[str, Any]] | None = None
+    isActive: bool | None = None
 
 
-class PostSecondaryGoalResponse(PostSecondaryGoalBase):
+class PostSecondaryGoalResponse(PostSecondaryGoalBase, ORMBase):
     id: str
     transitionPlanId: str
     progress: int
-    progressNotes: Optional[List[Dict[str, Any]]] = None
+    progressNotes: list[dict[str, Any]] | None = None
     isActive: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # COLLEGE PREP SCHEMAS
@@ -222,19 +217,19 @@ class SavedCollegeBase(BaseModel):
     collegeType: str
     state: str
     city: str
-    website: Optional[str] = None
-    disabilityServicesRating: Optional[int] = Field(None, ge=1, le=5)
-    disabilityServicesNotes: Optional[str] = None
+    website: str | None = None
+    disabilityServicesRating: int | None = Field(None, ge=1, le=5)
+    disabilityServicesNotes: str | None = None
     hasDisabilityServices: bool = True
-    acceptanceRate: Optional[float] = None
-    tuitionInState: Optional[float] = None
-    tuitionOutOfState: Optional[float] = None
-    averageFinancialAid: Optional[float] = None
-    graduationRate: Optional[float] = None
-    interestedPrograms: List[str] = []
-    notes: Optional[str] = None
-    pros: List[str] = []
-    cons: List[str] = []
+    acceptanceRate: float | None = None
+    tuitionInState: float | None = None
+    tuitionOutOfState: float | None = None
+    averageFinancialAid: float | None = None
+    graduationRate: float | None = None
+    interestedPrograms: list[str] = Field(default_factory=list)
+    notes: str | None = None
+    pros: list[str] = Field(default_factory=list)
+    cons: list[str] = Field(default_factory=list)
     isFavorite: bool = False
 
 
@@ -243,42 +238,39 @@ class SavedCollegeCreate(SavedCollegeBase):
 
 
 class SavedCollegeUpdate(BaseModel):
-    disabilityServicesRating: Optional[int] = Field(None, ge=1, le=5)
-    disabilityServicesNotes: Optional[str] = None
-    interestedPrograms: Optional[List[str]] = None
-    notes: Optional[str] = None
-    pros: Optional[List[str]] = None
-    cons: Optional[List[str]] = None
-    isFavorite: Optional[bool] = None
+    disabilityServicesRating: int | None = Field(None, ge=1, le=5)
+    disabilityServicesNotes: str | None = None
+    interestedPrograms: list[str] | None = None
+    notes: str | None = None
+    pros: list[str] | None = None
+    cons: list[str] | None = None
+    isFavorite: bool | None = None
 
 
-class SavedCollegeResponse(SavedCollegeBase):
+class SavedCollegeResponse(SavedCollegeBase, ORMBase):
     id: str
     transitionPlanId: str
     savedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class CollegeSearchFilters(BaseModel):
-    state: Optional[str] = None
-    collegeType: Optional[str] = None
-    hasDisabilityServices: Optional[bool] = True
-    minDisabilityServicesRating: Optional[int] = None
-    maxTuition: Optional[float] = None
-    minAcceptanceRate: Optional[float] = None
-    programs: Optional[List[str]] = None
+    state: str | None = None
+    collegeType: str | None = None
+    hasDisabilityServices: bool | None = True
+    minDisabilityServicesRating: int | None = None
+    maxTuition: float | None = None
+    minAcceptanceRate: float | None = None
+    programs: list[str] | None = None
 
 
 class CollegeApplicationBase(BaseModel):
     collegeName: str
     collegeType: str
-    applicationUrl: Optional[str] = None
-    applicationType: Optional[str] = None
-    applicationDeadline: Optional[datetime] = None
-    financialAidDeadline: Optional[datetime] = None
-    commitmentDeadline: Optional[datetime] = None
+    applicationUrl: str | None = None
+    applicationType: str | None = None
+    applicationDeadline: datetime | None = None
+    financialAidDeadline: datetime | None = None
+    commitmentDeadline: datetime | None = None
 
 
 class CollegeApplicationCreate(CollegeApplicationBase):
@@ -286,52 +278,49 @@ class CollegeApplicationCreate(CollegeApplicationBase):
 
 
 class CollegeApplicationUpdate(BaseModel):
-    status: Optional[CollegeApplicationStatus] = None
-    applicationDeadline: Optional[datetime] = None
-    submittedDate: Optional[datetime] = None
-    decisionDate: Optional[datetime] = None
-    commonAppComplete: Optional[bool] = None
-    essaysComplete: Optional[bool] = None
-    recommendationsRequested: Optional[int] = None
-    recommendationsReceived: Optional[int] = None
-    transcriptSent: Optional[bool] = None
-    testScoresSent: Optional[bool] = None
-    essays: Optional[List[Dict[str, Any]]] = None
-    fafsaSubmitted: Optional[bool] = None
-    financialAidOffered: Optional[float] = None
-    notes: Optional[str] = None
-
-
-class CollegeApplicationResponse(CollegeApplicationBase):
+    status: CollegeApplicationStatus | None = None
+    applicationDeadline: datetime | None = None
+    submittedDate: datetime | None = None
+    decisionDate: datetime | None = None
+    commonAppComplete: bool | None = None
+    essaysComplete: bool | None = None
+    recommendationsRequested: int | None = None
+    recommendationsReceived: int | None = None
+    transcriptSent: bool | None = None
+    testScoresSent: bool | None = None
+    essays: list[dict[str, Any]] | None = None
+    fafsaSubmitted: bool | None = None
+    financialAidOffered: float | None = None
+    notes: str | None = None
+
+
+class CollegeApplicationResponse(CollegeApplicationBase, ORMBase):
     id: str
     transitionPlanId: str
     status: CollegeApplicationStatus
-    submittedDate: Optional[datetime] = None
-    decisionDate: Optional[datetime] = None
+    submittedDate: datetime | None = None
+    decisionDate: datetime | None = None
     commonAppComplete: bool
     essaysComplete: bool
     recommendationsRequested: int
     recommendationsReceived: int
     transcriptSent: bool
     testScoresSent: bool
-    essays: Optional[List[Dict[str, Any]]] = None
+    essays: list[dict[str, Any]] | None = None
     fafsaSubmitted: bool
-    financialAidOffered: Optional[float] = None
-    scholarshipsApplied: Optional[List[Dict[str, Any]]] = None
-    notes: Optional[str] = None
+    financialAidOffered: float | None = None
+    scholarshipsApplied: list[dict[str, Any]] | None = None
+    notes: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class AccommodationRequestBase(BaseModel):
     collegeName: str
-    disabilityOfficeContact: Optional[str] = None
-    disabilityOfficeEmail: Optional[str] = None
-    disabilityOfficePhone: Optional[str] = None
-    accommodationsRequested: List[Dict[str, Any]]
+    disabilityOfficeContact: str | None = None
+    disabilityOfficeEmail: str | None = None
+    disabilityOfficePhone: str | None = None
+    accommodationsRequested: list[dict[str, Any]]
 
 
 class AccommodationRequestCreate(AccommodationRequestBase):
@@ -339,39 +328,36 @@ class AccommodationRequestCreate(AccommodationRequestBase):
 
 
 class AccommodationRequestUpdate(BaseModel):
-    status: Optional[AccommodationRequestStatus] = None
-    submittedDate: Optional[datetime] = None
-    responseDate: Optional[datetime] = None
-    accommodationsApproved: Optional[List[Dict[str, Any]]] = None
-    documentationSubmitted: Optional[List[Dict[str, Any]]] = None
-    iepProvided: Optional[bool] = None
-    medicalDocsProvided: Optional[bool] = None
-    psychEdReportProvided: Optional[bool] = None
-    meetingScheduled: Optional[datetime] = None
-    meetingNotes: Optional[str] = None
-    notes: Optional[str] = None
-
-
-class AccommodationRequestResponse(AccommodationRequestBase):
+    status: AccommodationRequestStatus | None = None
+    submittedDate: datetime | None = None
+    responseDate: datetime | None = None
+    accommodationsApproved: list[dict[str, Any]] | None = None
+    documentationSubmitted: list[dict[str, Any]] | None = None
+    iepProvided: bool | None = None
+    medicalDocsProvided: bool | None = None
+    psychEdReportProvided: bool | None = None
+    meetingScheduled: datetime | None = None
+    meetingNotes: str | None = None
+    notes: str | None = None
+
+
+class AccommodationRequestResponse(AccommodationRequestBase, ORMBase):
     id: str
     transitionPlanId: str
     status: AccommodationRequestStatus
-    submittedDate: Optional[datetime] = None
-    responseDate: Optional[datetime] = None
-    accommodationsApproved: Optional[List[Dict[str, Any]]] = None
-    documentationSubmitted: Optional[List[Dict[str, Any]]] = None
+    submittedDate: datetime | None = None
+    responseDate: datetime | None = None
+    accommodationsApproved: list[dict[str, Any]] | None = None
+    documentationSubmitted: list[dict[str, Any]] | None = None
     iepProvided: bool
     medicalDocsProvided: bool
     psychEdReportProvided: bool
-    meetingScheduled: Optional[datetime] = None
-    meetingNotes: Optional[str] = None
-    notes: Optional[str] = None
+    meetingScheduled: datetime | None = None
+    meetingNotes: str | None = None
+    notes: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # WORK-BASED LEARNING SCHEMAS
@@ -380,15 +366,15 @@ class AccommodationRequestResponse(AccommodationRequestBase):
 class EmployerPartnerBase(BaseModel):
     name: str
     industry: str
-    contactName: Optional[str] = None
-    contactEmail: Optional[str] = None
-    contactPhone: Optional[str] = None
-    address: Optional[str] = None
-    city: Optional[str] = None
-    state: Optional[str] = None
-    opportunityTypes: List[WorkExperienceType] = []
+    contactName: str | None = None
+    contactEmail: str | None = None
+    contactPhone: str | None = None
+    address: str | None = None
+    city: str | None = None
+    state: str | None = None
+    opportunityTypes: list[WorkExperienceType] = Field(default_factory=list)
     disabilityFriendly: bool = True
-    accommodationsOffered: List[str] = []
+    accommodationsOffered: list[str] = Field(default_factory=list)
 
 
 class EmployerPartnerCreate(EmployerPartnerBase):
@@ -396,28 +382,25 @@ class EmployerPartnerCreate(EmployerPartnerBase):
 
 
 class EmployerPartnerUpdate(BaseModel):
-    name: Optional[str] = None
-    industry: Optional[str] = None
-    contactName: Optional[str] = None
-    contactEmail: Optional[str] = None
-    contactPhone: Optional[str] = None
-    disabilityFriendly: Optional[bool] = None
-    accommodationsOffered: Optional[List[str]] = None
-    isActive: Optional[bool] = None
+    name: str | None = None
+    industry: str | None = None
+    contactName: str | None = None
+    contactEmail: str | None = None
+    contactPhone: str | None = None
+    disabilityFriendly: bool | None = None
+    accommodationsOffered: list[str] | None = None
+    isActive: bool | None = None
 
 
-class EmployerPartnerResponse(EmployerPartnerBase):
+class EmployerPartnerResponse(EmployerPartnerBase, ORMBase):
     id: str
     totalStudentsHosted: int
-    averageRating: Optional[float] = None
+    averageRating: float | None = None
     isActive: bool
     partnerSince: datetime
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class JobShadowingBase(BaseModel):
     employerName: str
@@ -425,100 +408,94 @@ class JobShadowingBase(BaseModel):
     duration: int  # hours
     industry: str
     jobTitle: str
-    tasksObserved: List[str] = []
-    skillsObserved: List[str] = []
+    tasksObserved: list[str] = Field(default_factory=list)
+    skillsObserved: list[str] = Field(default_factory=list)
 
 
 class JobShadowingCreate(JobShadowingBase):
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
 
 
 class JobShadowingUpdate(BaseModel):
-    questionsAsked: Optional[List[str]] = None
-    reflection: Optional[str] = None
-    whatLiked: Optional[str] = None
-    whatDisliked: Optional[str] = None
-    careerInterestLevel: Optional[int] = Field(None, ge=1, le=5)
-    wouldPursue: Optional[bool] = None
-    supervisorName: Optional[str] = None
-    supervisorFeedback: Optional[str] = None
-    completed: Optional[bool] = None
-
-
-class JobShadowingResponse(JobShadowingBase):
+    questionsAsked: list[str] | None = None
+    reflection: str | None = None
+    whatLiked: str | None = None
+    whatDisliked: str | None = None
+    careerInterestLevel: int | None = Field(None, ge=1, le=5)
+    wouldPursue: bool | None = None
+    supervisorName: str | None = None
+    supervisorFeedback: str | None = None
+    completed: bool | None = None
+
+
+class JobShadowingResponse(JobShadowingBase, ORMBase):
     id: str
     transitionPlanId: str
-    employerId: Optional[str] = None
-    questionsAsked: List[str]
-    reflection: Optional[str] = None
-    whatLiked: Optional[str] = None
-    whatDisliked: Optional[str] = None
-    careerInterestLevel: Optional[int] = None
-    wouldPursue: Optional[bool] = None
-    supervisorName: Optional[str] = None
-    supervisorFeedback: Optional[str] = None
+    employerId: str | None = None
+    questionsAsked: list[str]
+    reflection: str | None = None
+    whatLiked: str | None = None
+    whatDisliked: str | None = None
+    careerInterestLevel: int | None = None
+    wouldPursue: bool | None = None
+    supervisorName: str | None = None
+    supervisorFeedback: str | None = None
     completed: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class InternshipBase(BaseModel):
     employerName: str
     position: str
-    department: Optional[str] = None
+    department: str | None = None
     industry: str
     startDate: datetime
-    endDate: Optional[datetime] = None
+    endDate: datetime | None = None
     hoursPerWeek: int
     isPaid: bool = False
-    hourlyRate: Optional[float] = None
+    hourlyRate: float | None = None
     supervisorName: str
-    supervisorEmail: Optional[str] = None
-    supervisorPhone: Optional[str] = None
-    learningObjectives: List[str] = []
-    skillsTargeted: List[str] = []
+    supervisorEmail: str | None = None
+    supervisorPhone: str | None = None
+    learningObjectives: list[str] = Field(default_factory=list)
+    skillsTargeted: list[str] = Field(default_factory=list)
 
 
 class InternshipCreate(InternshipBase):
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
 
 
 class InternshipUpdate(BaseModel):
-    totalHoursCompleted: Optional[int] = None
-    skillsGained: Optional[List[str]] = None
-    tasksPerformed: Optional[List[str]] = None
-    evaluations: Optional[List[Dict[str, Any]]] = None
-    midtermEvaluation: Optional[Dict[str, Any]] = None
-    finalEvaluation: Optional[Dict[str, Any]] = None
-    accommodationsProvided: Optional[List[str]] = None
-    status: Optional[str] = None
-    completionCertificate: Optional[bool] = None
-
-
-class InternshipResponse(InternshipBase):
+    totalHoursCompleted: int | None = None
+    skillsGained: list[str] | None = None
+    tasksPerformed: list[str] | None = None
+    evaluations: list[dict[str, Any]] | None = None
+    midtermEvaluation: dict[str, Any] | None = None
+    finalEvaluation: dict[str, Any] | None = None
+    accommodationsProvided: list[str] | None = None
+    status: str | None = None
+    completionCertificate: bool | None = None
+
+
+class InternshipResponse(InternshipBase, ORMBase):
     id: str
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
     totalHoursCompleted: int
-    skillsGained: List[str]
-    tasksPerformed: List[str]
-    evaluations: Optional[List[Dict[str, Any]]] = None
-    midtermEvaluation: Optional[Dict[str, Any]] = None
-    finalEvaluation: Optional[Dict[str, Any]] = None
-    accommodationsProvided: List[str]
+    skillsGained: list[str]
+    tasksPerformed: list[str]
+    evaluations: list[dict[str, Any]] | None = None
+    midtermEvaluation: dict[str, Any] | None = None
+    finalEvaluation: dict[str, Any] | None = None
+    accommodationsProvided: list[str]
     status: str
     completionCertificate: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class WorkExperienceBase(BaseModel):
     employerName: str
@@ -526,50 +503,47 @@ class WorkExperienceBase(BaseModel):
     position: str
     industry: str
     startDate: datetime
-    endDate: Optional[datetime] = None
+    endDate: datetime | None = None
     isCurrent: bool = False
-    hoursPerWeek: Optional[int] = None
-    hourlyWage: Optional[float] = None
+    hoursPerWeek: int | None = None
+    hourlyWage: float | None = None
 
 
 class WorkExperienceCreate(WorkExperienceBase):
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
 
 
 class WorkExperienceUpdate(BaseModel):
-    endDate: Optional[datetime] = None
-    isCurrent: Optional[bool] = None
-    totalHoursWorked: Optional[int] = None
-    responsibilities: Optional[List[str]] = None
-    skillsGained: Optional[List[str]] = None
-    accomplishments: Optional[List[str]] = None
-    supervisorName: Optional[str] = None
-    supervisorContact: Optional[str] = None
-    canUseAsReference: Optional[bool] = None
-    reflection: Optional[str] = None
-    careerRelevance: Optional[str] = None
-
-
-class WorkExperienceResponse(WorkExperienceBase):
+    endDate: datetime | None = None
+    isCurrent: bool | None = None
+    totalHoursWorked: int | None = None
+    responsibilities: list[str] | None = None
+    skillsGained: list[str] | None = None
+    accomplishments: list[str] | None = None
+    supervisorName: str | None = None
+    supervisorContact: str | None = None
+    canUseAsReference: bool | None = None
+    reflection: str | None = None
+    careerRelevance: str | None = None
+
+
+class WorkExperienceResponse(WorkExperienceBase, ORMBase):
     id: str
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
     totalHoursWorked: int
-    responsibilities: List[str]
-    skillsGained: List[str]
-    accomplishments: List[str]
-    supervisorName: Optional[str] = None
-    supervisorContact: Optional[str] = None
+    responsibilities: list[str]
+    skillsGained: list[str]
+    accomplishments: list[str]
+    supervisorName: str | None = None
+    supervisorContact: str | None = None
     canUseAsReference: bool
-    reflection: Optional[str] = None
-    careerRelevance: Optional[str] = None
+    reflection: str | None = None
+    careerRelevance: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # VOCATIONAL PATHWAY SCHEMAS
@@ -580,22 +554,22 @@ class TradeProgramBase(BaseModel):
     trade: TradeType
     provider: str
     providerType: str
-    city: Optional[str] = None
-    state: Optional[str] = None
+    city: str | None = None
+    state: str | None = None
     isOnline: bool = False
     isHybrid: bool = False
-    description: Optional[str] = None
+    description: str | None = None
     duration: int  # weeks
-    totalHours: Optional[int] = None
+    totalHours: int | None = None
     tuition: float
-    booksAndSupplies: Optional[float] = None
+    booksAndSupplies: float | None = None
     financialAidAvailable: bool = True
     scholarshipsAvailable: bool = False
-    jobPlacementRate: Optional[float] = None
-    averageStartingSalary: Optional[float] = None
-    medianSalary: Optional[float] = None
-    certificationsEarned: List[str] = []
-    prerequisites: List[str] = []
+    jobPlacementRate: float | None = None
+    averageStartingSalary: float | None = None
+    medianSalary: float | None = None
+    certificationsEarned: list[str] = Field(default_factory=list)
+    prerequisites: list[str] = Field(default_factory=list)
 
 
 class TradeProgramCreate(TradeProgramBase):
@@ -603,52 +577,49 @@ class TradeProgramCreate(TradeProgramBase):
 
 
 class TradeProgramUpdate(BaseModel):
-    description: Optional[str] = None
-    tuition: Optional[float] = None
-    jobPlacementRate: Optional[float] = None
-    averageStartingSalary: Optional[float] = None
-    disabilityServicesAvailable: Optional[bool] = None
-    accommodationsOffered: Optional[List[str]] = None
-    isActive: Optional[bool] = None
+    description: str | None = None
+    tuition: float | None = None
+    jobPlacementRate: float | None = None
+    averageStartingSalary: float | None = None
+    disabilityServicesAvailable: bool | None = None
+    accommodationsOffered: list[str] | None = None
+    isActive: bool | None = None
 
 
-class TradeProgramResponse(TradeProgramBase):
+class TradeProgramResponse(TradeProgramBase, ORMBase):
     id: str
-    salaryRange: Optional[Dict[str, float]] = None
-    employmentGrowth: Optional[float] = None
-    creditsEarned: Optional[int] = None
+    salaryRange: dict[str, float] | None = None
+    employmentGrowth: float | None = None
+    creditsEarned: int | None = None
     industryRecognized: bool
-    minimumAge: Optional[int] = None
-    physicalRequirements: List[str]
+    minimumAge: int | None = None
+    physicalRequirements: list[str]
     disabilityServicesAvailable: bool
-    accommodationsOffered: List[str]
-    accessibilityNotes: Optional[str] = None
-    contactEmail: Optional[str] = None
-    contactPhone: Optional[str] = None
-    website: Optional[str] = None
+    accommodationsOffered: list[str]
+    accessibilityNotes: str | None = None
+    contactEmail: str | None = None
+    contactPhone: str | None = None
+    website: str | None = None
     isActive: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TradeProgramSearchFilters(BaseModel):
-    trade: Optional[TradeType] = None
-    state: Optional[str] = None
-    maxTuition: Optional[float] = None
-    minPlacementRate: Optional[float] = None
-    minSalary: Optional[float] = None
-    isOnline: Optional[bool] = None
-    disabilityServicesAvailable: Optional[bool] = True
-    maxDuration: Optional[int] = None  # weeks
+    trade: TradeType | None = None
+    state: str | None = None
+    maxTuition: float | None = None
+    minPlacementRate: float | None = None
+    minSalary: float | None = None
+    isOnline: bool | None = None
+    disabilityServicesAvailable: bool | None = True
+    maxDuration: int | None = None  # weeks
 
 
 class TradeProgramApplicationBase(BaseModel):
-    applicationUrl: Optional[str] = None
-    applicationDeadline: Optional[datetime] = None
-    startDate: Optional[datetime] = None
+    applicationUrl: str | None = None
+    applicationDeadline: datetime | None = None
+    startDate: datetime | None = None
 
 
 class TradeProgramApplicationCreate(TradeProgramApplicationBase):
@@ -657,48 +628,45 @@ class TradeProgramApplicationCreate(TradeProgramApplicationBase):
 
 
 class TradeProgramApplicationUpdate(BaseModel):
-    status: Optional[ProgramApplicationStatus] = None
-    submittedDate: Optional[datetime] = None
-    decisionDate: Optional[datetime] = None
-    applicationComplete: Optional[bool] = None
-    transcriptSent: Optional[bool] = None
-    recommendationsComplete: Optional[bool] = None
-    entranceExamComplete: Optional[bool] = None
-    entranceExamScore: Optional[float] = None
-    interviewComplete: Optional[bool] = None
-    documentsRequired: Optional[List[Dict[str, Any]]] = None
-    documentsSubmitted: Optional[List[Dict[str, Any]]] = None
-    financialAidApplied: Optional[bool] = None
-    financialAidAwarded: Optional[float] = None
-    notes: Optional[str] = None
-
-
-class TradeProgramApplicationResponse(TradeProgramApplicationBase):
+    status: ProgramApplicationStatus | None = None
+    submittedDate: datetime | None = None
+    decisionDate: datetime | None = None
+    applicationComplete: bool | None = None
+    transcriptSent: bool | None = None
+    recommendationsComplete: bool | None = None
+    entranceExamComplete: bool | None = None
+    entranceExamScore: float | None = None
+    interviewComplete: bool | None = None
+    documentsRequired: list[dict[str, Any]] | None = None
+    documentsSubmitted: list[dict[str, Any]] | None = None
+    financialAidApplied: bool | None = None
+    financialAidAwarded: float | None = None
+    notes: str | None = None
+
+
+class TradeProgramApplicationResponse(TradeProgramApplicationBase, ORMBase):
     id: str
     transitionPlanId: str
     programId: str
     status: ProgramApplicationStatus
-    submittedDate: Optional[datetime] = None
-    decisionDate: Optional[datetime] = None
+    submittedDate: datetime | None = None
+    decisionDate: datetime | None = None
     applicationComplete: bool
     transcriptSent: bool
     recommendationsComplete: bool
     entranceExamComplete: bool
-    entranceExamScore: Optional[float] = None
+    entranceExamScore: float | None = None
     interviewComplete: bool
-    documentsRequired: Optional[List[Dict[str, Any]]] = None
-    documentsSubmitted: Optional[List[Dict[str, Any]]] = None
+    documentsRequired: list[dict[str, Any]] | None = None
+    documentsSubmitted: list[dict[str, Any]] | None = None
     financialAidApplied: bool
-    financialAidAwarded: Optional[float] = None
-    notes: Optional[str] = None
+    financialAidAwarded: float | None = None
+    notes: str | None = None
     createdAt: datetime
     updatedAt: datetime
     
     # Include program details
-    program: Optional[TradeProgramResponse] = None
-
-    class Config:
-        from_attributes = True
+    program: TradeProgramResponse | None = None
 
 
 class ApprenticeshipBase(BaseModel):
@@ -706,67 +674,64 @@ class ApprenticeshipBase(BaseModel):
     programName: str
     sponsorOrganization: str
     startDate: datetime
-    expectedEndDate: Optional[datetime] = None
+    expectedEndDate: datetime | None = None
     totalHoursRequired: int
-    classroomHoursRequired: Optional[int] = None
+    classroomHoursRequired: int | None = None
     startingWage: float
     currentWage: float
-    journeymanWage: Optional[float] = None
+    journeymanWage: float | None = None
     totalLevels: int
 
 
 class ApprenticeshipCreate(ApprenticeshipBase):
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
 
 
 class ApprenticeshipUpdate(BaseModel):
-    hoursCompleted: Optional[int] = None
-    classroomHoursCompleted: Optional[int] = None
-    currentWage: Optional[float] = None
-    wageProgressions: Optional[List[Dict[str, Any]]] = None
-    mentorName: Optional[str] = None
-    mentorContact: Optional[str] = None
-    currentLevel: Optional[int] = None
-    competenciesCompleted: Optional[List[str]] = None
-    competenciesRemaining: Optional[List[str]] = None
-    certificationsEarned: Optional[List[Dict[str, Any]]] = None
-    status: Optional[str] = None
-    completionDate: Optional[datetime] = None
-
-
-class ApprenticeshipResponse(ApprenticeshipBase):
+    hoursCompleted: int | None = None
+    classroomHoursCompleted: int | None = None
+    currentWage: float | None = None
+    wageProgressions: list[dict[str, Any]] | None = None
+    mentorName: str | None = None
+    mentorContact: str | None = None
+    currentLevel: int | None = None
+    competenciesCompleted: list[str] | None = None
+    competenciesRemaining: list[str] | None = None
+    certificationsEarned: list[dict[str, Any]] | None = None
+    status: str | None = None
+    completionDate: datetime | None = None
+
+
+class ApprenticeshipResponse(ApprenticeshipBase, ORMBase):
     id: str
     transitionPlanId: str
-    employerId: Optional[str] = None
+    employerId: str | None = None
     hoursCompleted: int
     classroomHoursCompleted: int
-    wageProgressions: Optional[List[Dict[str, Any]]] = None
-    mentorName: Optional[str] = None
-    mentorContact: Optional[str] = None
+    wageProgressions: list[dict[str, Any]] | None = None
+    mentorName: str | None = None
+    mentorContact: str | None = None
     currentLevel: int
-    competenciesCompleted: List[str]
-    competenciesRemaining: List[str]
-    certificationsEarned: Optional[List[Dict[str, Any]]] = None
+    competenciesCompleted: list[str]
+    competenciesRemaining: list[str]
+    certificationsEarned: list[dict[str, Any]] | None = None
     status: str
-    actualEndDate: Optional[datetime] = None
-    completionDate: Optional[datetime] = None
+    actualEndDate: datetime | None = None
+    completionDate: datetime | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class IndustryCertificationBase(BaseModel):
     name: str
     issuingOrganization: str
-    industry: Optional[str] = None
+    industry: str | None = None
     earnedDate: datetime
-    expirationDate: Optional[datetime] = None
+    expirationDate: datetime | None = None
     isLifetime: bool = False
-    credentialId: Optional[str] = None
-    verificationUrl: Optional[str] = None
+    credentialId: str | None = None
+    verificationUrl: str | None = None
 
 
 class IndustryCertificationCreate(IndustryCertificationBase):
@@ -774,32 +739,29 @@ class IndustryCertificationCreate(IndustryCertificationBase):
 
 
 class IndustryCertificationUpdate(BaseModel):
-    expirationDate: Optional[datetime] = None
-    credentialId: Optional[str] = None
-    verificationUrl: Optional[str] = None
-    renewalRequired: Optional[bool] = None
-    renewalRequirements: Optional[str] = None
-    ceuRequired: Optional[int] = None
-    ceuCompleted: Optional[int] = None
-    salaryImpact: Optional[float] = None
-    jobsRequiring: Optional[List[str]] = None
-
-
-class IndustryCertificationResponse(IndustryCertificationBase):
+    expirationDate: datetime | None = None
+    credentialId: str | None = None
+    verificationUrl: str | None = None
+    renewalRequired: bool | None = None
+    renewalRequirements: str | None = None
+    ceuRequired: int | None = None
+    ceuCompleted: int | None = None
+    salaryImpact: float | None = None
+    jobsRequiring: list[str] | None = None
+
+
+class IndustryCertificationResponse(IndustryCertificationBase, ORMBase):
     id: str
     transitionPlanId: str
     renewalRequired: bool
-    renewalRequirements: Optional[str] = None
-    ceuRequired: Optional[int] = None
+    renewalRequirements: str | None = None
+    ceuRequired: int | None = None
     ceuCompleted: int
-    salaryImpact: Optional[float] = None
-    jobsRequiring: List[str]
+    salaryImpact: float | None = None
+    jobsRequiring: list[str]
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # SELF-DETERMINATION SCHEMAS
@@ -807,7 +769,7 @@ class IndustryCertificationResponse(IndustryCertificationBase):
 
 class SelfDeterminationAssessmentBase(BaseModel):
     assessmentType: str = "ARC_SDS"
-    assessor: Optional[str] = None
+    assessor: str | None = None
     # 11 domains (1-5 scale)
     selfAwareness: int = Field(..., ge=1, le=5)
     selfKnowledge: int = Field(..., ge=1, le=5)
@@ -824,45 +786,42 @@ class SelfDeterminationAssessmentBase(BaseModel):
 
 class SelfDeterminationAssessmentCreate(SelfDeterminationAssessmentBase):
     transitionPlanId: str
-    strengths: List[str] = []
-    areasForGrowth: List[str] = []
-    recommendations: List[str] = []
-    studentReflection: Optional[str] = None
+    strengths: list[str] = Field(default_factory=list)
+    areasForGrowth: list[str] = Field(default_factory=list)
+    recommendations: list[str] = Field(default_factory=list)
+    studentReflection: str | None = None
 
 
-class SelfDeterminationAssessmentResponse(SelfDeterminationAssessmentBase):
+class SelfDeterminationAssessmentResponse(SelfDeterminationAssessmentBase, ORMBase):
     id: str
     transitionPlanId: str
     assessmentDate: datetime
     # Composite scores
-    totalScore: Optional[int] = None
-    autonomyScore: Optional[int] = None
-    selfRegulationScore: Optional[int] = None
-    empowermentScore: Optional[int] = None
-    selfRealizationScore: Optional[int] = None
+    totalScore: int | None = None
+    autonomyScore: int | None = None
+    selfRegulationScore: int | None = None
+    empowermentScore: int | None = None
+    selfRealizationScore: int | None = None
     # Qualitative
-    strengths: List[str]
-    areasForGrowth: List[str]
-    recommendations: List[str]
-    studentReflection: Optional[str] = None
-    previousAssessmentId: Optional[str] = None
-    improvementAreas: List[str]
+    strengths: list[str]
+    areasForGrowth: list[str]
+    recommendations: list[str]
+    studentReflection: str | None = None
+    previousAssessmentId: str | None = None
+    improvementAreas: list[str]
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class PersonCenteredPlanBase(BaseModel):
-    dreams: List[str] = []
-    nightmares: List[str] = []
-    importantTo: List[str] = []
-    importantFor: List[str] = []
-    strengths: List[str] = []
-    gifts: List[str] = []
-    talents: List[str] = []
-    interests: List[str] = []
+    dreams: list[str] = Field(default_factory=list)
+    nightmares: list[str] = Field(default_factory=list)
+    importantTo: list[str] = Field(default_factory=list)
+    importantFor: list[str] = Field(default_factory=list)
+    strengths: list[str] = Field(default_factory=list)
+    gifts: list[str] = Field(default_factory=list)
+    talents: list[str] = Field(default_factory=list)
+    interests: list[str] = Field(default_factory=list)
 
 
 class PersonCenteredPlanCreate(PersonCenteredPlanBase):
@@ -870,95 +829,89 @@ class PersonCenteredPlanCreate(PersonCenteredPlanBase):
 
 
 class PersonCenteredPlanUpdate(BaseModel):
-    dreams: Optional[List[str]] = None
-    nightmares: Optional[List[str]] = None
-    importantTo: Optional[List[str]] = None
-    importantFor: Optional[List[str]] = None
-    strengths: Optional[List[str]] = None
-    gifts: Optional[List[str]] = None
-    talents: Optional[List[str]] = None
-    interests: Optional[List[str]] = None
-    supportNeeds: Optional[Dict[str, Any]] = None
-    importantPeople: Optional[List[Dict[str, Any]]] = None
-    supportCircle: Optional[List[Dict[str, Any]]] = None
-    communicationPreferences: Optional[List[str]] = None
-    learningPreferences: Optional[List[str]] = None
-    environmentPreferences: Optional[List[str]] = None
-    positiveExperiences: Optional[List[str]] = None
-    negativeExperiences: Optional[List[str]] = None
-    actionItems: Optional[List[Dict[str, Any]]] = None
-    meetingDate: Optional[datetime] = None
-    facilitator: Optional[str] = None
-    participants: Optional[List[str]] = None
-    meetingNotes: Optional[str] = None
-
-
-class PersonCenteredPlanResponse(PersonCenteredPlanBase):
+    dreams: list[str] | None = None
+    nightmares: list[str] | None = None
+    importantTo: list[str] | None = None
+    importantFor: list[str] | None = None
+    strengths: list[str] | None = None
+    gifts: list[str] | None = None
+    talents: list[str] | None = None
+    interests: list[str] | None = None
+    supportNeeds: dict[str, Any] | None = None
+    importantPeople: list[dict[str, Any]] | None = None
+    supportCircle: list[dict[str, Any]] | None = None
+    communicationPreferences: list[str] | None = None
+    learningPreferences: list[str] | None = None
+    environmentPreferences: list[str] | None = None
+    positiveExperiences: list[str] | None = None
+    negativeExperiences: list[str] | None = None
+    actionItems: list[dict[str, Any]] | None = None
+    meetingDate: datetime | None = None
+    facilitator: str | None = None
+    participants: list[str] | None = None
+    meetingNotes: str | None = None
+
+
+class PersonCenteredPlanResponse(PersonCenteredPlanBase, ORMBase):
     id: str
     transitionPlanId: str
-    supportNeeds: Optional[Dict[str, Any]] = None
-    importantPeople: Optional[List[Dict[str, Any]]] = None
-    supportCircle: Optional[List[Dict[str, Any]]] = None
-    communicationPreferences: List[str]
-    learningPreferences: List[str]
-    environmentPreferences: List[str]
-    positiveExperiences: List[str]
-    negativeExperiences: List[str]
-    actionItems: Optional[List[Dict[str, Any]]] = None
-    meetingDate: Optional[datetime] = None
-    facilitator: Optional[str] = None
-    participants: List[str]
-    meetingNotes: Optional[str] = None
+    supportNeeds: dict[str, Any] | None = None
+    importantPeople: list[dict[str, Any]] | None = None
+    supportCircle: list[dict[str, Any]] | None = None
+    communicationPreferences: list[str]
+    learningPreferences: list[str]
+    environmentPreferences: list[str]
+    positiveExperiences: list[str]
+    negativeExperiences: list[str]
+    actionItems: list[dict[str, Any]] | None = None
+    meetingDate: datetime | None = None
+    facilitator: str | None = None
+    participants: list[str]
+    meetingNotes: str | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TransitionGoalBase(BaseModel):
     category: TransitionGoalCategory
     goalText: str
-    specific: Optional[str] = None
-    measurable: Optional[str] = None
-    achievable: Optional[str] = None
-    relevant: Optional[str] = None
-    timeBound: Optional[datetime] = None
+    specific: str | None = None
+    measurable: str | None = None
+    achievable: str | None = None
+    relevant: str | None = None
+    timeBound: datetime | None = None
     targetDate: datetime
-    alignedIEPGoalIds: List[str] = []
+    alignedIEPGoalIds: list[str] = Field(default_factory=list)
 
 
 class TransitionGoalCreate(TransitionGoalBase):
     transitionPlanId: str
-    activities: Optional[List[Dict[str, Any]]] = None
-    milestones: Optional[List[Dict[str, Any]]] = None
+    activities: list[dict[str, Any]] | None = None
+    milestones: list[dict[str, Any]] | None = None
 
 
 class TransitionGoalUpdate(BaseModel):
-    goalText: Optional[str] = None
-    progress: Optional[int] = Field(None, ge=0, le=100)
-    status: Optional[str] = None
-    activities: Optional[List[Dict[str, Any]]] = None
-    milestones: Optional[List[Dict[str, Any]]] = None
-    progressNotes: Optional[List[Dict[str, Any]]] = None
-    isActive: Optional[bool] = None
+    goalText: str | None = None
+    progress: int | None = Field(None, ge=0, le=100)
+    status: str | None = None
+    activities: list[dict[str, Any]] | None = None
+    milestones: list[dict[str, Any]] | None = None
+    progressNotes: list[dict[str, Any]] | None = None
+    isActive: bool | None = None
 
 
-class TransitionGoalResponse(TransitionGoalBase):
+class TransitionGoalResponse(TransitionGoalBase, ORMBase):
     id: str
     transitionPlanId: str
     progress: int
     status: str
-    activities: Optional[List[Dict[str, Any]]] = None
-    milestones: Optional[List[Dict[str, Any]]] = None
-    progressNotes: Optional[List[Dict[str, Any]]] = None
+    activities: list[dict[str, Any]] | None = None
+    milestones: list[dict[str, Any]] | None = None
+    progressNotes: list[dict[str, Any]] | None = None
     isActive: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # AGENCY & REPORT SCHEMAS
@@ -967,11 +920,11 @@ class TransitionGoalResponse(TransitionGoalBase):
 class AgencyInvolvementBase(BaseModel):
     agencyName: str
     agencyType: str
-    contactName: Optional[str] = None
-    contactEmail: Optional[str] = None
-    contactPhone: Optional[str] = None
-    servicesProvided: List[str] = []
-    servicesNeeded: List[str] = []
+    contactName: str | None = None
+    contactEmail: str | None = None
+    contactPhone: str | None = None
+    servicesProvided: list[str] = Field(default_factory=list)
+    servicesNeeded: list[str] = Field(default_factory=list)
 
 
 class AgencyInvolvementCreate(AgencyInvolvementBase):
@@ -979,40 +932,37 @@ class AgencyInvolvementCreate(AgencyInvolvementBase):
 
 
 class AgencyInvolvementUpdate(BaseModel):
-    contactName: Optional[str] = None
-    contactEmail: Optional[str] = None
-    contactPhone: Optional[str] = None
-    servicesProvided: Optional[List[str]] = None
-    servicesNeeded: Optional[List[str]] = None
-    referralDate: Optional[datetime] = None
-    referralStatus: Optional[str] = None
-    eligibilityStatus: Optional[str] = None
-    caseNumber: Optional[str] = None
-    caseManagerName: Optional[str] = None
-    fundingProvided: Optional[List[str]] = None
-    fundingAmount: Optional[float] = None
-    notes: Optional[str] = None
-    isActive: Optional[bool] = None
-
-
-class AgencyInvolvementResponse(AgencyInvolvementBase):
+    contactName: str | None = None
+    contactEmail: str | None = None
+    contactPhone: str | None = None
+    servicesProvided: list[str] | None = None
+    servicesNeeded: list[str] | None = None
+    referralDate: datetime | None = None
+    referralStatus: str | None = None
+    eligibilityStatus: str | None = None
+    caseNumber: str | None = None
+    caseManagerName: str | None = None
+    fundingProvided: list[str] | None = None
+    fundingAmount: float | None = None
+    notes: str | None = None
+    isActive: bool | None = None
+
+
+class AgencyInvolvementResponse(AgencyInvolvementBase, ORMBase):
     id: str
     transitionPlanId: str
-    referralDate: Optional[datetime] = None
-    referralStatus: Optional[str] = None
-    eligibilityStatus: Optional[str] = None
-    caseNumber: Optional[str] = None
-    caseManagerName: Optional[str] = None
-    fundingProvided: List[str]
-    fundingAmount: Optional[float] = None
-    notes: Optional[str] = None
+    referralDate: datetime | None = None
+    referralStatus: str | None = None
+    eligibilityStatus: str | None = None
+    caseNumber: str | None = None
+    caseManagerName: str | None = None
+    fundingProvided: list[str]
+    fundingAmount: float | None = None
+    notes: str | None = None
     isActive: bool
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class TransitionReadinessReportCreate(BaseModel):
     transitionPlanId: str
@@ -1022,20 +972,20 @@ class TransitionReadinessReportCreate(BaseModel):
     employmentReadiness: int = Field(..., ge=0, le=100)
     independentLivingReadiness: int = Field(..., ge=0, le=100)
     selfDeterminationReadiness: int = Field(..., ge=0, le=100)
-    academicSkills: Optional[Dict[str, Any]] = None
-    employabilitySkills: Optional[Dict[str, Any]] = None
-    dailyLivingSkills: Optional[Dict[str, Any]] = None
-    socialSkills: Optional[Dict[str, Any]] = None
-    ideaRequirementsMet: Optional[Dict[str, bool]] = None
-    complianceNotes: Optional[str] = None
-    recommendations: List[str] = []
-    priorityAreas: List[str] = []
-    strengthAreas: List[str] = []
-    nextSteps: Optional[List[Dict[str, Any]]] = None
-    preparedBy: Optional[str] = None
-
-
-class TransitionReadinessReportResponse(BaseModel):
+    academicSkills: dict[str, Any] | None = None
+    employabilitySkills: dict[str, Any] | None = None
+    dailyLivingSkills: dict[str, Any] | None = None
+    socialSkills: dict[str, Any] | None = None
+    ideaRequirementsMet: dict[str, bool] | None = None
+    complianceNotes: str | None = None
+    recommendations: list[str] = Field(default_factory=list)
+    priorityAreas: list[str] = Field(default_factory=list)
+    strengthAreas: list[str] = Field(default_factory=list)
+    nextSteps: list[dict[str, Any]] | None = None
+    preparedBy: str | None = None
+
+
+class TransitionReadinessReportResponse(ORMBase):
     id: str
     transitionPlanId: str
     reportDate: datetime
@@ -1045,25 +995,22 @@ class TransitionReadinessReportResponse(BaseModel):
     employmentReadiness: int
     independentLivingReadiness: int
     selfDeterminationReadiness: int
-    academicSkills: Optional[Dict[str, Any]] = None
-    employabilitySkills: Optional[Dict[str, Any]] = None
-    dailyLivingSkills: Optional[Dict[str, Any]] = None
-    socialSkills: Optional[Dict[str, Any]] = None
-    ideaRequirementsMet: Optional[Dict[str, bool]] = None
-    complianceNotes: Optional[str] = None
-    recommendations: List[str]
-    priorityAreas: List[str]
-    strengthAreas: List[str]
-    nextSteps: Optional[List[Dict[str, Any]]] = None
-    preparedBy: Optional[str] = None
-    reviewedBy: Optional[str] = None
-    approvedDate: Optional[datetime] = None
+    academicSkills: dict[str, Any] | None = None
+    employabilitySkills: dict[str, Any] | None = None
+    dailyLivingSkills: dict[str, Any] | None = None
+    socialSkills: dict[str, Any] | None = None
+    ideaRequirementsMet: dict[str, bool] | None = None
+    complianceNotes: str | None = None
+    recommendations: list[str]
+    priorityAreas: list[str]
+    strengthAreas: list[str]
+    nextSteps: list[dict[str, Any]] | None = None
+    preparedBy: str | None = None
+    reviewedBy: str | None = None
+    approvedDate: datetime | None = None
     createdAt: datetime
     updatedAt: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ==========================================
 # DASHBOARD & ANALYTICS SCHEMAS
@@ -1097,16 +1044,16 @@ class TransitionDashboardStats(BaseModel):
     # Vocational
     tradeProgramsExplored: int
     certificationsEarned: int
-    apprenticeshipProgress: Optional[float] = None
+    apprenticeshipProgress: float | None = None
     
     # Self-determination
-    latestSelfDeterminationScore: Optional[int] = None
-    selfDeterminationTrend: Optional[str] = None  # "improving", "stable", "declining"
+    latestSelfDeterminationScore: int | None = None
+    selfDeterminationTrend: str | None = None  # "improving", "stable", "declining"
     
     # IDEA compliance
     ideaRequirementsMet: int
     ideaRequirementsTotal: int
-    nextAnnualReviewDate: Optional[datetime] = None
+    nextAnnualReviewDate: datetime | None = None
 
 
 class IDEARequirementsChecklist(BaseModel):
@@ -1115,8 +1062,8 @@ class IDEARequirementsChecklist(BaseModel):
     
     # Age-appropriate transition assessments
     ageAppropriateAssessmentsCompleted: bool
-    assessmentTypes: List[str]
-    lastAssessmentDate: Optional[datetime] = None
+    assessmentTypes: list[str]
+    lastAssessmentDate: datetime | None = None
     
     # Measurable postsecondary goals
     hasEducationGoal: bool
@@ -1138,15 +1085,15 @@ class IDEARequirementsChecklist(BaseModel):
     
     # Annual updates
     annualReviewScheduled: bool
-    lastAnnualReviewDate: Optional[datetime] = None
+    lastAnnualReviewDate: datetime | None = None
     
     # Transfer of rights
-    transferOfRightsNotificationDate: Optional[datetime] = None
+    transferOfRightsNotificationDate: datetime | None = None
     transferOfRightsCompleted: bool
     
     overallCompliance: bool
     compliancePercentage: int
-    missingRequirements: List[str]
+    missingRequirements: list[str]
 
 
 class TransitionTimelineMilestone(BaseModel):
@@ -1156,12 +1103,12 @@ class TransitionTimelineMilestone(BaseModel):
     description: str
     category: str  # "education", "employment", "assessment", "deadline", "meeting"
     status: str  # "completed", "upcoming", "overdue", "in-progress"
-    relatedRecordId: Optional[str] = None
-    relatedRecordType: Optional[str] = None
+    relatedRecordId: str | None = None
+    relatedRecordType: str | None = None
 
 
 class TransitionTimelineResponse(BaseModel):
     learnerId: str
-    milestones: List[TransitionTimelineMilestone]
-    upcomingDeadlines: List[TransitionTimelineMilestone]
-    recentCompletions: List[TransitionTimelineMilestone]
+    milestones: list[TransitionTimelineMilestone]
+    upcomingDeadlines: list[TransitionTimelineMilestone]
+    recentCompletions: list[TransitionTimelineMilestone]
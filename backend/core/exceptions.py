@@ -5,12 +5,13 @@ Date: 2025-11-23
 """
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from typing import Union, Dict, Any
 import traceback
 from datetime import datetime
+from pydantic_core import to_jsonable_python
 
 
 class AIVOException(Exception):
@@ -88,7 +89,7 @@ def create_error_response(
         "error": {
             "message": message,
             "code": status_code,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
     }
     
@@ -104,10 +105,14 @@ def create_error_response(
             "client": request.client.host if request.client else None,
         }
     
-    return JSONResponse(
-        status_code=status_code,
-        content=error_response
-    )
+    # Validation details echo raw input and error context: exceptions fall back
+    # to their message, and integers past 64 bits (which orjson rejects) go
+    # through the stdlib encoder instead
+    content = to_jsonable_python(error_response, fallback=str)
+    try:
+        return ORJSONResponse(status_code=status_code, content=content)
+    except TypeError:
+        return JSONResponse(status_code=status_code, content=content)
 
 
 def setup_exception_handlers(app: FastAPI) -> None:
@@ -5,7 +5,7 @@ Database operations for IEP documents, goals, and extractions.
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, update, delete, and_, or_
+from sqlalchemy import select, update, delete, and_, or_, func
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
@@ -89,6 +89,56 @@ class IEPRepository:
         docs = result.scalars().all()
         return [doc.to_dict() for doc in docs]
     
+    async def get_document_summaries_by_learner(
+        self,
+        learner_id: str,
+        status: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        List-view rows for a learner's documents, extraction counts included.
+        
+        Counts come from correlated subqueries, so the whole page is one
+        round trip. Keys match the IEPDocumentSummary fields.
+        """
+        from db.models import (
+            IEPDocument,
+            IEPExtractedGoal,
+            IEPExtractedService,
+            IEPExtractedAccommodation,
+            IEPExtractedPresentLevel,
+        )
+        
+        def count_of(model):
+            return (
+                select(func.count())
+                .where(model.document_id == IEPDocument.id)
+                .correlate(IEPDocument)
+                .scalar_subquery()
+            )
+        
+        query = select(
+            IEPDocument.id,
+            IEPDocument.file_name,
+            IEPDocument.status,
+            IEPDocument.uploaded_at,
+            IEPDocument.ocr_confidence,
+            count_of(IEPExtractedGoal).label("goal_count"),
+            count_of(IEPExtractedService).label("service_count"),
+            count_of(IEPExtractedAccommodation).label("accommodation_count"),
+            count_of(IEPExtractedPresentLevel).label("present_level_count"),
+        ).where(IEPDocument.learner_id == learner_id)
+        
+        if status:
+            query = query.where(IEPDocument.status == status)
+        
+        query = query.order_by(IEPDocument.uploaded_at.desc())
+        query = query.limit(limit).offset(offset)
+        
+        result = await self.session.execute(query)
+        return [dict(row._mapping) for row in result]
+    
     async def update_document_status(
         self,
         document_id: str,
@@ -7,7 +7,7 @@ Date: 2025-11-23
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 from datetime import datetime
@@ -95,6 +95,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=f"{settings.API_PREFIX}/docs" if settings.DEBUG else None,
     redoc_url=f"{settings.API_PREFIX}/redoc" if settings.DEBUG else None,
     openapi_url=f"{settings.API_PREFIX}/openapi.json" if settings.DEBUG else None,
@@ -230,7 +231,7 @@ async def health_check():
     return {
         "status": "healthy",
         "version": settings.APP_VERSION,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "uptime": uptime_seconds,
         "services": {
             "database": db_status,
@@ -256,22 +257,22 @@ async def ready_check():
     }
     
     try:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "ready": True,
                 "checks": checks,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
             }
         )
     except Exception as e:
         logger.error(f"Ready check failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "ready": False,
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
             }
         )
 
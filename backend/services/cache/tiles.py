@@ -0,0 +1,48 @@
+"""
+Dashboard Tile Cache
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+from datetime import timezone
+from typing import Awaitable, Callable
+
+from pydantic import BaseModel
+
+from api.schemas.common import request_now
+from core.logging import setup_logging
+from services.cache.redis_client import redis_client
+
+logger = setup_logging(__name__)
+
+# Tiles change at most a few times per hour
+TILE_TTL_SECONDS = 3600
+
+
+def tile_key(tile: str, learner_id: str, *params: object) -> str:
+    """
+    Redis key for a dashboard tile, bucketed by the current UTC hour.
+
+    A new hour starts a new key, so a tile is recomputed at most once per
+    hour per learner and parameter set. The hour comes from the pinned
+    request clock, so every tile of one response lands in the same bucket.
+    """
+    bucket = request_now(timezone.utc).strftime("%Y%m%d%H")
+    return ":".join(["tile", tile, learner_id, *map(str, params), bucket])
+
+
+async def cached_tile(key: str, build: Callable[[], Awaitable[BaseModel]]) -> str:
+    """
+    Return the serialized tile stored under `key`, building it on a miss.
+
+    Hits are returned as the stored JSON without re-validation. If Redis is
+    unavailable the tile is simply built for this request.
+    """
+    cached = await redis_client.get(key)
+    if cached is not None:
+        return cached
+
+    content = (await build()).model_dump_json()
+    if not await redis_client.set(key, content, ex=TILE_TTL_SECONDS):
+        logger.debug(f"Tile not cached: {key}")
+    return content
@@ -0,0 +1,155 @@
+"""
+API Response Helper Tests
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+import json
+from datetime import datetime
+from enum import Enum
+
+import msgpack
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field, field_serializer
+
+from api.responses import (
+    MSGPACK_MEDIA_TYPE,
+    fields_response,
+    model_response,
+    msgpack_response,
+    spliced_model_response,
+    streamed_model_response,
+    vary_on_accept,
+    wants_msgpack,
+)
+from api.schemas.adhd.dashboard import ParentDashboardResponse
+from api.schemas.common import ORMBase
+
+
+class Pair(BaseModel):
+    a: int = 1
+    b: list[int] = []
+
+
+class Level(str, Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+class Reading(ORMBase):
+    level: Level
+    taken_at: datetime = Field(serialization_alias="takenAt")
+
+
+class Report(ORMBase):
+    title: str = Field(alias="reportTitle")
+    readings: list[Reading]
+    level: Level
+    secret: str = Field(default="", exclude=True)
+    closed_at: datetime
+
+    @field_serializer("closed_at")
+    def _closed_at(self, value: datetime) -> str:
+        return value.strftime("%Y-%m-%d")
+
+
+def _report() -> Report:
+    when = datetime(2025, 11, 23, 8, 30)
+    return Report(
+        reportTitle="Week 1", readings=[Reading(level="high", taken_at=when)], level="low",
+        secret="s", closed_at=when,
+    )
+
+
+def _sections(report: Report):
+    return [(name, getattr(report, name)) for name in Report.model_fields]
+
+
+class TestSplicedModelResponse:
+    """Pre-serialized fragments written into a model dump"""
+
+    def test_fragment_spliced_after_fields(self):
+        response = spliced_model_response(Pair(), {"b": b"[1,2]"})
+        assert json.loads(response.body) == {"a": 1, "b": [1, 2]}
+
+    def test_no_fragments(self):
+        response = spliced_model_response(Pair(), {})
+        assert response.body == b'{"a":1,"b":[]}'
+
+    def test_every_field_spliced(self):
+        response = spliced_model_response(Pair(), {"a": b"2", "b": b"[]"})
+        assert json.loads(response.body) == {"a": 2, "b": []}
+
+
+class TestMsgpackNegotiation:
+    """JSON by default, MessagePack for callers that ask for it"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/pair")
+        async def get_pair(request: Request):
+            pair = Pair(b=[1, 2])
+            if wants_msgpack(request):
+                return msgpack_response(pair)
+            return vary_on_accept(model_response(pair))
+
+        return TestClient(app)
+
+    def test_json_by_default(self, client):
+        response = client.get("/pair")
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"a": 1, "b": [1, 2]}
+        assert response.headers["vary"] == "Accept"
+
+    def test_msgpack_when_accepted(self, client):
+        response = client.get("/pair", headers={"accept": MSGPACK_MEDIA_TYPE})
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content) == {"a": 1, "b": [1, 2]}
+        assert response.headers["vary"] == "Accept"
+
+    def test_msgpack_matches_json(self):
+        pairs = [Pair(), Pair(a=2, b=[3])]
+        assert msgpack.unpackb(msgpack_response(pairs).body) == [pair.model_dump(mode="json") for pair in pairs]
+
+
+class TestFieldSections:
+    """Objects written one field at a time match the whole-model dump"""
+
+    def test_fields_response_matches_model_response(self):
+        report = _report()
+        assert fields_response(Report, _sections(report)).body == model_response(report).body
+
+    def test_streamed_response_matches_model_response(self):
+        report = _report()
+        client = TestClient(FastAPI())
+        client.app.get("/report")(lambda: streamed_model_response(Report, iter(_sections(report))))
+        assert client.get("/report").content == model_response(report).body
+
+    def test_streamed_failure_is_an_error_response(self):
+        def sections():
+            yield "title", "Week 1"
+            raise RuntimeError("section fetch failed")
+
+        client = TestClient(FastAPI(), raise_server_exceptions=False)
+        client.app.get("/report")(lambda: streamed_model_response(Report, sections()))
+        assert client.get("/report").status_code == 500
+
+    def test_dashboard_sections_match_model(self):
+        values = dict(
+            learner_id="l1", learner_name="", upcoming_assignments=[], overdue_assignments=[],
+            recently_completed=[], todays_plan=None, weekly_completion_rate=0.0,
+            ef_profile_summary=None, active_interventions=[], alerts=[], recent_self_monitoring=None,
+        )
+        dashboard = ParentDashboardResponse(**values)
+        assert fields_response(ParentDashboardResponse, values.items()).body == model_response(dashboard).body
+
+    def test_empty_sections(self):
+        assert fields_response(Report, []).body == b"{}"
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(KeyError):
+            fields_response(Report, [("nope", 1)])
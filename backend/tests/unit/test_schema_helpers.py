@@ -0,0 +1,241 @@
+"""
+Shared Schema Helper Tests
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+import warnings
+from datetime import datetime
+from enum import Enum
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from core.exceptions import setup_exception_handlers
+from api.dependencies.body import json_body
+from api.schemas import slp, transition
+from api.schemas.common import FastStrEnum, ORMBase, PayloadBase, make_partial, value_object
+
+
+class Mood(FastStrEnum):
+    CALM = "calm"
+    UPSET = "upset"
+
+
+class StockMood(str, Enum):
+    CALM = "calm"
+    UPSET = "upset"
+
+
+class MoodModel(BaseModel):
+    mood: Mood
+
+
+class StockMoodModel(BaseModel):
+    mood: StockMood
+
+
+class MoodPayload(PayloadBase):
+    mood: Mood
+
+
+class Note(BaseModel):
+    text: str = Field(min_length=1)
+    mood: Mood = Mood.CALM
+    owner_id: str
+
+
+class NoteResponse(ORMBase):
+    id: str
+    mood: Mood
+    tags: list[str] = []
+
+
+@value_object
+class Edit:
+    editor: str
+    at: datetime
+
+
+class EditedNoteResponse(ORMBase):
+    id: str
+    last_edit: Edit | None = None
+    edits: list[Edit] = []
+
+
+def _error(model: type[BaseModel], value):
+    with pytest.raises(ValidationError) as exc_info:
+        model(mood=value)
+    error, = exc_info.value.errors(include_url=False)
+    return error
+
+
+class TestFastStrEnum:
+    """Core literal lookup behaves like a stock str Enum"""
+
+    def test_value_maps_to_member(self):
+        assert MoodModel(mood="upset").mood is Mood.UPSET
+
+    def test_member_accepted(self):
+        assert MoodModel(mood=Mood.CALM).mood is Mood.CALM
+
+    def test_use_enum_values_keeps_string(self):
+        mood = MoodPayload(mood="calm").mood
+        assert type(mood) is str and mood == "calm"
+
+    @pytest.mark.parametrize("value", ["angry", "CALM", "", 1, None, ["calm"]])
+    def test_rejection_matches_stock_enum(self, value):
+        error = _error(MoodModel, value)
+        stock = _error(StockMoodModel, value)
+        assert (error["type"], error["msg"], error.get("ctx")) == (stock["type"], stock["msg"], stock.get("ctx"))
+
+    def test_unknown_value_is_enum_error(self):
+        error = _error(MoodModel, "angry")
+        assert error["type"] == "enum"
+        assert error["ctx"] == {"expected": "'calm' or 'upset'"}
+
+    def test_non_string_is_string_type_error(self):
+        assert _error(MoodModel, 1)["type"] == "string_type"
+
+    def test_strict_mode_requires_member(self):
+        with pytest.raises(ValidationError):
+            MoodModel.model_validate({"mood": "calm"}, strict=True)
+
+    def test_json_round_trip(self):
+        model = MoodModel(mood="upset")
+        assert model.model_dump_json() == '{"mood":"upset"}'
+        assert MoodModel.model_validate_json(model.model_dump_json()) == model
+
+    def test_json_schema_unchanged(self):
+        assert MoodModel.model_json_schema()["$defs"]["Mood"]["enum"] == ["calm", "upset"]
+
+
+class TestMakePartial:
+    """PATCH models derived from create models"""
+
+    def test_every_field_optional(self):
+        NoteUpdate = make_partial(Note)
+        assert NoteUpdate().model_dump(exclude_unset=True) == {}
+        assert NoteUpdate.__name__ == "NoteUpdate"
+
+    def test_constraints_kept(self):
+        with pytest.raises(ValidationError) as exc_info:
+            make_partial(Note)(text="")
+        assert exc_info.value.errors()[0]["type"] == "string_too_short"
+
+    def test_excluded_fields_dropped(self):
+        assert "owner_id" not in make_partial(Note, "owner_id").model_fields
+
+    def test_cached_per_arguments(self):
+        assert make_partial(Note, "owner_id") is make_partial(Note, "owner_id")
+        assert make_partial(Note) is not make_partial(Note, "owner_id")
+
+
+class TestFromRow:
+    """Trusted row reads skip validation"""
+
+    def test_copies_matching_attributes(self):
+        response = NoteResponse.from_row(SimpleNamespace(id="n1", mood="calm", tags=["a"], extra=1))
+        assert (response.id, response.mood, response.tags) == ("n1", "calm", ["a"])
+
+    def test_missing_attribute_uses_default(self):
+        assert NoteResponse.from_row(SimpleNamespace(id="n1", mood="calm")).tags == []
+
+    def test_matches_validated_dump(self):
+        row = SimpleNamespace(id="n1", mood="upset", tags=["a"])
+        assert NoteResponse.from_row(row).model_dump_json() == NoteResponse.model_validate(row).model_dump_json()
+
+    def test_nested_values_validated(self):
+        edit = {"editor": "u1", "at": "2025-11-23T08:00:00"}
+        response = EditedNoteResponse.from_row(SimpleNamespace(id="n1", last_edit=edit, edits=[edit]))
+        assert response.last_edit == Edit(editor="u1", at=datetime(2025, 11, 23, 8))
+        assert response.edits == [response.last_edit]
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert response.model_dump()["edits"] == [{"editor": "u1", "at": datetime(2025, 11, 23, 8)}]
+
+    def test_nested_none_kept(self):
+        assert EditedNoteResponse.from_row(SimpleNamespace(id="n1", last_edit=None)).last_edit is None
+
+
+class TestJsonBody:
+    """Raw body validated by a prebuilt TypeAdapter"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        setup_exception_handlers(app)
+
+        async def current_user(request: Request) -> str:
+            if "authorization" not in request.headers:
+                raise HTTPException(status_code=401, detail="Not authenticated")
+            return "u1"
+
+        @app.post("/notes")
+        async def create_notes(notes: list[Note] = Depends(json_body(TypeAdapter(list[Note])))):
+            return {"texts": [note.text for note in notes]}
+
+        @app.post("/my-notes")
+        async def create_my_notes(
+            user: str = Depends(current_user),
+            notes: list[Note] = Depends(json_body(TypeAdapter(list[Note]))),
+        ):
+            return {"user": user, "count": len(notes)}
+
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_valid_body(self, client):
+        response = client.post("/notes", json=[{"text": "hi", "owner_id": "u1"}])
+        assert response.status_code == 200
+        assert response.json() == {"texts": ["hi"]}
+
+    def test_invalid_body_is_422_under_body(self, client):
+        response = client.post("/notes", json=[{"text": "hi", "owner_id": "u1", "mood": "angry"}])
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["type"] == "enum"
+        assert error["loc"] == ["body", 0, "mood"]
+
+    def test_malformed_json_is_422(self, client):
+        response = client.post("/notes", content=b"[{", headers={"content-type": "application/json"})
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["type"] == "json_invalid"
+
+    def test_auth_checked_before_body(self, client):
+        response = client.post("/my-notes", json=[{"mood": "angry"}])
+        assert response.status_code == 401
+        assert "details" not in response.json()["error"]
+
+    def test_authenticated_body_validated(self, client):
+        response = client.post("/my-notes", json=[{"mood": "angry"}], headers={"authorization": "Bearer t"})
+        assert response.status_code == 422
+
+
+def _fast_enums(*modules):
+    """FastStrEnum subclasses defined in `modules`"""
+    return [
+        value for module in modules for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, FastStrEnum) and value is not FastStrEnum
+        and value.__module__ == module.__name__
+    ]
+
+
+class TestConvertedEnums:
+    """SLP and transition enums moved onto FastStrEnum keep their stock validation"""
+
+    @pytest.mark.parametrize("enum", _fast_enums(slp, transition), ids=lambda enum: enum.__name__)
+    def test_matches_stock_enum(self, enum):
+        stock = Enum(enum.__name__, {member.name: member.value for member in enum}, type=str)
+        fast_adapter, stock_adapter = TypeAdapter(enum), TypeAdapter(stock)
+        for member in enum:
+            assert fast_adapter.validate_python(member.value) is member
+        for value in ("__unknown__", 1, None):
+            with pytest.raises(ValidationError) as fast_exc:
+                fast_adapter.validate_python(value)
+            with pytest.raises(ValidationError) as stock_exc:
+                stock_adapter.validate_python(value)
+            assert fast_exc.value.errors(include_url=False) == stock_exc.value.errors(include_url=False)
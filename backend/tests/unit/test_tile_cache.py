@@ -0,0 +1,34 @@
+"""
+Dashboard Tile Cache Tests
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+import contextvars
+from datetime import datetime, timedelta, timezone
+
+from api.schemas.common import pin_now
+from services.cache.tiles import tile_key
+
+
+def _key_at(now: datetime, *args) -> str:
+    """tile_key with the request clock pinned to `now`"""
+    def pinned():
+        pin_now(now)
+        return tile_key(*args)
+    return contextvars.copy_context().run(pinned)
+
+
+class TestTileKey:
+    """Keys follow the pinned request clock"""
+
+    def test_bucketed_by_pinned_utc_hour(self):
+        now = datetime(2025, 11, 23, 23, 59, 59, tzinfo=timezone.utc)
+        assert _key_at(now, "fluency", "l1", 30) == "tile:fluency:l1:30:2025112323"
+
+    def test_pinned_offset_converted_to_utc(self):
+        now = datetime(2025, 11, 24, 0, 30, tzinfo=timezone(timedelta(hours=1)))
+        assert _key_at(now, "fluency", "l1").endswith(":2025112323")
+
+    def test_unpinned_uses_system_clock(self):
+        assert tile_key("fluency", "l1").endswith(datetime.now(timezone.utc).strftime(":%Y%m%d%H"))
@@ -0,0 +1,128 @@
+"""
+Validation Error Response Tests
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, field_validator
+
+from core.exceptions import setup_exception_handlers
+from api.schemas.autism import AutismProfileCreate, VisualScheduleCreate
+from api.schemas.adhd.daily_plan import DailyPlanCreate
+
+
+class Nickname(BaseModel):
+    nickname: str
+
+    @field_validator("nickname")
+    @classmethod
+    def _no_spaces(cls, value: str) -> str:
+        if " " in value:
+            raise ValueError("must not contain spaces")
+        return value
+
+
+@pytest.fixture
+def client():
+    """App with the production exception handlers and schema-backed routes"""
+    app = FastAPI()
+    setup_exception_handlers(app)
+
+    @app.post("/visual-schedules")
+    async def create_visual_schedule(schedule: VisualScheduleCreate):
+        return {"name": schedule.name}
+
+    @app.post("/daily-plans")
+    async def create_daily_plan(plan: DailyPlanCreate):
+        return {"wake_time": plan.wake_time}
+
+    @app.post("/autism-profiles")
+    async def create_autism_profile(profile: AutismProfileCreate):
+        return {"learner_id": profile.learner_id}
+
+    @app.post("/nicknames")
+    async def create_nickname(body: Nickname):
+        return {"nickname": body.nickname}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestHexColor:
+    """Custom string validators must surface as 422s, not 500s"""
+
+    def test_valid_color_accepted(self, client):
+        response = client.post("/visual-schedules", json={
+            "autism_profile_id": "p1",
+            "name": "Morning",
+            "color_coding": {"school": "#1A2b3C"},
+        })
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("value", ["blue", "#aabbc", "#aabbcc\n", " #aabbcc"])
+    def test_invalid_color_rejected(self, client, value):
+        response = client.post("/visual-schedules", json={
+            "autism_profile_id": "p1",
+            "name": "Morning",
+            "color_coding": {"school": value},
+        })
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["type"] == "hex_color"
+        assert error["loc"] == ["body", "color_coding", "school"]
+
+
+class TestHHMM:
+    """Clock times in daily plans"""
+
+    @pytest.mark.parametrize("value", ["7:05", "07:05", "23:59"])
+    def test_valid_time_accepted(self, client, value):
+        response = client.post("/daily-plans", json={
+            "learner_id": "l1", "date": "2025-11-23", "wake_time": value,
+        })
+        assert response.status_code == 200
+        assert response.json() == {"wake_time": value}
+
+    @pytest.mark.parametrize("value", ["24:00", "7:5", "07-05", "noon", "07:05\n"])
+    def test_malformed_time_rejected(self, client, value):
+        response = client.post("/daily-plans", json={
+            "learner_id": "l1", "date": "2025-11-23", "wake_time": value,
+        })
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["type"] == "hhmm_time"
+        assert error["loc"] == ["body", "wake_time"]
+
+
+class TestErrorEncoding:
+    """Echoed input and error context never turn a 422 into a 500"""
+
+    def test_integer_past_64_bits(self, client):
+        response = client.post(
+            "/autism-profiles",
+            content=b'{"learner_id":"l","support_level":100000000000000000000000}',
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["loc"] == ["body", "support_level"]
+        assert error["input"] == 100000000000000000000000
+
+    def test_nan_input(self, client):
+        response = client.post(
+            "/autism-profiles",
+            content=b'{"learner_id":"l","support_level":NaN}',
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["input"] is None
+
+    def test_value_error_context(self, client):
+        response = client.post("/nicknames", json={"nickname": "a b"})
+        assert response.status_code == 422
+        error, = response.json()["error"]["details"]["validation_errors"]
+        assert error["type"] == "value_error"
+        assert error["ctx"] == {"error": "must not contain spaces"}
@@ -0,0 +1,93 @@
+"""
+Visual Schedule Weekday Tests
+Author: artpromedia
+Date: 2025-11-23
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from api.schemas.autism import (
+    VisualScheduleCreate,
+    VisualScheduleUpdate,
+    VisualScheduleResponse,
+    days_to_mask,
+    mask_to_days,
+)
+
+
+def _row(**overrides):
+    """Stored schedule row, which keeps weekdays as the `applicableDays` list"""
+    now = datetime(2025, 11, 23, 8, 0)
+    values = dict(
+        id="sched_1", autism_profile_id="p1", name="Morning", schedule_type="daily", items=[],
+        display_format="vertical", show_times=True, show_checkboxes=True, image_size="medium",
+        applicable_days=[1, 3], is_active=True, is_template=False, times_used=0,
+        created_at=now, updated_at=now,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestDayMask:
+    """Packing weekdays into the 7-bit mask"""
+
+    def test_round_trip(self):
+        assert days_to_mask([0, 2, 6]) == 0b1000101
+        assert mask_to_days(0b1000101) == [0, 2, 6]
+
+    def test_empty_means_all_days(self):
+        assert days_to_mask([]) == 0
+        assert mask_to_days(0) == []
+
+
+class TestLegacyDayList:
+    """Clients that still send `applicable_days`"""
+
+    def test_create_accepts_day_list(self):
+        schedule = VisualScheduleCreate(autism_profile_id="p1", name="Morning", applicable_days=[0, 2])
+        assert schedule.applicable_days_mask == 0b101
+        assert schedule.applicable_days == [0, 2]
+
+    def test_mask_wins_when_both_sent(self):
+        schedule = VisualScheduleCreate(
+            autism_profile_id="p1", name="Morning", applicable_days=[0], applicable_days_mask=0b10,
+        )
+        assert schedule.applicable_days_mask == 0b10
+
+    def test_update_accepts_day_list(self):
+        updates = VisualScheduleUpdate(applicable_days=[6])
+        assert updates.model_dump(exclude_unset=True) == {"applicable_days_mask": 0b1000000}
+
+    @pytest.mark.parametrize("days", [[7], [-1], ["mon"], 3])
+    def test_invalid_days_rejected(self, days):
+        with pytest.raises(ValidationError) as exc_info:
+            VisualScheduleCreate(autism_profile_id="p1", name="Morning", applicable_days=days)
+        assert exc_info.value.errors()[0]["type"] == "applicable_days"
+
+
+class TestStoredRows:
+    """Reads from rows that carry the day list, not the mask"""
+
+    def test_from_row_packs_days(self):
+        response = VisualScheduleResponse.from_row(_row())
+        assert response.applicable_days_mask == 0b1010
+        assert response.applicable_days == [1, 3]
+        assert not response.applies_on(0)
+        assert response.applies_on(3)
+
+    def test_from_attributes_packs_days(self):
+        response = VisualScheduleResponse.model_validate(_row())
+        assert response.applicable_days_mask == 0b1010
+
+    def test_empty_day_list_applies_every_day(self):
+        response = VisualScheduleResponse.from_row(_row(applicable_days=[]))
+        assert response.applicable_days == []
+        assert all(response.applies_on(day) for day in range(7))
+
+    def test_json_round_trip(self):
+        response = VisualScheduleResponse.from_row(_row())
+        assert VisualScheduleResponse.model_validate_json(response.model_dump_json()) == response